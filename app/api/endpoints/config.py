@@ -42,8 +42,13 @@ async def get_config():
         },
         model={
             "device": device or "unknown",
+            "precision": Config.PRECISION,
             "voice_sample_path": Config.VOICE_SAMPLE_PATH,
-            "model_cache_dir": Config.MODEL_CACHE_DIR
+            "model_cache_dir": Config.MODEL_CACHE_DIR,
+            "default_variant": Config.get_default_model_variant(),
+            "enabled_variants": Config.get_enabled_model_variants(),
+            "max_resident_models": Config.MAX_RESIDENT_MODELS,
+            "memory_budget_mb": Config.MODEL_MEMORY_BUDGET_MB
         },
         defaults={
             "exaggeration": Config.EXAGGERATION,
@@ -8,7 +8,7 @@ from app.models import HealthResponse
 from app.config import Config
 from app.core import get_memory_info, add_route_aliases
 from app.core.tts_model import (
-    get_model, 
+    get_model_registry,
     get_device, 
     get_initialization_state,
     get_initialization_progress,
@@ -16,6 +16,7 @@ from app.core.tts_model import (
     is_ready,
     is_initializing
 )
+from app.core.startup_profile import get_startup_profiler
 
 # Create router with aliasing support
 base_router = APIRouter()
@@ -30,7 +31,7 @@ router = add_route_aliases(base_router)
 )
 async def health_check():
     """Health check endpoint - always responds even during initialization"""
-    model = get_model()
+    resident_variants = get_model_registry().resident_variants()
     device = get_device()
     init_state = get_initialization_state()
     init_progress = get_initialization_progress()
@@ -48,7 +49,7 @@ async def health_check():
     
     return HealthResponse(
         status=status,
-        model_loaded=model is not None,
+        model_loaded=bool(resident_variants),
         device=device or "unknown",
         config={
             "max_chunk_length": Config.MAX_CHUNK_LENGTH,
@@ -74,5 +75,15 @@ async def ping():
     """Simple ping endpoint for connectivity testing"""
     return {"status": "ok", "message": "Server is running"}
 
+
+@router.get(
+    "/startup-profile",
+    summary="Startup profile",
+    description="Timed phases of process startup and model initialization (imports, config validation, voice library, model download and loading)"
+)
+async def startup_profile():
+    """Report where startup time went"""
+    return get_startup_profiler().get_report()
+
 # Export the base router for the main app to use
 __all__ = ["base_router"] 
\ No newline at end of file
@@ -2,11 +2,10 @@
 Long text TTS endpoints for processing texts > 3000 characters
 """
 
-import asyncio
 import json
 from pathlib import Path
 from typing import List, Optional
-from fastapi import APIRouter, HTTPException, status, Query
+from fastapi import APIRouter, Header, HTTPException, status, Query
 from fastapi.responses import FileResponse, StreamingResponse
 from sse_starlette.sse import EventSourceResponse
 
@@ -28,9 +27,12 @@ from app.models.long_text import (
     LongTextHistorySort
 )
 from app.config import Config
-from app.core.long_text_jobs import get_job_manager
+from app.core.long_text_jobs import get_job_manager, DeadlineExceededError
+from app.core.job_events import JOB_DELETED, STATUS_CHANGE, get_event_bus
+from app.core.job_audio_stream import STREAM_MEDIA_TYPES, stream_job_audio
 from app.core.background_tasks import get_processor
-from app.core.text_processing import validate_long_text_input, estimate_processing_time
+from app.core.text_processing import validate_long_text_input
+from app.core.tts_model import get_model_registry
 from app.core import add_route_aliases, cleanup_memory # Added cleanup_memory
 
 # Create router with aliasing support
@@ -63,6 +65,9 @@ async def create_long_text_job(request: LongTextRequest):
                 }
             )
 
+        # Reject unknown model names before any work is queued
+        get_model_registry().resolve_variant(request.model)
+
         # Get job manager and processor
         print(f"🔍 Getting job manager and processor...")
         job_manager = get_job_manager()
@@ -70,35 +75,66 @@ async def create_long_text_job(request: LongTextRequest):
 
         # Create the job
         print(f"🛠️ Creating long text job in manager...")
-        job_id, estimated_chunks = job_manager.create_job(
+        job_id, estimated_chunks, deduplicated_from = job_manager.create_job(
             text=request.input,
             voice=request.voice,
             output_format=request.response_format or "mp3",
             exaggeration=request.exaggeration,
             cfg_weight=request.cfg_weight,
             temperature=request.temperature,
-            session_id=request.session_id
+            session_id=request.session_id,
+            model=request.model,
+            deadline_seconds=request.deadline_seconds,
+            parallelism=request.parallelism,
+            deduplicate=request.deduplicate
         )
-        print(f"✅ Job created: {job_id}, estimated {estimated_chunks} chunks")
 
-        # Submit for background processing
-        print(f"🚀 Submitting job {job_id} to background processor...")
-        await processor.submit_job(job_id)
-        print(f"✅ Job {job_id} submitted successfully")
+        metadata = job_manager._load_job_metadata(job_id)
+        job_status = metadata.status if metadata else LongTextJobStatus.PENDING
+        if deduplicated_from is None:
+            print(f"✅ Job created: {job_id}, estimated {estimated_chunks} chunks")
+
+            # Submit for background processing
+            print(f"🚀 Submitting job {job_id} to background processor...")
+            await processor.submit_job(job_id)
+            print(f"✅ Job {job_id} submitted successfully")
+            message = "Job submitted for processing"
+        elif job_status == LongTextJobStatus.COMPLETED:
+            print(f"♻️ Job {job_id} completed at once with the audio of identical job {deduplicated_from}")
+            message = f"Identical job {deduplicated_from} already completed; its audio was reused"
+        else:
+            print(f"♻️ Job {job_id} follows identical job {deduplicated_from} in progress")
+            message = f"Identical job {deduplicated_from} already in progress; this job completes with its audio"
 
-        # Estimate processing time
-        estimated_time = estimate_processing_time(len(request.input))
+        # Estimate processing time from the planned units
+        progress = job_manager.get_progress(job_id)
+        estimated_time = progress.estimated_remaining_seconds if progress else None
 
         return LongTextJobCreateResponse(
             job_id=job_id,
-            status=LongTextJobStatus.PENDING,
+            status=job_status,
             estimated_processing_time_seconds=estimated_time,
+            queue_position=progress.queue_position if progress else None,
+            deduplicated_from=deduplicated_from,
             total_chunks=estimated_chunks,
-            message="Job submitted for processing",
+            message=message,
             status_url=f"/audio/speech/long/{job_id}",
             sse_url=f"/audio/speech/long/{job_id}/sse"
         )
 
+    except DeadlineExceededError as e:
+        print(f"⏱️ Long text job rejected: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail={
+                "error": {
+                    "message": str(e),
+                    "type": "deadline_exceeded",
+                    "predicted_seconds": int(round(e.predicted_seconds))
+                }
+            },
+            headers={"Retry-After": str(max(1, int(e.predicted_seconds - e.deadline_seconds)))}
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -161,6 +197,11 @@ async def get_job_status(job_id: str):
         if metadata.status == LongTextJobStatus.COMPLETED and metadata.output_path:
             download_url = f"/audio/speech/long/{job_id}/download"
 
+        # Audio can be streamed until the job fails or is cancelled
+        stream_url = None
+        if metadata.status not in (LongTextJobStatus.FAILED, LongTextJobStatus.CANCELLED):
+            stream_url = f"/audio/speech/long/{job_id}/stream"
+
         # Determine action capabilities
         can_pause = metadata.status == LongTextJobStatus.PROCESSING
         can_resume = metadata.status == LongTextJobStatus.PAUSED
@@ -173,6 +214,7 @@ async def get_job_status(job_id: str):
             created_at=metadata.created_at,
             updated_at=metadata.updated_at,
             download_url=download_url,
+            stream_url=stream_url,
             can_pause=can_pause,
             can_resume=can_resume
         )
@@ -287,6 +329,93 @@ async def download_job_audio(job_id: str):
         )
 
 
+@router.get("/audio/speech/long/{job_id}/stream")
+async def stream_job_audio_progressively(
+    job_id: str,
+    response_format: Optional[str] = Query(None, description="wav, mp3 or opus (defaults to the job's output format)")
+):
+    """
+    Stream a job's audio while it is still being generated.
+
+    Units that are already finished are sent in order as one continuous
+    stream; the response then waits for each following unit and ends when
+    the job does. Failed units are skipped, as in the final file.
+    """
+    try:
+        job_manager = get_job_manager()
+
+        # Check if job exists
+        if not job_manager.job_exists(job_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail={
+                    "error": {
+                        "message": f"Job {job_id} not found",
+                        "type": "not_found_error"
+                    }
+                }
+            )
+
+        metadata = job_manager._load_job_metadata(job_id)
+        if not metadata:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail={
+                    "error": {
+                        "message": "Failed to load job metadata",
+                        "type": "api_error"
+                    }
+                }
+            )
+
+        if metadata.status in (LongTextJobStatus.FAILED, LongTextJobStatus.CANCELLED):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail={
+                    "error": {
+                        "message": f"Job is {metadata.status.value}",
+                        "type": "invalid_request_error"
+                    }
+                }
+            )
+
+        output_format = (response_format or metadata.output_format).lower()
+        if output_format not in STREAM_MEDIA_TYPES:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={
+                    "error": {
+                        "message": f"Unsupported stream format: {output_format} "
+                                   f"(supported: {', '.join(STREAM_MEDIA_TYPES)})",
+                        "type": "invalid_request_error"
+                    }
+                }
+            )
+
+        return StreamingResponse(
+            stream_job_audio(job_id, output_format),
+            media_type=STREAM_MEDIA_TYPES[output_format],
+            headers={
+                "Content-Disposition": f"inline; filename=long_text_{job_id}.{output_format}",
+                "Cache-Control": "no-cache",
+                "X-Job-Status": metadata.status.value
+            }
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "error": {
+                    "message": f"Failed to start audio stream: {str(e)}",
+                    "type": "api_error"
+                }
+            }
+        )
+
+
 @router.put("/audio/speech/long/{job_id}/pause")
 async def pause_job(job_id: str):
     """
@@ -368,7 +497,6 @@ async def resume_job(job_id: str):
     """
     try:
         job_manager = get_job_manager()
-        processor = get_processor()
 
         # Check if job exists
         if not job_manager.job_exists(job_id):
@@ -406,8 +534,17 @@ async def resume_job(job_id: str):
                 }
             )
 
-        # Resume the job by re-submitting it
-        await processor.submit_job(job_id)
+        # Back to pending and into the queue; the worker resumes it from its checkpoint
+        if not job_manager.resume_job(job_id):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail={
+                    "error": {
+                        "message": f"Cannot resume job {job_id}",
+                        "type": "invalid_request_error"
+                    }
+                }
+            )
 
         return {"message": f"Job {job_id} resumed successfully"}
 
@@ -518,10 +655,139 @@ async def list_jobs(
         )
 
 
+_TERMINAL_STATUSES = {LongTextJobStatus.COMPLETED.value, LongTextJobStatus.FAILED.value, LongTextJobStatus.CANCELLED.value}
+
+
+def _sse_message(event: LongTextSSEEvent) -> dict:
+    return {
+        "id": str(event.id) if event.id is not None else None,
+        "event": event.event_type,
+        "data": json.dumps({"job_id": event.job_id, **event.data}, default=str)
+    }
+
+
+def _job_snapshot_events(job_id: str, event_id: int) -> List[LongTextSSEEvent]:
+    """A progress event with a job's current state, plus its final event if it has finished"""
+    job_manager = get_job_manager()
+    metadata = job_manager._load_job_metadata(job_id)
+    progress = job_manager.get_progress(job_id)
+    if not metadata or not progress:
+        return [LongTextSSEEvent(id=event_id, job_id=job_id, event_type=JOB_DELETED)]
+
+    events = [LongTextSSEEvent(
+        id=event_id,
+        job_id=job_id,
+        event_type="progress",
+        data={
+            "status": metadata.status.value,
+            "progress": progress.overall_progress,
+            "current_chunk": progress.current_chunk.index if progress.current_chunk else None,
+            "completed_chunks": len(progress.completed_chunks),
+            "total_chunks": metadata.total_chunks,
+            "estimated_remaining_seconds": progress.estimated_remaining_seconds,
+            "queue_position": progress.queue_position
+        }
+    )]
+    final_event = _final_event(job_id, {"status": metadata.status.value, "error": metadata.error}, event_id)
+    if final_event:
+        events.append(final_event)
+    return events
+
+
+def _final_event(job_id: str, data: dict, event_id: Optional[int]) -> Optional[LongTextSSEEvent]:
+    """The closing completed/error event for a status that ends the job, else None"""
+    if data.get("status") not in _TERMINAL_STATUSES:
+        return None
+    completed = data["status"] == LongTextJobStatus.COMPLETED.value
+    return LongTextSSEEvent(
+        id=event_id,
+        job_id=job_id,
+        event_type="completed" if completed else "error",
+        data={
+            "status": data["status"],
+            "message": "Job completed successfully" if completed else (data.get("error") or f"Job {data['status']}")
+        }
+    )
+
+
+async def _job_event_stream(job_ids: Optional[List[str]], last_event_id: Optional[str]):
+    """
+    SSE messages for `job_ids` (every job if None) as they are published.
+    Starts with what the client missed since `last_event_id` when that is
+    still known, otherwise with each job's current state. Ends once every
+    watched job has finished; a stream of all jobs never ends.
+    """
+    bus = get_event_bus()
+    subscription = bus.subscribe(set(job_ids) if job_ids is not None else None)
+    unfinished = set(job_ids) if job_ids is not None else None
+
+    def handle(event: LongTextSSEEvent) -> List[dict]:
+        messages = [_sse_message(event)]
+        finished = event.event_type == JOB_DELETED
+        if event.event_type in (STATUS_CHANGE, "progress"):
+            final_event = _final_event(event.job_id, event.data, event.id)
+            if final_event:
+                if event.event_type == STATUS_CHANGE:
+                    messages.append(_sse_message(final_event))
+                finished = True
+        if finished and unfinished is not None:
+            unfinished.discard(event.job_id)
+        return messages
+
+    def snapshots() -> List[dict]:
+        messages = []
+        for job_id in sorted(unfinished or ()):
+            for event in _job_snapshot_events(job_id, subscription.last_id):
+                messages.extend(handle(event))
+        return messages
+
+    try:
+        missed = None
+        if last_event_id and last_event_id.isdigit():
+            missed = bus.replay(int(last_event_id), subscription.job_ids)
+        if missed is None:
+            for message in snapshots():
+                yield message
+        else:
+            for event in missed:
+                for message in handle(event):
+                    yield message
+            # Jobs that had already finished before the client's last event send nothing more
+            for job_id in list(unfinished or ()):
+                metadata = get_job_manager()._load_job_metadata(job_id)
+                if not metadata or metadata.status.value in _TERMINAL_STATUSES:
+                    unfinished.discard(job_id)
+
+        while unfinished is None or unfinished:
+            events = await subscription.get()
+            if events is None:
+                # Fell too far behind to replay what was missed: resend current state
+                for message in snapshots():
+                    yield message
+                continue
+            for event in events:
+                for message in handle(event):
+                    yield message
+    except Exception as e:
+        error_event = LongTextSSEEvent(
+            job_id=",".join(job_ids or []),
+            event_type="error",
+            data={
+                "message": f"Error monitoring job: {str(e)}"
+            }
+        )
+        yield _sse_message(error_event)
+    finally:
+        bus.unsubscribe(subscription)
+
+
 @router.get("/audio/speech/long/{job_id}/sse")
-async def job_progress_sse(job_id: str):
+async def job_progress_sse(job_id: str, last_event_id: Optional[str] = Header(None, alias="Last-Event-ID")):
     """
     Server-Sent Events stream for real-time job progress updates.
+
+    Chunk, status and ETA events are pushed as they happen. Reconnecting
+    clients send Last-Event-ID to receive the events they missed.
     """
     try:
         job_manager = get_job_manager()
@@ -538,85 +804,52 @@ async def job_progress_sse(job_id: str):
                 }
             )
 
-        async def event_generator():
-            """Generate SSE events for job progress"""
-            last_status = None
-            last_progress = None
-
-            while True:
-                try:
-                    # Get current job status and progress
-                    metadata = job_manager._load_job_metadata(job_id)
-                    progress = job_manager.get_progress(job_id)
-
-                    if not metadata or not progress:
-                        break
-
-                    # Check if we should send an update
-                    send_update = (
-                        metadata.status != last_status or
-                        (progress.overall_progress != last_progress and
-                         progress.overall_progress % 5 == 0)  # Send every 5% progress
-                    )
-
-                    if send_update:
-                        event = LongTextSSEEvent(
-                            job_id=job_id,
-                            event_type="progress",
-                            data={
-                                "status": metadata.status,
-                                "progress": progress.overall_progress,
-                                "current_chunk": progress.current_chunk.index if progress.current_chunk else None,
-                                "total_chunks": metadata.total_chunks,
-                                "estimated_remaining_seconds": progress.estimated_remaining_seconds
-                            }
-                        )
-
-                        yield {
-                            "event": event.event_type,
-                            "data": json.dumps(event.data)
-                        }
+        return EventSourceResponse(_job_event_stream([job_id], last_event_id))
 
-                        last_status = metadata.status
-                        last_progress = progress.overall_progress
-
-                    # If job is completed, failed, or cancelled, send final event and exit
-                    if metadata.status in [LongTextJobStatus.COMPLETED, LongTextJobStatus.FAILED, LongTextJobStatus.CANCELLED]:
-                        final_event = LongTextSSEEvent(
-                            job_id=job_id,
-                            event_type="completed" if metadata.status == LongTextJobStatus.COMPLETED else "error",
-                            data={
-                                "status": metadata.status,
-                                "message": "Job completed successfully" if metadata.status == LongTextJobStatus.COMPLETED else metadata.error
-                            }
-                        )
-
-                        yield {
-                            "event": final_event.event_type,
-                            "data": json.dumps(final_event.data)
-                        }
-                        break
-
-                    # Wait before next check
-                    await asyncio.sleep(2)
-
-                except Exception as e:
-                    # Send error event and exit
-                    error_event = LongTextSSEEvent(
-                        job_id=job_id,
-                        event_type="error",
-                        data={
-                            "message": f"Error monitoring job: {str(e)}"
-                        }
-                    )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "error": {
+                    "message": f"Failed to start SSE stream: {str(e)}",
+                    "type": "api_error"
+                }
+            }
+        )
+
+
+@router.get("/audio/speech/long-events")
+async def jobs_progress_sse(
+    job_ids: Optional[str] = Query(None, description="Comma-separated job IDs to watch (all jobs if omitted)"),
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID")
+):
+    """
+    Server-Sent Events stream of progress events for several jobs at once.
 
-                    yield {
-                        "event": error_event.event_type,
-                        "data": json.dumps(error_event.data)
+    Each event's data carries its job_id. The stream ends when every listed
+    job has finished; without job_ids it follows all jobs indefinitely.
+    """
+    try:
+        job_manager = get_job_manager()
+
+        watched = None
+        if job_ids:
+            watched = list(dict.fromkeys(job_id.strip() for job_id in job_ids.split(",") if job_id.strip()))
+            missing = [job_id for job_id in watched if not job_manager.job_exists(job_id)]
+            if missing:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail={
+                        "error": {
+                            "message": f"Jobs not found: {', '.join(missing)}",
+                            "type": "not_found_error"
+                        }
                     }
-                    break
+                )
 
-        return EventSourceResponse(event_generator())
+        return EventSourceResponse(_job_event_stream(watched, last_event_id))
 
     except HTTPException:
         raise
@@ -2,7 +2,6 @@
 Memory management endpoints
 """
 
-import torch
 from typing import Optional, Dict, Any
 from fastapi import APIRouter, Query, HTTPException, status
 
@@ -93,6 +92,8 @@ async def memory_management(
     
     if cleanup:
         try:
+            import torch
+            
             # Perform cleanup
             collected_objects = cleanup_memory(force_cuda_clear)
             result["cleanup_performed"] = True
@@ -129,6 +130,8 @@ async def reset_memory_tracking(confirm: bool = Query(False, description="Confir
         }
     
     try:
+        import torch
+        
         # Reset counter
         old_counter = REQUEST_COUNTER
         REQUEST_COUNTER = 0
@@ -168,6 +171,8 @@ async def reset_memory_tracking(confirm: bool = Query(False, description="Confir
 )
 async def get_memory_config():
     """Get memory management configuration"""
+    import torch
+    
     return {
         "config": {
             "memory_cleanup_interval": Config.MEMORY_CLEANUP_INTERVAL,
@@ -254,6 +259,7 @@ async def get_memory_recommendations():
         })
     
     # GPU memory recommendations
+    import torch
     if torch.cuda.is_available() and gpu_memory > 6000:
         recommendations.append({
             "type": "gpu_memory",
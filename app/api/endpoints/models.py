@@ -6,31 +6,68 @@ from fastapi import APIRouter
 
 from app.models import ModelsResponse, ModelInfo
 from app.core import add_route_aliases
+from app.core.tts_model import get_model_registry
+from app.config import Config
 
 # Create router with aliasing support
 base_router = APIRouter()
 router = add_route_aliases(base_router)
 
+MODEL_CREATED_TIMESTAMP = 1677649963
+
 
 @router.get(
     "/models",
     response_model=ModelsResponse,
     summary="List models",
-    description="List available models (OpenAI API compatibility)"
+    description="List available model variants, which of them are resident, and recent load/eviction events (OpenAI API compatible)"
 )
 async def list_models():
     """List available models (OpenAI API compatibility)"""
-    return ModelsResponse(
-        object="list",
-        data=[
+    registry = get_model_registry()
+    data = []
+    default_id = None
+
+    for info in registry.describe():
+        variant = info["variant"]
+        if info["is_default"]:
+            default_id = variant.model_id
+        data.append(
             ModelInfo(
-                id="chatterbox-tts-1",
-                object="model", 
-                created=1677649963,
-                owned_by="resemble-ai"
+                id=variant.model_id,
+                object="model",
+                created=MODEL_CREATED_TIMESTAMP,
+                owned_by="resemble-ai",
+                description=variant.description,
+                is_default=info["is_default"],
+                loaded=info["loaded"],
+                languages=sorted(variant.languages.keys()),
+                memory_mb=info["memory_mb"],
+                last_used=info["last_used"],
+                request_count=info["request_count"]
             )
-        ]
+        )
+
+    # Keep the historical id so existing clients continue to work
+    data.insert(
+        0,
+        ModelInfo(
+            id="chatterbox-tts-1",
+            object="model",
+            created=MODEL_CREATED_TIMESTAMP,
+            owned_by="resemble-ai",
+            alias_for=default_id
+        )
+    )
+
+    return ModelsResponse(
+        object="list",
+        data=data,
+        resident_memory_mb=registry.get_memory_usage_mb(),
+        max_resident_models=Config.MAX_RESIDENT_MODELS,
+        memory_budget_mb=Config.MODEL_MEMORY_BUDGET_MB,
+        events=registry.get_events()
     )
 
 # Export the base router for the main app to use
-__all__ = ["base_router"] 
\ No newline at end of file
+__all__ = ["base_router"]
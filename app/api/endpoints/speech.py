@@ -6,11 +6,10 @@ import io
 import os
 import asyncio
 import tempfile
-import torch
-import torchaudio as ta
 import base64
 import json
 import struct
+import time
 from typing import Optional, List, Dict, Any, AsyncGenerator
 from fastapi import APIRouter, HTTPException, status, Form, File, UploadFile
 from fastapi.responses import StreamingResponse
@@ -19,11 +18,19 @@ from app.models import TTSRequest, ErrorResponse, SSEAudioDelta, SSEAudioDone, S
 from app.config import Config
 from app.core import (
     get_memory_info, cleanup_memory, safe_delete_tensors,
-    split_text_into_chunks, concatenate_audio_chunks, add_route_aliases,
+    concatenate_audio_chunks, add_route_aliases,
     TTSStatus, start_tts_request, update_tts_status, get_voice_library
 )
-from app.core.tts_model import get_model, is_multilingual, is_ready
+from app.core.tts_model import (
+    is_ready, get_model_for_request, get_model_registry, UnknownModelError, ModelVariant
+)
 from app.core.text_processing import split_text_for_streaming, get_streaming_settings
+from app.core.chunk_planner import plan_chunks, record_chunk_audio
+from app.core.processing_estimator import get_processing_estimator, voice_key
+from app.core.inference_gate import generate_conditioned
+from app.core.inference_scheduler import BUFFERED, STREAMING, get_inference_scheduler
+from app.core.silence import pause_after_text, pauses_for_chunks, trim_silence
+from app.core.stitching import StreamStitcher
 
 # Create router with aliasing support
 base_router = APIRouter()
@@ -59,6 +66,12 @@ def create_wav_header(sample_rate: int, channels: int, bits_per_sample: int, dat
     return header.getvalue()
 
 
+def pcm16_bytes(audio) -> bytes:
+    """Raw little-endian 16-bit PCM for a float audio tensor in [-1, 1]"""
+    import torch
+    return (torch.clamp(audio, -1.0, 1.0) * 32767).to(torch.int16).numpy().tobytes()
+
+
 def resolve_voice_path_and_language(voice_name: Optional[str]) -> tuple[str, str]:
     """
     Resolve a voice name or alias to a file path and language.
@@ -106,6 +119,43 @@ def resolve_voice_path(voice_name: Optional[str]) -> str:
     return path
 
 
+def validate_requested_model(model_name: Optional[str], language_id: Optional[str] = None) -> ModelVariant:
+    """Fail fast on unknown model names before a streaming response is started"""
+    try:
+        return get_model_registry().resolve_variant(model_name, language_id)
+    except UnknownModelError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"error": {"message": str(e), "type": "invalid_request_error"}}
+        )
+
+
+async def resolve_request_model(request_id: str, model_name: Optional[str], language_id: str):
+    """Resolve the model variant for a request, loading it on first use"""
+    try:
+        model, variant = await get_model_for_request(model_name, language_id)
+    except UnknownModelError as e:
+        update_tts_status(request_id, TTSStatus.ERROR, error_message=str(e))
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"error": {"message": str(e), "type": "invalid_request_error"}}
+        )
+    except Exception as e:
+        update_tts_status(request_id, TTSStatus.ERROR, error_message=f"Failed to load model: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={"error": {"message": f"Failed to load model: {e}", "type": "model_loading"}}
+        )
+
+    if model is None:
+        update_tts_status(request_id, TTSStatus.ERROR, error_message="Model not loaded")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"error": {"message": "Model not loaded", "type": "model_error"}}
+        )
+    return model, variant
+
+
 def validate_audio_file(file: UploadFile) -> None:
     """Validate uploaded audio file"""
     if not file.filename:
@@ -147,9 +197,13 @@ async def generate_speech_internal(
     language_id: str = "en",
     exaggeration: Optional[float] = None,
     cfg_weight: Optional[float] = None,
-    temperature: Optional[float] = None
+    temperature: Optional[float] = None,
+    model_name: Optional[str] = None
 ) -> io.BytesIO:
     """Internal function to generate speech with given parameters"""
+    import torch
+    import torchaudio as ta
+    
     global REQUEST_COUNTER
     REQUEST_COUNTER += 1
     
@@ -162,7 +216,8 @@ async def generate_speech_internal(
             "exaggeration": exaggeration,
             "cfg_weight": cfg_weight,
             "temperature": temperature,
-            "voice_sample_path": voice_sample_path
+            "voice_sample_path": voice_sample_path,
+            "model": model_name
         }
     )
     
@@ -176,13 +231,7 @@ async def generate_speech_internal(
             detail={"error": {"message": status_msg, "type": "model_loading"}}
         )
 
-    model = get_model()
-    if model is None:
-        update_tts_status(request_id, TTSStatus.ERROR, error_message="Model not loaded")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={"error": {"message": "Model not loaded", "type": "model_error"}}
-        )
+    model, variant = await resolve_request_model(request_id, model_name, language_id)
 
     # Log memory usage before processing
     initial_memory = None
@@ -212,6 +261,8 @@ async def generate_speech_internal(
         )
 
     audio_chunks = []
+    generated_texts = []
+    trimmed_seconds = 0.0
     final_audio = None
     buffer = None
     
@@ -221,9 +272,11 @@ async def generate_speech_internal(
         cfg_weight = cfg_weight if cfg_weight is not None else Config.CFG_WEIGHT
         temperature = temperature if temperature is not None else Config.TEMPERATURE
         
-        # Split text into chunks
+        # Split text into chunks sized by the model's tokenizer
         update_tts_status(request_id, TTSStatus.CHUNKING, "Splitting text into chunks")
-        chunks = split_text_into_chunks(text, Config.MAX_CHUNK_LENGTH)
+        plan = plan_chunks(text, model, language_id)
+        chunks = list(plan.chunks)
+        update_tts_status(request_id, TTSStatus.CHUNKING, "Planned text chunks", chunk_plan=plan.to_dict())
         
         voice_source = "uploaded file" if voice_sample_path != Config.VOICE_SAMPLE_PATH else "configured sample"
         print(f"Processing {len(chunks)} text chunks with {voice_source} and parameters:")
@@ -269,16 +322,19 @@ async def generate_speech_internal(
                     }
                     
                     # Add language_id for multilingual models
-                    if is_multilingual():
+                    if variant.multilingual:
                         generate_kwargs["language_id"] = language_id
                     
                     # Log chunk details for debugging
-                    print(f"   Chunk text length: {len(chunk)} chars, language: {language_id}")
+                    print(f"   Chunk text length: {len(chunk)} chars, language: {language_id}, model: {variant.name}")
                     
-                    audio_tensor = await loop.run_in_executor(
-                        None,
-                        lambda: model.generate(**generate_kwargs)
-                    )
+                    async with get_inference_scheduler().slot(BUFFERED, request_id, len(chunk)):
+                        generation_started = time.perf_counter()
+                        audio_tensor = await loop.run_in_executor(
+                            None,
+                            lambda: generate_conditioned(model, **generate_kwargs)
+                        )
+                        generation_seconds = time.perf_counter() - generation_started
                     
                 except Exception as chunk_error:
                     print(f"❌ Error generating audio for chunk {i+1}: {chunk_error}")
@@ -299,7 +355,12 @@ async def generate_speech_internal(
                     print(f"⚠️ Warning: Model returned empty tensor for chunk {i+1}")
                     continue
                     
+                record_chunk_audio(language_id, chunk, audio_tensor.shape[-1] / model.sr)
+                get_processing_estimator().record(len(chunk), generation_seconds, language_id, voice_key(voice_sample_path))
+                audio_tensor, chunk_trimmed_seconds = trim_silence(audio_tensor, model.sr)
+                trimmed_seconds += chunk_trimmed_seconds
                 audio_chunks.append(audio_tensor)
+                generated_texts.append(chunk)
             
             if not audio_chunks:
                 raise ValueError("No audio was generated for any of the text chunks")
@@ -316,9 +377,11 @@ async def generate_speech_internal(
             update_tts_status(request_id, TTSStatus.CONCATENATING, "Concatenating audio chunks")
             print("Concatenating audio chunks...")
             with torch.no_grad():
-                final_audio = concatenate_audio_chunks(audio_chunks, model.sr)
+                final_audio = concatenate_audio_chunks(audio_chunks, model.sr, pauses_for_chunks(generated_texts))
         else:
             final_audio = audio_chunks[0]
+        if trimmed_seconds > 0:
+            print(f"✂️ Trimmed {trimmed_seconds:.2f}s of edge silence from {len(audio_chunks)} chunks")
         
         # Convert to WAV format
         update_tts_status(request_id, TTSStatus.FINALIZING, "Converting to WAV format")
@@ -405,9 +468,12 @@ async def generate_speech_streaming(
     temperature: Optional[float] = None,
     streaming_chunk_size: Optional[int] = None,
     streaming_strategy: Optional[str] = None,
-    streaming_quality: Optional[str] = None
+    streaming_quality: Optional[str] = None,
+    model_name: Optional[str] = None
 ) -> AsyncGenerator[bytes, None]:
     """Streaming function to generate speech with real-time chunk yielding"""
+    import torch
+    
     global REQUEST_COUNTER
     REQUEST_COUNTER += 1
     
@@ -421,6 +487,7 @@ async def generate_speech_streaming(
             "cfg_weight": cfg_weight,
             "temperature": temperature,
             "voice_sample_path": voice_sample_path,
+            "model": model_name,
             "streaming": True,
             "streaming_chunk_size": streaming_chunk_size,
             "streaming_strategy": streaming_strategy,
@@ -438,13 +505,7 @@ async def generate_speech_streaming(
             detail={"error": {"message": status_msg, "type": "model_loading"}}
         )
 
-    model = get_model()
-    if model is None:
-        update_tts_status(request_id, TTSStatus.ERROR, error_message="Model not loaded")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={"error": {"message": "Model not loaded", "type": "model_error"}}
-        )
+    model, variant = await resolve_request_model(request_id, model_name, language_id)
 
     # Log memory usage before processing
     initial_memory = None
@@ -519,6 +580,9 @@ async def generate_speech_streaming(
         # Generate and stream audio for each chunk
         loop = asyncio.get_event_loop()
         total_samples = 0
+        trimmed_seconds = 0.0
+        pause_ms = 0
+        stitcher = StreamStitcher(sample_rate)
         
         for i, chunk in enumerate(chunks):
             # Update progress
@@ -531,36 +595,45 @@ async def generate_speech_streaming(
             # Use torch.no_grad() to prevent gradient accumulation
             with torch.no_grad():
                 # Run TTS generation in executor to avoid blocking
-                audio_tensor = await loop.run_in_executor(
-                    None,
-                    lambda: model.generate(
-                        text=chunk,
-                        audio_prompt_path=voice_sample_path,
-                        exaggeration=exaggeration,
-                        cfg_weight=cfg_weight,
-                        temperature=temperature,
-                        **({'language_id': language_id} if is_multilingual() else {})
+                async with get_inference_scheduler().slot(STREAMING, request_id, len(chunk)):
+                    generation_started = time.perf_counter()
+                    audio_tensor = await loop.run_in_executor(
+                        None,
+                        lambda: generate_conditioned(
+                            model,
+                            text=chunk,
+                            audio_prompt_path=voice_sample_path,
+                            exaggeration=exaggeration,
+                            cfg_weight=cfg_weight,
+                            temperature=temperature,
+                            **({'language_id': language_id} if variant.multilingual else {})
+                        )
                     )
-                )
                 
                 # Ensure tensor is on CPU for streaming
                 if hasattr(audio_tensor, 'cpu'):
                     audio_tensor = audio_tensor.cpu()
+                record_chunk_audio(language_id, chunk, audio_tensor.shape[-1] / model.sr)
+                get_processing_estimator().record(
+                    len(chunk), time.perf_counter() - generation_started, language_id, voice_key(voice_sample_path)
+                )
 
-                # Convert tensor to raw 16-bit PCM data
-                # Clamp values to [-1, 1] before conversion
-                audio_tensor = torch.clamp(audio_tensor, -1.0, 1.0)
-                audio_tensor_int = (audio_tensor * 32767).to(torch.int16)
-                
-                # Yield the raw audio data as bytes
-                pcm_data = audio_tensor_int.numpy().tobytes()
-                yield pcm_data
+                audio_tensor, chunk_trimmed_seconds = trim_silence(audio_tensor, model.sr)
+                trimmed_seconds += chunk_trimmed_seconds
+
+                # Stitch onto the previous chunk; only the crossfade tail is held back
+                ready = stitcher.push(audio_tensor, pause_ms)
+                pause_ms = pause_after_text(chunk)
                 
-                total_samples += audio_tensor.shape[1]
+                # Yield the raw audio data as 16-bit PCM bytes
+                if ready.shape[-1] > 0:
+                    pcm_data = pcm16_bytes(ready)
+                    yield pcm_data
+                    total_samples += ready.shape[-1]
+                    del pcm_data
                 
                 # Clean up this chunk
-                safe_delete_tensors(audio_tensor, audio_tensor_int)
-                del pcm_data
+                safe_delete_tensors(audio_tensor, ready)
             
             # Periodic memory cleanup during generation
             if i > 0 and i % 3 == 0:  # Every 3 chunks
@@ -569,9 +642,16 @@ async def generate_speech_streaming(
                 if torch.cuda.is_available():
                     torch.cuda.empty_cache()
         
+        # End of the last chunk, held back for a crossfade that never came
+        tail = stitcher.flush()
+        if tail is not None and tail.shape[-1] > 0:
+            yield pcm16_bytes(tail)
+            total_samples += tail.shape[-1]
+        
         # Mark as completed
         update_tts_status(request_id, TTSStatus.COMPLETED, "Streaming audio generation completed")
-        print(f"✓ Streaming audio generation completed. Total samples: {total_samples:,}")
+        print(f"✓ Streaming audio generation completed. Total samples: {total_samples:,}, "
+              f"trimmed {trimmed_seconds:.2f}s of edge silence")
         
     except Exception as e:
         # Update status with error
@@ -611,9 +691,12 @@ async def generate_speech_sse(
     temperature: Optional[float] = None,
     streaming_chunk_size: Optional[int] = None,
     streaming_strategy: Optional[str] = None,
-    streaming_quality: Optional[str] = None
+    streaming_quality: Optional[str] = None,
+    model_name: Optional[str] = None
 ) -> AsyncGenerator[str, None]:
     """Generate Server-Side Events for speech streaming (OpenAI compatible format)"""
+    import torch
+    
     global REQUEST_COUNTER
     REQUEST_COUNTER += 1
     
@@ -627,6 +710,7 @@ async def generate_speech_sse(
             "cfg_weight": cfg_weight,
             "temperature": temperature,
             "voice_sample_path": voice_sample_path,
+            "model": model_name,
             "streaming": True,
             "streaming_format": "sse",
             "streaming_chunk_size": streaming_chunk_size,
@@ -645,13 +729,7 @@ async def generate_speech_sse(
             detail={"error": {"message": status_msg, "type": "model_loading"}}
         )
 
-    model = get_model()
-    if model is None:
-        update_tts_status(request_id, TTSStatus.ERROR, error_message="Model not loaded")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={"error": {"message": "Model not loaded", "type": "model_error"}}
-        )
+    model, variant = await resolve_request_model(request_id, model_name, language_id)
 
     # Log memory usage before processing
     initial_memory = None
@@ -686,6 +764,9 @@ async def generate_speech_sse(
     bits_per_sample = 16
     total_audio_chunks = 0
     total_input_tokens = len(text.split())  # Rough token count
+    trimmed_seconds = 0.0
+    pause_ms = 0
+    stitcher = StreamStitcher(sample_rate)
     
     try:
         # Get parameters with defaults
@@ -742,42 +823,52 @@ async def generate_speech_sse(
             # Use torch.no_grad() to prevent gradient accumulation
             with torch.no_grad():
                 # Run TTS generation in executor to avoid blocking
-                audio_tensor = await loop.run_in_executor(
-                    None,
-                    lambda: model.generate(
-                        text=chunk,
-                        audio_prompt_path=voice_sample_path,
-                        exaggeration=exaggeration,
-                        cfg_weight=cfg_weight,
-                        temperature=temperature,
-                        **({'language_id': language_id} if is_multilingual() else {})
+                async with get_inference_scheduler().slot(STREAMING, request_id, len(chunk)):
+                    generation_started = time.perf_counter()
+                    audio_tensor = await loop.run_in_executor(
+                        None,
+                        lambda: generate_conditioned(
+                            model,
+                            text=chunk,
+                            audio_prompt_path=voice_sample_path,
+                            exaggeration=exaggeration,
+                            cfg_weight=cfg_weight,
+                            temperature=temperature,
+                            **({'language_id': language_id} if variant.multilingual else {})
+                        )
                     )
-                )
                 
                 # Ensure tensor is on CPU for processing
                 if hasattr(audio_tensor, 'cpu'):
                     audio_tensor = audio_tensor.cpu()
+                record_chunk_audio(language_id, chunk, audio_tensor.shape[-1] / model.sr)
+                get_processing_estimator().record(
+                    len(chunk), time.perf_counter() - generation_started, language_id, voice_key(voice_sample_path)
+                )
 
-                # Convert tensor to raw 16-bit PCM data
-                audio_tensor = torch.clamp(audio_tensor, -1.0, 1.0)
-                audio_tensor_int = (audio_tensor * 32767).to(torch.int16)
-                pcm_data = audio_tensor_int.numpy().tobytes()
-                
-                # Base64 encode the raw PCM data
-                audio_base64 = base64.b64encode(pcm_data).decode('utf-8')
-                
-                # Create SSE event for this audio chunk
-                sse_event = SSEAudioDelta(audio=audio_base64)
-                
-                # Format as SSE event
-                sse_data = f"data: {sse_event.model_dump_json()}\n\n"
-                yield sse_data
+                audio_tensor, chunk_trimmed_seconds = trim_silence(audio_tensor, model.sr)
+                trimmed_seconds += chunk_trimmed_seconds
+
+                # Stitch onto the previous chunk; only the crossfade tail is held back
+                ready = stitcher.push(audio_tensor, pause_ms)
+                pause_ms = pause_after_text(chunk)
                 
-                total_audio_chunks += 1
+                if ready.shape[-1] > 0:
+                    # Base64 encode the raw 16-bit PCM data
+                    audio_base64 = base64.b64encode(pcm16_bytes(ready)).decode('utf-8')
+                    
+                    # Create SSE event for this audio chunk
+                    sse_event = SSEAudioDelta(audio=audio_base64)
+                    
+                    # Format as SSE event
+                    sse_data = f"data: {sse_event.model_dump_json()}\n\n"
+                    yield sse_data
+                    
+                    total_audio_chunks += 1
+                    del audio_base64
                 
                 # Clean up this chunk
-                safe_delete_tensors(audio_tensor, audio_tensor_int)
-                del pcm_data
+                safe_delete_tensors(audio_tensor, ready)
             
             # Periodic memory cleanup during generation
             if i > 0 and i % 3 == 0:  # Every 3 chunks
@@ -786,6 +877,12 @@ async def generate_speech_sse(
                 if torch.cuda.is_available():
                     torch.cuda.empty_cache()
         
+        # End of the last chunk, held back for a crossfade that never came
+        tail = stitcher.flush()
+        if tail is not None and tail.shape[-1] > 0:
+            sse_event = SSEAudioDelta(audio=base64.b64encode(pcm16_bytes(tail)).decode('utf-8'))
+            yield f"data: {sse_event.model_dump_json()}\n\n"
+        
         # Send completion event
         total_output_tokens = total_audio_chunks * 50  # Rough estimate
         total_tokens = total_input_tokens + total_output_tokens
@@ -803,7 +900,8 @@ async def generate_speech_sse(
         
         # Mark as completed
         update_tts_status(request_id, TTSStatus.COMPLETED, "SSE audio generation completed")
-        print(f"✓ SSE audio generation completed. Total chunks: {total_audio_chunks}")
+        print(f"✓ SSE audio generation completed. Total chunks: {total_audio_chunks}, "
+              f"trimmed {trimmed_seconds:.2f}s of edge silence")
         
     except Exception as e:
         # Update status with error
@@ -856,6 +954,7 @@ async def text_to_speech(request: TTSRequest):
     
     voice_sample_path, language_id = resolve_voice_path_and_language(request.voice)
     print(f"🎙️ Resolved voice: {request.voice} -> {voice_sample_path}, lang: {language_id}")
+    validate_requested_model(request.model, language_id)
     
     # Check if SSE streaming is requested
     if request.stream_format == "sse":
@@ -871,7 +970,8 @@ async def text_to_speech(request: TTSRequest):
                 temperature=request.temperature,
                 streaming_chunk_size=request.streaming_chunk_size,
                 streaming_strategy=request.streaming_strategy,
-                streaming_quality=request.streaming_quality
+                streaming_quality=request.streaming_quality,
+                model_name=request.model
             ),
             media_type="text/event-stream",
             headers={
@@ -888,7 +988,8 @@ async def text_to_speech(request: TTSRequest):
             language_id=language_id,
             exaggeration=request.exaggeration,
             cfg_weight=request.cfg_weight,
-            temperature=request.temperature
+            temperature=request.temperature,
+            model_name=request.model
         )
         
         # Create response
@@ -918,6 +1019,7 @@ async def text_to_speech(request: TTSRequest):
 )
 async def text_to_speech_with_upload(
     input: str = Form(..., description="The text to generate audio for", min_length=1, max_length=3000),
+    model: Optional[str] = Form(None, description="Model variant to use (see /v1/models)"),
     voice: Optional[str] = Form("alloy", description="Voice name from library or OpenAI voice name (defaults to configured sample)"),
     response_format: Optional[str] = Form("wav", description="Audio format (always returns WAV)"),
     speed: Optional[float] = Form(1.0, description="Speed of speech (ignored)"),
@@ -971,6 +1073,8 @@ async def text_to_speech_with_upload(
     if not voice_file:
         voice_sample_path, language_id = resolve_voice_path_and_language(voice)
     
+    validate_requested_model(model, language_id)
+    
     # If a file is uploaded, it takes priority over voice name
     if voice_file:
         try:
@@ -1023,7 +1127,8 @@ async def text_to_speech_with_upload(
                         temperature=temperature,
                         streaming_chunk_size=streaming_chunk_size,
                         streaming_strategy=streaming_strategy,
-                        streaming_quality=streaming_quality
+                        streaming_quality=streaming_quality,
+                        model_name=model
                     ):
                         yield sse_event
                 finally:
@@ -1054,7 +1159,8 @@ async def text_to_speech_with_upload(
                 language_id=language_id,
                 exaggeration=exaggeration,
                 cfg_weight=cfg_weight,
-                temperature=temperature
+                temperature=temperature,
+                model_name=model
             )
             
             # Create response
@@ -1098,6 +1204,7 @@ async def stream_text_to_speech(request: TTSRequest):
     
     voice_sample_path, language_id = resolve_voice_path_and_language(request.voice)
     print(f"🎙️ Resolved voice: {request.voice} -> {voice_sample_path}, lang: {language_id}")
+    validate_requested_model(request.model, language_id)
     
     # Create streaming response
     return StreamingResponse(
@@ -1110,7 +1217,8 @@ async def stream_text_to_speech(request: TTSRequest):
             temperature=request.temperature,
             streaming_chunk_size=request.streaming_chunk_size,
             streaming_strategy=request.streaming_strategy,
-            streaming_quality=request.streaming_quality
+            streaming_quality=request.streaming_quality,
+            model_name=request.model
         ),
         media_type="audio/wav",
         headers={
@@ -1135,6 +1243,7 @@ async def stream_text_to_speech(request: TTSRequest):
 )
 async def stream_text_to_speech_with_upload(
     input: str = Form(..., description="The text to generate audio for", min_length=1, max_length=3000),
+    model: Optional[str] = Form(None, description="Model variant to use (see /v1/models)"),
     voice: Optional[str] = Form("alloy", description="Voice name from library or OpenAI voice name (defaults to configured sample)"),
     response_format: Optional[str] = Form("wav", description="Audio format (always returns WAV)"),
     speed: Optional[float] = Form(1.0, description="Speed of speech (ignored)"),
@@ -1179,6 +1288,8 @@ async def stream_text_to_speech_with_upload(
     if not voice_file:
         voice_sample_path, language_id = resolve_voice_path_and_language(voice)
     
+    validate_requested_model(model, language_id)
+    
     # If a file is uploaded, it takes priority over voice name
     if voice_file:
         try:
@@ -1229,7 +1340,8 @@ async def stream_text_to_speech_with_upload(
                 # ddim_steps=Config.SAMPLING_STEPS, # REMOVED: generate_speech_streaming doesn't take ddim_steps
                 streaming_chunk_size=streaming_chunk_size,
                 streaming_strategy=streaming_strategy,
-                streaming_quality=streaming_quality
+                streaming_quality=streaming_quality,
+                model_name=model
             ):
                 yield chunk
         finally:
@@ -16,6 +16,10 @@ from app.core import (
     get_version,
     get_version_info
 )
+from app.core.chunk_planner import get_planner_stats
+from app.core.inference_scheduler import get_inference_scheduler
+from app.core.processing_estimator import get_processing_estimator
+from app.core.silence import get_trim_stats
 
 # Create router with aliasing support
 base_router = APIRouter()
@@ -94,6 +98,16 @@ async def get_tts_progress() -> Dict[str, Any]:
         }
 
 
+@router.get(
+    "/status/scheduler",
+    summary="Get inference scheduler metrics",
+    description="Queue depth, running chunks and wait times per priority class (streaming, buffered, long_text)"
+)
+async def get_scheduler_status() -> Dict[str, Any]:
+    """Get inference scheduler metrics"""
+    return get_inference_scheduler().stats()
+
+
 @router.get(
     "/status/history",
     summary="Get TTS request history",
@@ -123,6 +137,10 @@ async def get_processing_statistics(
 ) -> Dict[str, Any]:
     """Get TTS processing statistics"""
     stats = get_tts_statistics()
+    stats["chunk_planner"] = get_planner_stats()
+    stats["processing_estimator"] = get_processing_estimator().stats()
+    stats["silence_trimming"] = get_trim_stats()
+    stats["inference_scheduler"] = get_inference_scheduler().stats()
     
     if include_memory:
         try:
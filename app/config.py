@@ -3,7 +3,6 @@ Configuration management for Chatterbox TTS API
 """
 
 import os
-import torch
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -17,6 +16,16 @@ class Config:
     HOST = os.getenv('HOST', '0.0.0.0')
     PORT = int(os.getenv('PORT', 4123))
     
+    # Multi-worker serving: weights are loaded once in a parent process and the
+    # uvicorn workers are forked from it, sharing them copy-on-write (CPU only;
+    # on CUDA/MPS every worker loads its own model)
+    WORKERS = int(os.getenv('WORKERS', 1))
+    WORKER_TORCH_THREADS = int(os.getenv('WORKER_TORCH_THREADS', 0))  # 0 = split CPU cores evenly
+    SHARED_STATE_DIR = os.getenv('SHARED_STATE_DIR', './data/runtime')
+    
+    # Startup profiling: write the timed startup phases as a Chrome trace (empty = don't write)
+    STARTUP_PROFILE_TRACE_PATH = os.getenv('STARTUP_PROFILE_TRACE_PATH', '')
+    
     # TTS Model settings
     EXAGGERATION: float = float(os.getenv("EXAGGERATION", "0.5"))
     CFG_WEIGHT: float = float(os.getenv("CFG_WEIGHT", "0.5"))
@@ -26,11 +35,22 @@ class Config:
     # Text processing
     MAX_CHUNK_LENGTH = int(os.getenv('MAX_CHUNK_LENGTH', 280))
     MAX_TOTAL_LENGTH = int(os.getenv('MAX_TOTAL_LENGTH', 3000))
+    # Chunk planning: "tokens" packs sentences up to a text-token and speech-duration
+    # budget measured with the model's tokenizer; "characters" uses MAX_CHUNK_LENGTH
+    CHUNK_PLANNER = os.getenv('CHUNK_PLANNER', 'tokens').strip().lower()
+    MAX_CHUNK_TOKENS = int(os.getenv('MAX_CHUNK_TOKENS', 400))
+    MAX_CHUNK_SPEECH_SECONDS = float(os.getenv('MAX_CHUNK_SPEECH_SECONDS', 30))  # Model stops at ~40s of speech
+    CHUNK_TOKEN_CACHE_SIZE = int(os.getenv('CHUNK_TOKEN_CACHE_SIZE', 4096))
+    TEXT_PLAN_CACHE_SIZE = int(os.getenv('TEXT_PLAN_CACHE_SIZE', 256))  # Memoized text plans
+    # Fraction of normalize_text calls that print replacement statistics (0 = never, 1 = always)
+    TEXT_NORMALIZATION_STATS_SAMPLE_RATE = float(os.getenv('TEXT_NORMALIZATION_STATS_SAMPLE_RATE', 0.01))
     
     # Voice and model settings
     VOICE_SAMPLE_PATH = os.getenv('VOICE_SAMPLE_PATH', './voice-sample.mp3')
     DEVICE_OVERRIDE = os.getenv('DEVICE', 'auto')
     MODEL_CACHE_DIR = os.getenv('MODEL_CACHE_DIR', './models')
+    # Inference precision: fp32, or bf16 (falls back to fp32 if the hardware lacks support)
+    PRECISION = os.getenv('PRECISION', 'fp32').strip().lower()
     
     # Voice library settings
     VOICE_LIBRARY_DIR = os.getenv('VOICE_LIBRARY_DIR', './voices')
@@ -40,8 +60,46 @@ class Config:
     LONG_TEXT_MAX_LENGTH = int(os.getenv('LONG_TEXT_MAX_LENGTH', 100000))
     LONG_TEXT_CHUNK_SIZE = int(os.getenv('LONG_TEXT_CHUNK_SIZE', 2500))
     LONG_TEXT_SILENCE_PADDING_MS = int(os.getenv('LONG_TEXT_SILENCE_PADDING_MS', 200))
+    LONG_TEXT_PARAGRAPH_PAUSE_MS = int(os.getenv('LONG_TEXT_PARAGRAPH_PAUSE_MS', 600))
+    # Pauses between chunks, picked by the punctuation that ends the chunk
+    PAUSE_CLAUSE_MS = int(os.getenv('PAUSE_CLAUSE_MS', 150))
+    PAUSE_SENTENCE_MS = int(os.getenv('PAUSE_SENTENCE_MS', 350))
+    # Equal-power crossfade at every joint between chunks stitched in memory
+    CROSSFADE_MS = int(os.getenv('CROSSFADE_MS', 15))
+    # Near-silence trimmed from the edges of every generated chunk before stitching
+    SILENCE_TRIM_ENABLED = os.getenv('SILENCE_TRIM_ENABLED', 'true').lower() == 'true'
+    SILENCE_TRIM_THRESHOLD_DB = float(os.getenv('SILENCE_TRIM_THRESHOLD_DB', -40))  # Relative to the loudest frame
+    SILENCE_TRIM_KEEP_MS = int(os.getenv('SILENCE_TRIM_KEEP_MS', 30))
+    LONG_TEXT_UNIT_MAX_RETRIES = int(os.getenv('LONG_TEXT_UNIT_MAX_RETRIES', 2))
     LONG_TEXT_JOB_RETENTION_DAYS = int(os.getenv('LONG_TEXT_JOB_RETENTION_DAYS', 7))
     LONG_TEXT_MAX_CONCURRENT_JOBS = int(os.getenv('LONG_TEXT_MAX_CONCURRENT_JOBS', 3))
+    # Model calls (chunks) run at the same time; waiting chunks are ordered by priority class,
+    # fair share across requests/jobs and age (see app/core/inference_scheduler.py)
+    INFERENCE_CONCURRENCY = int(os.getenv('INFERENCE_CONCURRENCY', 1))
+    SCHEDULER_AGING_SECONDS = float(os.getenv('SCHEDULER_AGING_SECONDS', 15.0))
+    # Units of one job generated at the same time, unless the request asks for a fan-out (up to the max)
+    LONG_TEXT_JOB_PARALLELISM = int(os.getenv('LONG_TEXT_JOB_PARALLELISM', 1))
+    LONG_TEXT_MAX_JOB_PARALLELISM = int(os.getenv('LONG_TEXT_MAX_JOB_PARALLELISM', 4))
+    # SQLite index of job metadata for listing/search/cleanup (empty = <LONG_TEXT_DATA_DIR>/index.db)
+    LONG_TEXT_INDEX_PATH = os.getenv('LONG_TEXT_INDEX_PATH', '')
+    # Durable SQLite queue of jobs waiting for a processing slot (empty = <LONG_TEXT_DATA_DIR>/queue.db)
+    LONG_TEXT_QUEUE_PATH = os.getenv('LONG_TEXT_QUEUE_PATH', '')
+    # A running job's lease is renewed while it runs; another worker takes the job once it expires
+    LONG_TEXT_QUEUE_LEASE_SECONDS = float(os.getenv('LONG_TEXT_QUEUE_LEASE_SECONDS', 60.0))
+    # Seconds between checks for jobs queued by other worker processes or whose lease expired
+    LONG_TEXT_QUEUE_POLL_SECONDS = float(os.getenv('LONG_TEXT_QUEUE_POLL_SECONDS', 5.0))
+    # Leases of a job that may end with its worker dying before the job is failed
+    LONG_TEXT_QUEUE_MAX_ATTEMPTS = int(os.getenv('LONG_TEXT_QUEUE_MAX_ATTEMPTS', 3))
+    # Seconds between write-behind flushes of running jobs' progress to disk (0 = write through)
+    LONG_TEXT_STATE_FLUSH_INTERVAL = float(os.getenv('LONG_TEXT_STATE_FLUSH_INTERVAL', 2.0))
+    # Recent job progress events kept for SSE clients resuming with Last-Event-ID
+    LONG_TEXT_EVENT_HISTORY_SIZE = int(os.getenv('LONG_TEXT_EVENT_HISTORY_SIZE', 1000))
+    # SQLite log of job progress events shared by the worker processes (empty = <LONG_TEXT_DATA_DIR>/events.db)
+    LONG_TEXT_EVENT_LOG_PATH = os.getenv('LONG_TEXT_EVENT_LOG_PATH', '')
+    # Seconds between checks of the event log for events published by other worker processes
+    LONG_TEXT_EVENT_POLL_SECONDS = float(os.getenv('LONG_TEXT_EVENT_POLL_SECONDS', 0.5))
+    # Learned per-chunk generation times, kept across restarts (empty = memory only)
+    PROCESSING_ESTIMATOR_PATH = os.getenv('PROCESSING_ESTIMATOR_PATH', './data/processing_estimator.json')
 
     # Multilingual model settings
     USE_MULTILINGUAL_MODEL: bool = os.getenv("USE_MULTILINGUAL_MODEL", "false").lower() == "true"
@@ -49,6 +107,13 @@ class Config:
     # Indonesian Optimization
     USE_INDONESIAN_OPTIMIZED_MODEL = os.getenv('USE_INDONESIAN_OPTIMIZED_MODEL', 'true').lower() == 'true'
     INDONESIAN_MODEL_REPO = os.getenv('INDONESIAN_MODEL_REPO', 'grandhigh/Chatterbox-TTS-Indonesian')
+
+    # Model registry settings (several variants can be resident at once)
+    # Empty DEFAULT_MODEL_VARIANT derives the default from the flags above
+    DEFAULT_MODEL_VARIANT = os.getenv('DEFAULT_MODEL_VARIANT', '').strip().lower()
+    ENABLED_MODEL_VARIANTS = os.getenv('ENABLED_MODEL_VARIANTS', 'standard,multilingual,indonesian')
+    MAX_RESIDENT_MODELS = int(os.getenv('MAX_RESIDENT_MODELS', 2))
+    MODEL_MEMORY_BUDGET_MB = int(os.getenv('MODEL_MEMORY_BUDGET_MB', 0))  # 0 = no byte budget
     
     # Memory management settings
     MEMORY_CLEANUP_INTERVAL = int(os.getenv('MEMORY_CLEANUP_INTERVAL', 5))
@@ -71,6 +136,18 @@ class Config:
             raise ValueError(f"MAX_CHUNK_LENGTH must be positive, got {cls.MAX_CHUNK_LENGTH}")
         if cls.MAX_TOTAL_LENGTH <= 0:
             raise ValueError(f"MAX_TOTAL_LENGTH must be positive, got {cls.MAX_TOTAL_LENGTH}")
+        if cls.CHUNK_PLANNER not in ('tokens', 'characters'):
+            raise ValueError(f"CHUNK_PLANNER must be 'tokens' or 'characters', got {cls.CHUNK_PLANNER}")
+        if cls.MAX_CHUNK_TOKENS <= 0:
+            raise ValueError(f"MAX_CHUNK_TOKENS must be positive, got {cls.MAX_CHUNK_TOKENS}")
+        if cls.MAX_CHUNK_SPEECH_SECONDS <= 0:
+            raise ValueError(f"MAX_CHUNK_SPEECH_SECONDS must be positive, got {cls.MAX_CHUNK_SPEECH_SECONDS}")
+        if cls.CHUNK_TOKEN_CACHE_SIZE <= 0:
+            raise ValueError(f"CHUNK_TOKEN_CACHE_SIZE must be positive, got {cls.CHUNK_TOKEN_CACHE_SIZE}")
+        if cls.TEXT_PLAN_CACHE_SIZE <= 0:
+            raise ValueError(f"TEXT_PLAN_CACHE_SIZE must be positive, got {cls.TEXT_PLAN_CACHE_SIZE}")
+        if not (0.0 <= cls.TEXT_NORMALIZATION_STATS_SAMPLE_RATE <= 1.0):
+            raise ValueError(f"TEXT_NORMALIZATION_STATS_SAMPLE_RATE must be between 0 and 1, got {cls.TEXT_NORMALIZATION_STATS_SAMPLE_RATE}")
         if cls.MEMORY_CLEANUP_INTERVAL <= 0:
             raise ValueError(f"MEMORY_CLEANUP_INTERVAL must be positive, got {cls.MEMORY_CLEANUP_INTERVAL}")
         if cls.CUDA_CACHE_CLEAR_INTERVAL <= 0:
@@ -83,10 +160,82 @@ class Config:
             raise ValueError(f"LONG_TEXT_CHUNK_SIZE ({cls.LONG_TEXT_CHUNK_SIZE}) must be less than MAX_TOTAL_LENGTH ({cls.MAX_TOTAL_LENGTH})")
         if cls.LONG_TEXT_SILENCE_PADDING_MS < 0:
             raise ValueError(f"LONG_TEXT_SILENCE_PADDING_MS must be non-negative, got {cls.LONG_TEXT_SILENCE_PADDING_MS}")
+        if cls.LONG_TEXT_PARAGRAPH_PAUSE_MS < 0:
+            raise ValueError(f"LONG_TEXT_PARAGRAPH_PAUSE_MS must be non-negative, got {cls.LONG_TEXT_PARAGRAPH_PAUSE_MS}")
+        if cls.PAUSE_CLAUSE_MS < 0:
+            raise ValueError(f"PAUSE_CLAUSE_MS must be non-negative, got {cls.PAUSE_CLAUSE_MS}")
+        if cls.PAUSE_SENTENCE_MS < 0:
+            raise ValueError(f"PAUSE_SENTENCE_MS must be non-negative, got {cls.PAUSE_SENTENCE_MS}")
+        if cls.CROSSFADE_MS < 0:
+            raise ValueError(f"CROSSFADE_MS must be non-negative, got {cls.CROSSFADE_MS}")
+        if cls.SILENCE_TRIM_THRESHOLD_DB >= 0:
+            raise ValueError(f"SILENCE_TRIM_THRESHOLD_DB must be negative, got {cls.SILENCE_TRIM_THRESHOLD_DB}")
+        if cls.SILENCE_TRIM_KEEP_MS < 0:
+            raise ValueError(f"SILENCE_TRIM_KEEP_MS must be non-negative, got {cls.SILENCE_TRIM_KEEP_MS}")
+        if cls.LONG_TEXT_UNIT_MAX_RETRIES < 0:
+            raise ValueError(f"LONG_TEXT_UNIT_MAX_RETRIES must be non-negative, got {cls.LONG_TEXT_UNIT_MAX_RETRIES}")
         if cls.LONG_TEXT_JOB_RETENTION_DAYS <= 0:
             raise ValueError(f"LONG_TEXT_JOB_RETENTION_DAYS must be positive, got {cls.LONG_TEXT_JOB_RETENTION_DAYS}")
         if cls.LONG_TEXT_MAX_CONCURRENT_JOBS <= 0:
             raise ValueError(f"LONG_TEXT_MAX_CONCURRENT_JOBS must be positive, got {cls.LONG_TEXT_MAX_CONCURRENT_JOBS}")
+        if cls.INFERENCE_CONCURRENCY <= 0:
+            raise ValueError(f"INFERENCE_CONCURRENCY must be positive, got {cls.INFERENCE_CONCURRENCY}")
+        if cls.SCHEDULER_AGING_SECONDS < 0:
+            raise ValueError(f"SCHEDULER_AGING_SECONDS must be non-negative, got {cls.SCHEDULER_AGING_SECONDS}")
+        if cls.LONG_TEXT_MAX_JOB_PARALLELISM <= 0:
+            raise ValueError(f"LONG_TEXT_MAX_JOB_PARALLELISM must be positive, got {cls.LONG_TEXT_MAX_JOB_PARALLELISM}")
+        if not 1 <= cls.LONG_TEXT_JOB_PARALLELISM <= cls.LONG_TEXT_MAX_JOB_PARALLELISM:
+            raise ValueError(f"LONG_TEXT_JOB_PARALLELISM must be between 1 and LONG_TEXT_MAX_JOB_PARALLELISM "
+                             f"({cls.LONG_TEXT_MAX_JOB_PARALLELISM}), got {cls.LONG_TEXT_JOB_PARALLELISM}")
+        if cls.LONG_TEXT_QUEUE_LEASE_SECONDS <= 0:
+            raise ValueError(f"LONG_TEXT_QUEUE_LEASE_SECONDS must be positive, got {cls.LONG_TEXT_QUEUE_LEASE_SECONDS}")
+        if cls.LONG_TEXT_QUEUE_POLL_SECONDS <= 0:
+            raise ValueError(f"LONG_TEXT_QUEUE_POLL_SECONDS must be positive, got {cls.LONG_TEXT_QUEUE_POLL_SECONDS}")
+        if cls.LONG_TEXT_QUEUE_MAX_ATTEMPTS <= 0:
+            raise ValueError(f"LONG_TEXT_QUEUE_MAX_ATTEMPTS must be positive, got {cls.LONG_TEXT_QUEUE_MAX_ATTEMPTS}")
+        if cls.LONG_TEXT_STATE_FLUSH_INTERVAL < 0:
+            raise ValueError(f"LONG_TEXT_STATE_FLUSH_INTERVAL must be non-negative, got {cls.LONG_TEXT_STATE_FLUSH_INTERVAL}")
+        if cls.LONG_TEXT_EVENT_HISTORY_SIZE <= 0:
+            raise ValueError(f"LONG_TEXT_EVENT_HISTORY_SIZE must be positive, got {cls.LONG_TEXT_EVENT_HISTORY_SIZE}")
+        if cls.LONG_TEXT_EVENT_POLL_SECONDS <= 0:
+            raise ValueError(f"LONG_TEXT_EVENT_POLL_SECONDS must be positive, got {cls.LONG_TEXT_EVENT_POLL_SECONDS}")
+        if cls.WORKERS <= 0:
+            raise ValueError(f"WORKERS must be positive, got {cls.WORKERS}")
+        if cls.WORKER_TORCH_THREADS < 0:
+            raise ValueError(f"WORKER_TORCH_THREADS must be non-negative, got {cls.WORKER_TORCH_THREADS}")
+        if cls.PRECISION not in ('fp32', 'bf16'):
+            raise ValueError(f"PRECISION must be 'fp32' or 'bf16', got {cls.PRECISION}")
+        valid_variants = ('standard', 'multilingual', 'indonesian')
+        if cls.DEFAULT_MODEL_VARIANT and cls.DEFAULT_MODEL_VARIANT not in valid_variants:
+            raise ValueError(f"DEFAULT_MODEL_VARIANT must be one of {', '.join(valid_variants)}, got {cls.DEFAULT_MODEL_VARIANT}")
+        for variant in cls.get_enabled_model_variants():
+            if variant not in valid_variants:
+                raise ValueError(f"ENABLED_MODEL_VARIANTS contains unknown variant '{variant}'")
+        if cls.MAX_RESIDENT_MODELS < 0:
+            raise ValueError(f"MAX_RESIDENT_MODELS must be non-negative, got {cls.MAX_RESIDENT_MODELS}")
+        if cls.MODEL_MEMORY_BUDGET_MB < 0:
+            raise ValueError(f"MODEL_MEMORY_BUDGET_MB must be non-negative, got {cls.MODEL_MEMORY_BUDGET_MB}")
+
+    @classmethod
+    def get_default_model_variant(cls) -> str:
+        """Variant loaded at startup and used when a request does not pick one"""
+        if cls.DEFAULT_MODEL_VARIANT:
+            return cls.DEFAULT_MODEL_VARIANT
+        # Indonesian weights only fit the standard architecture, so they win over multilingual
+        if cls.USE_INDONESIAN_OPTIMIZED_MODEL:
+            return 'indonesian'
+        if cls.USE_MULTILINGUAL_MODEL:
+            return 'multilingual'
+        return 'standard'
+
+    @classmethod
+    def get_enabled_model_variants(cls) -> list:
+        """Variants the registry may load; the default variant is always included"""
+        variants = [v.strip().lower() for v in cls.ENABLED_MODEL_VARIANTS.split(',') if v.strip()]
+        default = cls.get_default_model_variant()
+        if default not in variants:
+            variants.insert(0, default)
+        return variants
 
 
 def detect_device():
@@ -94,6 +243,7 @@ def detect_device():
     if Config.DEVICE_OVERRIDE.lower() != 'auto':
         return Config.DEVICE_OVERRIDE.lower()
     
+    import torch
     if torch.cuda.is_available():
         return 'cuda'
     elif hasattr(torch.backends, 'mps') and torch.backends.mps.is_available():
@@ -22,6 +22,7 @@ ENDPOINT_ALIASES: Dict[str, List[str]] = {
     "/voices/all-names": ["/v1/voices/all-names"],
     "/voices/cleanup": ["/v1/voices/cleanup"],
     "/health": ["/v1/health", "/status"],
+    "/startup-profile": ["/v1/startup-profile"],
     "/models": ["/v1/models"],
     "/config": ["/v1/config"],
     "/endpoints": ["/v1/endpoints", "/routes"],
@@ -1,12 +1,21 @@
 """
 Audio processing utilities for long text TTS concatenation
+
+Chunk files that are all 16-bit PCM WAV in one format (what the long-text
+processor writes) are concatenated by streaming: their PCM is read block by
+block, silence gaps are written as zeros, and the result goes to a WAV
+writer (whose header is patched on close) or is piped into ffmpeg, so
+memory use does not grow with the length of the job. Other inputs are
+loaded and joined with pydub.
 """
 
 import logging
 import os
+import subprocess
 import tempfile
+import wave
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import List, Optional, Tuple, Union
 
 try:
     from pydub import AudioSegment
@@ -30,6 +39,15 @@ from app.config import Config
 
 logger = logging.getLogger(__name__)
 
+# Frames read from a chunk file at a time when streaming
+STREAM_BLOCK_FRAMES = 64 * 1024
+
+# Largest gain change applied when normalizing chunk volume
+MAX_NORMALIZE_GAIN_DB = 20.0
+
+# Level chunks are normalized to (slightly below 0 dBFS to prevent clipping)
+NORMALIZE_TARGET_DBFS = -3.0
+
 
 class AudioConcatenationError(Exception):
     """Exception raised when audio concatenation fails"""
@@ -56,6 +74,7 @@ def concatenate_audio_files(audio_files: List[Union[str, Path]],
                           output_path: Union[str, Path],
                           output_format: str = "mp3",
                           silence_duration_ms: Optional[int] = None,
+                          silence_durations_ms: Optional[List[int]] = None,
                           crossfade_duration_ms: int = 0,
                           normalize_volume: bool = True,
                           remove_source_files: bool = False) -> dict:
@@ -67,6 +86,8 @@ def concatenate_audio_files(audio_files: List[Union[str, Path]],
         output_path: Path where the concatenated audio will be saved
         output_format: Output format ('mp3', 'wav', etc.)
         silence_duration_ms: Duration of silence between chunks (defaults to config)
+        silence_durations_ms: Per-gap silence durations (one per pair of adjacent
+            files), overriding silence_duration_ms
         crossfade_duration_ms: Duration of crossfade between chunks (0 for no crossfade)
         normalize_volume: Whether to normalize volume across all chunks
         remove_source_files: Whether to delete source files after concatenation
@@ -84,15 +105,286 @@ def concatenate_audio_files(audio_files: List[Union[str, Path]],
     Raises:
         AudioConcatenationError: If concatenation fails
     """
-    check_pydub_availability()
-
     if not audio_files:
         raise AudioConcatenationError("No audio files provided for concatenation")
 
     if silence_duration_ms is None:
         silence_duration_ms = Config.LONG_TEXT_SILENCE_PADDING_MS
 
-    logger.info(f"Concatenating {len(audio_files)} audio files with {silence_duration_ms}ms silence padding")
+    if silence_durations_ms is None:
+        silence_durations_ms = [silence_duration_ms] * (len(audio_files) - 1)
+        logger.info(f"Concatenating {len(audio_files)} audio files with {silence_duration_ms}ms silence padding")
+    elif len(silence_durations_ms) != len(audio_files) - 1:
+        raise AudioConcatenationError(
+            f"Expected {len(audio_files) - 1} silence durations, got {len(silence_durations_ms)}"
+        )
+    else:
+        logger.info(f"Concatenating {len(audio_files)} audio files with per-gap silence padding")
+
+    for audio_file in audio_files:
+        if not Path(audio_file).exists():
+            raise AudioConcatenationError(f"Audio file not found: {audio_file}")
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    stream_format = _streamable_format(audio_files)
+    if stream_format:
+        sample_rate, channels = stream_format
+        try:
+            frames = _concatenate_streaming(audio_files, output_path, output_format, sample_rate, channels,
+                                            silence_durations_ms, crossfade_duration_ms, normalize_volume)
+        except AudioConcatenationError:
+            raise
+        except Exception as e:
+            raise AudioConcatenationError(f"Audio concatenation failed: {e}")
+        duration_seconds = frames / sample_rate
+    else:
+        sample_rate, channels, duration_seconds = _concatenate_with_pydub(
+            audio_files, output_path, output_format, silence_durations_ms, crossfade_duration_ms, normalize_volume
+        )
+
+    file_size = output_path.stat().st_size
+    metadata = {
+        'output_path': str(output_path),
+        'duration_seconds': duration_seconds,
+        'file_size_bytes': file_size,
+        'sample_rate': sample_rate,
+        'channels': channels
+    }
+
+    logger.info(f"Audio concatenation successful: {duration_seconds:.1f}s, "
+               f"{file_size:,} bytes, saved to {output_path}")
+
+    # Clean up source files if requested
+    if remove_source_files:
+        for audio_file in audio_files:
+            try:
+                Path(audio_file).unlink()
+                logger.debug(f"Removed source file: {audio_file}")
+            except Exception as e:
+                logger.warning(f"Failed to remove source file {audio_file}: {e}")
+
+    return metadata
+
+
+def _streamable_format(audio_files: List[Union[str, Path]]) -> Optional[Tuple[int, int]]:
+    """(sample rate, channels) if every file is 16-bit PCM WAV of the same format, else None"""
+    formats = set()
+    for audio_file in audio_files:
+        try:
+            with wave.open(str(audio_file), 'rb') as reader:
+                if reader.getsampwidth() != 2:
+                    return None
+                formats.add((reader.getframerate(), reader.getnchannels()))
+        except (wave.Error, EOFError, OSError):
+            return None
+        if len(formats) > 1:
+            return None
+    return formats.pop()
+
+
+def _file_gain(audio_file: Union[str, Path], channels: int) -> float:
+    """Linear gain that brings a 16-bit WAV file to NORMALIZE_TARGET_DBFS (read in blocks)"""
+    import numpy as np
+
+    sum_squares = 0.0
+    samples = 0
+    with wave.open(str(audio_file), 'rb') as reader:
+        while True:
+            block = reader.readframes(STREAM_BLOCK_FRAMES)
+            if not block:
+                break
+            data = np.frombuffer(block, dtype='<i2').astype(np.float64)
+            sum_squares += float(np.dot(data, data))
+            samples += data.size
+    if not sum_squares:
+        return 1.0
+    dbfs = 20 * np.log10(np.sqrt(sum_squares / samples) / 32768)
+    gain_db = max(-MAX_NORMALIZE_GAIN_DB, min(MAX_NORMALIZE_GAIN_DB, NORMALIZE_TARGET_DBFS - dbfs))
+    return float(10 ** (gain_db / 20))
+
+
+def _to_int16_bytes(samples) -> bytes:
+    import numpy as np
+    return np.clip(np.round(samples), -32768, 32767).astype('<i2').tobytes()
+
+
+class _WavWriter:
+    """Writes 16-bit PCM WAV; the wave module patches the header's sizes on close"""
+
+    def __init__(self, output_path: Path, sample_rate: int, channels: int):
+        self._writer = wave.open(str(output_path), 'wb')
+        self._writer.setnchannels(channels)
+        self._writer.setsampwidth(2)
+        self._writer.setframerate(sample_rate)
+
+    def write(self, data: bytes):
+        self._writer.writeframesraw(data)
+
+    def close(self):
+        self._writer.close()
+
+    def abort(self):
+        self._writer.close()
+
+
+def ffmpeg_encode_command(output_format: str, sample_rate: int, channels: int, output: str) -> List[str]:
+    """ffmpeg command line that encodes 16-bit PCM read from stdin to `output` (a path or pipe:1)"""
+    export_params = _get_export_parameters(output_format)
+    command = [
+        AudioSegment.converter if PYDUB_AVAILABLE else "ffmpeg",
+        "-y", "-loglevel", "error",
+        "-f", "s16le", "-ar", str(sample_rate), "-ac", str(channels), "-i", "pipe:0",
+    ]
+    if export_params.get('bitrate'):
+        command += ["-b:a", export_params['bitrate']]
+    command += export_params.get('parameters', [])
+    command += ["-f", output_format, output]
+    return command
+
+
+class _FfmpegEncoder:
+    """Encodes 16-bit PCM piped to an ffmpeg process incrementally"""
+
+    def __init__(self, output_path: Path, output_format: str, sample_rate: int, channels: int):
+        command = ffmpeg_encode_command(output_format, sample_rate, channels, str(output_path))
+
+        # A file, not a pipe, so a chatty ffmpeg cannot block while we write its input
+        self._stderr = tempfile.TemporaryFile()
+        try:
+            self._process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL,
+                                             stderr=self._stderr)
+        except OSError as e:
+            self._stderr.close()
+            raise AudioConcatenationError(f"Could not start ffmpeg to encode {output_format}: {e}")
+
+    def _error_output(self) -> str:
+        self._stderr.seek(0)
+        return self._stderr.read().decode('utf-8', errors='replace').strip()
+
+    def write(self, data: bytes):
+        try:
+            self._process.stdin.write(data)
+        except BrokenPipeError:
+            self._process.wait()
+            raise AudioConcatenationError(f"ffmpeg exited while encoding: {self._error_output()}")
+
+    def close(self):
+        try:
+            self._process.stdin.close()
+        except BrokenPipeError:
+            pass
+        returncode = self._process.wait()
+        error_output = self._error_output()
+        self._stderr.close()
+        if returncode != 0:
+            raise AudioConcatenationError(f"ffmpeg failed with exit code {returncode}: {error_output}")
+
+    def abort(self):
+        self._process.kill()
+        self._process.wait()
+        self._stderr.close()
+
+
+def _concatenate_streaming(audio_files: List[Union[str, Path]], output_path: Path, output_format: str,
+                           sample_rate: int, channels: int, silence_durations_ms: List[int],
+                           crossfade_duration_ms: int, normalize_volume: bool) -> int:
+    """
+    Concatenate 16-bit PCM WAV files of one format into `output_path`, holding
+    at most one block (plus a crossfade tail) in memory. Returns the number of
+    frames written.
+    """
+    frame_bytes = 2 * channels
+    crossfade_bytes = int(sample_rate * crossfade_duration_ms / 1000) * frame_bytes
+    gains = [_file_gain(audio_file, channels) for audio_file in audio_files] if normalize_volume else None
+
+    if output_format.lower() == 'wav':
+        sink = _WavWriter(output_path, sample_rate, channels)
+    else:
+        sink = _FfmpegEncoder(output_path, output_format, sample_rate, channels)
+
+    written = 0
+    tail = b''  # last crossfade-length bytes written so far, held back to fade into what follows
+
+    def emit(data: bytes):
+        nonlocal written
+        if data:
+            sink.write(data)
+            written += len(data)
+
+    def file_data(i: int):
+        gap_bytes = int(sample_rate * silence_durations_ms[i - 1] / 1000) * frame_bytes if i else 0
+        if gap_bytes:
+            # The previous file fades out into the silence, so the audible gap stays gap_ms
+            yield bytes(gap_bytes + crossfade_bytes)
+        with wave.open(str(audio_files[i]), 'rb') as reader:
+            while True:
+                block = reader.readframes(STREAM_BLOCK_FRAMES)
+                if not block:
+                    break
+                if gains and gains[i] != 1.0:
+                    import numpy as np
+                    block = _to_int16_bytes(np.frombuffer(block, dtype='<i2') * gains[i])
+                yield block
+
+    try:
+        for i in range(len(audio_files)):
+            head = b''
+            pending = None  # output not yet written, once the joint with the tail is mixed
+            for data in file_data(i):
+                if pending is None:
+                    head += data
+                    if len(head) < len(tail):
+                        continue
+                    head, data = head[:len(tail)], head[len(tail):]
+                    pending = _crossfade_bytes(tail, head, channels)
+                pending += data
+                if len(pending) > crossfade_bytes:
+                    cut = len(pending) - crossfade_bytes
+                    emit(pending[:cut])
+                    pending = pending[cut:]
+
+            if pending is None:
+                # Shorter than the tail: only the end of the tail overlaps it
+                overlap = len(head)
+                pending = tail[:len(tail) - overlap] + _crossfade_bytes(tail[len(tail) - overlap:], head, channels)
+                if len(pending) > crossfade_bytes:
+                    cut = len(pending) - crossfade_bytes
+                    emit(pending[:cut])
+                    pending = pending[cut:]
+            tail = pending
+
+        emit(tail)
+        sink.close()
+    except BaseException:
+        sink.abort()
+        raise
+
+    return written // frame_bytes
+
+
+def _crossfade_bytes(tail: bytes, head: bytes, channels: int) -> bytes:
+    """Equal-power crossfade of two equal-length 16-bit PCM byte strings"""
+    import numpy as np
+    from app.core.stitching import equal_power_crossfade
+
+    if not tail:
+        return b''
+    tail_samples = np.frombuffer(tail, dtype='<i2').astype(np.float32).reshape(-1, channels).T
+    head_samples = np.frombuffer(head, dtype='<i2').astype(np.float32).reshape(-1, channels).T
+    return _to_int16_bytes(equal_power_crossfade(tail_samples, head_samples).T.reshape(-1))
+
+
+def _concatenate_with_pydub(audio_files: List[Union[str, Path]], output_path: Path, output_format: str,
+                            silence_durations_ms: List[int], crossfade_duration_ms: int,
+                            normalize_volume: bool) -> Tuple[int, int, float]:
+    """
+    Load every file with pydub and join them in memory (for inputs that are
+    not all 16-bit PCM WAV of one format). Returns the sample rate, channel
+    count and duration in seconds of the output.
+    """
+    check_pydub_availability()
 
     try:
         # Load all audio segments
@@ -132,63 +424,38 @@ def concatenate_audio_files(audio_files: List[Union[str, Path]],
         # Ensure all segments have the same sample rate and channels
         segments = _standardize_audio_properties(segments)
 
-        # Create silence segment for padding
-        silence = AudioSegment.silent(
-            duration=silence_duration_ms,
-            frame_rate=segments[0].frame_rate
-        )
+        # Silence segments for padding, one per distinct duration
+        silences = {
+            duration: AudioSegment.silent(duration=duration, frame_rate=segments[0].frame_rate)
+            for duration in set(silence_durations_ms) if duration > 0
+        }
 
         # Concatenate segments with silence or crossfade
-        result = segments[0]
-
-        for segment in segments[1:]:
+        pieces = [segments[0]]
+        for segment, gap_ms in zip(segments[1:], silence_durations_ms):
             if crossfade_duration_ms > 0:
                 # Add crossfade between segments
-                result = result.append(segment, crossfade=crossfade_duration_ms)
+                pieces[-1] = pieces[-1].append(segment, crossfade=crossfade_duration_ms)
             else:
                 # Add silence then append segment
-                if silence_duration_ms > 0:
-                    result = result + silence
-                result = result + segment
+                if gap_ms > 0:
+                    pieces.append(silences[gap_ms])
+                pieces.append(segment)
+        # One join instead of copying the growing result for every piece
+        reference = pieces[0]
+        pieces = [piece.set_frame_rate(reference.frame_rate).set_channels(reference.channels)
+                  .set_sample_width(reference.sample_width) for piece in pieces]
+        result = reference._spawn(b''.join(piece.raw_data for piece in pieces))
 
         # Export the concatenated audio
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Set export parameters based on format
         export_params = _get_export_parameters(output_format)
-
         result.export(
             str(output_path),
             format=output_format,
             **export_params
         )
 
-        # Get file metadata
-        file_size = output_path.stat().st_size
-        duration_seconds = len(result) / 1000.0
-
-        metadata = {
-            'output_path': str(output_path),
-            'duration_seconds': duration_seconds,
-            'file_size_bytes': file_size,
-            'sample_rate': result.frame_rate,
-            'channels': result.channels
-        }
-
-        logger.info(f"Audio concatenation successful: {duration_seconds:.1f}s, "
-                   f"{file_size:,} bytes, saved to {output_path}")
-
-        # Clean up source files if requested
-        if remove_source_files:
-            for audio_file in audio_files:
-                try:
-                    Path(audio_file).unlink()
-                    logger.debug(f"Removed source file: {audio_file}")
-                except Exception as e:
-                    logger.warning(f"Failed to remove source file {audio_file}: {e}")
-
-        return metadata
+        return result.frame_rate, result.channels, len(result) / 1000.0
 
     except AudioConcatenationError:
         raise
@@ -279,6 +546,11 @@ def _get_export_parameters(output_format: str) -> dict:
         export_params.update({
             'parameters': ['-acodec', 'pcm_s16le']  # 16-bit PCM
         })
+    elif output_format.lower() == 'opus':
+        export_params.update({
+            'bitrate': '64k',
+            'parameters': ['-acodec', 'libopus']  # Ogg Opus
+        })
 
     return export_params
 
@@ -3,18 +3,29 @@ Background task processing for long text TTS jobs
 """
 
 import asyncio
+import functools
 import logging
 import os
+import threading
+import time
 import traceback
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Set, Tuple
 
 from app.config import Config
-from app.core.long_text_jobs import get_job_manager
-from app.core.text_processing import split_text_for_long_generation, estimate_processing_time
+from app.core.long_text_jobs import file_digest, get_job_manager
+from app.core.chunk_planner import record_chunk_audio
+from app.core.inference_gate import generate_conditioned
+from app.core.inference_scheduler import LONG_TEXT, get_inference_scheduler
+from app.core.job_events import CHUNK_COMPLETED, CHUNK_STARTED, ETA, get_event_bus
+from app.core.job_queue import new_lease_owner
+from app.core.memory import cleanup_memory
+from app.core.processing_estimator import get_processing_estimator, voice_key
+from app.core.silence import trim_silence
+from app.core.tts_model import get_model_for_request, is_ready
 from app.core.audio_processing import concatenate_audio_files, AudioConcatenationError
-from app.api.endpoints.speech import generate_speech_internal, resolve_voice_path_and_language
+from app.api.endpoints.speech import resolve_voice_path_and_language
 from app.models.long_text import (
     LongTextJobStatus,
     LongTextJobMetadata,
@@ -25,13 +36,24 @@ logger = logging.getLogger(__name__)
 
 
 class LongTextProcessor:
-    """Processes long text TTS jobs in the background"""
+    """
+    Processes long text TTS jobs in the background. Jobs are taken from the
+    durable job queue by lease, up to LONG_TEXT_MAX_CONCURRENT_JOBS at a
+    time; leases are renewed while the jobs run.
+    """
 
     def __init__(self):
         self.job_manager = get_job_manager()
         self.active_tasks: Dict[str, asyncio.Task] = {}
         self.is_running = False
         self._worker_task: Optional[asyncio.Task] = None
+        self._lease_task: Optional[asyncio.Task] = None
+        self.lease_owner = new_lease_owner()
+        # Running jobs whose lease was removed or taken over by another worker
+        self._lost_leases: Set[str] = set()
+        # Running jobs leased again meanwhile (e.g. paused and resumed) -> attempts
+        # of the new lease, to run once the current run has exited
+        self._reruns: Dict[str, int] = {}
 
     async def start(self):
         """Start the background processor"""
@@ -39,8 +61,16 @@ class LongTextProcessor:
             return
 
         self.is_running = True
+        self.job_manager.queue_changed = asyncio.Event()
+        self.job_manager.start_state_flusher()
+
+        # Jobs interrupted by a shutdown or crash resume from their checkpoints
+        for job_id in self.job_manager.recover_interrupted_jobs():
+            logger.info(f"Re-queued interrupted job {job_id}")
+
         self._worker_task = asyncio.create_task(self._worker_loop())
-        logger.info("Long text processor started")
+        self._lease_task = asyncio.create_task(self._renew_leases())
+        logger.info(f"Long text processor started (lease owner {self.lease_owner})")
 
     async def stop(self):
         """Stop the background processor"""
@@ -49,7 +79,7 @@ class LongTextProcessor:
 
         self.is_running = False
 
-        # Cancel all active tasks
+        # Cancel all active tasks; their leases are released so the jobs keep their place
         for job_id, task in list(self.active_tasks.items()):
             logger.info(f"Cancelling active job: {job_id}")
             task.cancel()
@@ -58,15 +88,18 @@ class LongTextProcessor:
             except asyncio.CancelledError:
                 pass
 
-        # Cancel the worker task
-        if self._worker_task:
-            self._worker_task.cancel()
-            try:
-                await self._worker_task
-            except asyncio.CancelledError:
-                pass
+        # Cancel the worker and lease renewal tasks
+        for background_task in (self._worker_task, self._lease_task):
+            if background_task:
+                background_task.cancel()
+                try:
+                    await background_task
+                except asyncio.CancelledError:
+                    pass
 
         self.active_tasks.clear()
+        self._reruns.clear()
+        await self.job_manager.stop_state_flusher()
         logger.info("Long text processor stopped")
 
     async def submit_job(self, job_id: str):
@@ -74,37 +107,39 @@ class LongTextProcessor:
         if not self.is_running:
             raise RuntimeError("Processor is not running")
 
-        await self.job_manager.job_queue.put(job_id)
+        self.job_manager.enqueue_job(job_id)
         logger.info(f"Job {job_id} submitted for processing")
 
     async def _worker_loop(self):
-        """Main worker loop that processes jobs from the queue"""
+        """Main worker loop: lease queued jobs while a processing slot is free"""
         logger.info("Background worker loop started")
+        slots = asyncio.Semaphore(Config.LONG_TEXT_MAX_CONCURRENT_JOBS)
 
         while self.is_running:
             try:
-                # Wait for a job (with timeout to allow graceful shutdown)
+                await slots.acquire()
                 try:
-                    job_id = await asyncio.wait_for(
-                        self.job_manager.job_queue.get(),
-                        timeout=1.0
-                    )
-                except asyncio.TimeoutError:
+                    leased = await self._next_job()
+                except BaseException:
+                    slots.release()
+                    raise
+                job_id, attempts = leased
+
+                # Stopped while leasing: leave the job for the next start
+                if not self.is_running:
+                    self.job_manager.queue.release(job_id, self.lease_owner)
+                    slots.release()
+                    break
+
+                # Our own job, leased again while its run is still stopping (paused
+                # and resumed, or its lease lapsed): keep the lease and run the job
+                # again once that run has exited, in its slot
+                if job_id in self.active_tasks:
+                    self._reruns[job_id] = attempts
+                    slots.release()
                     continue
 
-                # Check if we have capacity to process more jobs
-                if len(self.active_tasks) >= Config.LONG_TEXT_MAX_CONCURRENT_JOBS:
-                    # Re-queue the job for later
-                    await self.job_manager.job_queue.put(job_id)
-                    await asyncio.sleep(1)  # Brief delay before checking again
-                    continue
-
-                # Start processing the job
-                task = asyncio.create_task(self._process_job(job_id))
-                self.active_tasks[job_id] = task
-
-                # Set up cleanup when task completes
-                task.add_done_callback(lambda t, jid=job_id: self._cleanup_task(jid))
+                self._start_job(job_id, attempts, slots)
 
             except asyncio.CancelledError:
                 break
@@ -114,155 +149,352 @@ class LongTextProcessor:
 
         logger.info("Background worker loop stopped")
 
-    def _cleanup_task(self, job_id: str):
+    def _start_job(self, job_id: str, attempts: int, slots: asyncio.Semaphore):
+        """Start processing a leased job in a slot already taken from `slots`"""
+        task = asyncio.create_task(self._run_leased_job(job_id, attempts))
+        self.active_tasks[job_id] = task
+
+        # Free the slot when the task completes
+        task.add_done_callback(lambda t, jid=job_id: self._cleanup_task(jid, slots))
+
+    async def _next_job(self) -> Tuple[str, int]:
+        """
+        Lease the next queued job, waiting until one is queued in this process
+        or, for jobs queued by other workers or whose lease expired, until the
+        next poll.
+        """
+        queue_changed = self.job_manager.queue_changed
+        while True:
+            # Cleared before looking, so a job queued meanwhile is not missed
+            queue_changed.clear()
+            leased = self.job_manager.queue.lease(self.lease_owner, Config.LONG_TEXT_QUEUE_LEASE_SECONDS)
+            if leased:
+                return leased
+            # asyncio.wait rather than wait_for, which can swallow a cancellation
+            waiter = asyncio.ensure_future(queue_changed.wait())
+            try:
+                await asyncio.wait({waiter}, timeout=Config.LONG_TEXT_QUEUE_POLL_SECONDS)
+            finally:
+                if not waiter.done():
+                    waiter.cancel()
+
+    async def _run_leased_job(self, job_id: str, attempts: int):
+        """Process a leased job, then take it off the queue (or give the lease back on shutdown)"""
+        queue = self.job_manager.queue
+        if attempts > Config.LONG_TEXT_QUEUE_MAX_ATTEMPTS:
+            await self._fail_job(job_id, f"Processing was interrupted {attempts - 1} times; not trying again")
+            queue.remove(job_id, self.lease_owner)
+            return
+
+        try:
+            await self._process_job(job_id)
+        finally:
+            if job_id in self._lost_leases:
+                self._lost_leases.discard(job_id)
+            elif not self.is_running:
+                queue.release(job_id, self.lease_owner)
+            elif job_id not in self._reruns:
+                # (A job leased again meanwhile stays queued for its next run)
+                queue.remove(job_id, self.lease_owner)
+
+    async def _renew_leases(self):
+        """Keep the leases of running jobs alive; stop jobs whose lease was lost"""
+        interval = Config.LONG_TEXT_QUEUE_LEASE_SECONDS / 3
+        while self.is_running:
+            try:
+                await asyncio.sleep(interval)
+                held = self.job_manager.queue.renew(self.lease_owner, Config.LONG_TEXT_QUEUE_LEASE_SECONDS)
+                for job_id, task in list(self.active_tasks.items()):
+                    if job_id not in held and not task.done():
+                        # Paused, cancelled or deleted by another worker, or taken
+                        # over after our lease expired: another worker owns it now
+                        logger.warning(f"Job {job_id}: Lease lost, stopping processing here")
+                        self._lost_leases.add(job_id)
+                        task.cancel()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error renewing job leases: {e}")
+
+    def _cleanup_task(self, job_id: str, slots: asyncio.Semaphore):
         """Clean up completed task"""
         if job_id in self.active_tasks:
             del self.active_tasks[job_id]
+        attempts = self._reruns.pop(job_id, None)
+        if attempts is not None and self.is_running:
+            self._start_job(job_id, attempts, slots)
+            return
+        slots.release()
+
+    def _synthesize_unit(self, model, variant, unit: LongTextChunk, output_path: Path,
+                         voice_path: str, language_id: str, parameters: Dict[str, Any]) -> Tuple[float, float]:
+        """
+        Generate one synthesis unit with a single model call, trim its edge
+        silence and save it as WAV (runs in an executor). Returns the generated
+        and trimmed durations in seconds.
+        """
+        import torch
+        import torchaudio as ta
+
+        generate_kwargs = {
+            "text": unit.text,
+            "audio_prompt_path": voice_path,
+            "exaggeration": parameters.get('exaggeration') if parameters.get('exaggeration') is not None else Config.EXAGGERATION,
+            "cfg_weight": parameters.get('cfg_weight') if parameters.get('cfg_weight') is not None else Config.CFG_WEIGHT,
+            "temperature": parameters.get('temperature') if parameters.get('temperature') is not None else Config.TEMPERATURE
+        }
+        if variant.multilingual:
+            generate_kwargs["language_id"] = language_id
+
+        with torch.no_grad():
+            audio = generate_conditioned(model, **generate_kwargs)
+            if audio is None or audio.dim() == 0 or audio.shape[-1] == 0:
+                raise ValueError("Model returned no audio")
+            audio = audio.detach().cpu()
+            if audio.dim() == 1:
+                audio = audio.unsqueeze(0)
+            generated_seconds = audio.shape[-1] / model.sr
+            audio, trimmed_seconds = trim_silence(audio, model.sr)
+
+        # Per-thread temporary name: a unit still generating after a pause must
+        # not collide with the same unit of the resumed job
+        tmp_path = output_path.with_name(f"{output_path.stem}.{threading.get_ident()}.tmp.wav")
+        # 16-bit PCM is what pydub reads natively when the units are concatenated
+        ta.save(str(tmp_path), audio, model.sr, format="wav", encoding="PCM_S", bits_per_sample=16)
+        os.replace(tmp_path, output_path)
+        return generated_seconds, trimmed_seconds
 
     async def _process_job(self, job_id: str):
-        """Process a single long text job"""
+        """
+        Process a single long text job. Its planned synthesis units are
+        generated up to the job's fan-out at a time, possibly finishing out of
+        order; the audio is assembled in unit order at the end. The job's
+        state lives in memory while it runs; progress is written behind and
+        pause/cancel requests arrive as an in-memory signal.
+        """
         logger.info(f"Starting processing for job {job_id}")
 
+        live = None
         try:
-            # Load job metadata
-            metadata = self.job_manager._load_job_metadata(job_id)
-            if not metadata:
+            live = self.job_manager.open_live_job(job_id)
+            if not live:
                 logger.error(f"Job {job_id} metadata not found")
                 return
+            metadata = live.metadata
+            if metadata.status not in [LongTextJobStatus.PENDING, LongTextJobStatus.CHUNKING, LongTextJobStatus.PROCESSING]:
+                logger.info(f"Job {job_id} is {metadata.status.value}, not processing it")
+                return
 
             # Update status to processing
             metadata.status = LongTextJobStatus.PROCESSING
-            metadata.processing_started_at = datetime.utcnow()
+            # Set again once the units to generate are known; a stale value would
+            # tell progressive streams that earlier units were skipped
+            metadata.current_chunk = None
+            if not metadata.processing_started_at:
+                metadata.processing_started_at = datetime.utcnow()
             self.job_manager._save_job_metadata(metadata)
+            self.job_manager.publish_status(metadata)
+
+            # Units are planned when the job is created; plan now for jobs
+            # created before that was the case
+            units = live.chunks
+            if not units:
+                input_text = self.job_manager._load_input_text(job_id)
+                if not input_text:
+                    await self._fail_job(job_id, "Input text not found")
+                    return
 
-            # Load input text
-            input_text = self.job_manager._load_input_text(job_id)
-            if not input_text:
-                await self._fail_job(job_id, "Input text not found")
-                return
-
-            # Phase 1: Text chunking
-            await self._update_job_status(job_id, LongTextJobStatus.CHUNKING, "Splitting text into chunks")
+                await self._update_job_status(job_id, LongTextJobStatus.CHUNKING, "Planning synthesis units")
+                units = self.job_manager.plan_job_units(input_text, metadata.voice, metadata.parameters)
+                if not units:
+                    await self._fail_job(job_id, "Failed to split text into chunks")
+                    return
 
-            chunks = split_text_for_long_generation(
-                input_text,
-                max_chunk_size=Config.LONG_TEXT_CHUNK_SIZE
-            )
+                metadata.total_chunks = len(units)
+                self.job_manager._save_job_metadata(metadata)
+                self.job_manager._save_chunks_data(job_id, units)
+                logger.info(f"Job {job_id}: Planned {len(units)} synthesis units")
 
-            if not chunks:
-                await self._fail_job(job_id, "Failed to split text into chunks")
+            if not is_ready():
+                await self._fail_job(job_id, "Model is not ready")
                 return
 
-            # Update metadata with actual chunk count
-            metadata.total_chunks = len(chunks)
-            self.job_manager._save_job_metadata(metadata)
-            self.job_manager._save_chunks_data(job_id, chunks)
-
-            logger.info(f"Job {job_id}: Split into {len(chunks)} chunks")
-
-            # Phase 2: Generate audio for each chunk
-            await self._update_job_status(job_id, LongTextJobStatus.PROCESSING, f"Generating audio for {len(chunks)} chunks")
-
             voice_path, language_id = resolve_voice_path_and_language(metadata.voice)
+            model, variant = await get_model_for_request(metadata.parameters.get('model'), language_id)
+
+            chunks_dir = self.job_manager._get_job_file_paths(job_id)['chunks_dir']
+
+            # Units whose audio on disk matches its recorded size and hash (a
+            # resumed, recovered or retried job) are kept; the rest are generated
+            loop = asyncio.get_event_loop()
+            completed = await loop.run_in_executor(None, self.job_manager.verify_chunk_audio, job_id, units)
+            pending = [unit for unit in units if not unit.audio_file]
+            # Units still to finish; the lowest is reported as the current unit,
+            # so every unit before current_chunk is done
+            unfinished = {unit.index for unit in pending}
+            metadata.completed_chunks = completed
+            metadata.current_chunk = pending[0].index if pending else None
+            self.job_manager.mark_job_dirty(job_id, chunks=True)
+            if completed:
+                logger.info(f"Job {job_id}: Resuming with {completed}/{len(units)} units already generated")
+
+            fan_out = self.job_manager.job_parallelism(metadata)
+            await self._update_job_status(
+                job_id, LongTextJobStatus.PROCESSING,
+                f"Generating audio for {len(pending)} of {len(units)} units"
+                + (f", {fan_out} at a time" if fan_out > 1 else "")
+            )
+            events = get_event_bus()
+            eta = self._publish_eta(metadata, units)
+            # Units wait for the model behind interactive requests, sharing the
+            # long-text share fairly with other jobs (per session when there is one)
+            scheduler = get_inference_scheduler()
+            flow = metadata.user_session_id or job_id
+            processed = 0
+            in_flight = 0
+
+            async def generate(unit: LongTextChunk):
+                nonlocal completed, eta, processed, in_flight
+                unit.processing_started_at = datetime.utcnow()
+                unit.processing_completed_at = None
+                unit.error = None
+                audio_filename = f"chunk_{unit.index + 1:03d}.wav"
+
+                logger.info(f"Job {job_id}: Processing unit {unit.index + 1}/{len(units)} ({len(unit.text)} chars)")
+                events.publish(job_id, CHUNK_STARTED, {
+                    "chunk": unit.index,
+                    "total_chunks": len(units),
+                    "characters": len(unit.text),
+                })
+
+                for attempt in range(Config.LONG_TEXT_UNIT_MAX_RETRIES + 1):
+                    unit.attempts += 1
+                    try:
+                        async with scheduler.slot(LONG_TEXT, flow, len(unit.text)):
+                            attempt_started = time.perf_counter()
+                            in_flight += 1
+                            try:
+                                generated_seconds, trimmed_seconds = await loop.run_in_executor(
+                                    None,
+                                    self._synthesize_unit,
+                                    model, variant, unit, chunks_dir / audio_filename,
+                                    voice_path, language_id, metadata.parameters
+                                )
+                                # Units generated side by side share the device; the
+                                # estimator learns each one's share of the elapsed time
+                                unit_seconds = (time.perf_counter() - attempt_started) / in_flight
+                            finally:
+                                in_flight -= 1
+                        unit.audio_seconds = round(generated_seconds - trimmed_seconds, 3)
+                        unit.trimmed_seconds = round(trimmed_seconds, 3)
+                        unit.audio_bytes, unit.audio_sha256 = await loop.run_in_executor(
+                            None, file_digest, chunks_dir / audio_filename
+                        )
+                        unit.audio_file = audio_filename
+                        unit.error = None
+                        get_processing_estimator().record(
+                            len(unit.text), unit_seconds, language_id, voice_key(voice_path)
+                        )
+                        break
+                    except Exception as e:
+                        unit.error = str(e)
+                        logger.warning(f"Job {job_id}: Unit {unit.index + 1} attempt {attempt + 1} failed: {e}")
+
+                unit.processing_completed_at = datetime.utcnow()
+                unit.duration_ms = int((unit.processing_completed_at - unit.processing_started_at).total_seconds() * 1000)
+
+                if unit.audio_file:
+                    completed += 1
+                    record_chunk_audio(language_id, unit.text, unit.audio_seconds + (unit.trimmed_seconds or 0.0))
+                    if unit.index in metadata.failed_chunks:
+                        metadata.failed_chunks.remove(unit.index)
+                else:
+                    logger.error(f"Job {job_id}: Failed unit text: '{unit.text[:200]}{'...' if len(unit.text) > 200 else ''}'")
+                    if unit.index not in metadata.failed_chunks:
+                        metadata.failed_chunks.append(unit.index)
+
+                # Update job progress
+                unfinished.discard(unit.index)
+                metadata.completed_chunks = completed
+                metadata.current_chunk = min(unfinished) if unfinished else unit.index
+                self.job_manager.mark_job_dirty(job_id, chunks=True)
+                events.publish(job_id, CHUNK_COMPLETED, {
+                    "chunk": unit.index,
+                    "total_chunks": len(units),
+                    "completed_chunks": completed,
+                    "progress": completed / len(units) * 100,
+                    "success": unit.audio_file is not None,
+                    "audio_seconds": unit.audio_seconds,
+                    "error": unit.error,
+                })
+                eta = self._publish_eta(metadata, units, eta)
+
+                processed += 1
+                if processed % Config.MEMORY_CLEANUP_INTERVAL == 0:
+                    cleanup_memory()
+
+            # Up to fan_out units are generated at once; each worker takes the
+            # lowest unit nobody has started, so they finish roughly in order
+            queue = iter(pending)
+
+            async def worker():
+                for unit in queue:
+                    # Check if job was paused or cancelled
+                    if live.stop_requested.is_set():
+                        return
+                    await generate(unit)
+
+            workers = [asyncio.ensure_future(worker()) for _ in range(min(fan_out, len(pending)))]
+            try:
+                await asyncio.gather(*workers)
+            finally:
+                # Do not leave units generating for a job that has failed
+                for task in workers:
+                    task.cancel()
+            if live.stop_requested.is_set():
+                logger.info(f"Job {job_id} was paused/cancelled, stopping processing")
+                return
 
-            chunk_audio_files = []
-            for i, chunk in enumerate(chunks):
-                # Check if job was paused or cancelled
-                current_metadata = self.job_manager._load_job_metadata(job_id)
-                if current_metadata and current_metadata.status in [LongTextJobStatus.PAUSED, LongTextJobStatus.CANCELLED]:
-                    logger.info(f"Job {job_id} was paused/cancelled, stopping processing")
-                    return
-
-                # Update current chunk
-                current_metadata.current_chunk = i
-                self.job_manager._save_job_metadata(current_metadata)
-
-                # Update chunk status
-                chunk.processing_started_at = datetime.utcnow()
-                chunks[i] = chunk  # Update in list
-
-                logger.info(f"Job {job_id}: Processing chunk {i+1}/{len(chunks)} ({len(chunk.text)} chars)")
-                logger.info(f"Job {job_id}: Chunk text preview: '{chunk.text[:100]}{'...' if len(chunk.text) > 100 else ''}'")
-
-                try:
-                    # Generate audio for this chunk
-                    audio_buffer = await generate_speech_internal(
-                        text=chunk.text,
-                        voice_sample_path=voice_path,
-                        language_id=language_id,
-                        exaggeration=metadata.parameters.get('exaggeration'),
-                        cfg_weight=metadata.parameters.get('cfg_weight'),
-                        temperature=metadata.parameters.get('temperature')
-                    )
-
-                    # Save chunk audio file
-                    chunk_filename = f"chunk_{i+1:03d}.wav"
-                    chunk_audio_path = self.job_manager._get_job_file_paths(job_id)['chunks_dir'] / chunk_filename
-
-                    with open(chunk_audio_path, 'wb') as f:
-                        f.write(audio_buffer.getvalue())
-
-                    # Update chunk metadata
-                    chunk.audio_file = chunk_filename
-                    chunk.processing_completed_at = datetime.utcnow()
-                    chunk.duration_ms = int((chunk.processing_completed_at - chunk.processing_started_at).total_seconds() * 1000)
-
-                    chunk_audio_files.append(chunk_audio_path)
-                    chunks[i] = chunk
-
-                    # Update job progress
-                    current_metadata.completed_chunks = i + 1
-                    self.job_manager._save_job_metadata(current_metadata)
-                    self.job_manager._save_chunks_data(job_id, chunks)
-
-                    logger.info(f"Job {job_id}: Completed chunk {i+1}/{len(chunks)}")
-
-                except Exception as e:
-                    logger.error(f"Job {job_id}: Failed to process chunk {i+1}: {e}")
-                    logger.error(f"Job {job_id}: Failed chunk text: '{chunk.text[:200]}{'...' if len(chunk.text) > 200 else ''}'")
-                    logger.error(f"Job {job_id}: Error type: {type(e).__name__}")
-                    chunk.error = str(e)
-                    chunks[i] = chunk
-
-                    # Mark chunk as failed
-                    if i not in current_metadata.failed_chunks:
-                        current_metadata.failed_chunks.append(i)
-                        self.job_manager._save_job_metadata(current_metadata)
-
-                    # For now, continue with other chunks (could be made configurable)
-                    continue
-
-            # Check if we have enough successful chunks to continue
-            successful_chunks = [f for f in chunk_audio_files if f.exists()]
-            if len(successful_chunks) == 0:
+            # Check if we have enough successful units to continue
+            successful = [unit for unit in units if unit.audio_file]
+            if not successful:
                 await self._fail_job(job_id, "No chunks were successfully generated")
                 return
-            elif len(successful_chunks) < len(chunks):
-                logger.warning(f"Job {job_id}: Only {len(successful_chunks)}/{len(chunks)} chunks generated successfully")
+            elif len(successful) < len(units):
+                logger.warning(f"Job {job_id}: Only {len(successful)}/{len(units)} units generated successfully")
 
-            # Phase 3: Concatenate audio chunks
+            # A gap takes the longest pause of the units it spans, so a failed
+            # unit at the end of a paragraph still leaves a paragraph pause
+            gaps_ms = []
+            for current, following in zip(successful, successful[1:]):
+                gaps_ms.append(max(u.pause_after_ms for u in units[current.index:following.index]))
+
+            # Concatenate unit audio
             await self._update_job_status(job_id, LongTextJobStatus.PROCESSING, "Combining audio chunks")
 
             try:
                 output_filename = f"final.{metadata.output_format}"
                 output_path = self.job_manager._get_job_file_paths(job_id)['output_dir'] / output_filename
 
-                concatenation_metadata = concatenate_audio_files(
-                    audio_files=successful_chunks,
+                # Streams chunk by chunk from disk; run off the event loop
+                concatenation_metadata = await loop.run_in_executor(None, functools.partial(
+                    concatenate_audio_files,
+                    audio_files=[chunks_dir / unit.audio_file for unit in successful],
                     output_path=output_path,
                     output_format=metadata.output_format,
-                    silence_duration_ms=Config.LONG_TEXT_SILENCE_PADDING_MS,
+                    silence_durations_ms=gaps_ms,
                     # normalize_volume=True,
                     normalize_volume=False,
                     remove_source_files=False  # Keep source chunks for debugging
-                )
+                ))
 
                 # Mark job as completed with history persistence
                 self.job_manager.complete_job(
                     job_id=job_id,
                     output_path=f"output/{output_filename}",
                     output_size_bytes=concatenation_metadata['file_size_bytes'],
-                    output_duration_seconds=concatenation_metadata['duration_seconds']
+                    output_duration_seconds=concatenation_metadata['duration_seconds'],
+                    trimmed_silence_seconds=round(sum(unit.trimmed_seconds or 0.0 for unit in successful), 3)
                 )
 
                 logger.info(f"Job {job_id} completed successfully: {concatenation_metadata['duration_seconds']:.1f}s audio, "
@@ -276,9 +508,19 @@ class LongTextProcessor:
                 return
 
         except asyncio.CancelledError:
-            # Job was cancelled
-            logger.info(f"Job {job_id} processing was cancelled")
-            await self._update_job_status(job_id, LongTextJobStatus.CANCELLED, "Processing was cancelled")
+            current_metadata = self.job_manager._load_job_metadata(job_id)
+            if current_metadata and current_metadata.status in [LongTextJobStatus.PAUSED, LongTextJobStatus.CANCELLED]:
+                # Paused or cancelled on purpose; the status is already set
+                logger.info(f"Job {job_id} processing stopped ({current_metadata.status.value})")
+            elif job_id in self._lost_leases:
+                # Another worker has the job now; leave its status to that worker
+                logger.info(f"Job {job_id} processing stopped, its lease was lost")
+            elif not self.is_running:
+                # Shutting down: leave the job to be recovered on the next start
+                await self._update_job_status(job_id, LongTextJobStatus.PENDING, "Interrupted by shutdown")
+            else:
+                logger.info(f"Job {job_id} processing was cancelled")
+                await self._update_job_status(job_id, LongTextJobStatus.CANCELLED, "Processing was cancelled")
             raise
 
         except Exception as e:
@@ -286,15 +528,33 @@ class LongTextProcessor:
             logger.error(traceback.format_exc())
             await self._fail_job(job_id, f"Unexpected error: {e}")
 
+        finally:
+            if live and job_id in self._lost_leases:
+                # The job's files belong to whoever holds it now; writing our
+                # in-memory state would put back a stale status
+                self.job_manager.discard_live_job(live)
+            elif live:
+                self.job_manager.close_live_job(live)
+
+    def _publish_eta(self, metadata: LongTextJobMetadata, units: list, previous: Optional[int] = None) -> int:
+        """Publish the job's estimated seconds remaining if it changed; returns it"""
+        eta = int(round(self.job_manager.estimate_remaining_seconds(metadata, units)))
+        if eta != previous:
+            get_event_bus().publish(metadata.job_id, ETA, {"estimated_remaining_seconds": eta})
+        return eta
+
     async def _update_job_status(self, job_id: str, status: LongTextJobStatus, message: str = ""):
         """Update job status"""
         try:
             metadata = self.job_manager._load_job_metadata(job_id)
             if metadata:
+                changed = metadata.status != status
                 metadata.status = status
                 if message:
                     logger.info(f"Job {job_id}: {message}")
                 self.job_manager._save_job_metadata(metadata)
+                if changed:
+                    self.job_manager.publish_status(metadata, message or None)
         except Exception as e:
             logger.error(f"Failed to update status for job {job_id}: {e}")
 
@@ -313,6 +573,7 @@ class LongTextProcessor:
                         (metadata.processing_completed_at - metadata.processing_started_at).total_seconds() * 1000
                     )
                 self.job_manager._save_job_metadata(metadata)
+                self.job_manager.publish_status(metadata)
         except Exception as e:
             logger.error(f"Failed to mark job {job_id} as failed: {e}")
 
@@ -325,13 +586,14 @@ class LongTextProcessor:
         return list(self.active_tasks.keys())
 
     async def pause_job(self, job_id: str) -> bool:
-        """Pause a currently processing job"""
+        """Pause a currently processing job; resuming continues from its last finished unit"""
         if job_id in self.active_tasks:
+            if not self.job_manager.pause_job(job_id):
+                return False
             task = self.active_tasks[job_id]
             task.cancel()
 
-            # The task cancellation will be handled by the processing loop
-            # and will update the job status appropriately
+            # The processing loop sees the paused status and leaves it as is
             return True
 
         return False
@@ -0,0 +1,387 @@
+"""
+Tokenizer-aware chunk planning
+
+Chunks are packed from whole sentences up to a text-token budget (measured with
+the loaded model's tokenizer) and a speech-duration budget (estimated from a
+per-language seconds-per-character rate learned from generated audio), so
+chunks are as full as the model allows without overflowing its speech-token
+limit.
+
+Plans are immutable and memoized by text hash and planning settings, so the
+same text planned again (a retry, the upload and JSON variants of a request,
+an identical long-text job) skips normalization, segmentation and tokenizing.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
+
+from app.config import Config
+from app.core.text_processing import (
+    PARAGRAPH_BREAK_RE,
+    iter_sentence_spans,
+    normalize_text,
+    split_long_sentence,
+    split_text_into_chunks,
+)
+
+# Speech rate used until audio for a language has been observed (~15 chars/s)
+DEFAULT_SECONDS_PER_CHAR = 0.065
+
+# Weight of a new observation in the learned speech rate
+SPEECH_RATE_EMA_ALPHA = 0.1
+
+# Ignore observations from chunks too short to say much about the rate
+MIN_OBSERVED_CHARS = 20
+
+
+@dataclass(frozen=True)
+class ChunkPlan:
+    """How a text was split into synthesis chunks"""
+    chunks: Tuple[str, ...]
+    token_counts: Tuple[int, ...]
+    estimated_seconds: Tuple[float, ...]
+    strategy: str  # "tokens" or "characters"
+    tokenizer: str  # tokenizer that measured the chunks ("characters" if none was available)
+    language_id: str
+    max_tokens: int
+    max_seconds: float
+
+    @property
+    def total_estimated_seconds(self) -> float:
+        return sum(self.estimated_seconds)
+
+    def to_dict(self, preview_chars: int = 40) -> Dict[str, Any]:
+        """Summary for request diagnostics"""
+        return {
+            "strategy": self.strategy,
+            "tokenizer": self.tokenizer,
+            "language_id": self.language_id,
+            "max_tokens": self.max_tokens,
+            "max_seconds": self.max_seconds,
+            "chunk_count": len(self.chunks),
+            "total_tokens": sum(self.token_counts),
+            "total_estimated_seconds": round(self.total_estimated_seconds, 2),
+            "chunks": [
+                {
+                    "characters": len(chunk),
+                    "tokens": tokens,
+                    "estimated_seconds": round(seconds, 2),
+                    "preview": chunk[:preview_chars] + ("..." if len(chunk) > preview_chars else ""),
+                }
+                for chunk, tokens, seconds in zip(self.chunks, self.token_counts, self.estimated_seconds)
+            ],
+        }
+
+
+@dataclass(frozen=True)
+class TextPlan:
+    """Chunk plans for each paragraph (blank-line separated) of a text"""
+    text_hash: str
+    paragraphs: Tuple[ChunkPlan, ...]
+
+    @property
+    def chunk_count(self) -> int:
+        return sum(len(plan.chunks) for plan in self.paragraphs)
+
+    @property
+    def total_estimated_seconds(self) -> float:
+        return sum(plan.total_estimated_seconds for plan in self.paragraphs)
+
+
+class PlanCache:
+    """Bounded LRU of plans keyed by text hash and planning settings"""
+
+    def __init__(self, max_entries: int):
+        self._lock = threading.Lock()
+        self._cache: "OrderedDict[Tuple, Any]" = OrderedDict()
+        self._max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Tuple):
+        with self._lock:
+            plan = self._cache.get(key)
+            if plan is None:
+                self.misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return plan
+
+    def put(self, key: Tuple, plan):
+        with self._lock:
+            self._cache[key] = plan
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._max_entries:
+                self._cache.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"entries": len(self._cache), "hits": self.hits, "misses": self.misses}
+
+
+class TokenCounter:
+    """Counts text tokens with a model's tokenizer, caching counts per string"""
+
+    def __init__(self, max_entries: int):
+        self._lock = threading.Lock()
+        self._cache: "OrderedDict[Tuple[str, str, str], int]" = OrderedDict()
+        self._max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _encode(tokenizer, text: str, language_id: str) -> int:
+        try:
+            # Multilingual tokenizer takes the language for its language tag
+            return len(tokenizer.encode(text, language_id=language_id))
+        except TypeError:
+            return len(tokenizer.encode(text))
+
+    def count(self, tokenizer, text: str, language_id: str) -> int:
+        if tokenizer is None:
+            return len(text)
+
+        key = (type(tokenizer).__name__, language_id, text)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return cached
+
+        count = self._encode(tokenizer, text, language_id)
+
+        with self._lock:
+            self.misses += 1
+            self._cache[key] = count
+            while len(self._cache) > self._max_entries:
+                self._cache.popitem(last=False)
+        return count
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"entries": len(self._cache), "hits": self.hits, "misses": self.misses}
+
+
+class SpeechRateEstimator:
+    """Learned seconds of speech per character of text, per language"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._rates: Dict[str, float] = {}
+        self._observations: Dict[str, int] = {}
+
+    def seconds_per_char(self, language_id: str) -> float:
+        with self._lock:
+            return self._rates.get(language_id, DEFAULT_SECONDS_PER_CHAR)
+
+    def estimate(self, language_id: str, characters: int) -> float:
+        return characters * self.seconds_per_char(language_id)
+
+    def observe(self, language_id: str, characters: int, seconds: float):
+        if characters < MIN_OBSERVED_CHARS or seconds <= 0:
+            return
+        rate = seconds / characters
+        with self._lock:
+            previous = self._rates.get(language_id)
+            self._rates[language_id] = rate if previous is None else (
+                previous + SPEECH_RATE_EMA_ALPHA * (rate - previous)
+            )
+            self._observations[language_id] = self._observations.get(language_id, 0) + 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                language: {
+                    "seconds_per_char": round(rate, 5),
+                    "observations": self._observations.get(language, 0),
+                }
+                for language, rate in self._rates.items()
+            }
+
+
+# Global planner state
+_token_counter = TokenCounter(Config.CHUNK_TOKEN_CACHE_SIZE)
+_speech_rate = SpeechRateEstimator()
+_plan_cache = PlanCache(Config.TEXT_PLAN_CACHE_SIZE)
+
+
+def _get_tokenizer(model):
+    tokenizer = getattr(model, "tokenizer", None) if model is not None else None
+    return tokenizer if hasattr(tokenizer, "encode") else None
+
+
+def _character_plan(text: str, language_id: str) -> ChunkPlan:
+    """Plan using the character limits (CHUNK_PLANNER=characters)"""
+    chunks = split_text_into_chunks(text, Config.MAX_CHUNK_LENGTH)
+    return ChunkPlan(
+        chunks=tuple(chunks),
+        token_counts=tuple(len(c) for c in chunks),
+        estimated_seconds=tuple(_speech_rate.estimate(language_id, len(c)) for c in chunks),
+        strategy="characters",
+        tokenizer="characters",
+        language_id=language_id,
+        max_tokens=Config.MAX_CHUNK_LENGTH,
+        max_seconds=0.0,
+    )
+
+
+def _plan_key(kind: str, text: str, tokenizer, language_id: str) -> Tuple:
+    """Cache key: the text's hash plus every setting the plan depends on"""
+    return (
+        kind,
+        hashlib.sha256(text.encode("utf-8")).hexdigest(),
+        language_id,
+        type(tokenizer).__name__ if tokenizer is not None else "characters",
+        Config.CHUNK_PLANNER,
+        Config.MAX_CHUNK_TOKENS,
+        Config.MAX_CHUNK_SPEECH_SECONDS,
+        Config.MAX_CHUNK_LENGTH,
+        # The learned rate drifts slowly; plans are reused until it moves noticeably
+        round(_speech_rate.seconds_per_char(language_id), 3),
+    )
+
+
+def plan_chunks(text: str, model=None, language_id: str = "en") -> ChunkPlan:
+    """
+    Split `text` into synthesis chunks.
+
+    Sentences are packed into a chunk while its token count stays within
+    MAX_CHUNK_TOKENS and its estimated speech within MAX_CHUNK_SPEECH_SECONDS.
+    A sentence over budget on its own is split at clause and then word
+    boundaries. Without a model tokenizer, tokens are approximated by characters.
+    """
+    tokenizer = _get_tokenizer(model)
+    key = _plan_key("chunks", text, tokenizer, language_id)
+    plan = _plan_cache.get(key)
+    if plan is None:
+        plan = _plan_chunks(text, tokenizer, language_id)
+        _plan_cache.put(key, plan)
+    return plan
+
+
+def _plan_chunks(text: str, tokenizer, language_id: str, normalized: bool = False) -> ChunkPlan:
+    """Uncached plan_chunks; `normalized` skips normalizing text that already was"""
+    if Config.CHUNK_PLANNER == "characters":
+        return _character_plan(text, language_id)
+
+    max_tokens = Config.MAX_CHUNK_TOKENS
+    max_seconds = Config.MAX_CHUNK_SPEECH_SECONDS
+    seconds_per_char = _speech_rate.seconds_per_char(language_id)
+
+    def measure(piece: str) -> int:
+        return _token_counter.count(tokenizer, piece, language_id)
+
+    def fits(tokens: int, characters: int) -> bool:
+        return tokens <= max_tokens and characters * seconds_per_char <= max_seconds
+
+    def split_to_fit(piece: str, tokens: int) -> List[Tuple[str, int]]:
+        """Break an over-budget piece into parts that fit, re-splitting any part that still does not"""
+        # Character limit equivalent to the budgets for this piece's density;
+        # always shorter than the piece, so every pass makes progress
+        scale = min(max_tokens / max(tokens, 1), max_seconds / max(len(piece) * seconds_per_char, 1e-9))
+        char_limit = max(1, int(len(piece) * scale))
+        parts = []
+        for part in split_long_sentence(piece, char_limit):
+            part_tokens = measure(part)
+            if fits(part_tokens, len(part)) or len(part) <= 1:
+                parts.append((part, part_tokens))
+            else:
+                # Denser than the piece as a whole (e.g. digits or symbols)
+                parts.extend(split_to_fit(part, part_tokens))
+        return parts
+
+    if not normalized:
+        text = normalize_text(text)
+
+    # Whole sentences, with oversized ones broken into parts that fit
+    pieces: List[Tuple[str, int]] = []
+    for start, end in iter_sentence_spans(text):
+        sentence = text[start:end].strip()
+        if not sentence:
+            continue
+        tokens = measure(sentence)
+        if fits(tokens, len(sentence)):
+            pieces.append((sentence, tokens))
+        else:
+            pieces.extend(split_to_fit(sentence, tokens))
+
+    # Pack pieces greedily; a joining space costs one token
+    chunks: List[str] = []
+    token_counts: List[int] = []
+    current: List[str] = []
+    current_tokens = 0
+    current_chars = 0
+    for piece, tokens in pieces:
+        if current:
+            joined_tokens = current_tokens + 1 + tokens
+            joined_chars = current_chars + 1 + len(piece)
+            if fits(joined_tokens, joined_chars):
+                current.append(piece)
+                current_tokens, current_chars = joined_tokens, joined_chars
+                continue
+            chunks.append(" ".join(current))
+            token_counts.append(current_tokens)
+        current = [piece]
+        current_tokens, current_chars = tokens, len(piece)
+    if current:
+        chunks.append(" ".join(current))
+        token_counts.append(current_tokens)
+
+    return ChunkPlan(
+        chunks=tuple(chunks),
+        token_counts=tuple(token_counts),
+        estimated_seconds=tuple(len(c) * seconds_per_char for c in chunks),
+        strategy="tokens",
+        tokenizer=type(tokenizer).__name__ if tokenizer is not None else "characters",
+        language_id=language_id,
+        max_tokens=max_tokens,
+        max_seconds=max_seconds,
+    )
+
+
+def plan_paragraphs(text: str, model=None, language_id: str = "en") -> TextPlan:
+    """
+    Plan each paragraph (blank-line separated) of `text` separately, so that no
+    chunk spans a paragraph break and callers can pause longer between them.
+    """
+    tokenizer = _get_tokenizer(model)
+    key = _plan_key("paragraphs", text, tokenizer, language_id)
+    plan = _plan_cache.get(key)
+    if plan is None:
+        normalized = normalize_text(text)
+        plan = TextPlan(
+            text_hash=key[1],
+            paragraphs=tuple(
+                _plan_chunks(paragraph, tokenizer, language_id, normalized=True)
+                for paragraph in PARAGRAPH_BREAK_RE.split(normalized)
+                if paragraph.strip()
+            ),
+        )
+        _plan_cache.put(key, plan)
+    return plan
+
+
+def record_chunk_audio(language_id: str, text: str, seconds: float):
+    """Feed the duration of generated audio back into the speech-rate estimate"""
+    _speech_rate.observe(language_id, len(text), seconds)
+
+
+def get_planner_stats() -> Dict[str, Any]:
+    """Token cache and learned speech-rate statistics"""
+    return {
+        "planner": Config.CHUNK_PLANNER,
+        "max_tokens": Config.MAX_CHUNK_TOKENS,
+        "max_seconds": Config.MAX_CHUNK_SPEECH_SECONDS,
+        "token_cache": _token_counter.stats(),
+        "plan_cache": _plan_cache.stats(),
+        "speech_rate": _speech_rate.stats(),
+    }
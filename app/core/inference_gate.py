@@ -0,0 +1,95 @@
+"""
+Conditioning gate around model.generate
+
+Chatterbox models keep the voice conditioning of the latest generate() call
+on the model itself: a call with `audio_prompt_path` replaces it and a
+different `exaggeration` rebuilds part of it. Calls that condition the model
+the same way can safely overlap (the units of one long-text job, or requests
+for the same voice), but a call with another voice or exaggeration would
+change the conditioning under them.
+
+The gate lets any number of calls with the same conditioning run on a model
+at once. A call with different conditioning waits until they have finished;
+while it waits, new calls with the running conditioning queue behind it so
+it is not starved. When the model is free, every queued call that shares the
+conditioning of the longest-waiting one is let in together.
+"""
+
+import threading
+import weakref
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Deque, Hashable, Optional
+
+
+class _Waiter:
+    __slots__ = ("key", "granted")
+
+    def __init__(self, key: Hashable):
+        self.key = key
+        self.granted = False
+
+
+class ConditioningGate:
+    """Admits concurrent calls that share a conditioning key; different keys take turns"""
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._key: Optional[Hashable] = None
+        self._active = 0
+        self._queue: Deque[_Waiter] = deque()
+
+    @contextmanager
+    def hold(self, key: Hashable):
+        with self._condition:
+            if not self._queue and (self._active == 0 or key == self._key):
+                self._key = key
+                self._active += 1
+            else:
+                waiter = _Waiter(key)
+                self._queue.append(waiter)
+                while not waiter.granted:
+                    self._condition.wait()
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._active -= 1
+                if self._active == 0:
+                    self._admit_next()
+
+    def _admit_next(self):
+        """Let in every queued call with the conditioning of the longest-waiting one"""
+        if not self._queue:
+            self._key = None
+            return
+        self._key = self._queue[0].key
+        remaining = deque()
+        for waiter in self._queue:
+            if waiter.key == self._key:
+                waiter.granted = True
+                self._active += 1
+            else:
+                remaining.append(waiter)
+        self._queue = remaining
+        self._condition.notify_all()
+
+
+_gates: "weakref.WeakKeyDictionary[Any, ConditioningGate]" = weakref.WeakKeyDictionary()
+_gates_lock = threading.Lock()
+
+
+def get_conditioning_gate(model) -> ConditioningGate:
+    """The gate of a model instance"""
+    with _gates_lock:
+        gate = _gates.get(model)
+        if gate is None:
+            gate = _gates[model] = ConditioningGate()
+        return gate
+
+
+def generate_conditioned(model, **generate_kwargs):
+    """model.generate(**generate_kwargs), overlapping only with calls that condition it the same way"""
+    key = (generate_kwargs.get("audio_prompt_path"), generate_kwargs.get("exaggeration"))
+    with get_conditioning_gate(model).hold(key):
+        return model.generate(**generate_kwargs)
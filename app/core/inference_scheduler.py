@@ -0,0 +1,213 @@
+"""
+Chunk-level scheduling of model calls
+
+Every generate() call (one chunk or long-text unit) asks the scheduler for
+one of INFERENCE_CONCURRENCY slots before it runs, so the order in which
+waiting chunks reach the model is decided here rather than by whichever task
+the event loop happens to resume first.
+
+- Priority classes: streaming requests go before buffered /audio/speech
+  requests, which go before long-text job units.
+- Within a class, flows (a request, a long-text job, or all jobs of one
+  session) share the model by start-time fair queuing weighted by the
+  characters each chunk generates, so a job with thousands of units cannot
+  hold back a small one that arrived later.
+- A class whose oldest chunk has waited SCHEDULER_AGING_SECONDS is treated as
+  one class more urgent (and so on), so long-text work is never starved by a
+  steady stream of interactive traffic.
+
+Queue depth, running chunks and wait times are kept per class for /status.
+"""
+
+import asyncio
+import itertools
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Deque, Dict, List, Optional
+
+from app.config import Config
+
+# Priority classes, most urgent first
+STREAMING = "streaming"
+BUFFERED = "buffered"
+LONG_TEXT = "long_text"
+PRIORITY_CLASSES = (STREAMING, BUFFERED, LONG_TEXT)
+
+# Recent waits per class kept for the wait-time percentiles
+WAIT_SAMPLE_SIZE = 1000
+
+
+class _Request:
+    __slots__ = ("priority_class", "flow", "start_tag", "sequence", "enqueued_at", "future")
+
+    def __init__(self, priority_class: str, flow: str, start_tag: float, sequence: int,
+                 future: asyncio.Future):
+        self.priority_class = priority_class
+        self.flow = flow
+        self.start_tag = start_tag
+        self.sequence = sequence
+        self.enqueued_at = time.monotonic()
+        self.future = future
+
+
+class _ClassQueue:
+    """Waiting chunks of one priority class, ordered by start-time fair queuing"""
+
+    def __init__(self):
+        self.waiting: List[_Request] = []
+        # Start tag of the chunk dispatched last: the class's virtual time
+        self.virtual_time = 0.0
+        # Virtual finish time of each flow's latest chunk
+        self.flow_finish: Dict[str, float] = {}
+        self.running = 0
+        self.dispatched = 0
+        self.promoted = 0
+        self.waits: Deque[float] = deque(maxlen=WAIT_SAMPLE_SIZE)
+
+    def enqueue(self, request: _Request, cost: float, weight: float):
+        request.start_tag = max(self.virtual_time, self.flow_finish.get(request.flow, 0.0))
+        self.flow_finish[request.flow] = request.start_tag + cost / weight
+        self.waiting.append(request)
+
+    def oldest_wait(self, now: float) -> float:
+        return now - min(request.enqueued_at for request in self.waiting)
+
+    def pop(self) -> _Request:
+        request = min(self.waiting, key=lambda r: (r.start_tag, r.sequence))
+        self.waiting.remove(request)
+        self.virtual_time = request.start_tag
+        # Flows that have fallen behind the virtual time carry no credit; forget them
+        waiting_flows = {r.flow for r in self.waiting}
+        for flow in [f for f, finish in self.flow_finish.items()
+                     if finish <= self.virtual_time and f not in waiting_flows]:
+            del self.flow_finish[flow]
+        return request
+
+
+class InferenceScheduler:
+    """Grants model-call slots to waiting chunks by priority class, fair share and age"""
+
+    def __init__(self, concurrency: int, aging_seconds: float):
+        self.concurrency = concurrency
+        self.aging_seconds = aging_seconds
+        self._classes: Dict[str, _ClassQueue] = {name: _ClassQueue() for name in PRIORITY_CLASSES}
+        self._sequence = itertools.count()
+        self._running = 0
+        self._lock = threading.Lock()
+
+    @asynccontextmanager
+    async def slot(self, priority_class: str, flow: str, cost: float = 1.0, weight: float = 1.0):
+        """
+        Hold a model-call slot for the duration of the block. `flow` groups the
+        chunks that share a fair share (a request, job or session); `cost` is
+        the work of this chunk (its characters).
+        """
+        await self._acquire(priority_class, flow, cost, weight)
+        try:
+            yield
+        finally:
+            self._release(priority_class)
+
+    async def _acquire(self, priority_class: str, flow: str, cost: float, weight: float):
+        if priority_class not in self._classes:
+            raise ValueError(f"Unknown priority class: {priority_class}")
+        future = asyncio.get_running_loop().create_future()
+        with self._lock:
+            request = _Request(priority_class, flow, 0.0, next(self._sequence), future)
+            self._classes[priority_class].enqueue(request, max(cost, 1.0), max(weight, 1e-6))
+            self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                queue = self._classes[priority_class]
+                if request in queue.waiting:
+                    queue.waiting.remove(request)
+                    raise
+            # Granted just as the waiter was cancelled: hand the slot on
+            self._release(priority_class)
+            raise
+
+    def _release(self, priority_class: str):
+        with self._lock:
+            self._running -= 1
+            self._classes[priority_class].running -= 1
+            self._dispatch()
+
+    def _dispatch(self):
+        """Grant free slots to the most urgent waiting chunks (lock held)"""
+        while self._running < self.concurrency:
+            queue_name = self._next_class()
+            if queue_name is None:
+                return
+            queue = self._classes[queue_name]
+            request = queue.pop()
+            wait = time.monotonic() - request.enqueued_at
+            queue.waits.append(wait)
+            queue.dispatched += 1
+            queue.running += 1
+            self._running += 1
+            if self._effective_rank(queue_name, wait) < PRIORITY_CLASSES.index(queue_name):
+                queue.promoted += 1
+            request.future.get_loop().call_soon_threadsafe(_grant, request.future)
+
+    def _effective_rank(self, name: str, wait: float) -> int:
+        rank = PRIORITY_CLASSES.index(name)
+        if self.aging_seconds > 0:
+            rank -= int(wait // self.aging_seconds)
+        return rank
+
+    def _next_class(self) -> Optional[str]:
+        now = time.monotonic()
+        candidates = [
+            (self._effective_rank(name, queue.oldest_wait(now)), PRIORITY_CLASSES.index(name), name)
+            for name, queue in self._classes.items() if queue.waiting
+        ]
+        return min(candidates)[2] if candidates else None
+
+    def stats(self) -> dict:
+        """Per-class queue depth, running chunks and wait times"""
+        with self._lock:
+            now = time.monotonic()
+            classes = {}
+            for name, queue in self._classes.items():
+                waits = sorted(queue.waits)
+                classes[name] = {
+                    "queued": len(queue.waiting),
+                    "running": queue.running,
+                    "dispatched": queue.dispatched,
+                    "promoted_by_aging": queue.promoted,
+                    "flows": len(queue.flow_finish),
+                    "oldest_wait_seconds": round(queue.oldest_wait(now), 3) if queue.waiting else 0.0,
+                    "wait_seconds": {
+                        "mean": round(sum(waits) / len(waits), 3) if waits else 0.0,
+                        "p50": round(waits[len(waits) // 2], 3) if waits else 0.0,
+                        "p95": round(waits[min(len(waits) - 1, int(len(waits) * 0.95))], 3) if waits else 0.0,
+                        "max": round(waits[-1], 3) if waits else 0.0,
+                    },
+                }
+            return {
+                "concurrency": self.concurrency,
+                "running": self._running,
+                "aging_seconds": self.aging_seconds,
+                "classes": classes,
+            }
+
+
+def _grant(future: asyncio.Future):
+    if not future.done():
+        future.set_result(None)
+
+
+# Global scheduler instance
+_scheduler: Optional[InferenceScheduler] = None
+
+
+def get_inference_scheduler() -> InferenceScheduler:
+    """Get the global inference scheduler"""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = InferenceScheduler(Config.INFERENCE_CONCURRENCY, Config.SCHEDULER_AGING_SECONDS)
+    return _scheduler
@@ -0,0 +1,221 @@
+"""
+Progressive audio of long-text jobs that are still running
+
+A listener does not have to wait for the final concatenated file: the audio
+of every unit that has been generated so far is streamed in order, with the
+same pauses the final file will have, and the stream then waits on the job
+event bus for the next unit to finish (for a job running in another worker
+process, it also re-reads the job's progress as that worker writes it). It
+ends once the job is completed, failed or cancelled and every generated unit
+has been sent. Units that fail are skipped, as they are in the final file.
+
+WAV is sent with a streaming header (unknown length); MP3 and Opus are
+encoded on the fly by piping the PCM through ffmpeg.
+"""
+
+import asyncio
+import logging
+import wave
+from pathlib import Path
+from typing import AsyncIterator, List, Optional, Set, Tuple
+
+from app.config import Config
+from app.core.audio_processing import ffmpeg_encode_command
+from app.core.job_events import CHUNK_COMPLETED, get_event_bus
+from app.core.long_text_jobs import get_job_manager
+from app.models.long_text import LongTextChunk, LongTextJobStatus
+
+logger = logging.getLogger(__name__)
+
+# Formats a job's audio can be streamed in, with their media types
+STREAM_MEDIA_TYPES = {
+    "wav": "audio/wav",
+    "mp3": "audio/mpeg",
+    "opus": "audio/ogg",
+}
+
+# Job state is re-read at least this often while waiting, in case an event was missed
+RECHECK_SECONDS = 30.0
+
+# Shortest wait between re-reads of a job running in another worker process,
+# whose unit audio reaches the job files when that worker writes its progress
+# (every LONG_TEXT_STATE_FLUSH_INTERVAL), possibly after the unit's event
+MIN_REMOTE_RECHECK_SECONDS = 0.5
+
+# Bytes read from ffmpeg's output at a time
+ENCODER_READ_BYTES = 64 * 1024
+
+_FINISHED_STATUSES = {LongTextJobStatus.COMPLETED, LongTextJobStatus.FAILED, LongTextJobStatus.CANCELLED}
+
+
+class JobAudioStreamError(Exception):
+    """Raised when a job's audio cannot be streamed"""
+    pass
+
+
+def _read_pcm(path: Path) -> Optional[Tuple[int, int, bytes]]:
+    """(sample rate, channels, frames) of a 16-bit PCM WAV file, or None if it cannot be read"""
+    try:
+        with wave.open(str(path), 'rb') as reader:
+            if reader.getsampwidth() != 2:
+                return None
+            return reader.getframerate(), reader.getnchannels(), reader.readframes(reader.getnframes())
+    except (wave.Error, EOFError, OSError):
+        return None
+
+
+def _unit_settled(unit: LongTextChunk, status: LongTextJobStatus, current_chunk: Optional[int],
+                  failed: Set[int]) -> bool:
+    """Whether a unit without audio will not get any in this run"""
+    if status in _FINISHED_STATUSES or unit.index in failed:
+        return True
+    # Every unit before the current (lowest unfinished) one is done, so one without audio failed
+    return status == LongTextJobStatus.PROCESSING and current_chunk is not None and current_chunk > unit.index
+
+
+async def iter_job_pcm(job_id: str) -> AsyncIterator[Tuple[int, int, bytes]]:
+    """
+    Yield (sample rate, channels, PCM) for each generated unit of a job in
+    order, preceded by the silence that goes before it, waiting for units
+    that are still being generated. Ends when the job has finished (or was
+    deleted) and every generated unit has been yielded.
+    """
+    job_manager = get_job_manager()
+    # Subscribe before reading the job's state so no change in between is missed
+    subscription = get_event_bus().subscribe({job_id})
+    loop = asyncio.get_event_loop()
+    failed: Set[int] = set()
+    next_index = 0
+    previous: Optional[int] = None  # index of the last unit whose audio was yielded
+    stream_format: Optional[Tuple[int, int]] = None
+
+    try:
+        while True:
+            metadata = job_manager._load_job_metadata(job_id)
+            if metadata is None:
+                return
+            units: List[LongTextChunk] = job_manager._load_chunks_data(job_id)
+
+            while next_index < len(units):
+                unit = units[next_index]
+                if not unit.audio_file:
+                    if not _unit_settled(unit, metadata.status, metadata.current_chunk, failed):
+                        break
+                    next_index += 1
+                    continue
+
+                chunks_dir = job_manager._get_job_file_paths(job_id)['chunks_dir']
+                pcm = await loop.run_in_executor(None, _read_pcm, chunks_dir / unit.audio_file)
+                if pcm is None or (stream_format and pcm[:2] != stream_format):
+                    logger.warning(f"Job {job_id}: Skipping unreadable audio of unit {unit.index + 1} in stream")
+                    next_index += 1
+                    continue
+                sample_rate, channels, frames = pcm
+                stream_format = (sample_rate, channels)
+
+                if previous is not None:
+                    # A gap takes the longest pause of the units it spans, as in the final file
+                    gap_ms = max(u.pause_after_ms for u in units[previous:unit.index])
+                    if gap_ms > 0:
+                        yield sample_rate, channels, bytes(int(sample_rate * gap_ms / 1000) * 2 * channels)
+                yield sample_rate, channels, frames
+                previous = unit.index
+                next_index += 1
+
+            if metadata.status in _FINISHED_STATUSES and next_index >= len(units):
+                return
+
+            if job_manager.is_job_live(job_id):
+                recheck_seconds = RECHECK_SECONDS
+            else:
+                recheck_seconds = max(Config.LONG_TEXT_STATE_FLUSH_INTERVAL, MIN_REMOTE_RECHECK_SECONDS)
+
+            # asyncio.wait rather than wait_for, which can swallow a cancellation
+            # that arrives as the event does (and the stream would not close)
+            getter = asyncio.ensure_future(subscription.get())
+            try:
+                await asyncio.wait({getter}, timeout=recheck_seconds)
+            finally:
+                if not getter.done():
+                    getter.cancel()
+            # Timed out: the cancelled getter may not have finished cancelling yet
+            if not getter.done() or getter.cancelled():
+                continue
+            for event in getter.result() or []:
+                if event.event_type == CHUNK_COMPLETED and not event.data.get("success"):
+                    failed.add(event.data.get("chunk"))
+    finally:
+        get_event_bus().unsubscribe(subscription)
+
+
+async def _stream_wav(pcm: AsyncIterator[Tuple[int, int, bytes]]) -> AsyncIterator[bytes]:
+    from app.api.endpoints.speech import create_wav_header
+
+    header_sent = False
+    try:
+        async for sample_rate, channels, data in pcm:
+            if not header_sent:
+                yield create_wav_header(sample_rate, channels, 16)
+                header_sent = True
+            yield data
+    finally:
+        await pcm.aclose()
+
+
+async def _stream_encoded(pcm: AsyncIterator[Tuple[int, int, bytes]], output_format: str) -> AsyncIterator[bytes]:
+    """Pipe the PCM through ffmpeg, yielding its output as it is encoded"""
+    try:
+        sample_rate, channels, first = await pcm.__anext__()
+    except StopAsyncIteration:
+        return
+
+    command = ffmpeg_encode_command(output_format, sample_rate, channels, "pipe:1")
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *command, stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+    except OSError as e:
+        raise JobAudioStreamError(f"Could not start ffmpeg to encode {output_format}: {e}")
+
+    async def feed():
+        try:
+            process.stdin.write(first)
+            await process.stdin.drain()
+            async for _, _, data in pcm:
+                process.stdin.write(data)
+                await process.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            process.stdin.close()
+
+    feeder = asyncio.create_task(feed())
+    try:
+        while True:
+            data = await process.stdout.read(ENCODER_READ_BYTES)
+            if not data:
+                break
+            yield data
+        await feeder
+        if await process.wait() != 0:
+            raise JobAudioStreamError(f"ffmpeg failed with exit code {process.returncode}")
+    finally:
+        # Killing ffmpeg also unblocks a feeder waiting for it to take more input
+        if not feeder.done():
+            feeder.cancel()
+        if process.returncode is None:
+            process.kill()
+        await asyncio.wait({feeder})
+        await pcm.aclose()
+        await process.wait()
+
+
+def stream_job_audio(job_id: str, output_format: str) -> AsyncIterator[bytes]:
+    """Audio of a job in `output_format` (see STREAM_MEDIA_TYPES), streamed as its units are generated"""
+    output_format = output_format.lower()
+    if output_format not in STREAM_MEDIA_TYPES:
+        raise JobAudioStreamError(f"Unsupported stream format: {output_format}")
+    if output_format == "wav":
+        return _stream_wav(iter_job_pcm(job_id))
+    return _stream_encoded(iter_job_pcm(job_id), output_format)
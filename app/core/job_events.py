@@ -0,0 +1,260 @@
+"""
+Event bus for long-text job progress, shared by the worker processes
+
+The background processor publishes an event whenever a unit starts or
+finishes, a job changes status or its estimated time remaining moves.
+Server-sent event streams subscribe to the jobs they watch and receive each
+event as it is published instead of re-reading job files on a timer.
+
+Events are appended to an SQLite log next to the job index, so a stream
+served by one worker process also receives the events of jobs running in
+another. Each process follows the log while it has subscribers: at once for
+events it published itself, and every LONG_TEXT_EVENT_POLL_SECONDS for
+those of other processes.
+
+Every event gets its sequence number in the log, sent as the SSE event id,
+so the ids are the same in every worker. The most recent
+LONG_TEXT_EVENT_HISTORY_SIZE events are kept so a client reconnecting with
+Last-Event-ID (to any worker) is sent what it missed; if those events are
+no longer kept it is sent the job's current state instead.
+"""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+from app.config import Config
+from app.models.long_text import LongTextSSEEvent
+
+logger = logging.getLogger(__name__)
+
+# Event types
+CHUNK_STARTED = "chunk_started"
+CHUNK_COMPLETED = "chunk_completed"
+STATUS_CHANGE = "status_change"
+ETA = "eta"
+JOB_DELETED = "deleted"
+
+# Events queued for one subscriber before it counts as lagging and is resynced from the history
+SUBSCRIBER_QUEUE_SIZE = 1000
+
+# File name of the event log inside the data directory (with SQLite's WAL files)
+EVENTS_FILE_NAME = "events.db"
+
+# The log is trimmed to the history size once every this many events
+TRIM_EVERY_EVENTS = 100
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id TEXT NOT NULL,
+    event_type TEXT NOT NULL,
+    data TEXT NOT NULL,
+    timestamp TEXT NOT NULL
+);
+"""
+
+
+class Subscription:
+    """Events of a set of jobs (or of all jobs), queued for one consumer"""
+
+    def __init__(self, bus: "JobEventBus", job_ids: Optional[Set[str]]):
+        self.bus = bus
+        self.job_ids = job_ids
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        # Sequence number of the last event handed to the consumer
+        self.last_id = bus.last_id
+        self.lagged = False
+
+    def matches(self, event: LongTextSSEEvent) -> bool:
+        return self.job_ids is None or event.job_id in self.job_ids
+
+    def _deliver(self, event: LongTextSSEEvent):
+        if self.lagged:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # Catch up from the history on the next get() instead of blocking publishers
+            self.lagged = True
+
+    async def get(self) -> Optional[List[LongTextSSEEvent]]:
+        """
+        Wait for the next events, in order. Returns None if the subscriber fell
+        so far behind that events were lost; it should resend current state.
+        """
+        if not self.lagged:
+            events = [await self.queue.get()]
+            while not self.queue.empty():
+                events.append(self.queue.get_nowait())
+        else:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.lagged = False
+            events = self.bus.replay(self.last_id, self.job_ids)
+            if events is None:
+                self.last_id = self.bus.last_id
+                return None
+
+        events = [event for event in events if event.id > self.last_id]
+        if events:
+            self.last_id = events[-1].id
+        return events
+
+
+class JobEventBus:
+    """Publishes job events to subscribers through a shared log, which also serves as the history for resuming"""
+
+    def __init__(self, history_size: int, path: Optional[Path] = None):
+        self.history_size = history_size
+        self.path = Path(path) if path is not None else None
+        self._lock = threading.Lock()
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Without a path the log is private to this process
+        self._conn = sqlite3.connect(str(self.path) if self.path is not None else ":memory:",
+                                     timeout=30, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        if self.path is not None:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._lock:
+            self._conn.executescript(_SCHEMA)
+        # Sequence number of the last event dispatched to this process's subscribers
+        self.last_id = 0
+        self._subscribers: Set[Subscription] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._follower: Optional[asyncio.Task] = None
+
+    def publish(self, job_id: str, event_type: str, data: Optional[Dict[str, Any]] = None) -> LongTextSSEEvent:
+        """Publish an event for a job; safe to call from any thread"""
+        event = LongTextSSEEvent(job_id=job_id, event_type=event_type, data=data or {})
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO events (job_id, event_type, data, timestamp) VALUES (?, ?, ?, ?)",
+                (job_id, event_type, json.dumps(event.data, default=str), event.timestamp.isoformat()),
+            )
+            event.id = cursor.lastrowid
+            if event.id % TRIM_EVERY_EVENTS == 0:
+                self._conn.execute("DELETE FROM events WHERE id <= ?", (event.id - self.history_size,))
+        self._wake_follower()
+        return event
+
+    def _wake_follower(self):
+        """Have the log follower dispatch new events now rather than at its next poll"""
+        if self._wakeup is None:
+            return
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is self._loop:
+            self._wakeup.set()
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+        except RuntimeError:
+            # The subscribers' loop has been closed
+            pass
+
+    def _read_events(self, since_id: int, job_ids: Optional[Set[str]] = None) -> List[LongTextSSEEvent]:
+        sql = "SELECT * FROM events WHERE id > ?"
+        params: List[Any] = [since_id]
+        if job_ids is not None:
+            sql += f" AND job_id IN ({', '.join('?' * len(job_ids))})"
+            params.extend(job_ids)
+        with self._lock:
+            rows = self._conn.execute(sql + " ORDER BY id", params).fetchall()
+        return [
+            LongTextSSEEvent(id=row["id"], job_id=row["job_id"], event_type=row["event_type"],
+                             data=json.loads(row["data"]), timestamp=datetime.fromisoformat(row["timestamp"]))
+            for row in rows
+        ]
+
+    def _latest_id(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(MAX(id), 0) FROM events").fetchone()[0]
+
+    async def _follow(self):
+        """Dispatch the log's new events, in order, while this process has subscribers"""
+        while self._subscribers:
+            try:
+                for event in self._read_events(self.last_id):
+                    self.last_id = event.id
+                    self._dispatch(event)
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to read job events: {e}")
+            if not self._subscribers:
+                break
+            self._wakeup.clear()
+            # asyncio.wait rather than wait_for, which can swallow a cancellation
+            waiter = asyncio.ensure_future(self._wakeup.wait())
+            try:
+                await asyncio.wait({waiter}, timeout=Config.LONG_TEXT_EVENT_POLL_SECONDS)
+            finally:
+                if not waiter.done():
+                    waiter.cancel()
+
+    def _dispatch(self, event: LongTextSSEEvent):
+        for subscription in list(self._subscribers):
+            if subscription.matches(event):
+                subscription._deliver(event)
+
+    def subscribe(self, job_ids: Optional[Set[str]] = None) -> Subscription:
+        """Subscribe to events of `job_ids` (all jobs if None); call from the event loop"""
+        loop = asyncio.get_running_loop()
+        if self._follower is None or self._follower.done() or self._loop is not loop:
+            # Nobody was following the log: start from its current end
+            self._loop = loop
+            self._wakeup = asyncio.Event()
+            self.last_id = self._latest_id()
+            self._follower = asyncio.ensure_future(self._follow())
+        subscription = Subscription(self, job_ids)
+        self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        self._subscribers.discard(subscription)
+
+    def replay(self, since_id: int, job_ids: Optional[Set[str]] = None) -> Optional[List[LongTextSSEEvent]]:
+        """
+        Events after `since_id` for `job_ids` (all jobs if None) that have been
+        dispatched here, or None if some of them are no longer kept (or
+        `since_id` was never issued).
+        """
+        if since_id > self.last_id:
+            return None
+        with self._lock:
+            oldest = self._conn.execute("SELECT MIN(id) FROM events").fetchone()[0]
+        if oldest is not None and oldest > since_id + 1:
+            return None
+        return [event for event in self._read_events(since_id, job_ids) if event.id <= self.last_id]
+
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+# Global event bus instance
+_event_bus: Optional[JobEventBus] = None
+
+
+def get_event_bus() -> JobEventBus:
+    """Get the global job event bus"""
+    global _event_bus
+    if _event_bus is None:
+        _event_bus = JobEventBus(
+            Config.LONG_TEXT_EVENT_HISTORY_SIZE,
+            Path(Config.LONG_TEXT_EVENT_LOG_PATH) if Config.LONG_TEXT_EVENT_LOG_PATH
+            else Path(Config.LONG_TEXT_DATA_DIR) / EVENTS_FILE_NAME,
+        )
+    return _event_bus
@@ -0,0 +1,327 @@
+"""
+SQLite index of long-text job metadata
+
+The job directories under LONG_TEXT_DATA_DIR stay the source of truth; this
+index mirrors every job's metadata (updated in the same call that writes
+metadata.json) so listing, history, search, statistics and cleanup are
+indexed queries instead of a scan that parses every job's files. Input text
+is searchable through an FTS5 trigram table, which keeps the substring,
+case-insensitive matching of the old scan.
+
+If the index is lost or out of date it can be rebuilt from disk:
+
+    python -m app.core.job_index --rebuild
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 2
+
+# File names of the index inside the data directory (with SQLite's WAL files)
+INDEX_FILE_NAME = "index.db"
+
+# Sort options of the history view -> ORDER BY clause
+SORT_ORDERS = {
+    "created_desc": "created_at DESC",
+    "created_asc": "created_at ASC",
+    # NULL sorts lowest, as datetime.min did in the scan
+    "completed_desc": "completed_at DESC",
+    "completed_asc": "completed_at ASC",
+    "duration_desc": "COALESCE(total_duration_seconds, 0) DESC",
+    "duration_asc": "COALESCE(total_duration_seconds, 0) ASC",
+    "name_asc": "LOWER(COALESCE(display_name, text_preview)) ASC",
+    "name_desc": "LOWER(COALESCE(display_name, text_preview)) DESC",
+    "size_desc": "COALESCE(audio_file_size, 0) DESC",
+    "size_asc": "COALESCE(audio_file_size, 0) ASC",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    job_id TEXT NOT NULL UNIQUE,
+    status TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    completed_at TEXT,
+    sort_date TEXT NOT NULL,
+    voice TEXT,
+    is_archived INTEGER NOT NULL DEFAULT 0,
+    display_name TEXT,
+    text_preview TEXT NOT NULL DEFAULT '',
+    total_duration_seconds REAL,
+    audio_file_size INTEGER,
+    total_processing_time_ms INTEGER NOT NULL DEFAULT 0,
+    storage_bytes INTEGER NOT NULL DEFAULT 0,
+    dedup_key TEXT,
+    metadata TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs(status, sort_date);
+CREATE INDEX IF NOT EXISTS jobs_created ON jobs(created_at);
+CREATE INDEX IF NOT EXISTS jobs_sort_date ON jobs(sort_date);
+CREATE INDEX IF NOT EXISTS jobs_completed ON jobs(completed_at);
+CREATE INDEX IF NOT EXISTS jobs_voice ON jobs(voice);
+CREATE INDEX IF NOT EXISTS jobs_archived ON jobs(is_archived, sort_date);
+"""
+
+
+def _timestamp(value: Optional[datetime]) -> Optional[str]:
+    """Fixed-width naive-UTC ISO string, so text order is time order"""
+    if value is None:
+        return None
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.strftime("%Y-%m-%dT%H:%M:%S.%f")
+
+
+def text_preview(text: str) -> str:
+    return text[:100] + ("..." if len(text) > 100 else "")
+
+
+class JobIndex:
+    """Indexed mirror of job metadata, safe to share between threads"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self.created = self._conn.execute("PRAGMA user_version").fetchone()[0] == 0
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+            self._migrate()
+            self.trigram = self._create_text_table()
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def _migrate(self):
+        """Add the columns of newer schema versions to an existing index"""
+        columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+        if "dedup_key" not in columns:
+            # Jobs indexed before have no key and are never matched as duplicates
+            self._conn.execute("ALTER TABLE jobs ADD COLUMN dedup_key TEXT")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_dedup ON jobs(dedup_key, status)")
+
+    def _create_text_table(self) -> bool:
+        """Full-text table for input text (rowid = jobs.id); plain LIKE table without FTS5 trigram"""
+        try:
+            self._conn.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS jobs_text USING fts5(input_text, tokenize='trigram')"
+            )
+            return True
+        except sqlite3.OperationalError as e:
+            logger.warning(f"SQLite FTS5 trigram tokenizer unavailable ({e}); text search will scan")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS jobs_text (rowid INTEGER PRIMARY KEY, input_text TEXT)")
+            return False
+
+    # Writes
+
+    def _upsert(self, metadata, storage_bytes: int):
+        completed_at = metadata.completion_timestamp or metadata.processing_completed_at
+        self._conn.execute(
+            """
+            INSERT INTO jobs (job_id, status, created_at, completed_at, sort_date, voice, is_archived,
+                              display_name, total_duration_seconds, audio_file_size,
+                              total_processing_time_ms, storage_bytes, dedup_key, metadata)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(job_id) DO UPDATE SET
+                status = excluded.status, created_at = excluded.created_at,
+                completed_at = excluded.completed_at, sort_date = excluded.sort_date,
+                voice = excluded.voice, is_archived = excluded.is_archived,
+                display_name = excluded.display_name,
+                total_duration_seconds = excluded.total_duration_seconds,
+                audio_file_size = excluded.audio_file_size,
+                total_processing_time_ms = excluded.total_processing_time_ms,
+                storage_bytes = excluded.storage_bytes, dedup_key = excluded.dedup_key,
+                metadata = excluded.metadata
+            """,
+            (
+                metadata.job_id, metadata.status.value, _timestamp(metadata.created_at),
+                _timestamp(completed_at), _timestamp(metadata.completion_timestamp or metadata.created_at),
+                metadata.voice, int(metadata.is_archived), metadata.display_name,
+                metadata.total_duration_seconds, metadata.audio_file_size,
+                metadata.total_processing_time_ms, storage_bytes, metadata.dedup_key,
+                json.dumps(metadata.dict(), default=str),
+            ),
+        )
+
+    def _set_text(self, job_id: str, text: str):
+        row = self._conn.execute("SELECT id FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        if row is None:
+            return
+        self._conn.execute("UPDATE jobs SET text_preview = ? WHERE id = ?", (text_preview(text), row["id"]))
+        self._conn.execute("DELETE FROM jobs_text WHERE rowid = ?", (row["id"],))
+        self._conn.execute("INSERT INTO jobs_text (rowid, input_text) VALUES (?, ?)", (row["id"], text))
+
+    def upsert(self, metadata, storage_bytes: int = 0):
+        """Insert or update a job's row from its metadata"""
+        with self._lock, self._conn:
+            self._upsert(metadata, storage_bytes)
+
+    def set_text(self, job_id: str, text: str):
+        """Index a job's input text (the job's metadata must be indexed first)"""
+        with self._lock, self._conn:
+            self._set_text(job_id, text)
+
+    def delete(self, job_id: str):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM jobs_text WHERE rowid = (SELECT id FROM jobs WHERE job_id = ?)", (job_id,))
+            self._conn.execute("DELETE FROM jobs WHERE job_id = ?", (job_id,))
+
+    def rebuild(self, entries: Iterable[Tuple[Any, Optional[str], int]]) -> int:
+        """Replace the whole index with (metadata, input text, storage bytes) entries in one transaction"""
+        count = 0
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM jobs_text")
+            self._conn.execute("DELETE FROM jobs")
+            for metadata, text, storage_bytes in entries:
+                self._upsert(metadata, storage_bytes)
+                if text is not None:
+                    self._set_text(metadata.job_id, text)
+                count += 1
+        return count
+
+    # Queries
+
+    def _query(self, sql: str, params: Iterable = ()) -> List[sqlite3.Row]:
+        with self._lock:
+            return self._conn.execute(sql, tuple(params)).fetchall()
+
+    def _search_clause(self, search_text: str) -> Tuple[str, List[Any]]:
+        pattern = "%" + search_text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        if self.trigram and len(search_text) >= 3:
+            text_match = "id IN (SELECT rowid FROM jobs_text WHERE jobs_text MATCH ?)"
+            text_param = '"' + search_text.replace('"', '""') + '"'
+        else:
+            text_match = "id IN (SELECT rowid FROM jobs_text WHERE input_text LIKE ? ESCAPE '\\')"
+            text_param = pattern
+        return f"({text_match} OR display_name LIKE ? ESCAPE '\\')", [text_param, pattern]
+
+    def _where(self, statuses: Optional[Iterable[str]] = None, start_date: Optional[datetime] = None,
+               end_date: Optional[datetime] = None, is_archived: Optional[bool] = None,
+               search_text: Optional[str] = None, sort_date_before: Optional[datetime] = None,
+               dedup_key: Optional[str] = None) -> Tuple[str, List[Any]]:
+        clauses, params = [], []
+        if statuses is not None:
+            statuses = list(statuses)
+            clauses.append(f"status IN ({', '.join('?' for _ in statuses)})")
+            params.extend(statuses)
+        if start_date:
+            clauses.append("sort_date >= ?")
+            params.append(_timestamp(start_date))
+        if end_date:
+            clauses.append("sort_date <= ?")
+            params.append(_timestamp(end_date))
+        if sort_date_before:
+            clauses.append("sort_date < ?")
+            params.append(_timestamp(sort_date_before))
+        if is_archived is not None:
+            clauses.append("is_archived = ?")
+            params.append(int(is_archived))
+        if dedup_key:
+            clauses.append("dedup_key = ?")
+            params.append(dedup_key)
+        if search_text:
+            clause, search_params = self._search_clause(search_text)
+            clauses.append(clause)
+            params.extend(search_params)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def list(self, sort_by: str = "created_desc", limit: Optional[int] = None, offset: int = 0,
+             **filters) -> List[sqlite3.Row]:
+        """Rows (metadata JSON and text preview) matching the filters, sorted and paginated"""
+        where, params = self._where(**filters)
+        order = SORT_ORDERS.get(sort_by, SORT_ORDERS["created_desc"])
+        sql = f"SELECT job_id, metadata, text_preview FROM jobs{where} ORDER BY {order}, job_id"
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params += [limit, offset]
+        return self._query(sql, params)
+
+    def job_ids(self, **filters) -> List[str]:
+        """Job IDs matching the filters, oldest first"""
+        where, params = self._where(**filters)
+        return [row["job_id"] for row in self._query(f"SELECT job_id FROM jobs{where} ORDER BY sort_date, job_id", params)]
+
+    def count_by_status(self, **filters) -> Dict[str, int]:
+        where, params = self._where(**filters)
+        rows = self._query(f"SELECT status, COUNT(*) AS n FROM jobs{where} GROUP BY status", params)
+        return {row["status"]: row["n"] for row in rows}
+
+    def storage_by_status(self) -> Dict[str, Tuple[int, int]]:
+        """status -> (job count, storage bytes)"""
+        rows = self._query("SELECT status, COUNT(*) AS n, SUM(storage_bytes) AS bytes FROM jobs GROUP BY status")
+        return {row["status"]: (row["n"], row["bytes"] or 0) for row in rows}
+
+    def oldest_by_storage(self, status: str) -> List[Tuple[str, int]]:
+        """(job_id, storage bytes) of jobs with `status`, oldest first"""
+        rows = self._query(
+            "SELECT job_id, storage_bytes FROM jobs WHERE status = ? ORDER BY sort_date, job_id", (status,)
+        )
+        return [(row["job_id"], row["storage_bytes"]) for row in rows]
+
+    def history_stats(self, completed_status: str, failed_status: str) -> Dict[str, Any]:
+        with self._lock:
+            totals = self._conn.execute(
+                """
+                SELECT COUNT(*) AS total,
+                       SUM(status = ?) AS completed,
+                       SUM(status = ?) AS failed,
+                       SUM(CASE WHEN status = ? THEN COALESCE(total_duration_seconds, 0) END) AS duration,
+                       SUM(CASE WHEN status = ? THEN COALESCE(audio_file_size, 0) END) AS storage,
+                       SUM(CASE WHEN status = ? THEN total_processing_time_ms END) AS processing_ms
+                FROM jobs
+                """,
+                (completed_status, failed_status, completed_status, completed_status, completed_status),
+            ).fetchone()
+            voice = self._conn.execute(
+                "SELECT voice FROM jobs WHERE voice IS NOT NULL AND voice != '' "
+                "GROUP BY voice ORDER BY COUNT(*) DESC, MIN(id) LIMIT 1"
+            ).fetchone()
+            months = self._conn.execute(
+                "SELECT SUBSTR(created_at, 1, 7) AS month, COUNT(*) AS n FROM jobs GROUP BY month ORDER BY month"
+            ).fetchall()
+        return {
+            "total_jobs": totals["total"] or 0,
+            "completed_jobs": totals["completed"] or 0,
+            "failed_jobs": totals["failed"] or 0,
+            "total_audio_duration_seconds": float(totals["duration"] or 0.0),
+            "total_storage_bytes": totals["storage"] or 0,
+            "total_processing_time_ms": totals["processing_ms"] or 0,
+            "most_used_voice": voice["voice"] if voice else None,
+            "jobs_by_month": {row["month"]: row["n"] for row in months},
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def _main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Maintain the long-text job index")
+    parser.add_argument("--rebuild", action="store_true", help="Rebuild the index from the job directories")
+    args = parser.parse_args()
+
+    from app.core.long_text_jobs import get_job_manager
+
+    manager = get_job_manager()
+    if args.rebuild:
+        count = manager.rebuild_index()
+        print(f"✅ Rebuilt job index at {manager.index.path} ({count} jobs)")
+    else:
+        counts = manager.index.count_by_status()
+        print(f"📇 Job index at {manager.index.path}: {sum(counts.values())} jobs {counts}")
+
+
+if __name__ == "__main__":
+    _main()
@@ -0,0 +1,190 @@
+"""
+Durable queue of long-text jobs waiting for (or holding) a processing slot
+
+Queued jobs are kept in SQLite next to the job index, so the queue survives
+restarts and is shared by every worker process using the same data directory.
+A processor takes the oldest available job by leasing it: the lease names the
+processor and expires unless it is renewed, so a job whose processor died is
+picked up again once its lease runs out (or at once, when the processor that
+starts next on the same host can tell the owner is gone). A job leaves the
+queue when its processing ends; a lease released on shutdown puts it back in
+its place.
+
+Every lease counts as an attempt and a gracefully released one is given
+back, so `attempts` counts the processors that died holding the job.
+"""
+
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# File name of the queue inside the data directory (with SQLite's WAL files)
+QUEUE_FILE_NAME = "queue.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS queue (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id TEXT NOT NULL UNIQUE,
+    enqueued_at REAL NOT NULL,
+    lease_owner TEXT,
+    lease_expires_at REAL,
+    attempts INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS queue_lease ON queue(lease_owner);
+"""
+
+
+def new_lease_owner() -> str:
+    """Lease owner name of a processor: host, process ID and a per-instance token"""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+def _owner_is_gone(owner: str) -> bool:
+    """Whether a lease owner is known to be dead (only decidable for owners on this host)"""
+    try:
+        host, pid, _ = owner.rsplit(":", 2)
+        pid = int(pid)
+    except ValueError:
+        return False
+    if host != socket.gethostname():
+        return False
+    if pid == os.getpid():
+        # One processor per process: any other owner with our PID is a
+        # previous instance, e.g. before a container restart reused the PID
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return True
+    except PermissionError:
+        pass
+    return False
+
+
+class DurableJobQueue:
+    """FIFO of job IDs with expiring leases, safe to share between threads and processes"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # Autocommit mode, so lease() can take the write lock before it reads
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._lock:
+            self._conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _transaction(self):
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def _query(self, sql: str, params: Iterable = ()) -> List[sqlite3.Row]:
+        with self._lock:
+            return self._conn.execute(sql, tuple(params)).fetchall()
+
+    def enqueue(self, job_ids: Iterable[str]):
+        """Append jobs in order; a job already queued keeps its place"""
+        now = time.time()
+        with self._transaction():
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO queue (job_id, enqueued_at) VALUES (?, ?)",
+                [(job_id, now) for job_id in job_ids],
+            )
+
+    def lease(self, owner: str, lease_seconds: float) -> Optional[Tuple[str, int]]:
+        """Lease the oldest job that is not leased (or whose lease expired); (job_id, attempts) or None"""
+        now = time.time()
+        with self._transaction():
+            row = self._conn.execute(
+                "SELECT seq, job_id, attempts FROM queue WHERE lease_owner IS NULL OR lease_expires_at < ? "
+                "ORDER BY seq LIMIT 1", (now,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE queue SET lease_owner = ?, lease_expires_at = ?, attempts = attempts + 1 WHERE seq = ?",
+                (owner, now + lease_seconds, row["seq"]),
+            )
+            return row["job_id"], row["attempts"] + 1
+
+    def renew(self, owner: str, lease_seconds: float) -> Set[str]:
+        """Extend every lease `owner` still holds; returns the IDs of those jobs"""
+        with self._transaction():
+            self._conn.execute(
+                "UPDATE queue SET lease_expires_at = ? WHERE lease_owner = ?", (time.time() + lease_seconds, owner)
+            )
+            rows = self._conn.execute("SELECT job_id FROM queue WHERE lease_owner = ?", (owner,)).fetchall()
+        return {row["job_id"] for row in rows}
+
+    def release(self, job_id: str, owner: str):
+        """Give a lease back without finishing the job; it keeps its place in the queue"""
+        with self._transaction():
+            self._conn.execute(
+                "UPDATE queue SET lease_owner = NULL, lease_expires_at = NULL, attempts = MAX(attempts - 1, 0) "
+                "WHERE job_id = ? AND lease_owner = ?", (job_id, owner)
+            )
+
+    def remove(self, job_id: str, owner: Optional[str] = None):
+        """Take a job off the queue (only if `owner` still holds its lease, when given)"""
+        with self._transaction():
+            if owner is None:
+                self._conn.execute("DELETE FROM queue WHERE job_id = ?", (job_id,))
+            else:
+                self._conn.execute("DELETE FROM queue WHERE job_id = ? AND lease_owner = ?", (job_id, owner))
+
+    def release_dead_leases(self) -> List[str]:
+        """Release leases whose owner is known to have died; returns the job IDs"""
+        released = []
+        with self._transaction():
+            rows = self._conn.execute("SELECT job_id, lease_owner FROM queue WHERE lease_owner IS NOT NULL").fetchall()
+            for row in rows:
+                if _owner_is_gone(row["lease_owner"]):
+                    self._conn.execute(
+                        "UPDATE queue SET lease_owner = NULL, lease_expires_at = NULL WHERE job_id = ?",
+                        (row["job_id"],)
+                    )
+                    released.append(row["job_id"])
+        return released
+
+    def leased_job_ids(self) -> Set[str]:
+        """Jobs held under a lease that has not expired"""
+        rows = self._query("SELECT job_id FROM queue WHERE lease_expires_at >= ?", (time.time(),))
+        return {row["job_id"] for row in rows}
+
+    def job_ids(self) -> List[str]:
+        """Every job in the queue, in queue order"""
+        return [row["job_id"] for row in self._query("SELECT job_id FROM queue ORDER BY seq")]
+
+    def positions(self) -> Dict[str, int]:
+        """Place of each job waiting for a lease (1 = next), in queue order"""
+        rows = self._query(
+            "SELECT job_id FROM queue WHERE lease_owner IS NULL OR lease_expires_at < ? ORDER BY seq", (time.time(),)
+        )
+        return {row["job_id"]: position for position, row in enumerate(rows, start=1)}
+
+    def stats(self) -> Dict[str, int]:
+        now = time.time()
+        row = self._query(
+            "SELECT COUNT(*) AS total, SUM(lease_expires_at >= ?) AS leased FROM queue", (now,)
+        )[0]
+        leased = row["leased"] or 0
+        return {"queued": row["total"] - leased, "leased": leased}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -7,6 +7,8 @@ import hashlib
 import json
 import os
 import shutil
+import sqlite3
+import threading
 import uuid
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -14,6 +16,18 @@ from typing import Any, Dict, List, Optional, Set, Tuple
 import logging
 
 from app.config import Config
+from app.core.chunk_planner import plan_paragraphs
+from app.core.processing_estimator import (
+    JOB_OVERHEAD_SECONDS,
+    MIN_OBSERVATIONS,
+    get_processing_estimator,
+    voice_key
+)
+from app.core.job_events import JOB_DELETED, STATUS_CHANGE, get_event_bus
+from app.core.job_index import INDEX_FILE_NAME, JobIndex
+from app.core.job_queue import QUEUE_FILE_NAME, DurableJobQueue
+from app.core.silence import pause_after_text
+from app.core.tts_model import get_model_registry
 from app.core.voice_library import get_voice_library
 from app.models.long_text import (
     LongTextJobStatus,
@@ -28,6 +42,74 @@ from app.models.long_text import (
 
 logger = logging.getLogger(__name__)
 
+# Statuses of jobs that still need processing time
+_UNFINISHED_STATUSES = (LongTextJobStatus.PENDING, LongTextJobStatus.CHUNKING, LongTextJobStatus.PROCESSING)
+# Statuses of jobs whose processing has ended with a result
+_FINISHED_STATUSES = (LongTextJobStatus.COMPLETED, LongTextJobStatus.FAILED)
+
+
+def file_digest(path: Path) -> Tuple[int, str]:
+    """Size in bytes and SHA256 hex digest of a file"""
+    digest = hashlib.sha256()
+    size = 0
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+            size += len(block)
+    return size, digest.hexdigest()
+
+
+def link_or_copy(source: Path, destination: Path) -> bool:
+    """
+    Make `destination` a hard link to `source`, sharing its storage, or a
+    copy where links are not possible (another filesystem). Returns whether
+    it was linked. Only for files that are replaced rather than rewritten.
+    """
+    # Never write through an existing destination: it may share another job's storage
+    if destination.exists():
+        destination.unlink()
+    try:
+        os.link(source, destination)
+        return True
+    except OSError:
+        shutil.copy2(source, destination)
+        return False
+
+
+class DeadlineExceededError(Exception):
+    """Raised when a job is predicted to finish after the caller's deadline"""
+
+    def __init__(self, predicted_seconds: float, deadline_seconds: float):
+        self.predicted_seconds = predicted_seconds
+        self.deadline_seconds = deadline_seconds
+        super().__init__(
+            f"Predicted completion in {predicted_seconds:.0f}s exceeds the deadline of {deadline_seconds:.0f}s"
+        )
+
+
+class LiveJob:
+    """
+    In-memory state of a job while it is being processed. It is the source of
+    truth for the job until processing ends; its files are written behind it.
+    """
+
+    __slots__ = ("metadata", "chunks", "stop_requested", "version", "chunks_version",
+                 "written_version", "written_chunks_version", "written_status")
+
+    def __init__(self, metadata: LongTextJobMetadata, chunks: List[LongTextChunk]):
+        self.metadata = metadata
+        self.chunks = chunks
+        # Set when the job is paused or cancelled; the processor checks it between units
+        self.stop_requested = threading.Event()
+        # Change counters, so an older snapshot never overwrites a newer file
+        self.version = 0
+        self.chunks_version = 0
+        self.written_version = 0
+        self.written_chunks_version = 0
+        # Status in the metadata file as of our last write; a different one
+        # on disk was set by another worker (e.g. a pause)
+        self.written_status = metadata.status
+
 
 class LongTextJobManager:
     """Manages long text TTS jobs with filesystem persistence"""
@@ -35,9 +117,22 @@ class LongTextJobManager:
     def __init__(self):
         self.data_dir = Path(Config.LONG_TEXT_DATA_DIR)
         self.active_jobs: Dict[str, asyncio.Task] = {}
-        self.job_queue: asyncio.Queue = asyncio.Queue()
-        self.processing_semaphore = asyncio.Semaphore(Config.LONG_TEXT_MAX_CONCURRENT_JOBS)
+        # Set whenever a job is queued; the processor waiting for work installs it
+        self.queue_changed: Optional[asyncio.Event] = None
+        self._live: Dict[str, LiveJob] = {}
+        self._dirty: Set[str] = set()
+        self._write_lock = threading.Lock()
+        self._flusher: Optional[asyncio.Task] = None
+        # Voice file path -> ((size, mtime), SHA256), so voices are not rehashed per job
+        self._voice_digests: Dict[str, Tuple[Tuple[int, int], str]] = {}
         self._ensure_data_directory()
+        self.index = JobIndex(Path(Config.LONG_TEXT_INDEX_PATH) if Config.LONG_TEXT_INDEX_PATH
+                              else self.data_dir / INDEX_FILE_NAME)
+        if self.index.created and any(item.is_dir() for item in self.data_dir.iterdir()):
+            logger.info("Building job index from existing job directories")
+            self.rebuild_index()
+        self.queue = DurableJobQueue(Path(Config.LONG_TEXT_QUEUE_PATH) if Config.LONG_TEXT_QUEUE_PATH
+                                     else self.data_dir / QUEUE_FILE_NAME)
 
     def _ensure_data_directory(self):
         """Ensure the data directory structure exists"""
@@ -74,17 +169,41 @@ class LongTextJobManager:
         paths['output_dir'].mkdir(exist_ok=True)
 
     def _save_job_metadata(self, metadata: LongTextJobMetadata):
-        """Save job metadata to filesystem"""
-        paths = self._get_job_file_paths(metadata.job_id)
-
+        """Save job metadata to filesystem (written through, also for a job being processed)"""
         # Update timestamp
         metadata.updated_at = datetime.utcnow()
 
-        with open(paths['metadata'], 'w') as f:
+        live = self._live.get(metadata.job_id)
+        if live is not None:
+            live.metadata = metadata
+            live.version += 1
+            self._write_live_snapshot(self._live_snapshot(live))
+            return
+
+        with self._write_lock:
+            self._write_metadata_file(metadata)
+
+    def _write_metadata_file(self, metadata: LongTextJobMetadata):
+        paths = self._get_job_file_paths(metadata.job_id)
+        tmp_path = paths['metadata'].with_suffix('.json.tmp')
+        with open(tmp_path, 'w') as f:
             json.dump(metadata.dict(), f, indent=2, default=str)
+        os.replace(tmp_path, paths['metadata'])
+
+        # The files are the source of truth; a failed index update is repaired by a rebuild
+        try:
+            self.index.upsert(metadata, self._calculate_job_size(metadata.job_id))
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to index job {metadata.job_id}: {e}")
 
     def _load_job_metadata(self, job_id: str) -> Optional[LongTextJobMetadata]:
-        """Load job metadata from filesystem"""
+        """Load job metadata (from memory while the job is being processed)"""
+        live = self._live.get(job_id)
+        if live is not None:
+            return live.metadata
+        return self._read_metadata_file(job_id)
+
+    def _read_metadata_file(self, job_id: str) -> Optional[LongTextJobMetadata]:
         paths = self._get_job_file_paths(job_id)
 
         if not paths['metadata'].exists():
@@ -106,15 +225,31 @@ class LongTextJobManager:
             return None
 
     def _save_chunks_data(self, job_id: str, chunks: List[LongTextChunk]):
-        """Save chunks data to filesystem"""
-        paths = self._get_job_file_paths(job_id)
+        """Save chunks data to filesystem (atomically: it is the job's resume checkpoint)"""
+        live = self._live.get(job_id)
+        if live is not None:
+            live.chunks = chunks
+            live.chunks_version += 1
+            self._write_live_snapshot(self._live_snapshot(live))
+            return
 
+        with self._write_lock:
+            self._write_chunks_file(job_id, chunks)
+
+    def _write_chunks_file(self, job_id: str, chunks: List[LongTextChunk]):
+        paths = self._get_job_file_paths(job_id)
         chunks_data = [chunk.dict() for chunk in chunks]
-        with open(paths['chunks'], 'w') as f:
+        tmp_path = paths['chunks'].with_suffix('.json.tmp')
+        with open(tmp_path, 'w') as f:
             json.dump(chunks_data, f, indent=2, default=str)
+        os.replace(tmp_path, paths['chunks'])
 
     def _load_chunks_data(self, job_id: str) -> List[LongTextChunk]:
-        """Load chunks data from filesystem"""
+        """Load chunks data (from memory while the job is being processed)"""
+        live = self._live.get(job_id)
+        if live is not None:
+            return list(live.chunks)
+
         paths = self._get_job_file_paths(job_id)
 
         if not paths['chunks'].exists():
@@ -137,6 +272,224 @@ class LongTextJobManager:
             logger.error(f"Failed to load chunks data for job {job_id}: {e}")
             return []
 
+    def open_live_job(self, job_id: str) -> Optional[LiveJob]:
+        """
+        Load a job into memory for processing. Until close_live_job, reads are
+        served from memory and progress marked with mark_job_dirty is written
+        behind by the state flusher.
+        """
+        live = self._live.get(job_id)
+        if live is None:
+            metadata = self._load_job_metadata(job_id)
+            if not metadata:
+                return None
+            live = self._live[job_id] = LiveJob(metadata, self._load_chunks_data(job_id))
+        return live
+
+    def close_live_job(self, live: LiveJob):
+        """Write a processed job's outstanding changes and drop it from memory"""
+        job_id = live.metadata.job_id
+        self._dirty.discard(job_id)
+        self._write_live_snapshot(self._live_snapshot(live))
+        if self._live.get(job_id) is live:
+            del self._live[job_id]
+
+    def is_job_live(self, job_id: str) -> bool:
+        """Whether a job is being processed in this process (its state is in memory)"""
+        return job_id in self._live
+
+    def discard_live_job(self, live: LiveJob):
+        """
+        Drop a job from memory without writing its outstanding changes, for a
+        job another worker has taken over; reads come from its files again.
+        """
+        job_id = live.metadata.job_id
+        self._dirty.discard(job_id)
+        if self._live.get(job_id) is live:
+            del self._live[job_id]
+
+    def mark_job_dirty(self, job_id: str, chunks: bool = False):
+        """
+        Record that a live job's metadata (and its chunks, if `chunks`) changed
+        in memory. The change is written by the next flush, or right away when
+        no flusher is running.
+        """
+        live = self._live.get(job_id)
+        if live is None:
+            return
+        live.metadata.updated_at = datetime.utcnow()
+        live.version += 1
+        if chunks:
+            live.chunks_version += 1
+        if self._flusher is None:
+            self._write_live_snapshot(self._live_snapshot(live))
+        else:
+            self._dirty.add(job_id)
+
+    def _live_snapshot(self, live: LiveJob) -> Tuple[LiveJob, int, LongTextJobMetadata, int, Optional[List[LongTextChunk]]]:
+        """Copy of a live job's state, taken on the event loop so it can be written from another thread"""
+        chunks = None
+        if live.chunks_version > live.written_chunks_version:
+            chunks = [chunk.copy() for chunk in live.chunks]
+        return live, live.version, live.metadata.copy(deep=True), live.chunks_version, chunks
+
+    def _write_live_snapshot(self, snapshot):
+        live, version, metadata, chunks_version, chunks = snapshot
+        with self._write_lock:
+            # Deleted while it was running: nothing left to write to
+            if not self._get_job_directory(metadata.job_id).exists():
+                return
+            if chunks is not None and chunks_version > live.written_chunks_version:
+                self._write_chunks_file(metadata.job_id, chunks)
+                live.written_chunks_version = chunks_version
+            if version > live.written_version:
+                stored = self._read_metadata_file(metadata.job_id)
+                changed_elsewhere = stored is not None and stored.status != live.written_status
+                if changed_elsewhere:
+                    self._adopt_stored_status(live, metadata, stored)
+                # A job finished by another worker keeps that worker's metadata
+                if not (changed_elsewhere and stored.status in _FINISHED_STATUSES):
+                    self._write_metadata_file(metadata)
+                live.written_version = version
+                live.written_status = metadata.status
+
+    def _adopt_stored_status(self, live: LiveJob, metadata: LongTextJobMetadata, stored: LongTextJobMetadata):
+        """
+        Keep a status another worker set while this one was processing the job
+        (paused, cancelled, resumed or finished elsewhere) instead of writing
+        ours over it, and stop processing here.
+        """
+        logger.info(f"Job {metadata.job_id} became {stored.status.value} elsewhere, stopping processing here")
+        for target in (metadata, live.metadata):
+            target.status = stored.status
+            target.processing_paused_at = stored.processing_paused_at
+        live.stop_requested.set()
+
+    def start_state_flusher(self):
+        """Start writing live job state behind (needs a running event loop)"""
+        if self._flusher is None and Config.LONG_TEXT_STATE_FLUSH_INTERVAL > 0:
+            self._flusher = asyncio.create_task(self._flush_state_loop())
+
+    async def stop_state_flusher(self):
+        """Stop the flusher and write everything still outstanding"""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            try:
+                await self._flusher
+            except asyncio.CancelledError:
+                pass
+            self._flusher = None
+        self.flush_job_state()
+
+    def flush_job_state(self):
+        """Write all outstanding live job changes now"""
+        dirty, self._dirty = self._dirty, set()
+        for job_id in dirty:
+            live = self._live.get(job_id)
+            if live is not None:
+                self._write_live_snapshot(self._live_snapshot(live))
+
+    async def _flush_state_loop(self):
+        """Coalesce live job changes into one write per job every LONG_TEXT_STATE_FLUSH_INTERVAL seconds"""
+        loop = asyncio.get_event_loop()
+        while True:
+            await asyncio.sleep(Config.LONG_TEXT_STATE_FLUSH_INTERVAL)
+            dirty, self._dirty = self._dirty, set()
+            for job_id in dirty:
+                live = self._live.get(job_id)
+                if live is None:
+                    continue
+                try:
+                    await loop.run_in_executor(None, self._write_live_snapshot, self._live_snapshot(live))
+                except Exception as e:
+                    logger.error(f"Failed to write state of job {job_id}: {e}")
+                    self._dirty.add(job_id)
+
+    def verify_chunk_audio(self, job_id: str, chunks: List[LongTextChunk]) -> int:
+        """
+        Check the audio of every chunk that has some against the size and
+        SHA256 recorded when it was written. Chunks whose file is missing or
+        differs lose their audio_file so they are generated again; chunks from
+        before digests were recorded get one if their file is present.
+        Returns the number of chunks with verified audio.
+        """
+        chunks_dir = self._get_job_file_paths(job_id)['chunks_dir']
+        verified = 0
+        for chunk in chunks:
+            if not chunk.audio_file:
+                continue
+            audio_path = chunks_dir / chunk.audio_file
+            try:
+                size, sha256 = file_digest(audio_path)
+            except OSError:
+                size, sha256 = None, None
+
+            if size and (chunk.audio_sha256 is None or (size, sha256) == (chunk.audio_bytes, chunk.audio_sha256)):
+                chunk.audio_bytes, chunk.audio_sha256 = size, sha256
+                verified += 1
+            else:
+                logger.warning(f"Job {job_id}: audio for chunk {chunk.index + 1} is missing or corrupt, regenerating it")
+                chunk.audio_file = None
+                chunk.audio_bytes = chunk.audio_sha256 = None
+        return verified
+
+    def enqueue_job(self, job_id: str):
+        """Queue a job for processing (a job already queued keeps its place)"""
+        self.queue.enqueue([job_id])
+        if self.queue_changed is not None:
+            self.queue_changed.set()
+
+    def recover_interrupted_jobs(self) -> List[str]:
+        """
+        Jobs left unfinished by a shutdown or crash, reset to pending and
+        queued again; they resume from their verified chunks. Jobs still
+        leased by a live worker (another process) are left to it, and queue
+        entries of jobs that no longer need processing are dropped.
+        """
+        self.queue.release_dead_leases()
+        leased = self.queue.leased_job_ids()
+        recovered = []
+        unfinished = set()
+        for job_id in self.index.job_ids(statuses=[status.value for status in _UNFINISHED_STATUSES]):
+            metadata = self._load_job_metadata(job_id)
+            if not metadata or metadata.status not in _UNFINISHED_STATUSES:
+                continue
+            unfinished.add(job_id)
+            if job_id in leased:
+                continue
+            if metadata.deduplicated_from:
+                # Waits for its source rather than the queue, unless the source ended meanwhile
+                if not self._is_followable(metadata.deduplicated_from):
+                    self._settle_followers(metadata.deduplicated_from, metadata.dedup_key)
+                continue
+            if metadata.status != LongTextJobStatus.PENDING:
+                metadata.status = LongTextJobStatus.PENDING
+                self._save_job_metadata(metadata)
+                self.publish_status(metadata, "Recovered after restart")
+            recovered.append(metadata)
+
+        for job_id in self.queue.job_ids():
+            if job_id not in unfinished and job_id not in leased:
+                self.queue.remove(job_id)
+        # Jobs still in the queue keep their place; the others follow in creation order
+        recovered_ids = [metadata.job_id for metadata in sorted(recovered, key=lambda m: m.created_at)]
+        self.queue.enqueue(recovered_ids)
+        return recovered_ids
+
+    def rebuild_index(self) -> int:
+        """Rebuild the job index from the job directories on disk; returns the number of jobs"""
+        def entries():
+            for job_dir in sorted(self.data_dir.iterdir()):
+                if not job_dir.is_dir() or job_dir.name == 'history':
+                    continue
+                metadata = self._load_job_metadata(job_dir.name)
+                if metadata:
+                    yield metadata, self._load_input_text(job_dir.name), self._calculate_job_size(job_dir.name)
+
+        count = self.index.rebuild(entries())
+        logger.info(f"Rebuilt job index with {count} jobs")
+        return count
+
     def _save_input_text(self, job_id: str, text: str):
         """Save input text to filesystem"""
         paths = self._get_job_file_paths(job_id)
@@ -144,6 +497,11 @@ class LongTextJobManager:
         with open(paths['input_text'], 'w', encoding='utf-8') as f:
             f.write(text)
 
+        try:
+            self.index.set_text(job_id, text)
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to index text of job {job_id}: {e}")
+
     def _load_input_text(self, job_id: str) -> Optional[str]:
         """Load input text from filesystem"""
         paths = self._get_job_file_paths(job_id)
@@ -158,6 +516,322 @@ class LongTextJobManager:
             logger.error(f"Failed to load input text for job {job_id}: {e}")
             return None
 
+    def _unit_cache_key(self, text: str, voice: Optional[str], language_id: str,
+                        parameters: Dict[str, Any]) -> str:
+        """Hash of everything that determines a synthesis unit's audio"""
+        payload = {
+            'text': text,
+            'voice': voice,
+            'language_id': language_id,
+            **{key: parameters.get(key) for key in ('exaggeration', 'cfg_weight', 'temperature', 'model')}
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode('utf-8')).hexdigest()
+
+    def _voice_digest(self, voice: Optional[str]) -> str:
+        """SHA256 of a voice's audio file (its path if the file cannot be read)"""
+        voice_path = (get_voice_library().get_voice_path(voice) if voice else None) or Config.VOICE_SAMPLE_PATH
+        try:
+            stat = os.stat(voice_path)
+            cached = self._voice_digests.get(voice_path)
+            if cached and cached[0] == (stat.st_size, stat.st_mtime_ns):
+                return cached[1]
+            _, digest = file_digest(Path(voice_path))
+            self._voice_digests[voice_path] = ((stat.st_size, stat.st_mtime_ns), digest)
+            return digest
+        except OSError:
+            return voice_path
+
+    def job_dedup_key(self, text_hash: str, voice: Optional[str], output_format: str,
+                      parameters: Dict[str, Any]) -> str:
+        """
+        Hash of everything that determines a job's audio: its text, the voice
+        audio (not its name), the generation settings with defaults filled in,
+        the output format and the model variant that will generate it.
+        """
+        language_id = self._voice_language(voice)
+        try:
+            model = get_model_registry().resolve_variant(parameters.get('model'), language_id).name
+        except Exception:
+            model = parameters.get('model')
+        defaults = {'exaggeration': Config.EXAGGERATION, 'cfg_weight': Config.CFG_WEIGHT,
+                    'temperature': Config.TEMPERATURE}
+        payload = {
+            'text_hash': text_hash,
+            'voice': self._voice_digest(voice),
+            'language_id': language_id,
+            'model': model,
+            'output_format': output_format,
+            **{key: parameters.get(key) if parameters.get(key) is not None else default
+               for key, default in defaults.items()}
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode('utf-8')).hexdigest()
+
+    def find_duplicate_job(self, dedup_key: str) -> Optional[LongTextJobMetadata]:
+        """
+        A job a new job with `dedup_key` can reuse: a completed job with all
+        of its audio on disk, otherwise the oldest one still in progress that
+        generates its own audio (not a follower of another).
+        """
+        statuses = [LongTextJobStatus.COMPLETED, *_UNFINISHED_STATUSES]
+        in_progress = None
+        for job_id in self.index.job_ids(statuses=[status.value for status in statuses], dedup_key=dedup_key):
+            metadata = self._load_job_metadata(job_id)
+            if not metadata or metadata.dedup_key != dedup_key:
+                continue
+            if metadata.status == LongTextJobStatus.COMPLETED:
+                if (not metadata.failed_chunks and metadata.output_path
+                        and (self._get_job_directory(job_id) / metadata.output_path).is_file()):
+                    return metadata
+            elif metadata.status in _UNFINISHED_STATUSES and in_progress is None and not metadata.deduplicated_from:
+                in_progress = metadata
+        return in_progress
+
+    def _create_deduplicated_job(self, source: LongTextJobMetadata, text: str, voice: str,
+                                 parameters: Dict[str, Any], session_id: Optional[str]) -> str:
+        """A new, already completed job sharing the audio files of the completed job `source`"""
+        metadata = self._create_follower_metadata(source, text, voice, parameters, session_id)
+        self._complete_from_duplicate(metadata, source)
+        return metadata.job_id
+
+    def _create_follower_job(self, source: LongTextJobMetadata, text: str, voice: str,
+                             parameters: Dict[str, Any], session_id: Optional[str]) -> str:
+        """
+        A new job that waits for the identical job `source`, still in
+        progress, and completes with its audio. The new job is the caller's
+        own: cancelling either job leaves the other running (see
+        _settle_followers).
+        """
+        metadata = self._create_follower_metadata(source, text, voice, parameters, session_id)
+        self.publish_status(metadata)
+        # The source may have finished before the follower was saved, in which case nothing settled it
+        if not self._is_followable(source.job_id):
+            self._settle_followers(source.job_id, source.dedup_key)
+        return metadata.job_id
+
+    def _is_followable(self, job_id: str) -> bool:
+        """Whether a job may still produce audio for its followers (unfinished or paused)"""
+        metadata = self._load_job_metadata(job_id)
+        return metadata is not None and metadata.status in (*_UNFINISHED_STATUSES, LongTextJobStatus.PAUSED)
+
+    def _create_follower_metadata(self, source: LongTextJobMetadata, text: str, voice: str,
+                                  parameters: Dict[str, Any], session_id: Optional[str]) -> LongTextJobMetadata:
+        job_id = str(uuid.uuid4())
+        self._create_job_directories(job_id)
+        metadata = LongTextJobMetadata(
+            job_id=job_id,
+            text_length=len(text),
+            text_hash=source.text_hash,
+            total_chunks=source.total_chunks,
+            voice=voice,
+            parameters=parameters,
+            output_format=source.output_format,
+            user_session_id=session_id,
+            dedup_key=source.dedup_key,
+            deduplicated_from=source.job_id
+        )
+        self._save_job_metadata(metadata)
+        self._save_input_text(job_id, text)
+        return metadata
+
+    def _complete_from_duplicate(self, metadata: LongTextJobMetadata, source: LongTextJobMetadata):
+        """Complete a job with the audio files of the completed job `source`, linked rather than copied"""
+        job_id = metadata.job_id
+        source_paths = self._get_job_file_paths(source.job_id)
+        paths = self._get_job_file_paths(job_id)
+
+        # Unit audio is shared too, so the job can be streamed and retried like its source
+        units = self._load_chunks_data(source.job_id)
+        for unit in units:
+            if unit.audio_file and (source_paths['chunks_dir'] / unit.audio_file).is_file():
+                link_or_copy(source_paths['chunks_dir'] / unit.audio_file, paths['chunks_dir'] / unit.audio_file)
+            else:
+                unit.audio_file = None
+        output_file = Path(source.output_path).name
+        link_or_copy(source_paths['output_dir'] / output_file, paths['output_dir'] / output_file)
+
+        metadata.deduplicated_from = source.job_id
+        metadata.total_chunks = source.total_chunks
+        metadata.completed_chunks = source.completed_chunks
+        if not metadata.processing_started_at:
+            metadata.processing_started_at = datetime.utcnow()
+        self._save_job_metadata(metadata)
+        self._save_chunks_data(job_id, units)
+        self.complete_job(
+            job_id=job_id,
+            output_path=source.output_path,
+            output_size_bytes=source.output_size_bytes,
+            output_duration_seconds=source.output_duration_seconds,
+            trimmed_silence_seconds=source.trimmed_silence_seconds
+        )
+
+    def _followers(self, source_job_id: str, dedup_key: Optional[str]) -> List[LongTextJobMetadata]:
+        """Jobs waiting for the job `source_job_id` to finish, oldest first"""
+        if not dedup_key:
+            return []
+        followers = []
+        for job_id in self.index.job_ids(statuses=[LongTextJobStatus.PENDING.value], dedup_key=dedup_key):
+            metadata = self._load_job_metadata(job_id)
+            if (metadata and metadata.status == LongTextJobStatus.PENDING
+                    and metadata.deduplicated_from == source_job_id):
+                followers.append(metadata)
+        return sorted(followers, key=lambda m: m.created_at)
+
+    def _settle_followers(self, source_job_id: str, dedup_key: Optional[str]):
+        """
+        Finish the jobs following the job `source_job_id`, which has ended (or
+        was deleted): they complete with its audio if it completed with all
+        of it. Otherwise the oldest follower is planned and queued to generate
+        the audio itself, and the others follow it instead.
+        """
+        followers = self._followers(source_job_id, dedup_key)
+        if not followers:
+            return
+        source = self._load_job_metadata(source_job_id)
+        if (source is not None and source.status == LongTextJobStatus.COMPLETED and not source.failed_chunks
+                and source.output_path and (self._get_job_directory(source_job_id) / source.output_path).is_file()):
+            for follower in followers:
+                self._complete_from_duplicate(follower, source)
+                logger.info(f"Completed job {follower.job_id} with the audio of identical job {source_job_id}")
+            return
+
+        leader, others = followers[0], followers[1:]
+        units = self.plan_job_units(self._load_input_text(leader.job_id) or "", leader.voice, leader.parameters)
+        if not units:
+            leader.status = LongTextJobStatus.FAILED
+            leader.error = "Input text contains no speakable content"
+            self._save_job_metadata(leader)
+            self.publish_status(leader)
+            return
+        leader.deduplicated_from = None
+        leader.total_chunks = len(units)
+        self._save_chunks_data(leader.job_id, units)
+        self._save_job_metadata(leader)
+        self.enqueue_job(leader.job_id)
+        logger.info(f"Identical job {source_job_id} ended without its audio; job {leader.job_id} generates it")
+        for follower in others:
+            follower.deduplicated_from = leader.job_id
+            self._save_job_metadata(follower)
+
+    def _voice_language(self, voice: Optional[str]) -> str:
+        """Language of a library voice ("en" if unknown)"""
+        language_id = get_voice_library().get_voice_language(voice) if voice else None
+        return language_id or "en"
+
+    def _voice_key(self, voice: Optional[str]) -> str:
+        """Voice key used for processing-time estimates"""
+        return voice_key(get_voice_library().get_voice_path(voice) if voice else None)
+
+    def plan_job_units(self, text: str, voice: Optional[str],
+                       parameters: Dict[str, Any]) -> List[LongTextChunk]:
+        """
+        Split a job's text into its final synthesis units: token-budgeted chunks
+        of whole sentences that never cross a paragraph break. Each unit is
+        generated with a single model call, and its pause_after_ms is the
+        silence placed after it in the final audio, chosen from the
+        punctuation it ends with (or a paragraph pause).
+        """
+        language_id = self._voice_language(voice)
+
+        # Measure with the model's tokenizer if the variant is already loaded;
+        # otherwise plan_chunks approximates tokens by characters
+        model = None
+        try:
+            registry = get_model_registry()
+            variant = registry.resolve_variant(parameters.get('model'), language_id)
+            model = registry.get_resident(variant.name)
+        except Exception as e:
+            logger.warning(f"Planning without a tokenizer: {e}")
+
+        units: List[LongTextChunk] = []
+        for paragraph_index, plan in enumerate(plan_paragraphs(text, model, language_id).paragraphs):
+            last = len(plan.chunks) - 1
+            for i, (chunk_text, tokens, seconds) in enumerate(
+                    zip(plan.chunks, plan.token_counts, plan.estimated_seconds)):
+                units.append(LongTextChunk(
+                    index=len(units),
+                    text=chunk_text,
+                    text_preview=chunk_text[:50] + ("..." if len(chunk_text) > 50 else ""),
+                    character_count=len(chunk_text),
+                    paragraph_index=paragraph_index,
+                    pause_after_ms=pause_after_text(chunk_text, paragraph_end=i == last),
+                    token_count=tokens,
+                    estimated_seconds=round(seconds, 3),
+                    cache_key=self._unit_cache_key(chunk_text, voice, language_id, parameters)
+                ))
+
+        if units:
+            units[-1].pause_after_ms = 0
+        return units
+
+    def estimate_units_seconds(self, units: List[LongTextChunk], voice: Optional[str]) -> float:
+        """Predicted seconds to generate `units` with `voice`, excluding job overhead"""
+        return get_processing_estimator().predict_chunks(
+            (unit.character_count for unit in units), self._voice_language(voice), self._voice_key(voice)
+        )
+
+    def job_parallelism(self, metadata: LongTextJobMetadata) -> int:
+        """Units of a job generated at the same time (its request, or the configured default)"""
+        requested = metadata.parameters.get('parallelism') or Config.LONG_TEXT_JOB_PARALLELISM
+        return max(1, min(requested, Config.LONG_TEXT_MAX_JOB_PARALLELISM))
+
+    def estimate_remaining_seconds(self, metadata: LongTextJobMetadata,
+                                   chunks: List[LongTextChunk]) -> float:
+        """
+        Predicted seconds until a job finishes: the learned estimate for its
+        pending units, scaled by how its completed units compared with their
+        estimates, plus setup and concatenation overhead.
+        """
+        if not chunks:
+            # Not planned yet (jobs created before planning happened up front)
+            return get_processing_estimator().predict_chunks(
+                [metadata.text_length], self._voice_language(metadata.voice), self._voice_key(metadata.voice)
+            ) + JOB_OVERHEAD_SECONDS
+
+        pending = [chunk for chunk in chunks if not chunk.audio_file]
+        remaining = self.estimate_units_seconds(pending, metadata.voice)
+
+        completed = [chunk for chunk in chunks if chunk.audio_file and chunk.duration_ms]
+        if len(completed) >= MIN_OBSERVATIONS:
+            predicted = self.estimate_units_seconds(completed, metadata.voice)
+            # Units generated side by side overlap in time
+            actual = sum(chunk.duration_ms for chunk in completed) / 1000 / self.job_parallelism(metadata)
+            if predicted > 0:
+                remaining *= min(max(actual / predicted, 0.5), 2.0)
+
+        return remaining + JOB_OVERHEAD_SECONDS
+
+    def queue_wait(self, job_id: str) -> Tuple[Optional[int], Optional[float]]:
+        """
+        Place of a job in the queue (1 = next to start) and the predicted
+        seconds of work ahead of it: the running jobs and the jobs queued
+        before it. (None, None) if the job is not waiting in the queue.
+        """
+        positions = self.queue.positions()
+        position = positions.get(job_id)
+        if position is None:
+            return None, None
+        ahead = [other for other, place in positions.items() if place < position]
+        ahead.extend(self.queue.leased_job_ids())
+        seconds = 0.0
+        for other in ahead:
+            metadata = self._load_job_metadata(other)
+            if metadata and metadata.status in _UNFINISHED_STATUSES:
+                seconds += self.estimate_remaining_seconds(metadata, self._load_chunks_data(other))
+        return position, seconds
+
+    def get_backlog_seconds(self) -> float:
+        """
+        Predicted seconds of work in unfinished jobs. Jobs share one model, so
+        this is also roughly the wait before a new job's units get their turn.
+        """
+        total = 0.0
+        for job_id in self.index.job_ids(statuses=[status.value for status in _UNFINISHED_STATUSES]):
+            metadata = self._load_job_metadata(job_id)
+            # A follower's work is its source's, which is counted already
+            if metadata and metadata.status in _UNFINISHED_STATUSES and not metadata.deduplicated_from:
+                total += self.estimate_remaining_seconds(metadata, self._load_chunks_data(job_id))
+        return total
+
     def create_job(self,
                    text: str,
                    voice: Optional[str] = None,
@@ -165,25 +839,37 @@ class LongTextJobManager:
                    exaggeration: Optional[float] = None,
                    cfg_weight: Optional[float] = None,
                    temperature: Optional[float] = None,
-                   session_id: Optional[str] = None) -> Tuple[str, int]:
+                   session_id: Optional[str] = None,
+                   model: Optional[str] = None,
+                   deadline_seconds: Optional[float] = None,
+                   parallelism: Optional[int] = None,
+                   deduplicate: bool = True) -> Tuple[str, int, Optional[str]]:
         """
         Create a new long text job
 
+        Args:
+            deadline_seconds: Reject the job if its predicted completion (queued
+                work plus its own processing) is further away than this
+            parallelism: Units generated at the same time (None for
+                LONG_TEXT_JOB_PARALLELISM; capped by LONG_TEXT_MAX_JOB_PARALLELISM)
+            deduplicate: Reuse an identical job (see job_dedup_key) instead of
+                generating the audio again: an identical completed job is
+                copied into a new completed job that shares its files, and
+                for one still in progress a new job is created that waits
+                for it and then completes the same way
+
         Returns:
-            Tuple of (job_id, estimated_chunks)
+            Tuple of (job_id, estimated_chunks, deduplicated_from), where
+            deduplicated_from is the identical job reused (None for a new job)
+
+        Raises:
+            DeadlineExceededError: if the job would miss `deadline_seconds`
         """
         # Generate unique job ID
         job_id = str(uuid.uuid4())
 
-        # Calculate text hash for potential deduplication
         text_hash = self._generate_text_hash(text)
 
-        # Estimate number of chunks
-        estimated_chunks = max(1, (len(text) + Config.LONG_TEXT_CHUNK_SIZE - 1) // Config.LONG_TEXT_CHUNK_SIZE)
-
-        # Create job directories
-        self._create_job_directories(job_id)
-
         # Resolve voice name for storage (use default if no voice specified)
         resolved_voice_name = voice
         if not voice:
@@ -192,6 +878,51 @@ class LongTextJobManager:
             default_voice = voice_lib.get_default_voice()
             resolved_voice_name = default_voice or "Default"
 
+        parameters = {
+            'exaggeration': exaggeration,
+            'cfg_weight': cfg_weight,
+            'temperature': temperature,
+            'output_format': output_format,
+            'model': model,
+            'parallelism': parallelism
+        }
+
+        # Resubmissions of the same text and settings reuse the audio already
+        # generated (or being generated) instead of producing it again
+        dedup_key = self.job_dedup_key(text_hash, resolved_voice_name, output_format, parameters)
+        duplicate = self.find_duplicate_job(dedup_key) if deduplicate else None
+        if duplicate and duplicate.status == LongTextJobStatus.COMPLETED:
+            job_id = self._create_deduplicated_job(duplicate, text, resolved_voice_name, parameters, session_id)
+            logger.info(f"Created job {job_id} from the audio of identical job {duplicate.job_id}")
+            return job_id, duplicate.total_chunks, duplicate.job_id
+        if duplicate:
+            if deadline_seconds is not None:
+                position, wait_seconds = self.queue_wait(duplicate.job_id)
+                predicted = (wait_seconds or 0.0) + self.estimate_remaining_seconds(
+                    duplicate, self._load_chunks_data(duplicate.job_id))
+                if predicted > deadline_seconds:
+                    raise DeadlineExceededError(predicted, deadline_seconds)
+            job_id = self._create_follower_job(duplicate, text, resolved_voice_name, parameters, session_id)
+            logger.info(f"Created job {job_id} following identical job {duplicate.job_id} in progress")
+            return job_id, duplicate.total_chunks, duplicate.job_id
+
+        # Plan the synthesis units up front so progress is exact from the start
+        units = self.plan_job_units(text, resolved_voice_name, parameters)
+        if not units:
+            raise ValueError("Input text contains no speakable content")
+        estimated_chunks = len(units)
+
+        # Admission check against the caller's deadline
+        if deadline_seconds is not None:
+            predicted = (self.get_backlog_seconds()
+                         + self.estimate_units_seconds(units, resolved_voice_name)
+                         + JOB_OVERHEAD_SECONDS)
+            if predicted > deadline_seconds:
+                raise DeadlineExceededError(predicted, deadline_seconds)
+
+        # Create job directories
+        self._create_job_directories(job_id)
+
         # Create metadata
         metadata = LongTextJobMetadata(
             job_id=job_id,
@@ -199,22 +930,20 @@ class LongTextJobManager:
             text_hash=text_hash,
             total_chunks=estimated_chunks,
             voice=resolved_voice_name,
-            parameters={
-                'exaggeration': exaggeration,
-                'cfg_weight': cfg_weight,
-                'temperature': temperature,
-                'output_format': output_format
-            },
+            parameters=parameters,
             output_format=output_format,
-            user_session_id=session_id
+            user_session_id=session_id,
+            dedup_key=dedup_key
         )
 
         # Save to filesystem
         self._save_job_metadata(metadata)
         self._save_input_text(job_id, text)
+        self._save_chunks_data(job_id, units)
+        self.publish_status(metadata)
 
         logger.info(f"Created job {job_id} for {len(text)} characters ({estimated_chunks} chunks)")
-        return job_id, estimated_chunks
+        return job_id, estimated_chunks, None
 
     def get_job_status(self, job_id: str) -> Optional[LongTextJobResponse]:
         """Get current status and progress of a job"""
@@ -239,6 +968,11 @@ class LongTextJobManager:
         if metadata.status == LongTextJobStatus.COMPLETED and metadata.output_path:
             download_url = f"/v1/audio/speech/long/{job_id}/download"
 
+        # Audio can be streamed until the job fails or is cancelled
+        stream_url = None
+        if metadata.status not in (LongTextJobStatus.FAILED, LongTextJobStatus.CANCELLED):
+            stream_url = f"/v1/audio/speech/long/{job_id}/stream"
+
         return LongTextJobResponse(
             job_id=job_id,
             status=metadata.status,
@@ -247,6 +981,7 @@ class LongTextJobManager:
             created_at=metadata.created_at,
             updated_at=metadata.updated_at,
             download_url=download_url,
+            stream_url=stream_url,
             can_pause=can_pause,
             can_resume=can_resume,
             can_cancel=can_cancel
@@ -269,12 +1004,26 @@ class LongTextJobManager:
         else:
             overall_progress = 0.0
 
-        # Estimate remaining time based on completed chunks
+        # Estimate remaining time from learned per-chunk generation times,
+        # plus the work ahead of the job while it waits in the queue
         estimated_remaining = None
-        if completed_chunks and metadata.current_chunk is not None:
-            avg_time_per_chunk = sum(c.duration_ms or 0 for c in completed_chunks) / len(completed_chunks)
-            remaining_chunks = metadata.total_chunks - len(completed_chunks)
-            estimated_remaining = int((avg_time_per_chunk * remaining_chunks) / 1000)
+        queue_position = estimated_wait = None
+        source = None
+        if metadata.status in _UNFINISHED_STATUSES and metadata.deduplicated_from:
+            source = self._load_job_metadata(metadata.deduplicated_from)
+        if source is not None:
+            # A follower is done when the job it follows is
+            source_progress = self._calculate_progress(source, self._load_chunks_data(source.job_id))
+            overall_progress = source_progress.overall_progress
+            estimated_remaining = source_progress.estimated_remaining_seconds
+        elif metadata.status in _UNFINISHED_STATUSES or metadata.status == LongTextJobStatus.PAUSED:
+            remaining = self.estimate_remaining_seconds(metadata, chunks)
+            if metadata.status in _UNFINISHED_STATUSES:
+                queue_position, wait_seconds = self.queue_wait(metadata.job_id)
+                if queue_position is not None:
+                    estimated_wait = int(round(wait_seconds))
+                    remaining += wait_seconds
+            estimated_remaining = int(round(remaining))
 
         return LongTextProgress(
             job_id=metadata.job_id,
@@ -282,72 +1031,50 @@ class LongTextJobManager:
             current_chunk=current_chunk,
             completed_chunks=completed_chunks,
             estimated_remaining_seconds=estimated_remaining,
+            queue_position=queue_position,
+            estimated_wait_seconds=estimated_wait,
             status=metadata.status,
             error=metadata.error
         )
 
-    def list_jobs(self, session_id: Optional[str] = None, limit: int = 50) -> LongTextJobList:
-        """List all jobs, optionally filtered by session ID"""
-        jobs = []
-        active_count = 0
-        completed_count = 0
-
-        # Scan all job directories
-        if self.data_dir.exists():
-            for job_dir in self.data_dir.iterdir():
-                if not job_dir.is_dir():
-                    continue
-
-                metadata = self._load_job_metadata(job_dir.name)
-                if not metadata:
-                    continue
-
-                # Session ID filtering removed - show all jobs for better UX
-
-                # Load input text for preview
-                input_text = self._load_input_text(job_dir.name) or ""
-                text_preview = input_text[:100] + ("..." if len(input_text) > 100 else "")
-
-                # Calculate progress
-                chunks = self._load_chunks_data(job_dir.name)
-                progress = self._calculate_progress(metadata, chunks)
-
-                # Generate download URL if completed
-                download_url = None
-                if metadata.status == LongTextJobStatus.COMPLETED:
-                    download_url = f"/v1/audio/speech/long/{job_dir.name}/download"
-
-                # Count job types
-                if metadata.status in [LongTextJobStatus.PENDING, LongTextJobStatus.PROCESSING]:
-                    active_count += 1
-                elif metadata.status == LongTextJobStatus.COMPLETED:
-                    completed_count += 1
-
-                jobs.append(LongTextJobListItem(
-                    job_id=job_dir.name,
-                    status=metadata.status,
-                    text_preview=text_preview,
-                    text_length=metadata.text_length,
-                    progress_percentage=progress.overall_progress,
-                    created_at=metadata.created_at,
-                    completed_at=metadata.processing_completed_at,
-                    download_url=download_url,
-                    can_resume=metadata.status == LongTextJobStatus.PAUSED,
-                    voice=metadata.voice,
-                    parameters=metadata.parameters
-                ))
-
-        # Sort by creation date (newest first)
-        jobs.sort(key=lambda x: x.created_at, reverse=True)
+    def _list_item(self, row, queue_positions: Optional[Dict[str, int]] = None) -> LongTextJobListItem:
+        """History/list entry from an index row"""
+        metadata = LongTextJobMetadata(**json.loads(row["metadata"]))
+        progress = min(100.0, metadata.completed_chunks / metadata.total_chunks * 100) if metadata.total_chunks else 0.0
+        return LongTextJobListItem(
+            job_id=metadata.job_id,
+            status=metadata.status,
+            text_preview=row["text_preview"],
+            text_length=metadata.text_length,
+            progress_percentage=progress,
+            created_at=metadata.created_at,
+            completed_at=metadata.completion_timestamp or metadata.processing_completed_at,
+            download_url=(f"/v1/audio/speech/long/{metadata.job_id}/download"
+                          if metadata.status == LongTextJobStatus.COMPLETED else None),
+            can_resume=metadata.status == LongTextJobStatus.PAUSED,
+            queue_position=(queue_positions or {}).get(metadata.job_id),
+            voice=metadata.voice,
+            total_duration_seconds=metadata.total_duration_seconds,
+            audio_file_size=metadata.audio_file_size,
+            retry_count=metadata.retry_count,
+            is_archived=metadata.is_archived,
+            display_name=metadata.display_name,
+            tags=metadata.tags,
+            last_accessed=metadata.last_accessed,
+            parameters=metadata.parameters
+        )
 
-        # Apply limit
-        jobs = jobs[:limit]
+    def list_jobs(self, session_id: Optional[str] = None, limit: int = 50) -> LongTextJobList:
+        """List the newest jobs (session ID filtering removed - show all jobs for better UX)"""
+        positions = self.queue.positions()
+        jobs = [self._list_item(row, positions) for row in self.index.list(sort_by="created_desc", limit=limit)]
+        counts = self.index.count_by_status()
 
         return LongTextJobList(
             jobs=jobs,
             total_jobs=len(jobs),
-            active_jobs=active_count,
-            completed_jobs=completed_count
+            active_jobs=counts.get(LongTextJobStatus.PENDING.value, 0) + counts.get(LongTextJobStatus.PROCESSING.value, 0),
+            completed_jobs=counts.get(LongTextJobStatus.COMPLETED.value, 0)
         )
 
     def list_history_jobs(self, session_id: Optional[str] = None,
@@ -359,193 +1086,46 @@ class LongTextJobManager:
                          sort_by: str = "completed_desc",
                          limit: int = 50, offset: int = 0) -> LongTextJobList:
         """List jobs for history view with advanced filtering and sorting"""
-        jobs = []
-        active_count = 0
-        completed_count = 0
-
-        if not self.data_dir.exists():
-            return LongTextJobList(jobs=[], total_jobs=0, active_jobs=0, completed_jobs=0)
-
-        # Collect all jobs first
-        all_jobs = []
-        for job_dir in self.data_dir.iterdir():
-            if not job_dir.is_dir() or job_dir.name in ['history']:
-                continue
-
-            metadata = self._load_job_metadata(job_dir.name)
-            if not metadata:
-                continue
-
-            # Session ID filtering removed - show all jobs for better UX
-
-            # Status filter
-            if status_filter and metadata.status != status_filter:
-                continue
-
-            # Date filters
-            comparison_date = metadata.completion_timestamp or metadata.created_at
-            if start_date and comparison_date < start_date:
-                continue
-            if end_date and comparison_date > end_date:
-                continue
-
-            # Archive filter
-            if is_archived is not None and metadata.is_archived != is_archived:
-                continue
-
-            # Search filter
-            if search_text:
-                input_text = self._load_input_text(job_dir.name) or ""
-                display_name = metadata.display_name or ""
-                if (search_text.lower() not in input_text.lower() and
-                    search_text.lower() not in display_name.lower()):
-                    continue
-
-            # Load input text for preview
-            input_text = self._load_input_text(job_dir.name) or ""
-            text_preview = input_text[:100] + ("..." if len(input_text) > 100 else "")
-
-            # Calculate progress
-            chunks = self._load_chunks_data(job_dir.name)
-            progress = self._calculate_progress(metadata, chunks)
-
-            # Generate download URL if completed
-            download_url = None
-            if metadata.status == LongTextJobStatus.COMPLETED:
-                download_url = f"/v1/audio/speech/long/{job_dir.name}/download"
-
-            # Count job types
-            if metadata.status in [LongTextJobStatus.PENDING, LongTextJobStatus.PROCESSING]:
-                active_count += 1
-            elif metadata.status == LongTextJobStatus.COMPLETED:
-                completed_count += 1
-
-            job_item = LongTextJobListItem(
-                job_id=job_dir.name,
-                status=metadata.status,
-                text_preview=text_preview,
-                text_length=metadata.text_length,
-                progress_percentage=progress.overall_progress,
-                created_at=metadata.created_at,
-                completed_at=metadata.completion_timestamp or metadata.processing_completed_at,
-                download_url=download_url,
-                can_resume=metadata.status == LongTextJobStatus.PAUSED,
-                voice=metadata.voice,
-                total_duration_seconds=metadata.total_duration_seconds,
-                audio_file_size=metadata.audio_file_size,
-                retry_count=metadata.retry_count,
-                is_archived=metadata.is_archived,
-                display_name=metadata.display_name,
-                tags=metadata.tags,
-                last_accessed=metadata.last_accessed,
-                parameters=metadata.parameters
-            )
-            all_jobs.append(job_item)
-
-        # Sort jobs
-        if sort_by == "created_desc":
-            all_jobs.sort(key=lambda x: x.created_at, reverse=True)
-        elif sort_by == "created_asc":
-            all_jobs.sort(key=lambda x: x.created_at)
-        elif sort_by == "completed_desc":
-            all_jobs.sort(key=lambda x: x.completed_at or datetime.min, reverse=True)
-        elif sort_by == "completed_asc":
-            all_jobs.sort(key=lambda x: x.completed_at or datetime.min)
-        elif sort_by == "duration_desc":
-            all_jobs.sort(key=lambda x: x.total_duration_seconds or 0, reverse=True)
-        elif sort_by == "duration_asc":
-            all_jobs.sort(key=lambda x: x.total_duration_seconds or 0)
-        elif sort_by == "name_asc":
-            all_jobs.sort(key=lambda x: (x.display_name or x.text_preview).lower())
-        elif sort_by == "name_desc":
-            all_jobs.sort(key=lambda x: (x.display_name or x.text_preview).lower(), reverse=True)
-        elif sort_by == "size_desc":
-            all_jobs.sort(key=lambda x: x.audio_file_size or 0, reverse=True)
-        elif sort_by == "size_asc":
-            all_jobs.sort(key=lambda x: x.audio_file_size or 0)
-
-        # Apply pagination
-        total_count = len(all_jobs)
-        jobs = all_jobs[offset:offset + limit]
+        # Session ID filtering removed - show all jobs for better UX
+        filters = dict(
+            statuses=[status_filter.value] if status_filter else None,
+            start_date=start_date,
+            end_date=end_date,
+            is_archived=is_archived,
+            search_text=search_text
+        )
+        rows = self.index.list(sort_by=sort_by, limit=limit, offset=offset, **filters)
+        counts = self.index.count_by_status(**filters)
+        positions = self.queue.positions()
 
         return LongTextJobList(
-            jobs=jobs,
-            total_jobs=total_count,
-            active_jobs=active_count,
-            completed_jobs=completed_count
+            jobs=[self._list_item(row, positions) for row in rows],
+            total_jobs=sum(counts.values()),
+            active_jobs=counts.get(LongTextJobStatus.PENDING.value, 0) + counts.get(LongTextJobStatus.PROCESSING.value, 0),
+            completed_jobs=counts.get(LongTextJobStatus.COMPLETED.value, 0)
         )
 
     def get_history_stats(self, session_id: Optional[str] = None) -> Dict[str, Any]:
         """Get statistics for job history"""
-        if not self.data_dir.exists():
-            return {
-                "total_jobs": 0,
-                "completed_jobs": 0,
-                "failed_jobs": 0,
-                "total_audio_duration_seconds": 0.0,
-                "total_storage_bytes": 0,
-                "average_processing_time_seconds": 0.0,
-                "success_rate_percentage": 0.0,
-                "most_used_voice": None,
-                "jobs_by_month": {}
-            }
-
-        total_jobs = 0
-        completed_jobs = 0
-        failed_jobs = 0
-        total_audio_duration = 0.0
-        total_storage_bytes = 0
-        total_processing_time = 0
-        voice_counts = {}
-        jobs_by_month = {}
-
-        for job_dir in self.data_dir.iterdir():
-            if not job_dir.is_dir() or job_dir.name in ['history']:
-                continue
-
-            metadata = self._load_job_metadata(job_dir.name)
-            if not metadata:
-                continue
-
-            # Session ID filtering removed - show all jobs for better UX
-
-            total_jobs += 1
-
-            if metadata.status == LongTextJobStatus.COMPLETED:
-                completed_jobs += 1
-                if metadata.total_duration_seconds:
-                    total_audio_duration += metadata.total_duration_seconds
-                if metadata.audio_file_size:
-                    total_storage_bytes += metadata.audio_file_size
-                if metadata.total_processing_time_ms:
-                    total_processing_time += metadata.total_processing_time_ms
-
-            elif metadata.status == LongTextJobStatus.FAILED:
-                failed_jobs += 1
-
-            # Track voice usage
-            if metadata.voice:
-                voice_counts[metadata.voice] = voice_counts.get(metadata.voice, 0) + 1
-
-            # Track jobs by month
-            month_key = metadata.created_at.strftime("%Y-%m")
-            jobs_by_month[month_key] = jobs_by_month.get(month_key, 0) + 1
+        # Session ID filtering removed - show all jobs for better UX
+        stats = self.index.history_stats(LongTextJobStatus.COMPLETED.value, LongTextJobStatus.FAILED.value)
+        total_jobs = stats["total_jobs"]
+        completed_jobs = stats["completed_jobs"]
 
         # Calculate averages and percentages
         success_rate = (completed_jobs / total_jobs * 100) if total_jobs > 0 else 0.0
-        avg_processing_time = (total_processing_time / completed_jobs / 1000) if completed_jobs > 0 else 0.0
-        most_used_voice = max(voice_counts, key=voice_counts.get) if voice_counts else None
+        avg_processing_time = (stats["total_processing_time_ms"] / completed_jobs / 1000) if completed_jobs > 0 else 0.0
 
         return {
             "total_jobs": total_jobs,
             "completed_jobs": completed_jobs,
-            "failed_jobs": failed_jobs,
-            "total_audio_duration_seconds": total_audio_duration,
-            "total_storage_bytes": total_storage_bytes,
+            "failed_jobs": stats["failed_jobs"],
+            "total_audio_duration_seconds": stats["total_audio_duration_seconds"],
+            "total_storage_bytes": stats["total_storage_bytes"],
             "average_processing_time_seconds": avg_processing_time,
             "success_rate_percentage": success_rate,
-            "most_used_voice": most_used_voice,
-            "jobs_by_month": jobs_by_month
+            "most_used_voice": stats["most_used_voice"],
+            "jobs_by_month": stats["jobs_by_month"]
         }
 
     def pause_job(self, job_id: str) -> bool:
@@ -563,6 +1143,10 @@ class LongTextJobManager:
         metadata.status = LongTextJobStatus.PAUSED
         metadata.processing_paused_at = datetime.utcnow()
         self._save_job_metadata(metadata)
+        self._request_stop(job_id)
+        # A worker in another process notices its lease is gone and stops
+        self.queue.remove(job_id)
+        self.publish_status(metadata)
 
         logger.info(f"Paused job {job_id}")
         return True
@@ -577,9 +1161,10 @@ class LongTextJobManager:
         metadata.status = LongTextJobStatus.PENDING
         metadata.processing_paused_at = None
         self._save_job_metadata(metadata)
+        self.publish_status(metadata)
 
-        # Add back to queue for processing
-        asyncio.create_task(self.job_queue.put(job_id))
+        # Back in the queue, behind the jobs already waiting
+        self.enqueue_job(job_id)
 
         logger.info(f"Resumed job {job_id}")
         return True
@@ -601,12 +1186,39 @@ class LongTextJobManager:
         # Update metadata
         metadata.status = LongTextJobStatus.CANCELLED
         self._save_job_metadata(metadata)
+        self._request_stop(job_id)
+        self.queue.remove(job_id)
+        self.publish_status(metadata)
 
         logger.info(f"Cancelled job {job_id}")
         return True
 
+    def publish_status(self, metadata: LongTextJobMetadata, message: Optional[str] = None):
+        """Notify progress subscribers, and jobs following this one, of a job's (new) status"""
+        data = {"status": metadata.status.value}
+        if message:
+            data["message"] = message
+        if metadata.status == LongTextJobStatus.FAILED and metadata.error:
+            data["error"] = metadata.error
+        if metadata.status == LongTextJobStatus.COMPLETED:
+            data["duration_seconds"] = metadata.output_duration_seconds
+            data["download_url"] = f"/v1/audio/speech/long/{metadata.job_id}/download"
+        get_event_bus().publish(metadata.job_id, STATUS_CHANGE, data)
+        if metadata.status in (*_FINISHED_STATUSES, LongTextJobStatus.CANCELLED):
+            self._settle_followers(metadata.job_id, metadata.dedup_key)
+
+    def _request_stop(self, job_id: str):
+        """
+        Tell the processor working on a job in this process to stop after its
+        current unit (one in another process stops when it next writes the
+        job's state and finds the new status)
+        """
+        live = self._live.get(job_id)
+        if live is not None:
+            live.stop_requested.set()
+
     def complete_job(self, job_id: str, output_path: str, output_size_bytes: int,
-                    output_duration_seconds: float) -> bool:
+                    output_duration_seconds: float, trimmed_silence_seconds: Optional[float] = None) -> bool:
         """Mark a job as completed and set up for history persistence"""
         metadata = self._load_job_metadata(job_id)
         if not metadata:
@@ -620,6 +1232,7 @@ class LongTextJobManager:
         metadata.output_size_bytes = output_size_bytes
         metadata.output_duration_seconds = output_duration_seconds
         metadata.total_duration_seconds = output_duration_seconds
+        metadata.trimmed_silence_seconds = trimmed_silence_seconds
 
         # Set up persistent storage for history
         persistent_path = self._setup_persistent_storage(job_id, output_path)
@@ -643,6 +1256,7 @@ class LongTextJobManager:
             )
 
         self._save_job_metadata(metadata)
+        self.publish_status(metadata)
         logger.info(f"Completed job {job_id} - Duration: {output_duration_seconds:.1f}s, Size: {output_size_bytes:,} bytes")
         return True
 
@@ -660,9 +1274,9 @@ class LongTextJobManager:
             persistent_dir = self.data_dir / "history" / job_id
             persistent_dir.mkdir(parents=True, exist_ok=True)
 
-            # Copy file to persistent location
+            # Link (or copy) the file to the persistent location
             persistent_file = persistent_dir / source_file.name
-            shutil.copy2(source_file, persistent_file)
+            link_or_copy(source_file, persistent_file)
 
             return str(persistent_file.relative_to(self.data_dir))
 
@@ -747,14 +1361,18 @@ class LongTextJobManager:
         if new_parameters:
             parameters.update(new_parameters)
 
-        new_job_id, _ = self.create_job(
+        # A retry regenerates what failed, so it never reuses another job
+        new_job_id, _, _ = self.create_job(
             text=input_text,
             voice=original_metadata.voice,
             output_format=original_metadata.output_format,
             exaggeration=parameters.get('exaggeration'),
             cfg_weight=parameters.get('cfg_weight'),
             temperature=parameters.get('temperature'),
-            session_id=original_metadata.user_session_id
+            session_id=original_metadata.user_session_id,
+            model=parameters.get('model'),
+            parallelism=parameters.get('parallelism'),
+            deduplicate=False
         )
 
         # Update metadata to link to original job
@@ -764,25 +1382,44 @@ class LongTextJobManager:
             new_metadata.retry_count = original_metadata.retry_count + 1
             self._save_job_metadata(new_metadata)
 
-        # If preserving chunks, copy successful ones
+        # If preserving chunks, carry over audio for units whose text and
+        # settings are unchanged (matched by cache key)
         if preserve_chunks:
             try:
                 original_chunks = self._load_chunks_data(job_id)
-                successful_chunks = [chunk for chunk in original_chunks if chunk.audio_file and not chunk.error]
-
-                if successful_chunks:
-                    # Copy successful chunk files to new job
-                    new_paths = self._get_job_file_paths(new_job_id)
-                    original_paths = self._get_job_file_paths(job_id)
-
-                    for chunk in successful_chunks:
-                        if chunk.audio_file:
-                            original_file = original_paths['chunks_dir'] / chunk.audio_file
-                            if original_file.exists():
-                                new_file = new_paths['chunks_dir'] / chunk.audio_file
-                                shutil.copy2(original_file, new_file)
-
-                    logger.info(f"Copied {len(successful_chunks)} successful chunks to retry job {new_job_id}")
+                original_paths = self._get_job_file_paths(job_id)
+                self.verify_chunk_audio(job_id, original_chunks)
+                available = {}
+                for chunk in original_chunks:
+                    if chunk.audio_file and not chunk.error and chunk.cache_key:
+                        original_file = original_paths['chunks_dir'] / chunk.audio_file
+                        available.setdefault(chunk.cache_key, (chunk, original_file))
+
+                new_paths = self._get_job_file_paths(new_job_id)
+                new_chunks = self._load_chunks_data(new_job_id)
+                preserved = 0
+                for chunk in new_chunks:
+                    match = available.get(chunk.cache_key)
+                    if not match:
+                        continue
+                    original_chunk, original_file = match
+                    chunk.audio_file = f"chunk_{chunk.index + 1:03d}.wav"
+                    link_or_copy(original_file, new_paths['chunks_dir'] / chunk.audio_file)
+                    chunk.audio_seconds = original_chunk.audio_seconds
+                    chunk.trimmed_seconds = original_chunk.trimmed_seconds
+                    chunk.audio_bytes = original_chunk.audio_bytes
+                    chunk.audio_sha256 = original_chunk.audio_sha256
+                    chunk.duration_ms = original_chunk.duration_ms
+                    chunk.processing_started_at = original_chunk.processing_started_at
+                    chunk.processing_completed_at = original_chunk.processing_completed_at
+                    preserved += 1
+
+                if preserved:
+                    self._save_chunks_data(new_job_id, new_chunks)
+                    if new_metadata:
+                        new_metadata.completed_chunks = preserved
+                        self._save_job_metadata(new_metadata)
+                    logger.info(f"Preserved {preserved} completed chunks in retry job {new_job_id}")
 
             except Exception as e:
                 logger.warning(f"Failed to preserve chunks for retry job {new_job_id}: {e}")
@@ -802,7 +1439,12 @@ class LongTextJobManager:
 
         # Remove all files
         try:
+            self._dirty.discard(job_id)
+            self._live.pop(job_id, None)
             shutil.rmtree(job_dir)
+            self.index.delete(job_id)
+            self.queue.remove(job_id)
+            get_event_bus().publish(job_id, JOB_DELETED)
             logger.info(f"Deleted job {job_id}")
             return True
         except Exception as e:
@@ -827,38 +1469,17 @@ class LongTextJobManager:
         deleted_count = 0
         freed_bytes = 0
 
-        # First pass: Delete jobs past retention period
-        for job_dir in self.data_dir.iterdir():
-            if not job_dir.is_dir() or job_dir.name == 'history':
-                continue
-
-            metadata = self._load_job_metadata(job_dir.name)
-            if not metadata:
-                continue
-
-            # Delete based on retention policy
-            should_delete = False
-            comparison_date = metadata.completion_timestamp or metadata.created_at
-            
-            # Skip if date is missing
-            if not comparison_date:
-                continue
-
-            if metadata.status == LongTextJobStatus.COMPLETED:
-                # Keep completed jobs longer if they're not archived
-                if metadata.is_archived and comparison_date < cutoff_date:
-                    should_delete = True
-                elif not metadata.is_archived and comparison_date < cutoff_date:
-                    should_delete = True
-            elif metadata.status in [LongTextJobStatus.FAILED, LongTextJobStatus.CANCELLED]:
-                if comparison_date < failed_cutoff:
-                    should_delete = True
-
-            if should_delete:
-                job_size = self._calculate_job_size(job_dir.name)
-                if self.delete_job(job_dir.name):
-                    deleted_count += 1
-                    freed_bytes += job_size
+        # First pass: Delete jobs past retention period (dated by completion, else creation)
+        expired = self.index.job_ids(statuses=[LongTextJobStatus.COMPLETED.value], sort_date_before=cutoff_date)
+        expired += self.index.job_ids(
+            statuses=[LongTextJobStatus.FAILED.value, LongTextJobStatus.CANCELLED.value],
+            sort_date_before=failed_cutoff
+        )
+        for job_id in expired:
+            job_size = self._calculate_job_size(job_id)
+            if self.delete_job(job_id):
+                deleted_count += 1
+                freed_bytes += job_size
 
         # Second pass: If storage limit exceeded, delete oldest completed jobs
         if max_storage_bytes:
@@ -899,37 +1520,12 @@ class LongTextJobManager:
         return total_size
 
     def _calculate_total_storage(self) -> int:
-        """Calculate total storage used by all jobs"""
-        total_size = 0
-
-        if not self.data_dir.exists():
-            return 0
-
-        for job_dir in self.data_dir.iterdir():
-            if job_dir.is_dir():
-                total_size += self._calculate_job_size(job_dir.name)
-
-        return total_size
+        """Total storage used by all jobs, as of each job's last metadata update"""
+        return sum(size for _, size in self.index.storage_by_status().values())
 
     def _get_oldest_jobs_by_storage(self) -> List[Tuple[str, int]]:
-        """Get jobs sorted by age (oldest first) with their storage sizes"""
-        jobs_with_size = []
-
-        for job_dir in self.data_dir.iterdir():
-            if not job_dir.is_dir() or job_dir.name == 'history':
-                continue
-
-            metadata = self._load_job_metadata(job_dir.name)
-            if not metadata or metadata.status != LongTextJobStatus.COMPLETED:
-                continue
-
-            job_size = self._calculate_job_size(job_dir.name)
-            comparison_date = metadata.completion_timestamp or metadata.created_at
-            jobs_with_size.append((job_dir.name, job_size, comparison_date))
-
-        # Sort by date (oldest first)
-        jobs_with_size.sort(key=lambda x: x[2])
-        return [(job_id, size) for job_id, size, _ in jobs_with_size]
+        """Get completed jobs sorted by age (oldest first) with their storage sizes"""
+        return self.index.oldest_by_storage(LongTextJobStatus.COMPLETED.value)
 
     def cleanup_orphaned_files(self):
         """Clean up orphaned files that don't belong to valid jobs"""
@@ -939,7 +1535,10 @@ class LongTextJobManager:
         cleaned_count = 0
 
         for item in self.data_dir.iterdir():
-            if item.is_file():
+            if item.is_file() and item.name.startswith((INDEX_FILE_NAME, QUEUE_FILE_NAME)):
+                # The job index, the queue and their WAL files
+                continue
+            elif item.is_file():
                 # Remove any loose files in the data directory
                 try:
                     item.unlink()
@@ -957,80 +1556,45 @@ class LongTextJobManager:
                     except OSError:
                         continue
 
+        # Index rows of jobs whose directory is gone
+        for job_id in self.index.job_ids():
+            if not self._get_job_directory(job_id).is_dir():
+                self.index.delete(job_id)
+                cleaned_count += 1
+
         if cleaned_count > 0:
             logger.info(f"Cleaned up {cleaned_count} orphaned files/directories")
 
     def auto_archive_old_completed_jobs(self, archive_days: int = 30):
         """Automatically archive old completed jobs"""
-        if not self.data_dir.exists():
-            return
-
         archive_cutoff = datetime.utcnow() - timedelta(days=archive_days)
         archived_count = 0
 
-        for job_dir in self.data_dir.iterdir():
-            if not job_dir.is_dir() or job_dir.name == 'history':
-                continue
-
-            metadata = self._load_job_metadata(job_dir.name)
-            if not metadata:
-                continue
-
-            # Auto-archive old completed jobs that aren't already archived
-            if (metadata.status == LongTextJobStatus.COMPLETED and
-                not metadata.is_archived and
-                (metadata.completion_timestamp or metadata.created_at) < archive_cutoff):
-
-                if self.archive_job(job_dir.name):
-                    archived_count += 1
+        # Old completed jobs that aren't already archived
+        for job_id in self.index.job_ids(statuses=[LongTextJobStatus.COMPLETED.value], is_archived=False,
+                                         sort_date_before=archive_cutoff):
+            if self.archive_job(job_id):
+                archived_count += 1
 
         if archived_count > 0:
             logger.info(f"Auto-archived {archived_count} old completed jobs")
 
     def get_storage_stats(self) -> Dict[str, Any]:
-        """Get storage usage statistics"""
-        if not self.data_dir.exists():
-            return {
-                "total_storage_bytes": 0,
-                "job_count": 0,
-                "avg_job_size_bytes": 0,
-                "completed_jobs_storage": 0,
-                "failed_jobs_storage": 0,
-                "active_jobs_storage": 0
-            }
-
-        total_storage = 0
-        job_count = 0
-        completed_storage = 0
-        failed_storage = 0
-        active_storage = 0
-
-        for job_dir in self.data_dir.iterdir():
-            if not job_dir.is_dir() or job_dir.name == 'history':
-                continue
+        """Get storage usage statistics (job sizes as of each job's last metadata update)"""
+        by_status = self.index.storage_by_status()
+        job_count = sum(count for count, _ in by_status.values())
+        total_storage = sum(size for _, size in by_status.values())
 
-            metadata = self._load_job_metadata(job_dir.name)
-            if not metadata:
-                continue
-
-            job_size = self._calculate_job_size(job_dir.name)
-            total_storage += job_size
-            job_count += 1
-
-            if metadata.status == LongTextJobStatus.COMPLETED:
-                completed_storage += job_size
-            elif metadata.status == LongTextJobStatus.FAILED:
-                failed_storage += job_size
-            elif metadata.status in [LongTextJobStatus.PENDING, LongTextJobStatus.PROCESSING]:
-                active_storage += job_size
+        def storage(*statuses):
+            return sum(by_status.get(status.value, (0, 0))[1] for status in statuses)
 
         return {
             "total_storage_bytes": total_storage,
             "job_count": job_count,
             "avg_job_size_bytes": total_storage // job_count if job_count > 0 else 0,
-            "completed_jobs_storage": completed_storage,
-            "failed_jobs_storage": failed_storage,
-            "active_jobs_storage": active_storage
+            "completed_jobs_storage": storage(LongTextJobStatus.COMPLETED),
+            "failed_jobs_storage": storage(LongTextJobStatus.FAILED),
+            "active_jobs_storage": storage(LongTextJobStatus.PENDING, LongTextJobStatus.PROCESSING)
         }
 
     def get_job_file_path(self, job_id: str, file_type: str = 'output') -> Optional[Path]:
@@ -0,0 +1,179 @@
+"""
+Reduced-precision (bfloat16) inference
+
+With PRECISION=bf16 the weights of the heavy matmul-bound submodules (the T3
+transformer and the S3Gen flow encoder/estimator) are stored in bfloat16 and
+run under autocast. The voice encoder, tokenizers, embeddings, norms, output
+heads and the vocoder stay in float32, and the wrapped submodules hand
+float32 tensors back to them.
+"""
+
+import functools
+from typing import Any, List, Optional, Tuple
+
+from app.config import Config
+
+# Submodules cast to bfloat16, as attribute paths from the TTS model object
+BF16_MODULE_PATHS = (
+    "t3.tfmr",
+    "s3gen.flow.encoder",
+    "s3gen.flow.decoder.estimator",
+)
+
+# CPU flags that indicate native bfloat16 matmul support
+CPU_BF16_FLAGS = ("avx512_bf16", "amx_bf16")
+
+# Resolved precision per device: device -> (precision, reason)
+_resolved = {}
+
+
+def _read_cpu_flags() -> Optional[set]:
+    """CPU feature flags from /proc/cpuinfo (None if unavailable)"""
+    try:
+        with open("/proc/cpuinfo", "r") as f:
+            for line in f:
+                if line.startswith("flags"):
+                    return set(line.split(":", 1)[1].split())
+    except OSError:
+        return None
+    return set()
+
+
+def check_bf16_support(device: str) -> Tuple[bool, str]:
+    """Return (supported, reason) for running bfloat16 inference on `device`"""
+    import torch
+
+    if device == "cuda":
+        if torch.cuda.is_available() and torch.cuda.is_bf16_supported():
+            return True, "CUDA device supports bfloat16"
+        return False, "CUDA device does not support bfloat16"
+
+    if device != "cpu":
+        return False, f"bfloat16 mode is not supported on device '{device}'"
+
+    flags = _read_cpu_flags()
+    if flags is None:
+        # No /proc/cpuinfo (non-Linux); ask oneDNN instead
+        try:
+            if torch.ops.mkldnn._is_mkldnn_bf16_supported():
+                supported, reason = True, "oneDNN reports bfloat16 support"
+            else:
+                return False, "oneDNN reports no bfloat16 support on this CPU"
+        except Exception:
+            return False, "could not determine CPU bfloat16 support"
+    else:
+        native = [flag for flag in CPU_BF16_FLAGS if flag in flags]
+        if not native:
+            return False, f"CPU lacks {' / '.join(CPU_BF16_FLAGS)} (bfloat16 would be emulated and slower)"
+        supported, reason = True, f"CPU supports {', '.join(native)}"
+
+    # Make sure the kernels actually run before committing to bf16
+    try:
+        a = torch.randn(8, 8)
+        layer = torch.nn.Linear(8, 8).to(torch.bfloat16)
+        with torch.autocast("cpu", dtype=torch.bfloat16):
+            layer(a)
+    except Exception as e:
+        return False, f"bfloat16 smoke test failed: {e}"
+
+    return supported, reason
+
+
+def resolve_precision(device: str) -> str:
+    """Effective precision for `device`: the configured one, or fp32 if bf16 is unsupported"""
+    if device in _resolved:
+        return _resolved[device][0]
+
+    if Config.PRECISION != "bf16":
+        _resolved[device] = ("fp32", "PRECISION=fp32")
+        return "fp32"
+
+    supported, reason = check_bf16_support(device)
+    if supported:
+        print(f"⚡ bfloat16 inference enabled on {device}: {reason}")
+        _resolved[device] = ("bf16", reason)
+    else:
+        print(f"⚠️ PRECISION=bf16 requested but falling back to fp32 on {device}: {reason}")
+        _resolved[device] = ("fp32", reason)
+    return _resolved[device][0]
+
+
+def get_precision_info() -> dict:
+    """Requested and effective precision per resolved device"""
+    return {
+        "requested": Config.PRECISION,
+        "devices": {
+            device: {"precision": precision, "reason": reason}
+            for device, (precision, reason) in _resolved.items()
+        }
+    }
+
+
+def _resolve_path(root: Any, path: str):
+    target = root
+    for attr in path.split("."):
+        target = getattr(target, attr, None)
+        if target is None:
+            return None
+    return target
+
+
+def _to_float32(value):
+    """Cast floating bf16 tensors (and flat tuples/dicts of them) back to float32"""
+    import torch
+
+    if isinstance(value, torch.Tensor):
+        return value.float() if value.dtype == torch.bfloat16 else value
+    if isinstance(value, (tuple, list)):
+        if all(isinstance(v, torch.Tensor) or v is None for v in value):
+            return type(value)(_to_float32(v) for v in value)
+        return value
+    if isinstance(value, dict):
+        # Covers transformers ModelOutput; nested KV caches are left untouched
+        for key in list(value.keys()):
+            value[key] = _to_float32(value[key])
+        return value
+    return value
+
+
+def _wrap_forward(module, device_type: str):
+    """Run `module` under bf16 autocast and return float32 outputs"""
+    import torch
+
+    original_forward = module.forward
+
+    @functools.wraps(original_forward)
+    def forward(*args, **kwargs):
+        with torch.autocast(device_type, dtype=torch.bfloat16):
+            output = original_forward(*args, **kwargs)
+        return _to_float32(output)
+
+    module.forward = forward
+
+
+def apply_precision(model, device: str) -> List[str]:
+    """
+    Cast the configured submodules of a loaded model to bfloat16 if the
+    effective precision for `device` is bf16. Returns the converted paths.
+    """
+    if resolve_precision(device) != "bf16":
+        return []
+
+    import torch
+
+    device_type = "cuda" if device == "cuda" else "cpu"
+    converted = []
+    for path in BF16_MODULE_PATHS:
+        module = _resolve_path(model, path)
+        if not isinstance(module, torch.nn.Module):
+            continue
+        # Only matmul/conv weights; norms and embeddings keep float32 parameters
+        for layer in module.modules():
+            if isinstance(layer, (torch.nn.Linear, torch.nn.Conv1d)):
+                layer.to(torch.bfloat16)
+        _wrap_forward(module, device_type)
+        converted.append(path)
+
+    if converted:
+        print(f"⚡ Converted to bfloat16: {', '.join(converted)}")
+    return converted
@@ -0,0 +1,167 @@
+"""
+Preload-then-fork multi-worker serving
+
+The parent process loads the model weights once, binds the listening socket and
+then forks the uvicorn workers. Tensor storage is never written after loading,
+so the forked workers share the weights copy-on-write instead of each holding
+a private copy.
+
+Only CPU weights can be shared this way: a CUDA or MPS context created before
+fork() cannot be used or re-created in the children, so on those devices each
+worker loads its own model after it is forked.
+"""
+
+import asyncio
+import atexit
+import gc
+import os
+import signal
+import socket
+import sys
+import time
+from typing import Dict
+
+from app.config import Config, detect_device
+
+# Delay before replacing a worker that exited unexpectedly
+RESPAWN_DELAY_SECONDS = 1.0
+
+
+def get_worker_torch_threads(workers: int) -> int:
+    """Intra-op threads per worker so that workers do not oversubscribe the CPU"""
+    if Config.WORKER_TORCH_THREADS > 0:
+        return Config.WORKER_TORCH_THREADS
+    try:
+        cpu_count = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpu_count = os.cpu_count() or 1
+    return max(1, cpu_count // workers)
+
+
+def _bind_socket(host: str, port: int) -> socket.socket:
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+def _parent_device() -> str:
+    """Device the workers will use, detected without initializing CUDA in the parent"""
+    # torch.cuda.is_available() otherwise initializes the driver, which forked
+    # children cannot use
+    os.environ.setdefault("PYTORCH_NVML_BASED_CUDA_CHECK", "1")
+    return detect_device()
+
+
+def _preload_model():
+    """Load the default model variant in the parent before forking"""
+    import torch
+    from app.core.tts_model import initialize_model
+
+    # A single thread keeps the OpenMP pool from being spawned in the parent;
+    # a pool created before fork() is not usable in the children.
+    torch.set_num_threads(1)
+    started = time.time()
+    try:
+        asyncio.run(initialize_model())
+        print(f"✓ Model preloaded in parent process in {time.time() - started:.1f}s")
+    except Exception as e:
+        # Workers fall back to loading the model themselves
+        print(f"⚠️ Warning: Model preload failed, workers will initialize individually: {e}")
+
+
+def _run_worker(worker_id: int, sock: socket.socket, torch_threads: int, app) -> None:
+    """Body of a forked worker; never returns"""
+    exit_code = 0
+    try:
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        os.environ["WORKER_ID"] = str(worker_id)
+
+        import torch
+        torch.set_num_threads(torch_threads)
+        print(f"👷 Worker {worker_id} (pid {os.getpid()}) started with {torch_threads} torch threads")
+
+        import uvicorn
+        config = uvicorn.Config(
+            app,
+            reload=False,
+            access_log=True,
+            timeout_keep_alive=300,  # Match nginx proxy_read_timeout (5 minutes)
+            timeout_graceful_shutdown=30
+        )
+        uvicorn.Server(config).run(sockets=[sock])
+    except Exception as e:
+        print(f"✗ Worker {worker_id} crashed: {e}")
+        exit_code = 1
+    finally:
+        # Skip the parent's stack and cleanup handlers, but run our own atexit hooks
+        atexit._run_exitfuncs()
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(exit_code)
+
+
+def serve_preforked(app, workers: int):
+    """Serve `app` from `workers` forked processes sharing preloaded weights"""
+    if not hasattr(os, "fork"):
+        raise RuntimeError("WORKERS > 1 requires a platform with fork()")
+
+    device = _parent_device()
+    if device == "cpu":
+        _preload_model()
+    else:
+        print(f"ℹ️ Not preloading the model: a {device} context cannot be shared with forked workers, "
+              f"so each worker loads its own copy")
+
+    sock = _bind_socket(Config.HOST, Config.PORT)
+    torch_threads = get_worker_torch_threads(workers)
+    print(f"🍴 Forking {workers} workers ({torch_threads} torch threads each)")
+
+    # Move everything allocated so far out of the GC's reach so that collections
+    # in the workers do not touch (and thereby copy) the shared pages
+    gc.collect()
+    gc.freeze()
+
+    children: Dict[int, int] = {}
+    shutting_down = False
+
+    def spawn(worker_id: int):
+        pid = os.fork()
+        if pid == 0:
+            _run_worker(worker_id, sock, torch_threads, app)
+        children[pid] = worker_id
+
+    def handle_shutdown(signum, frame):
+        nonlocal shutting_down
+        shutting_down = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, handle_shutdown)
+    signal.signal(signal.SIGINT, handle_shutdown)
+
+    for worker_id in range(workers):
+        spawn(worker_id)
+
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        worker_id = children.pop(pid, None)
+        if worker_id is None or shutting_down:
+            continue
+        print(f"⚠️ Worker {worker_id} (pid {pid}) exited with status {status}, restarting")
+        time.sleep(RESPAWN_DELAY_SECONDS)
+        if not shutting_down:
+            spawn(worker_id)
+
+    sock.close()
+    print("All workers stopped")
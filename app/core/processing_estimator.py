@@ -0,0 +1,188 @@
+"""
+Learned processing-time estimates
+
+Every generated chunk records how long the model took for how many
+characters. A rolling (exponentially weighted) least-squares fit of
+seconds ~ intercept + slope * characters is kept per language, voice and
+sampling-step setting, plus a global fit across all of them, and persisted
+so estimates survive restarts. Predictions fall back from the specific fit
+to the global fit to a fixed rate until enough chunks have been observed.
+"""
+
+import json
+import math
+import os
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional
+
+from app.config import Config
+
+# Rate used before any chunk has been observed
+DEFAULT_CHARS_PER_SECOND = 25.0
+
+# Weight kept by past observations on each new one (~50 observation window)
+FORGETTING_FACTOR = 0.98
+
+# Observations needed before a fit is used instead of its fallback
+MIN_OBSERVATIONS = 3
+
+# Setup and final concatenation of a long-text job
+JOB_OVERHEAD_SECONDS = 5.0
+
+# Minimum interval between writes of the persisted state
+SAVE_INTERVAL_SECONDS = 30.0
+
+GLOBAL_KEY = "*"
+
+
+def voice_key(voice_path: Optional[str]) -> str:
+    """Identify a voice by its library file name; uploaded samples share one key"""
+    if not voice_path or voice_path == Config.VOICE_SAMPLE_PATH:
+        return "default"
+    library_dir = os.path.abspath(Config.VOICE_LIBRARY_DIR) + os.sep
+    if os.path.abspath(voice_path).startswith(library_dir):
+        return os.path.basename(voice_path)
+    return "uploaded"
+
+
+class _RollingFit:
+    """Exponentially weighted sufficient statistics for a 1-D linear fit"""
+
+    __slots__ = ("w", "sx", "sy", "sxx", "sxy", "n")
+
+    def __init__(self, w=0.0, sx=0.0, sy=0.0, sxx=0.0, sxy=0.0, n=0):
+        self.w, self.sx, self.sy, self.sxx, self.sxy, self.n = w, sx, sy, sxx, sxy, n
+
+    def add(self, x: float, y: float):
+        decay = FORGETTING_FACTOR
+        self.w = self.w * decay + 1.0
+        self.sx = self.sx * decay + x
+        self.sy = self.sy * decay + y
+        self.sxx = self.sxx * decay + x * x
+        self.sxy = self.sxy * decay + x * y
+        self.n += 1
+
+    def coefficients(self):
+        """(intercept, slope) in seconds and seconds per character"""
+        denominator = self.w * self.sxx - self.sx * self.sx
+        # Too little spread in chunk sizes for a slope: fit a rate through the origin
+        if denominator <= 1e-9 * max(self.w * self.sxx, 1.0):
+            return 0.0, (self.sy / self.sx if self.sx > 0 else 1.0 / DEFAULT_CHARS_PER_SECOND)
+        slope = (self.w * self.sxy - self.sx * self.sy) / denominator
+        intercept = (self.sy - slope * self.sx) / self.w
+        if slope <= 0 or intercept < 0:
+            return 0.0, self.sy / self.sx if self.sx > 0 else 1.0 / DEFAULT_CHARS_PER_SECOND
+        return intercept, slope
+
+    def predict(self, characters: float) -> float:
+        intercept, slope = self.coefficients()
+        return max(0.0, intercept + slope * characters)
+
+    def to_dict(self) -> Dict[str, float]:
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+
+class ProcessingTimeEstimator:
+    """Predicts generation time from character counts using observed chunks"""
+
+    def __init__(self, path: Optional[str]):
+        self._lock = threading.Lock()
+        self._path = path
+        self._fits: Dict[str, _RollingFit] = {}
+        self._last_save = 0.0
+        self._dirty = False
+        self._load()
+
+    @staticmethod
+    def _key(language_id: str, voice: str, sampling_steps: Optional[int]) -> str:
+        steps = sampling_steps if sampling_steps is not None else Config.SAMPLING_STEPS
+        return f"{language_id}|{voice}|{steps}"
+
+    def record(self, characters: int, seconds: float, language_id: str, voice: str,
+               sampling_steps: Optional[int] = None):
+        """Add one generated chunk: `characters` of text took `seconds`"""
+        if characters <= 0 or seconds <= 0 or not math.isfinite(seconds):
+            return
+        key = self._key(language_id, voice, sampling_steps)
+        with self._lock:
+            for fit_key in (key, GLOBAL_KEY):
+                fit = self._fits.get(fit_key)
+                if fit is None:
+                    fit = self._fits[fit_key] = _RollingFit()
+                fit.add(characters, seconds)
+            self._dirty = True
+        self.save()
+
+    def predict(self, characters: int, language_id: str, voice: str,
+                sampling_steps: Optional[int] = None) -> float:
+        """Predicted seconds to generate one chunk of `characters`"""
+        key = self._key(language_id, voice, sampling_steps)
+        with self._lock:
+            for fit_key in (key, GLOBAL_KEY):
+                fit = self._fits.get(fit_key)
+                if fit is not None and fit.n >= MIN_OBSERVATIONS:
+                    return fit.predict(characters)
+        return characters / DEFAULT_CHARS_PER_SECOND
+
+    def predict_chunks(self, character_counts: Iterable[int], language_id: str, voice: str,
+                       sampling_steps: Optional[int] = None) -> float:
+        """Predicted seconds to generate a sequence of chunks"""
+        return sum(self.predict(count, language_id, voice, sampling_steps) for count in character_counts)
+
+    def _load(self):
+        if not self._path or not os.path.exists(self._path):
+            return
+        try:
+            with open(self._path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self._fits = {key: _RollingFit(**values) for key, values in data.get("fits", {}).items()}
+            print(f"⏱️ Loaded processing-time estimates for {len(self._fits)} settings from {self._path}")
+        except (OSError, ValueError, TypeError) as e:
+            print(f"⚠️ Warning: Could not load processing-time estimates: {e}")
+
+    def save(self, force: bool = False):
+        """Persist the fits; throttled to one write per SAVE_INTERVAL_SECONDS unless forced"""
+        if not self._path:
+            return
+        with self._lock:
+            if not self._dirty or (not force and time.time() - self._last_save < SAVE_INTERVAL_SECONDS):
+                return
+            data = {"fits": {key: fit.to_dict() for key, fit in self._fits.items()}}
+            self._dirty = False
+            self._last_save = time.time()
+        try:
+            directory = os.path.dirname(self._path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self._path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self._path)
+        except OSError as e:
+            print(f"⚠️ Warning: Could not save processing-time estimates: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            fits = dict(self._fits)
+        result = {}
+        for key, fit in fits.items():
+            intercept, slope = fit.coefficients()
+            result[key] = {
+                "observations": fit.n,
+                "seconds_per_chunk": round(intercept, 3),
+                "chars_per_second": round(1.0 / slope, 2) if slope > 0 else None,
+            }
+        return result
+
+
+# Global estimator instance
+_estimator: Optional[ProcessingTimeEstimator] = None
+
+
+def get_processing_estimator() -> ProcessingTimeEstimator:
+    """Get the global processing-time estimator"""
+    global _estimator
+    if _estimator is None:
+        _estimator = ProcessingTimeEstimator(Config.PROCESSING_ESTIMATOR_PATH)
+    return _estimator
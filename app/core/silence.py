@@ -0,0 +1,108 @@
+"""
+Edge-silence trimming and punctuation-based pauses
+
+Every generated chunk starts and ends with a variable amount of near-silence.
+Before chunks are stitched together that silence is cut with a vectorized
+frame-energy scan (a small margin is kept so soft onsets and releases are not
+clipped), and the gap that follows a chunk is chosen from how its text ends:
+a clause break, a sentence end or a paragraph end.
+"""
+
+import threading
+from typing import List, Tuple
+
+from app.config import Config
+
+# Analysis frame for the energy scan
+FRAME_MS = 10
+
+# Chunks whose loudest frame is below this are left untouched (nothing to anchor on)
+MIN_PEAK_DB = -60.0
+
+SENTENCE_END_CHARS = ".!?…"
+CLAUSE_END_CHARS = ",;:—–-"
+# Closing quotes and brackets are skipped when looking for the final punctuation mark
+TRAILING_CLOSERS = "\"'”’»)]}"
+
+_stats_lock = threading.Lock()
+_stats = {"chunks": 0, "trimmed_chunks": 0, "trimmed_seconds": 0.0}
+
+
+def find_speech_bounds(audio, sample_rate: int) -> Tuple[int, int]:
+    """
+    Sample range [start, end) of `audio` (shape (channels, samples) or
+    (samples,)) that lies between the first and last frames within
+    SILENCE_TRIM_THRESHOLD_DB of the loudest frame, widened by
+    SILENCE_TRIM_KEEP_MS on both sides.
+    """
+    import torch
+
+    # Loudest channel per sample
+    samples = audio.abs().amax(dim=tuple(range(audio.dim() - 1))) if audio.dim() > 1 else audio
+    length = samples.shape[-1]
+    frame = max(1, int(sample_rate * FRAME_MS / 1000))
+    frames = -(-length // frame)
+    if frames < 3:
+        return 0, length
+
+    padded = torch.nn.functional.pad(samples.float(), (0, frames * frame - length))
+    energy = padded.reshape(frames, frame).pow(2).mean(dim=1)
+    frame_db = 10.0 * torch.log10(energy + 1e-12)
+
+    peak_db = frame_db.max().item()
+    if peak_db < MIN_PEAK_DB:
+        return 0, length
+
+    voiced = torch.nonzero(frame_db >= peak_db + Config.SILENCE_TRIM_THRESHOLD_DB).flatten()
+    keep = int(sample_rate * Config.SILENCE_TRIM_KEEP_MS / 1000)
+    start = max(0, voiced[0].item() * frame - keep)
+    end = min(length, (voiced[-1].item() + 1) * frame + keep)
+    return start, end
+
+
+def trim_silence(audio, sample_rate: int):
+    """
+    Trim leading and trailing near-silence from an audio tensor. Returns the
+    trimmed tensor (a view of `audio`) and the number of seconds removed.
+    """
+    if not Config.SILENCE_TRIM_ENABLED or audio.shape[-1] == 0:
+        return audio, 0.0
+
+    start, end = find_speech_bounds(audio, sample_rate)
+    trimmed_seconds = (audio.shape[-1] - (end - start)) / sample_rate
+    with _stats_lock:
+        _stats["chunks"] += 1
+        if trimmed_seconds > 0:
+            _stats["trimmed_chunks"] += 1
+            _stats["trimmed_seconds"] += trimmed_seconds
+    return audio[..., start:end], trimmed_seconds
+
+
+def pause_after_text(text: str, paragraph_end: bool = False) -> int:
+    """Silence in milliseconds to place after a chunk, from how its text ends"""
+    if paragraph_end:
+        return Config.LONG_TEXT_PARAGRAPH_PAUSE_MS
+    ending = text.rstrip().rstrip(TRAILING_CLOSERS)
+    last = ending[-1:]
+    if last and last in SENTENCE_END_CHARS:
+        return Config.PAUSE_SENTENCE_MS
+    if last and last in CLAUSE_END_CHARS:
+        return Config.PAUSE_CLAUSE_MS
+    # Split inside a sentence: only the margins kept by the trimmer separate the chunks
+    return 0
+
+
+def pauses_for_chunks(chunks) -> List[int]:
+    """Per-gap pauses (one per pair of adjacent chunks) for a list of chunk texts"""
+    return [pause_after_text(text) for text in chunks[:-1]]
+
+
+def get_trim_stats() -> dict:
+    """Chunks trimmed and seconds of silence removed since startup"""
+    with _stats_lock:
+        return {
+            "enabled": Config.SILENCE_TRIM_ENABLED,
+            "chunks": _stats["chunks"],
+            "trimmed_chunks": _stats["trimmed_chunks"],
+            "trimmed_seconds": round(_stats["trimmed_seconds"], 3),
+        }
@@ -0,0 +1,160 @@
+"""
+Startup profiling: named, timed phases of process start and model initialization
+
+Phases are recorded from any thread (model loading runs in an executor) and
+can be exported as JSON or as a Chrome trace (chrome://tracing, Perfetto).
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, Dict, List, Optional
+
+from app.config import Config
+
+
+def _process_start_time() -> Optional[float]:
+    """Wall-clock time at which this process was created, if it can be determined"""
+    try:
+        import psutil
+        return psutil.Process().create_time()
+    except Exception:
+        return None
+
+
+class StartupProfiler:
+    """Collects timed startup phases"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._origin = time.time()
+        self._origin_perf = time.perf_counter()
+        self._process_start = _process_start_time()
+        self._phases: List[Dict[str, Any]] = []
+        self._completed_at: Optional[float] = None
+
+    def _now(self) -> float:
+        """Seconds since the profiler was created"""
+        return time.perf_counter() - self._origin_perf
+
+    @contextmanager
+    def phase(self, name: str, **details):
+        """Time the enclosed block as a named phase; the phase is recorded even if it raises"""
+        entry = {
+            "name": name,
+            "start": self._now(),
+            "duration": None,
+            "thread": threading.current_thread().name,
+            "tid": threading.get_ident(),
+            "pid": os.getpid(),
+            "status": "running",
+            "details": details,
+        }
+        with self._lock:
+            self._phases.append(entry)
+        try:
+            yield entry["details"]
+            entry["status"] = "ok"
+        except BaseException as e:
+            entry["status"] = "error"
+            entry["details"]["error"] = str(e)
+            raise
+        finally:
+            entry["duration"] = self._now() - entry["start"]
+
+    def is_complete(self) -> bool:
+        """Whether model initialization has finished (successfully or not)"""
+        return self._completed_at is not None
+
+    def mark_complete(self):
+        """Record that startup has finished and write the trace file if configured"""
+        self._completed_at = self._now()
+        if Config.STARTUP_PROFILE_TRACE_PATH:
+            try:
+                self.write_chrome_trace(Config.STARTUP_PROFILE_TRACE_PATH)
+            except OSError as e:
+                print(f"⚠️ Warning: Could not write startup trace: {e}")
+
+    def get_report(self) -> Dict[str, Any]:
+        """JSON-serializable summary of all recorded phases"""
+        with self._lock:
+            phases = [dict(p, details=dict(p["details"])) for p in self._phases]
+
+        # Time spent before the profiler existed (interpreter start, early imports)
+        before_profiler = None
+        if self._process_start is not None:
+            before_profiler = max(0.0, self._origin - self._process_start)
+
+        report_phases = []
+        for p in phases:
+            report_phases.append({
+                "name": p["name"],
+                "start_seconds": round(p["start"], 4),
+                "duration_seconds": round(p["duration"], 4) if p["duration"] is not None else None,
+                "thread": p["thread"],
+                "pid": p["pid"],
+                "status": p["status"],
+                "details": p["details"],
+            })
+
+        return {
+            "pid": os.getpid(),
+            "complete": self._completed_at is not None,
+            "before_profiler_seconds": round(before_profiler, 4) if before_profiler is not None else None,
+            "total_seconds": round(self._completed_at, 4) if self._completed_at is not None else None,
+            "elapsed_seconds": round(self._now(), 4),
+            "phases": report_phases,
+            "trace_path": Config.STARTUP_PROFILE_TRACE_PATH or None,
+        }
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Phases in the Chrome trace event format (complete events, microseconds)"""
+        with self._lock:
+            phases = list(self._phases)
+
+        events = []
+        for p in phases:
+            duration = p["duration"] if p["duration"] is not None else self._now() - p["start"]
+            events.append({
+                "name": p["name"],
+                "cat": "startup",
+                "ph": "X",
+                "ts": round(p["start"] * 1_000_000),
+                "dur": round(duration * 1_000_000),
+                "pid": p["pid"],
+                "tid": p["tid"],
+                "args": dict(p["details"], status=p["status"]),
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: str):
+        """Write the Chrome trace atomically to `path`"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome_trace(), f)
+        os.replace(tmp_path, path)
+        print(f"🧭 Startup trace written to {path}")
+
+
+# Global profiler instance, created as early as possible
+_startup_profiler = StartupProfiler()
+
+
+def get_startup_profiler() -> StartupProfiler:
+    """Get the global startup profiler"""
+    return _startup_profiler
+
+
+def startup_phase(name: str, **details):
+    """
+    Time a phase of code that also runs after startup (e.g. lazily loading a
+    model variant); only the calls made before startup completes are recorded.
+    """
+    if _startup_profiler.is_complete():
+        return nullcontext(details)
+    return _startup_profiler.phase(name, **details)
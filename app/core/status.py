@@ -3,14 +3,20 @@ TTS request status tracking and management
 """
 
 import asyncio
+import atexit
+import json
+import os
 import threading
 import time
 import uuid
+from pathlib import Path
 from datetime import datetime, timezone
 from typing import Dict, Optional, List, Any
 from enum import Enum
 from dataclasses import dataclass, asdict
 
+from app.config import Config
+
 
 class TTSStatus(Enum):
     """TTS request status enumeration"""
@@ -55,6 +61,7 @@ class TTSRequestInfo:
     progress: TTSProgressInfo = None
     error_message: Optional[str] = None
     memory_usage: Dict[str, float] = None
+    chunk_plan: Dict[str, Any] = None
     
     def __post_init__(self):
         """Initialize default values"""
@@ -64,6 +71,8 @@ class TTSRequestInfo:
             self.progress = TTSProgressInfo()
         if self.memory_usage is None:
             self.memory_usage = {}
+        if self.chunk_plan is None:
+            self.chunk_plan = {}
     
     @property
     def duration_seconds(self) -> Optional[float]:
@@ -78,15 +87,102 @@ class TTSRequestInfo:
         return self.status not in [TTSStatus.COMPLETED, TTSStatus.ERROR, TTSStatus.IDLE]
 
 
+def _serialize_request(request: TTSRequestInfo) -> Dict[str, Any]:
+    """Convert a request record to a JSON-friendly dict"""
+    request_dict = asdict(request)
+    request_dict['status'] = request.status.value
+    request_dict['start_time'] = request.start_time.timestamp()
+    if request.end_time:
+        request_dict['end_time'] = request.end_time.timestamp()
+    request_dict['duration_seconds'] = request.duration_seconds
+    request_dict['progress']['progress_percentage'] = request.progress.progress_percentage
+    return request_dict
+
+
+def _status_value(status: Any) -> str:
+    return status.value if isinstance(status, TTSStatus) else status
+
+
 class TTSStatusManager:
-    """Thread-safe TTS status manager"""
+    """
+    Thread-safe TTS status manager.
+
+    When several worker processes serve the API, each one publishes a snapshot
+    of its state to ``shared_dir`` so that any worker can answer status queries
+    for the whole server.
+    """
     
-    def __init__(self):
+    def __init__(self, shared_dir: Optional[str] = None):
         self._lock = threading.RLock()
         self._current_request: Optional[TTSRequestInfo] = None
         self._request_history: List[TTSRequestInfo] = []
         self._max_history = 10  # Keep last 10 requests
         self._total_requests = 0
+        self._shared_dir = Path(shared_dir) if shared_dir else None
+        if self._shared_dir:
+            atexit.register(self._remove_snapshot)
+    
+    @property
+    def is_shared(self) -> bool:
+        return self._shared_dir is not None
+    
+    def _snapshot_path(self, pid: int) -> Path:
+        return self._shared_dir / f"status-{pid}.json"
+    
+    def _publish(self):
+        """Write this worker's state for its peers (caller holds the lock)"""
+        if not self._shared_dir:
+            return
+        snapshot = {
+            "pid": os.getpid(),
+            "updated_at": time.time(),
+            "total_requests": self._total_requests,
+            "current": _serialize_request(self._current_request) if self._current_request else None,
+            "history": [_serialize_request(r) for r in self._request_history],
+        }
+        try:
+            self._shared_dir.mkdir(parents=True, exist_ok=True)
+            path = self._snapshot_path(os.getpid())
+            tmp_path = path.with_suffix(".tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f, default=str)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"⚠️ Warning: Failed to publish worker status: {e}")
+    
+    def _remove_snapshot(self):
+        try:
+            self._snapshot_path(os.getpid()).unlink(missing_ok=True)
+        except OSError:
+            pass
+    
+    def read_peer_snapshots(self) -> List[Dict[str, Any]]:
+        """Load the published state of every other live worker"""
+        if not self._shared_dir or not self._shared_dir.exists():
+            return []
+        peers = []
+        own_pid = os.getpid()
+        for path in self._shared_dir.glob("status-*.json"):
+            try:
+                pid = int(path.stem.split("-", 1)[1])
+            except ValueError:
+                continue
+            if pid == own_pid:
+                continue
+            try:
+                os.kill(pid, 0)
+            except ProcessLookupError:
+                # Worker is gone; drop its stale snapshot
+                path.unlink(missing_ok=True)
+                continue
+            except PermissionError:
+                pass
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    peers.append(json.load(f))
+            except (OSError, json.JSONDecodeError):
+                continue
+        return peers
     
     def start_request(
         self,
@@ -109,6 +205,7 @@ class TTSStatusManager:
             )
             
             self._total_requests += 1
+            self._publish()
             return request_id
     
     def update_status(
@@ -119,7 +216,8 @@ class TTSStatusManager:
         current_chunk: int = None,
         total_chunks: int = None,
         memory_usage: Optional[Dict[str, float]] = None,
-        error_message: Optional[str] = None
+        error_message: Optional[str] = None,
+        chunk_plan: Optional[Dict[str, Any]] = None
     ):
         """Update request status and progress"""
         with self._lock:
@@ -151,10 +249,15 @@ class TTSStatusManager:
             if error_message:
                 self._current_request.error_message = error_message
             
+            if chunk_plan:
+                self._current_request.chunk_plan = chunk_plan
+            
             # If completed or error, finalize request
             if status in [TTSStatus.COMPLETED, TTSStatus.ERROR]:
                 self._current_request.end_time = datetime.now(timezone.utc)
                 self._finalize_request()
+            
+            self._publish()
     
     def _finalize_request(self):
         """Move current request to history"""
@@ -247,10 +350,20 @@ class TTSStatusManager:
         """Clear request history (keep current request)"""
         with self._lock:
             self._request_history.clear()
+            self._publish()
+    
+    def get_serialized_history(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [_serialize_request(r) for r in self._request_history]
+
+
+def _create_status_manager() -> TTSStatusManager:
+    shared_dir = Config.SHARED_STATE_DIR if Config.WORKERS > 1 else None
+    return TTSStatusManager(shared_dir)
 
 
 # Global status manager instance
-_status_manager = TTSStatusManager()
+_status_manager = _create_status_manager()
 
 
 # Public API functions
@@ -270,28 +383,77 @@ def update_tts_status(
     current_chunk: int = None,
     total_chunks: int = None,
     memory_usage: Optional[Dict[str, float]] = None,
-    error_message: Optional[str] = None
+    error_message: Optional[str] = None,
+    chunk_plan: Optional[Dict[str, Any]] = None
 ):
     """Update TTS request status"""
     _status_manager.update_status(
         request_id, status, current_step, current_chunk, 
-        total_chunks, memory_usage, error_message
+        total_chunks, memory_usage, error_message, chunk_plan
     )
 
 
 def get_tts_status() -> Dict[str, Any]:
-    """Get current TTS processing status"""
-    return _status_manager.get_current_status()
+    """Get current TTS processing status (across all workers)"""
+    status = _status_manager.get_current_status()
+    if not _status_manager.is_shared:
+        return status
+    
+    peers = _status_manager.read_peer_snapshots()
+    active = [peer["current"] for peer in peers if peer.get("current")]
+    total_requests = status["total_requests"] + sum(peer.get("total_requests", 0) for peer in peers)
+    
+    if not status["is_processing"] and active:
+        # Report the most recently started request running on another worker
+        status = dict(max(active, key=lambda r: r["start_time"]))
+        status["is_active"] = True
+        status["is_processing"] = True
+    
+    status["total_requests"] = total_requests
+    status["active_workers"] = len(active) + (1 if _status_manager.get_current_status()["is_processing"] else 0)
+    status["workers"] = len(peers) + 1
+    return status
 
 
 def get_tts_history(limit: int = 5) -> List[Dict[str, Any]]:
-    """Get TTS request history"""
-    return _status_manager.get_request_history(limit)
+    """Get TTS request history (across all workers)"""
+    if not _status_manager.is_shared:
+        return _status_manager.get_request_history(limit)
+    
+    history = _status_manager.get_serialized_history()
+    for peer in _status_manager.read_peer_snapshots():
+        history.extend(peer.get("history", []))
+    history.sort(key=lambda r: r["start_time"], reverse=True)
+    return history[:limit]
 
 
 def get_tts_statistics() -> Dict[str, Any]:
-    """Get TTS processing statistics"""
-    return _status_manager.get_statistics()
+    """Get TTS processing statistics (across all workers)"""
+    stats = _status_manager.get_statistics()
+    if not _status_manager.is_shared:
+        return stats
+    
+    peers = _status_manager.read_peer_snapshots()
+    history = _status_manager.get_serialized_history()
+    for peer in peers:
+        history.extend(peer.get("history", []))
+    
+    completed = [r for r in history if _status_value(r["status"]) == TTSStatus.COMPLETED.value]
+    errors = [r for r in history if _status_value(r["status"]) == TTSStatus.ERROR.value]
+    stats.update({
+        "total_requests": stats["total_requests"] + sum(peer.get("total_requests", 0) for peer in peers),
+        "completed_requests": len(completed),
+        "error_requests": len(errors),
+        "success_rate": (len(completed) / max(1, len(completed) + len(errors))) * 100,
+        "average_duration_seconds": (
+            sum(r["duration_seconds"] for r in completed) / len(completed) if completed else 0
+        ),
+        "average_text_length": (
+            sum(r["text_length"] for r in completed) / len(completed) if completed else 0
+        ),
+        "is_processing": stats["is_processing"] or any(peer.get("current") for peer in peers),
+    })
+    return stats
 
 
 def clear_tts_history():
@@ -0,0 +1,122 @@
+"""
+Equal-power crossfade stitching of generated audio chunks
+
+Adjacent chunks overlap by a short crossfade: the end of one fades out along
+a cosine curve while the start of the next fades in along a sine curve, so
+the summed power stays constant across the joint and there is no click. A
+pause between chunks becomes silence that the previous chunk fades out into.
+
+`StreamStitcher` does this incrementally for streaming responses. It only
+holds back the last crossfade-length samples of each chunk, so streaming
+adds no latency beyond the fade itself. The buffered path runs every chunk
+through the same stitcher.
+
+Works on torch tensors or NumPy arrays shaped (samples,) or (channels, samples).
+"""
+
+import math
+from typing import List, Optional
+
+from app.config import Config
+
+
+def _is_numpy(audio) -> bool:
+    return type(audio).__module__.startswith("numpy")
+
+
+def _cat(pieces):
+    if _is_numpy(pieces[0]):
+        import numpy as np
+        return np.concatenate(pieces, axis=-1)
+    import torch
+    return torch.cat(pieces, dim=-1)
+
+
+def _zeros(reference, samples: int):
+    shape = tuple(reference.shape[:-1]) + (samples,)
+    if _is_numpy(reference):
+        import numpy as np
+        return np.zeros(shape, dtype=reference.dtype)
+    import torch
+    return torch.zeros(shape, dtype=reference.dtype, device=reference.device)
+
+
+def _fade_curves(reference, samples: int):
+    """(fade_out, fade_in) quarter-period cosine and sine curves of `samples` points"""
+    if _is_numpy(reference):
+        import numpy as np
+        phase = (np.arange(samples, dtype=np.float64) + 0.5) / samples * (math.pi / 2)
+        return np.cos(phase).astype(reference.dtype), np.sin(phase).astype(reference.dtype)
+    import torch
+    phase = (torch.arange(samples, dtype=torch.float64, device=reference.device) + 0.5) / samples * (math.pi / 2)
+    return torch.cos(phase).to(reference.dtype), torch.sin(phase).to(reference.dtype)
+
+
+def equal_power_crossfade(tail, head):
+    """
+    Mix `tail` (the end of one chunk) fading out with `head` (the start of the
+    next) fading in. Both must have the same shape; returns a new array of it.
+    """
+    samples = tail.shape[-1]
+    if head.shape[-1] != samples:
+        raise ValueError(f"Crossfade needs equal lengths, got {samples} and {head.shape[-1]}")
+    if samples == 0:
+        return tail
+    fade_out, fade_in = _fade_curves(tail, samples)
+    return tail * fade_out + head * fade_in
+
+
+class StreamStitcher:
+    """Incrementally stitches chunks with pauses and equal-power crossfades"""
+
+    def __init__(self, sample_rate: int, crossfade_ms: Optional[int] = None):
+        if crossfade_ms is None:
+            crossfade_ms = Config.CROSSFADE_MS
+        self.sample_rate = sample_rate
+        self.crossfade_samples = max(0, int(sample_rate * crossfade_ms / 1000))
+        self._tail = None
+
+    def push(self, audio, pause_ms: int = 0):
+        """
+        Add the next chunk, preceded by `pause_ms` of silence (ignored for the
+        first chunk). Returns the audio that is final and can be emitted; the
+        last crossfade-length samples are held back for the next joint.
+        """
+        if self._tail is not None and pause_ms > 0:
+            # The fade runs into the silence, so the audible gap stays pause_ms
+            silence = _zeros(audio, int(self.sample_rate * pause_ms / 1000) + self.crossfade_samples)
+            audio = _cat([silence, audio])
+
+        if self._tail is None or self._tail.shape[-1] == 0:
+            joined = audio
+        else:
+            overlap = min(self._tail.shape[-1], audio.shape[-1])
+            tail, head = self._tail[..., self._tail.shape[-1] - overlap:], audio[..., :overlap]
+            joined = _cat([self._tail[..., :self._tail.shape[-1] - overlap],
+                           equal_power_crossfade(tail, head), audio[..., overlap:]])
+
+        held = min(self.crossfade_samples, joined.shape[-1])
+        ready = joined[..., :joined.shape[-1] - held]
+        self._tail = joined[..., joined.shape[-1] - held:]
+        return ready
+
+    def flush(self):
+        """Return the held-back end of the last chunk (None if nothing was pushed)"""
+        tail, self._tail = self._tail, None
+        return tail
+
+
+def stitch_chunks(audio_chunks: List, sample_rate: int, pauses_ms: Optional[List[int]] = None,
+                  crossfade_ms: Optional[int] = None):
+    """Stitch a list of chunks in one go (the buffered counterpart of StreamStitcher)"""
+    if pauses_ms is None:
+        pauses_ms = [0] * (len(audio_chunks) - 1)
+    elif len(pauses_ms) != len(audio_chunks) - 1:
+        raise ValueError(f"Expected {len(audio_chunks) - 1} pauses, got {len(pauses_ms)}")
+
+    stitcher = StreamStitcher(sample_rate, crossfade_ms)
+    pieces = [stitcher.push(audio_chunks[0])]
+    for pause, chunk in zip(pauses_ms, audio_chunks[1:]):
+        pieces.append(stitcher.push(chunk, pause))
+    pieces.append(stitcher.flush())
+    return _cat(pieces)
@@ -3,92 +3,205 @@ Text processing utilities for TTS
 """
 
 import gc
-import torch
+import random
 import re
+from bisect import bisect_right
+from collections import Counter
 from typing import List, Optional, Tuple
 import unicodedata
 from app.config import Config
+from app.core.processing_estimator import JOB_OVERHEAD_SECONDS, get_processing_estimator
 from app.models.long_text import LongTextChunk
 
 
-def normalize_text(text: str) -> str:
+# Replacements for "smart" characters and symbols that often trip up the model.
+# No replacement produces a character that is itself replaced, so a single
+# str.translate pass is equivalent to applying them one after another.
+NORMALIZATION_REPLACEMENTS = {
+    # Smart quotes
+    '“': '"', '”': '"', '‘': "'", '’': "'",
+    # Various dashes and hyphens
+    '–': '-', '—': '-', '−': '-', '‐': '-',
+    # Ellipses
+    '…': '...',
+    # Accented characters (Indonesian sometimes uses these in names or loanwords)
+    # Common Latin accents
+    'é': 'e', 'è': 'e', 'ê': 'e', 'ë': 'e', 'ē': 'e', 'ė': 'e', 'ę': 'e',
+    'á': 'a', 'à': 'a', 'â': 'a', 'ä': 'a', 'ā': 'a', 'ã': 'a', 'å': 'a',
+    'í': 'i', 'ì': 'i', 'î': 'i', 'ï': 'i', 'ī': 'i', 'į': 'i',
+    'ó': 'o', 'ò': 'o', 'ô': 'o', 'ö': 'o', 'ō': 'o', 'õ': 'o', 'ø': 'o',
+    'ú': 'u', 'ù': 'u', 'û': 'u', 'ü': 'u', 'ū': 'u', 'ũ': 'u',
+    'ñ': 'n', 'ç': 'c',
+    # Uppercase accented characters
+    'É': 'E', 'È': 'E', 'Ê': 'E', 'Ë': 'E',
+    'Á': 'A', 'À': 'A', 'Â': 'A', 'Ä': 'A',
+    'Í': 'I', 'Ì': 'I', 'Î': 'I', 'Ï': 'I',
+    'Ó': 'O', 'Ò': 'O', 'Ô': 'O', 'Ö': 'O',
+    'Ú': 'U', 'Ù': 'U', 'Û': 'U', 'Ü': 'U',
+    'Ñ': 'N', 'Ç': 'C',
+    # glottal stop / hamzah marks sometimes copy-pasted in Indonesian
+    'ʿ': "'", 'ʾ': "'", 'ʻ': "'", 'ʼ': "'", 'ʽ': "'",
+    # Other common problematic characters
+    '‚': ',', '„': '"', '‹': '<', '›': '>', '«': '"', '»': '"',
+}
+
+_NORMALIZATION_TABLE = str.maketrans(NORMALIZATION_REPLACEMENTS)
+
+# Runs of replaceable characters. str.translate does a dict lookup for every
+# character of non-ASCII input, so only the matched runs are translated.
+_REPLACEABLE_RE = re.compile('[' + ''.join(map(re.escape, NORMALIZATION_REPLACEMENTS)) + ']+')
+
+# Characters that may be control/format characters (Unicode category C):
+# ASCII controls other than tab/newline/carriage return, DEL, and anything
+# non-ASCII. Only these are looked up in the Unicode database.
+_CONTROL_CANDIDATE_RE = re.compile(r'[^\t\n\r\x20-\x7e]')
+
+# Non-ASCII characters left after normalization (reported in sampled stats)
+_NON_ASCII_RE = re.compile(r'[^\x00-\x7f]')
+
+
+def _translate_run(match) -> str:
+    return match.group().translate(_NORMALIZATION_TABLE)
+
+
+def _drop_control_char(match) -> str:
+    ch = match.group()
+    return "" if unicodedata.category(ch)[0] == "C" else ch
+
+
+def _should_log_normalization(log_stats: Optional[bool]) -> bool:
+    if log_stats is not None:
+        return log_stats
+    rate = Config.TEXT_NORMALIZATION_STATS_SAMPLE_RATE
+    return rate > 0 and (rate >= 1 or random.random() < rate)
+
+
+def _log_replacements(text: str):
+    """Print which replacement characters occur in `text` (before translation)"""
+    counts = Counter(ch for ch in text if ch in NORMALIZATION_REPLACEMENTS)
+    if counts:
+        # Report in table order, as the per-character replace loop used to
+        replacements_made = [
+            f"'{char}'→'{replacement}' ({counts[char]}x)"
+            for char, replacement in NORMALIZATION_REPLACEMENTS.items() if char in counts
+        ]
+        print(f"🔄 Text normalization: {', '.join(replacements_made)}")
+
+
+def normalize_text(text: str, log_stats: Optional[bool] = None) -> str:
     """ 
     Normalize text to remove or replace non-standard characters that might trip up the model.
     This function aggressively normalizes text to ensure compatibility with the TTS model.
+
+    Replacement statistics are printed for a sample of calls
+    (TEXT_NORMALIZATION_STATS_SAMPLE_RATE); pass log_stats=True/False to force them on or off.
     """
     if not text:
         return ""
-    
-    # Validate UTF-8 encoding
-    try:
-        # Try encoding/decoding to ensure valid UTF-8
+
+    log = _should_log_normalization(log_stats)
+
+    if not text.isascii():
+        # Drop lone surrogates and other unencodable code points
         text = text.encode('utf-8', errors='ignore').decode('utf-8')
-    except Exception as e:
-        print(f"⚠️  UTF-8 validation warning: {e}")
-    
-    # Use standard NFC normalization first
-    text = unicodedata.normalize('NFC', text)
-    
-    # Track replacements for logging
-    replacements_made = []
-    
-    # Replace common "smart" characters and symbols that are often problematic
-    replacements = {
-        # Smart quotes
-        '“': '"', '”': '"', '‘': "'", '’': "'",
-        # Various dashes and hyphens
-        '–': '-', '—': '-', '−': '-', '‐': '-',
-        # Ellipses
-        '…': '...',
-        # Accented characters (Indonesian sometimes uses these in names or loanwords)
-        # Common Latin accents
-        'é': 'e', 'è': 'e', 'ê': 'e', 'ë': 'e', 'ē': 'e', 'ė': 'e', 'ę': 'e',
-        'á': 'a', 'à': 'a', 'â': 'a', 'ä': 'a', 'ā': 'a', 'ã': 'a', 'å': 'a',
-        'í': 'i', 'ì': 'i', 'î': 'i', 'ï': 'i', 'ī': 'i', 'į': 'i',
-        'ó': 'o', 'ò': 'o', 'ô': 'o', 'ö': 'o', 'ō': 'o', 'õ': 'o', 'ø': 'o',
-        'ú': 'u', 'ù': 'u', 'û': 'u', 'ü': 'u', 'ū': 'u', 'ũ': 'u',
-        'ñ': 'n', 'ç': 'c',
-        # Uppercase accented characters
-        'É': 'E', 'È': 'E', 'Ê': 'E', 'Ë': 'E',
-        'Á': 'A', 'À': 'A', 'Â': 'A', 'Ä': 'A',
-        'Í': 'I', 'Ì': 'I', 'Î': 'I', 'Ï': 'I',
-        'Ó': 'O', 'Ò': 'O', 'Ô': 'O', 'Ö': 'O',
-        'Ú': 'U', 'Ù': 'U', 'Û': 'U', 'Ü': 'U',
-        'Ñ': 'N', 'Ç': 'C',
-        # glottal stop / hamzah marks sometimes copy-pasted in Indonesian
-        'ʿ': "'", 'ʾ': "'", 'ʻ': "'", 'ʼ': "'", 'ʽ': "'",
-        # Other common problematic characters
-        '‚': ',', '„': '"', '‹': '<', '›': '>', '«': '"', '»': '"',
-    }
-    
-    # Apply replacements and track what was changed
-    for char, replacement in replacements.items():
-        if char in text:
-            count = text.count(char)
-            replacements_made.append(f"'{char}'→'{replacement}' ({count}x)")
-            text = text.replace(char, replacement)
-    
-    # Log replacements if any were made
-    if replacements_made:
-        print(f"🔄 Text normalization: {', '.join(replacements_made)}")
-            
+
+        # Use standard NFC normalization first
+        text = unicodedata.normalize('NFC', text)
+
+        if log:
+            _log_replacements(text)
+        text = _REPLACEABLE_RE.sub(_translate_run, text)
+
     # Remove other control characters and problematic non-printable chars
     original_len = len(text)
-    text = "".join(ch for ch in text if unicodedata.category(ch)[0] != "C" or ch in "\n\r\t")
-    
-    if len(text) != original_len:
-        removed_count = original_len - len(text)
-        print(f"🧹 Removed {removed_count} control character(s)")
-    
-    # Final validation: check for any remaining high-unicode characters that might cause issues
-    high_unicode_chars = [ch for ch in text if ord(ch) > 127 and ch not in "\n\r\t"]
-    if high_unicode_chars:
-        unique_chars = list(set(high_unicode_chars))
-        print(f"⚠️  Warning: {len(high_unicode_chars)} high-unicode characters remain: {unique_chars[:10]}")
-            
+    text = _CONTROL_CANDIDATE_RE.sub(_drop_control_char, text)
+
+    if log:
+        if len(text) != original_len:
+            print(f"🧹 Removed {original_len - len(text)} control character(s)")
+
+        # Check for any remaining high-unicode characters that might cause issues
+        high_unicode_chars = _NON_ASCII_RE.findall(text)
+        if high_unicode_chars:
+            unique_chars = list(set(high_unicode_chars))
+            print(f"⚠️  Warning: {len(high_unicode_chars)} high-unicode characters remain: {unique_chars[:10]}")
+
     return text.strip()
 
 
+# Sentence terminators; a terminator only ends a sentence when followed by
+# whitespace, so decimals and grouped numbers ("3.14", "1.000.000") never split
+_SENTENCE_END_RE = re.compile(r'[.!?][ \n]')
+
+# Abbreviations that are never sentence-final (titles, address and reference prefixes)
+_TITLE_ABBREVIATIONS = frozenset({
+    # Indonesian
+    'bpk', 'dr', 'dra', 'drs', 'h', 'hj', 'ir', 'jl', 'jln', 'kab', 'kec', 'kel',
+    'no', 'prof', 'prov', 'pt', 'rp', 'sdr', 'sdri', 'tgl', 'yth', 'hlm',
+    'a.n', 'u.p', 's.h', 's.e', 's.t', 's.kom', 's.pd', 'm.si', 'm.m', 'a.md',
+    # English
+    'mr', 'mrs', 'ms', 'st', 'mt', 'jr', 'sr', 'vs', 'fig', 'approx', 'dept',
+    'e.g', 'i.e', 'cf', 'ave', 'gen', 'gov', 'sgt', 'capt', 'lt', 'col',
+})
+
+# Abbreviations that often end a sentence: they only end one when the next
+# word starts with an uppercase letter
+_TRAILING_ABBREVIATIONS = frozenset({
+    # Indonesian
+    'dll', 'dsb', 'dst', 'dkk', 'tsb', 'spt', 'tbk', 'thn',
+    # English
+    'etc', 'inc', 'ltd', 'co', 'corp', 'al', 'est',
+})
+
+_MAX_ABBREVIATION_LENGTH = max(len(a) for a in _TITLE_ABBREVIATIONS | _TRAILING_ABBREVIATIONS)
+
+
+def _is_abbreviation(text: str, dot: int, after: int) -> bool:
+    """Whether the period at `dot` ends an abbreviation rather than a sentence"""
+    # Only look back far enough to cover the longest abbreviation (plus an opening bracket/quote)
+    lower_bound = max(0, dot - _MAX_ABBREVIATION_LENGTH - 2)
+    word_start = max(text.rfind(' ', lower_bound, dot), text.rfind('\n', lower_bound, dot)) + 1
+    if word_start == 0 and lower_bound > 0:
+        return False
+    word = text[word_start:dot].lstrip('("\'[')
+    if not word:
+        return False
+
+    # Single uppercase initials, e.g. "J. K. Rowling", "Soekarno M. Hatta"
+    if len(word) == 1 and word.isupper():
+        return True
+
+    word = word.lower()
+    if word in _TITLE_ABBREVIATIONS:
+        return True
+    if word in _TRAILING_ABBREVIATIONS:
+        next_pos = after
+        while next_pos < len(text) and text[next_pos] in ' \n':
+            next_pos += 1
+        return next_pos < len(text) and not text[next_pos].isupper()
+    return False
+
+
+def iter_sentence_spans(text: str):
+    """
+    Yield (start, end) offsets of the sentences in `text` in a single scan.
+
+    A sentence ends after ". ", "! ", "? " or the same terminators followed by a
+    newline; the span includes the terminator and the whitespace character.
+    Periods that close Indonesian/English abbreviations and initials do not end
+    a sentence.
+    """
+    start = 0
+    for match in _SENTENCE_END_RE.finditer(text):
+        end = match.end()
+        if text[match.start()] == '.' and _is_abbreviation(text, match.start(), end):
+            continue
+        yield start, end
+        start = end
+    if start < len(text):
+        yield start, len(text)
+
+
 def split_text_into_chunks(text: str, max_length: int = None) -> list:
     """Split text into manageable chunks for TTS processing"""
     if max_length is None:
@@ -100,32 +213,11 @@ def split_text_into_chunks(text: str, max_length: int = None) -> list:
     if len(text) <= max_length:
         return [text]
     
-    # Try to split at sentence boundaries first
-    sentence_endings = ['. ', '! ', '? ', '.\n', '!\n', '?\n']
     chunks = []
     current_chunk = ""
     
     # Split into sentences
-    sentences = []
-    temp_text = text
-    
-    while temp_text:
-        best_split = len(temp_text)
-        best_ending = ""
-        
-        for ending in sentence_endings:
-            pos = temp_text.find(ending)
-            if pos != -1 and pos < best_split:
-                best_split = pos + len(ending)
-                best_ending = ending
-        
-        if best_split == len(temp_text):
-            # No sentence ending found, take the rest
-            sentences.append(temp_text)
-            break
-        else:
-            sentences.append(temp_text[:best_split])
-            temp_text = temp_text[best_split:]
+    sentences = (text[start:end] for start, end in iter_sentence_spans(text))
     
     # Group sentences into chunks
     for sentence in sentences:
@@ -141,46 +233,8 @@ def split_text_into_chunks(text: str, max_length: int = None) -> list:
             
             # If single sentence is too long, split it further
             if len(sentence) > max_length:
-                # Split at commas, semicolons, etc.
-                sub_delimiters = [', ', '; ', ' - ', ' — ']
-                sub_chunks = [sentence]
-                
-                for delimiter in sub_delimiters:
-                    new_sub_chunks = []
-                    for chunk in sub_chunks:
-                        if len(chunk) <= max_length:
-                            new_sub_chunks.append(chunk)
-                        else:
-                            parts = chunk.split(delimiter)
-                            current_part = ""
-                            for part in parts:
-                                if len(current_part) + len(delimiter) + len(part) <= max_length:
-                                    current_part += (delimiter if current_part else "") + part
-                                else:
-                                    if current_part:
-                                        new_sub_chunks.append(current_part)
-                                    current_part = part
-                            if current_part:
-                                new_sub_chunks.append(current_part)
-                    sub_chunks = new_sub_chunks
-                
-                # Add sub-chunks
-                for sub_chunk in sub_chunks:
-                    if len(sub_chunk) <= max_length:
-                        chunks.append(sub_chunk.strip())
-                    else:
-                        # Last resort: split by words
-                        words = sub_chunk.split()
-                        current_word_chunk = ""
-                        for word in words:
-                            if len(current_word_chunk) + len(word) + 1 <= max_length:
-                                current_word_chunk += (" " if current_word_chunk else "") + word
-                            else:
-                                if current_word_chunk:
-                                    chunks.append(current_word_chunk)
-                                current_word_chunk = word
-                        if current_word_chunk:
-                            chunks.append(current_word_chunk)
+                # Clause boundaries first, then words, then a hard cut
+                chunks.extend(split_long_sentence(sentence, max_length))
                 current_chunk = ""
             else:
                 current_chunk = sentence
@@ -309,7 +363,7 @@ def _split_by_sentences(text: str, max_length: int) -> List[str]:
             
             # If sentence is too long, split it further
             if len(sentence) > max_length:
-                sub_chunks = _split_long_sentence(sentence, max_length)
+                sub_chunks = split_long_sentence(sentence, max_length)
                 chunks.extend(sub_chunks)
                 current_chunk = ""
             else:
@@ -365,7 +419,7 @@ def _split_by_fixed_size(text: str, chunk_size: int) -> List[str]:
     return chunks
 
 
-def _split_long_sentence(sentence: str, max_length: int) -> List[str]:
+def split_long_sentence(sentence: str, max_length: int) -> List[str]:
     """Split a long sentence at natural break points"""
     # Try to split at commas, semicolons, etc.
     delimiters = [', ', '; ', ' - ', ' — ', ': ', ' and ', ' or ', ' but ']
@@ -379,14 +433,21 @@ def _split_long_sentence(sentence: str, max_length: int) -> List[str]:
                 new_chunks.append(chunk)
             else:
                 parts = chunk.split(delimiter)
-                current_part = ""
-                for part in parts:
+                # Inside a chunk the delimiter is kept as written; at a split,
+                # punctuation stays with the clause before it and a conjunction
+                # starts the clause after it
+                if delimiter.strip().isalpha():
+                    before_split, after_split = "", delimiter.lstrip()
+                else:
+                    before_split, after_split = delimiter.rstrip(), ""
+                current_part = parts[0]
+                for part in parts[1:]:
                     if len(current_part) + len(delimiter) + len(part) <= max_length:
-                        current_part += (delimiter if current_part else "") + part
+                        current_part += delimiter + part
                     else:
-                        if current_part:
-                            new_chunks.append(current_part)
-                        current_part = part
+                        if current_part.strip():
+                            new_chunks.append(current_part + before_split)
+                        current_part = after_split + part
                 if current_part:
                     new_chunks.append(current_part)
         chunks = new_chunks
@@ -435,36 +496,104 @@ def get_streaming_settings(
     return settings
 
 
-def concatenate_audio_chunks(audio_chunks: list, sample_rate: int) -> torch.Tensor:
-    """Concatenate multiple audio tensors with proper memory management"""
+def concatenate_audio_chunks(audio_chunks: list, sample_rate: int,
+                             pauses_ms: Optional[List[int]] = None,
+                             crossfade_ms: Optional[int] = None) -> "torch.Tensor":
+    """
+    Concatenate multiple audio tensors with silence between them and an
+    equal-power crossfade at every joint. `pauses_ms` gives the silence for
+    each gap (one per pair of adjacent chunks); without it every gap is 0.1
+    seconds. `crossfade_ms` defaults to CROSSFADE_MS.
+    """
     if len(audio_chunks) == 1:
         return audio_chunks[0]
     
-    # Add small silence between chunks (0.1 seconds)
-    silence_samples = int(0.1 * sample_rate)
+    import torch
+    from app.core.stitching import stitch_chunks
     
-    # Create silence tensor on the same device as audio chunks
-    device = audio_chunks[0].device if hasattr(audio_chunks[0], 'device') else 'cpu'
-    silence = torch.zeros(1, silence_samples, device=device)
+    if pauses_ms is None:
+        pauses_ms = [100] * (len(audio_chunks) - 1)
     
     # Use torch.no_grad() to prevent gradient tracking
     with torch.no_grad():
-        concatenated = audio_chunks[0]
-        
-        for i, chunk in enumerate(audio_chunks[1:], 1):
-            # Concatenate current result with silence and next chunk
-            concatenated = torch.cat([concatenated, silence, chunk], dim=1)
-            
-            # Optional: cleanup intermediate tensors for very long sequences
-            if i % 10 == 0:  # Every 10 chunks
-                gc.collect()
+        concatenated = stitch_chunks(audio_chunks, sample_rate, pauses_ms, crossfade_ms)
     
-    # Clean up silence tensor
-    del silence
+    if len(audio_chunks) > 10:
+        gc.collect()
     
     return concatenated
 
 
+# Boundary markers for long-text splitting, in the order they are tried.
+# Within a strategy the last marker (in list order) with a fitting occurrence wins.
+PARAGRAPH_BREAK_RE = re.compile(r'\n\s*\n')
+_LONG_TEXT_SENTENCE_ENDINGS = ['. ', '! ', '? ', '.\n', '!\n', '?\n', '."', '!"', '?"', ".'", "!'", "?'"]
+_LONG_TEXT_CLAUSE_DELIMITERS = [', ', '; ', ': ', ' - ', ' — ', ' and ', ' or ', ' but ', ' while ', ' when ']
+_NON_WHITESPACE_RE = re.compile(r'\S')
+
+
+def _find_all(text: str, needle: str) -> List[int]:
+    """Start offsets of every (possibly overlapping) occurrence of `needle`"""
+    positions = []
+    found = text.find(needle)
+    while found != -1:
+        positions.append(found)
+        found = text.find(needle, found + 1)
+    return positions
+
+
+class _BoundaryIndex:
+    """
+    Sorted offsets of paragraph, sentence and clause boundaries in a text,
+    built once so split points can be found by binary search.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.paragraph_ends = [m.end() for m in PARAGRAPH_BREAK_RE.finditer(text)]
+        # (marker length, start offsets) per marker, in priority order
+        self.sentence_starts = [(len(e), _find_all(text, e)) for e in _LONG_TEXT_SENTENCE_ENDINGS]
+        self.clause_starts = [(len(d), _find_all(text, d)) for d in _LONG_TEXT_CLAUSE_DELIMITERS]
+
+    def _last_marker_end(self, markers, base: int, limit: int) -> Optional[int]:
+        """End of the last marker occurrence within [base, limit], last marker in list order winning"""
+        best = None
+        for length, starts in markers:
+            # Last occurrence that starts at or after base and ends by limit
+            i = bisect_right(starts, limit - length) - 1
+            if i >= 0 and starts[i] >= base:
+                best = starts[i] + length
+        return best
+
+    def find_split(self, base: int, max_length: int) -> int:
+        """
+        Best split point (relative to `base`) for text[base:], which is longer
+        than `max_length` and starts with a non-whitespace character.
+        """
+        limit = base + max_length
+
+        # Strategy 1: Split at paragraph boundaries (don't take chunks that are too small)
+        i = bisect_right(self.paragraph_ends, limit) - 1
+        if i >= 0 and self.paragraph_ends[i] > base:
+            split = self.paragraph_ends[i] - base
+            if split > max_length * 0.5:
+                return split
+
+        # Strategy 2: Split at sentence boundaries
+        end = self._last_marker_end(self.sentence_starts, base, limit)
+        if end is not None and end - base > max_length * 0.4:
+            return end - base
+
+        # Strategy 3: Split at clause boundaries
+        end = self._last_marker_end(self.clause_starts, base, limit)
+        if end is not None and end - base > max_length * 0.3:
+            return end - base
+
+        # Strategy 4: Split at the last space before the limit (last resort)
+        space = self.text.rfind(' ', base, limit)
+        return space - base if space != -1 else max_length
+
+
 def split_text_for_long_generation(text: str,
                                    max_chunk_size: Optional[int] = None,
                                    overlap_chars: int = 0) -> List[LongTextChunk]:
@@ -477,6 +606,9 @@ def split_text_for_long_generation(text: str,
     3. Third attempt: Split at clause boundaries (, ; : - —)
     4. Last resort: Split at word boundaries
 
+    All boundaries are indexed once up front and chunks are tracked as offsets
+    into the text, so splitting is linear in the text length.
+
     Args:
         text: Input text to split (should be > 3000 characters)
     """
@@ -489,20 +621,21 @@ def split_text_for_long_generation(text: str,
     # Ensure we don't exceed the regular TTS limit
     effective_max = min(max_chunk_size, Config.MAX_TOTAL_LENGTH - 100)  # Leave some buffer
 
+    text = text.strip()
+    index = _BoundaryIndex(text)
     chunks = []
     chunk_index = 0
-    remaining_text = text.strip()
+    base = 0  # Start of the remaining text; always a non-whitespace character
 
-    while remaining_text:
-        if len(remaining_text) <= effective_max:
+    while base < len(text):
+        if len(text) - base <= effective_max:
             # Last chunk
-            chunk_text = remaining_text
-            remaining_text = ""
+            chunk_text = text[base:]
+            next_base = len(text)
         else:
-            # Find the best split point
-            chunk_text, remaining_text = _find_best_split_point(
-                remaining_text, effective_max, overlap_chars
-            )
+            split = index.find_split(base, effective_max)
+            chunk_text = text[base:base + split].strip()
+            next_base = base + max(0, split - overlap_chars)
 
         # Create chunk metadata
         chunk = LongTextChunk(
@@ -515,155 +648,44 @@ def split_text_for_long_generation(text: str,
         chunks.append(chunk)
         chunk_index += 1
 
-    return chunks
-
-
-def _find_best_split_point(text: str, max_length: int, overlap_chars: int = 0) -> Tuple[str, str]:
-    """
-    Find the best point to split text while preserving semantic boundaries.
-
-    Returns:
-        Tuple of (chunk_text, remaining_text)
-    """
-    if len(text) <= max_length:
-        return text, ""
-
-    # Strategy 1: Split at paragraph boundaries
-    split_result = _try_split_at_paragraphs(text, max_length, overlap_chars)
-    if split_result:
-        return split_result
-
-    # Strategy 2: Split at sentence boundaries
-    split_result = _try_split_at_sentences(text, max_length, overlap_chars)
-    if split_result:
-        return split_result
-
-    # Strategy 3: Split at clause boundaries
-    split_result = _try_split_at_clauses(text, max_length, overlap_chars)
-    if split_result:
-        return split_result
-
-    # Strategy 4: Split at word boundaries (last resort)
-    return _split_at_words(text, max_length, overlap_chars)
-
-
-def _try_split_at_paragraphs(text: str, max_length: int, overlap_chars: int) -> Optional[Tuple[str, str]]:
-    """Try to split at paragraph boundaries (double newlines)"""
-    # Find all paragraph breaks
-    paragraph_pattern = r'\n\s*\n'
-    matches = list(re.finditer(paragraph_pattern, text))
-
-    if not matches:
-        return None
-
-    # Find the best paragraph break within our limit
-    best_split = None
-    for match in matches:
-        split_pos = match.end()
-        if split_pos <= max_length:
-            best_split = split_pos
-        else:
-            break
-
-    if best_split and best_split > max_length * 0.5:  # Don't take chunks that are too small
-        chunk_text = text[:best_split].strip()
-        remaining_text = text[max(0, best_split - overlap_chars):].strip()
-        return chunk_text, remaining_text
-
-    return None
-
-
-def _try_split_at_sentences(text: str, max_length: int, overlap_chars: int) -> Optional[Tuple[str, str]]:
-    """Try to split at sentence boundaries"""
-    # Enhanced sentence boundary detection
-    sentence_endings = ['. ', '! ', '? ', '.\n', '!\n', '?\n', '."', '!"', '?"', ".'", "!'", "?'"]
-
-    best_split = None
-    for ending in sentence_endings:
-        pos = 0
-        while pos < len(text):
-            found = text.find(ending, pos)
-            if found == -1:
-                break
+        # Skip the whitespace the remaining text would have been stripped of
+        match = _NON_WHITESPACE_RE.search(text, next_base)
+        base = match.start() if match else len(text)
 
-            split_pos = found + len(ending)
-            if split_pos <= max_length:
-                best_split = split_pos
-                pos = found + 1
-            else:
-                break
-
-    if best_split and best_split > max_length * 0.4:  # Don't take chunks that are too small
-        chunk_text = text[:best_split].strip()
-        remaining_text = text[max(0, best_split - overlap_chars):].strip()
-        return chunk_text, remaining_text
-
-    return None
-
-
-def _try_split_at_clauses(text: str, max_length: int, overlap_chars: int) -> Optional[Tuple[str, str]]:
-    """Try to split at clause boundaries (commas, semicolons, etc.)"""
-    clause_delimiters = [', ', '; ', ': ', ' - ', ' — ', ' and ', ' or ', ' but ', ' while ', ' when ']
-
-    best_split = None
-    for delimiter in clause_delimiters:
-        pos = 0
-        while pos < len(text):
-            found = text.find(delimiter, pos)
-            if found == -1:
-                break
-
-            split_pos = found + len(delimiter)
-            if split_pos <= max_length:
-                best_split = split_pos
-                pos = found + 1
-            else:
-                break
-
-    if best_split and best_split > max_length * 0.3:  # Don't take chunks that are too small
-        chunk_text = text[:best_split].strip()
-        remaining_text = text[max(0, best_split - overlap_chars):].strip()
-        return chunk_text, remaining_text
-
-    return None
-
-
-def _split_at_words(text: str, max_length: int, overlap_chars: int) -> Tuple[str, str]:
-    """Split at word boundaries as last resort"""
-    if len(text) <= max_length:
-        return text, ""
-
-    # Find the last space before our limit
-    split_pos = text.rfind(' ', 0, max_length)
-
-    if split_pos == -1:  # No space found, force split
-        split_pos = max_length
-
-    chunk_text = text[:split_pos].strip()
-    remaining_text = text[max(0, split_pos - overlap_chars):].strip()
-
-    return chunk_text, remaining_text
+    return chunks
 
 
-def estimate_processing_time(text_length: int, avg_chars_per_second: float = 25.0) -> int:
+def estimate_processing_time(text_length: int, avg_chars_per_second: Optional[float] = None,
+                             language_id: str = "en", voice: str = "default") -> int:
     """
     Estimate processing time for long text TTS generation.
 
     Args:
         text_length: Total characters in text
-        avg_chars_per_second: Average processing rate (characters per second)
+        avg_chars_per_second: Fixed processing rate; by default the per-chunk
+            generation times learned from previous requests are used
+        language_id: Language of the text
+        voice: Voice key (see processing_estimator.voice_key)
 
     Returns:
         Estimated processing time in seconds
     """
-    # Base estimate + overhead for chunking and concatenation
-    base_time = text_length / avg_chars_per_second
-
-    # Add overhead: 5 seconds for setup + 2 seconds per chunk + 10 seconds for concatenation
-    num_chunks = max(1, (text_length + Config.LONG_TEXT_CHUNK_SIZE - 1) // Config.LONG_TEXT_CHUNK_SIZE)
-    overhead = 5 + (num_chunks * 2) + 10
-
-    return int(base_time + overhead)
+    if avg_chars_per_second is not None:
+        # Base estimate + overhead for chunking and concatenation
+        base_time = text_length / avg_chars_per_second
+
+        # Add overhead: 5 seconds for setup + 2 seconds per chunk + 10 seconds for concatenation
+        num_chunks = max(1, (text_length + Config.LONG_TEXT_CHUNK_SIZE - 1) // Config.LONG_TEXT_CHUNK_SIZE)
+        overhead = 5 + (num_chunks * 2) + 10
+
+        return int(base_time + overhead)
+
+    # Assume chunks filled to the planner's budget (tokens are roughly characters)
+    chunk_chars = max(1, Config.MAX_CHUNK_TOKENS)
+    full_chunks, remainder = divmod(max(0, text_length), chunk_chars)
+    chunk_sizes = [chunk_chars] * full_chunks + ([remainder] if remainder else [])
+    seconds = get_processing_estimator().predict_chunks(chunk_sizes, language_id, voice)
+    return int(round(seconds + JOB_OVERHEAD_SECONDS))
 
 
 def validate_long_text_input(text: str) -> Tuple[bool, str]:
@@ -3,27 +3,28 @@ TTS model initialization and management
 """
 
 import os
+import time
 import asyncio
+from collections import OrderedDict, deque
+from dataclasses import dataclass
 from enum import Enum
-from typing import Optional, Dict, Any
-from chatterbox.tts import ChatterboxTTS
-from chatterbox.mtl_tts import ChatterboxMultilingualTTS
+from typing import Optional, Dict, Any, List, Tuple
 from app.core.mtl import SUPPORTED_LANGUAGES
 from app.config import Config, detect_device
+from app.core.precision import apply_precision, get_precision_info, resolve_precision
+from app.core.startup_profile import get_startup_profiler, startup_phase
 
-# For Indonesian Optimization
-from huggingface_hub import hf_hub_download
-from safetensors.torch import load_file
-import torch
+# torch, chatterbox, huggingface_hub and safetensors are imported by the
+# functions below (in an executor thread) so importing this module stays cheap
 
-# Global model instance
-_model = None
+# Global model state (loaded models themselves live in the registry)
 _device = None
 _initialization_state = "not_started"
 _initialization_error = None
 _initialization_progress = ""
 _is_multilingual = None
 _supported_languages = {}
+_cpu_load_patched = False
 
 
 class InitializationState(Enum):
@@ -33,173 +34,505 @@ class InitializationState(Enum):
     ERROR = "error"
 
 
-async def initialize_model():
-    """Initialize the Chatterbox TTS model"""
-    global _model, _device, _initialization_state, _initialization_error, _initialization_progress, _is_multilingual, _supported_languages
-    
-    # Inner helper for Indonesian optimization
-    def apply_indonesian_optimization(model):
-        if not Config.USE_INDONESIAN_OPTIMIZED_MODEL:
-            return
-            
-        repo_id = Config.INDONESIAN_MODEL_REPO
-        filename = "t3_cfg.safetensors"
-        
-        print(f"Checking for Indonesian optimization weights from {repo_id}...")
+@dataclass(frozen=True)
+class ModelVariant:
+    """Static description of a loadable model variant"""
+    name: str
+    model_id: str
+    description: str
+    multilingual: bool
+    indonesian_weights: bool
+    languages: Dict[str, str]
+
+
+MODEL_VARIANTS: Dict[str, ModelVariant] = {
+    "standard": ModelVariant(
+        name="standard",
+        model_id="chatterbox-standard",
+        description="Standard English Chatterbox TTS model",
+        multilingual=False,
+        indonesian_weights=False,
+        languages={"en": "English"},
+    ),
+    "multilingual": ModelVariant(
+        name="multilingual",
+        model_id="chatterbox-multilingual",
+        description="Chatterbox Multilingual TTS model",
+        multilingual=True,
+        indonesian_weights=False,
+        languages=SUPPORTED_LANGUAGES.copy(),
+    ),
+    # NOTE: Indonesian optimized weights from grandhigh are based on the standard (704 tokens)
+    # architecture and are INCOMPATIBLE with the multilingual (2352 tokens) architecture,
+    # so this variant is always the standard model with the fine-tuned T3 weights applied.
+    "indonesian": ModelVariant(
+        name="indonesian",
+        model_id="chatterbox-indonesian",
+        description="Standard Chatterbox TTS model with Indonesian fine-tuned T3 weights",
+        multilingual=False,
+        indonesian_weights=True,
+        languages={"en": "English", "id": "Indonesian"},
+    ),
+}
+
+# Model ids that always resolve to the configured default variant
+DEFAULT_MODEL_ALIASES = {"chatterbox-tts-1", "default", "tts-1", "tts-1-hd"}
+
+
+class UnknownModelError(ValueError):
+    """Raised when a request names a model that is not served"""
+
+
+@dataclass
+class _ResidentModel:
+    """Bookkeeping for a variant that is currently loaded"""
+    variant: ModelVariant
+    model: Any
+    size_bytes: int
+    loaded_at: float
+    last_used: float
+    load_seconds: float
+    request_count: int = 0
+
+
+class ModelRegistry:
+    """
+    Keeps several model variants resident at once.
+
+    Variants are loaded lazily on first use and the least recently used one is
+    evicted when the resident count or memory budget would be exceeded. Requests
+    that already hold a model reference keep it alive until they finish.
+    """
+
+    def __init__(self):
+        self._resident: "OrderedDict[str, _ResidentModel]" = OrderedDict()
+        # One load at a time across all variants: room is made for a load
+        # against the residents only, so concurrent loads would overshoot the limits
+        self._load_lock: Optional[asyncio.Lock] = None
+        self._known_sizes: Dict[str, int] = {}
+        self._events: deque = deque(maxlen=100)
+
+    # ------------------------------------------------------------------
+    # Variant resolution
+    # ------------------------------------------------------------------
+
+    def enabled_variants(self) -> List[ModelVariant]:
+        """Variants this server is allowed to load, in configured order"""
+        return [MODEL_VARIANTS[name] for name in Config.get_enabled_model_variants() if name in MODEL_VARIANTS]
+
+    def default_variant(self) -> ModelVariant:
+        return MODEL_VARIANTS[Config.get_default_model_variant()]
+
+    def resolve_variant(self, model_name: Optional[str] = None, language_id: Optional[str] = None) -> ModelVariant:
+        """
+        Map a request's `model` field and language to a variant.
+
+        An explicit variant is honoured as-is. Without one (or with an OpenAI-style
+        alias) the default variant is used unless it cannot speak the requested
+        language, in which case the first enabled variant that can is preferred,
+        favouring variants that are already resident.
+        """
+        enabled = {v.name: v for v in self.enabled_variants()}
+
+        if model_name and model_name.lower() not in DEFAULT_MODEL_ALIASES:
+            wanted = model_name.lower()
+            for variant in enabled.values():
+                if wanted in (variant.name, variant.model_id):
+                    return variant
+            # OpenAI model names carry no meaning here and fall through to the default
+            if not wanted.startswith(("tts-", "gpt-")):
+                available = ", ".join(v.model_id for v in enabled.values())
+                raise UnknownModelError(f"Model '{model_name}' is not available. Available models: {available}")
+
+        default = self.default_variant()
+        if not language_id or language_id in default.languages:
+            return default
+
+        candidates = [v for v in enabled.values() if language_id in v.languages]
+        if not candidates:
+            return default
+        for variant in candidates:
+            if variant.name in self._resident:
+                return variant
+        return candidates[0]
+
+    # ------------------------------------------------------------------
+    # Loading and eviction
+    # ------------------------------------------------------------------
+
+    def get_resident(self, variant_name: str) -> Optional[Any]:
+        entry = self._resident.get(variant_name)
+        return entry.model if entry else None
+
+    def is_resident(self, variant_name: str) -> bool:
+        return variant_name in self._resident
+
+    def resident_variants(self) -> List[str]:
+        return list(self._resident.keys())
+
+    def _touch(self, variant_name: str) -> _ResidentModel:
+        entry = self._resident[variant_name]
+        self._resident.move_to_end(variant_name)
+        entry.last_used = time.time()
+        entry.request_count += 1
+        return entry
+
+    async def get_model(self, variant: ModelVariant) -> Any:
+        """Return a resident model for the variant, loading it if needed"""
+        if variant.name in self._resident:
+            return self._touch(variant.name).model
+
+        if self._load_lock is None:
+            self._load_lock = asyncio.Lock()
+        async with self._load_lock:
+            # Another request may have loaded it while we waited
+            if variant.name in self._resident:
+                return self._touch(variant.name).model
+            await self._load(variant, reason="on_demand")
+            return self._touch(variant.name).model
+
+    async def _load(self, variant: ModelVariant, reason: str):
+        expected_size = self._known_sizes.get(variant.name) or self._average_resident_size()
+        self._make_room(expected_size, incoming=variant.name)
+
+        print(f"📦 Loading model variant '{variant.name}' ({reason})...")
+        started = time.time()
+        loop = asyncio.get_event_loop()
         try:
-            # Check if likely already in cache to provide better logging
-            # (hf_hub_download handles cache internally, but we want to be explicit in logs)
+            model = await loop.run_in_executor(None, lambda: _load_variant_sync(variant, _device))
+        except Exception as e:
+            self._record_event("load_failed", variant, reason=reason, error=str(e))
+            raise
+
+        load_seconds = time.time() - started
+        size_bytes = _estimate_model_bytes(model)
+        self._known_sizes[variant.name] = size_bytes
+        now = time.time()
+        self._resident[variant.name] = _ResidentModel(
+            variant=variant,
+            model=model,
+            size_bytes=size_bytes,
+            loaded_at=now,
+            last_used=now,
+            load_seconds=load_seconds,
+        )
+        self._record_event("load", variant, reason=reason, duration_seconds=round(load_seconds, 2),
+                           size_mb=round(size_bytes / (1024 * 1024), 1))
+        print(f"✓ Model variant '{variant.name}' loaded in {load_seconds:.1f}s ({size_bytes / (1024 * 1024):.0f}MB)")
+
+        # The size estimate for a first-time load may have been too low
+        self._make_room(0, incoming=variant.name)
+
+    def _average_resident_size(self) -> int:
+        if not self._resident:
+            return 0
+        return sum(entry.size_bytes for entry in self._resident.values()) // len(self._resident)
+
+    def _over_limits(self, extra_bytes: int, extra_count: int) -> bool:
+        count = len(self._resident) + extra_count
+        if Config.MAX_RESIDENT_MODELS > 0 and count > Config.MAX_RESIDENT_MODELS:
+            return True
+        budget_bytes = Config.MODEL_MEMORY_BUDGET_MB * 1024 * 1024
+        if budget_bytes > 0:
+            used = sum(entry.size_bytes for entry in self._resident.values())
+            return used + extra_bytes > budget_bytes
+        return False
+
+    def _make_room(self, incoming_bytes: int, incoming: str):
+        """Evict least recently used variants until the incoming one fits"""
+        extra_count = 0 if incoming in self._resident else 1
+        while self._over_limits(incoming_bytes, extra_count):
+            victim = next((name for name in self._resident if name != incoming), None)
+            if victim is None:
+                break
+            self.evict(victim, reason="lru")
+
+    def evict(self, variant_name: str, reason: str = "manual") -> bool:
+        entry = self._resident.pop(variant_name, None)
+        if entry is None:
+            return False
+        self._record_event("evict", entry.variant, reason=reason,
+                           size_mb=round(entry.size_bytes / (1024 * 1024), 1),
+                           idle_seconds=round(time.time() - entry.last_used, 1))
+        print(f"♻️ Evicted model variant '{variant_name}' ({reason})")
+        del entry
+        # Deferred import to avoid a cycle through app.core
+        from app.core.memory import cleanup_memory
+        cleanup_memory()
+        return True
+
+    def adopt(self, variant: ModelVariant, model: Any, load_seconds: float, reason: str):
+        """Register an already-loaded model (used by startup initialization)"""
+        size_bytes = _estimate_model_bytes(model)
+        self._known_sizes[variant.name] = size_bytes
+        now = time.time()
+        self._resident[variant.name] = _ResidentModel(
+            variant=variant,
+            model=model,
+            size_bytes=size_bytes,
+            loaded_at=now,
+            last_used=now,
+            load_seconds=load_seconds,
+        )
+        self._record_event("load", variant, reason=reason, duration_seconds=round(load_seconds, 2),
+                           size_mb=round(size_bytes / (1024 * 1024), 1))
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+
+    def _record_event(self, event: str, variant: ModelVariant, **details):
+        self._events.append({
+            "event": event,
+            "model": variant.model_id,
+            "variant": variant.name,
+            "timestamp": int(time.time()),
+            **details,
+        })
+
+    def get_events(self) -> List[Dict[str, Any]]:
+        return list(self._events)
+
+    def describe(self) -> List[Dict[str, Any]]:
+        """Status of every enabled variant"""
+        default = self.default_variant()
+        result = []
+        for variant in self.enabled_variants():
+            entry = self._resident.get(variant.name)
+            result.append({
+                "variant": variant,
+                "is_default": variant.name == default.name,
+                "loaded": entry is not None,
+                "memory_mb": round(entry.size_bytes / (1024 * 1024), 1) if entry else None,
+                "loaded_at": int(entry.loaded_at) if entry else None,
+                "last_used": int(entry.last_used) if entry else None,
+                "request_count": entry.request_count if entry else 0,
+            })
+        return result
+
+    def get_memory_usage_mb(self) -> float:
+        return round(sum(entry.size_bytes for entry in self._resident.values()) / (1024 * 1024), 1)
+
+
+_registry = ModelRegistry()
+
+if hasattr(os, "register_at_fork"):
+    # Locks may be bound to the parent's event loop; forked workers start clean
+    os.register_at_fork(after_in_child=lambda: setattr(_registry, "_load_lock", None))
+
+
+def get_model_registry() -> ModelRegistry:
+    """Get the global model registry"""
+    return _registry
+
+
+def _estimate_model_bytes(model) -> int:
+    """Sum parameter and buffer sizes across the model's torch submodules"""
+    import torch
+    
+    total = 0
+    seen = set()
+    for attr in ("t3", "s3gen", "ve", "tokenizer"):
+        module = getattr(model, attr, None)
+        if not isinstance(module, torch.nn.Module):
+            continue
+        for tensor in list(module.parameters()) + list(module.buffers()):
+            if id(tensor) in seen:
+                continue
+            seen.add(id(tensor))
+            total += tensor.numel() * tensor.element_size()
+    return total
+
+
+def _apply_cpu_load_patches():
+    """Patch torch.load / safetensors so checkpoints always map to CPU"""
+    global _cpu_load_patched
+    if _cpu_load_patched:
+        return
+
+    import torch
+    original_load = torch.load
+    original_load_file = None
+
+    # Try to patch safetensors if available
+    try:
+        import safetensors.torch
+        original_load_file = safetensors.torch.load_file
+    except ImportError:
+        pass
+
+    def force_cpu_torch_load(f, map_location=None, **kwargs):
+        # Always force CPU mapping if we're on a CPU device
+        return original_load(f, map_location='cpu', **kwargs)
+
+    def force_cpu_load_file(filename, device=None):
+        # Force CPU for safetensors loading too
+        return original_load_file(filename, device='cpu')
+
+    torch.load = force_cpu_torch_load
+    if original_load_file:
+        safetensors.torch.load_file = force_cpu_load_file
+    _cpu_load_patched = True
+
+
+def _apply_indonesian_optimization(model):
+    """Inject the Indonesian fine-tuned T3 weights into a standard model"""
+    from huggingface_hub import hf_hub_download
+    from safetensors.torch import load_file
+
+    repo_id = Config.INDONESIAN_MODEL_REPO
+    filename = "t3_cfg.safetensors"
+
+    print(f"Checking for Indonesian optimization weights from {repo_id}...")
+    try:
+        # Check if likely already in cache to provide better logging
+        # (hf_hub_download handles cache internally, but we want to be explicit in logs)
+        with startup_phase("model.indonesian_download", repo_id=repo_id):
             checkpoint_path = hf_hub_download(
-                repo_id=repo_id, 
+                repo_id=repo_id,
                 filename=filename,
                 cache_dir=Config.MODEL_CACHE_DIR
             )
-            
-            # Check if the path is already within our persistent cache dir
-            is_cached = Config.MODEL_CACHE_DIR in checkpoint_path
-            msg_prefix = "✓ Loading from persistent cache:" if is_cached else "✓ Downloaded:"
-            print(f"{msg_prefix} {checkpoint_path}")
-            
+
+        # Check if the path is already within our persistent cache dir
+        is_cached = Config.MODEL_CACHE_DIR in checkpoint_path
+        msg_prefix = "✓ Loading from persistent cache:" if is_cached else "✓ Downloaded:"
+        print(f"{msg_prefix} {checkpoint_path}")
+
+        with startup_phase("model.indonesian_overlay"):
             # Load weights (forcing CPU if needed as handled by patches earlier)
             weights = load_file(checkpoint_path, device='cpu')
-            
+
             # Inject weights into the T3 module
-            # Both standard and multilingual models use .t3 for the text-to-token module
             if hasattr(model, 't3'):
                 model.t3.load_state_dict(weights)
                 print(f"✓ Indonesian optimized weights applied successfully")
             else:
                 print(f"⚠️ Warning: Model does not have a 't3' module, skipping optimization")
-                
-        except Exception as e:
-            print(f"⚠️ Warning: Failed to apply Indonesian optimization: {e}")
-            import traceback
-            traceback.print_exc()
-            # Non-fatal error, continue with base model
-    
+
+    except Exception as e:
+        print(f"⚠️ Warning: Failed to apply Indonesian optimization: {e}")
+        import traceback
+        traceback.print_exc()
+        # Non-fatal error, continue with base model
+
+
+def _configure_sampling_steps(model):
+    """Deep set sampling steps for speed optimization"""
+    targets = [model]
+    if hasattr(model, 's3gen'): targets.append(model.s3gen)
+    if hasattr(model, 's3gen') and hasattr(model.s3gen, 'cfm'): targets.append(model.s3gen.cfm)
+
+    for target in targets:
+        if hasattr(target, 'n_timesteps'):
+            old_steps = getattr(target, 'n_timesteps')
+            setattr(target, 'n_timesteps', Config.SAMPLING_STEPS)
+            print(f"⚡ Set {type(target).__name__} sampling steps: {old_steps} -> {Config.SAMPLING_STEPS}")
+
+
+def _import_model_packages():
+    """Import the heavy inference stack (blocking; run in an executor)"""
+    import torch  # noqa: F401
+    import chatterbox.tts  # noqa: F401
+    if any(MODEL_VARIANTS[name].multilingual for name in Config.get_enabled_model_variants()):
+        import chatterbox.mtl_tts  # noqa: F401
+
+
+def _load_variant_sync(variant: ModelVariant, device: str):
+    """Load a model variant (blocking; run in an executor)"""
+    if device == 'cpu':
+        _apply_cpu_load_patches()
+
+    # from_pretrained covers both the hub download/cache verification and
+    # building the modules from the checkpoint files
+    if variant.multilingual:
+        from chatterbox.mtl_tts import ChatterboxMultilingualTTS
+        print(f"Loading Chatterbox Multilingual TTS model...")
+        with startup_phase("model.from_pretrained", variant=variant.name):
+            model = ChatterboxMultilingualTTS.from_pretrained(device=device)
+    else:
+        from chatterbox.tts import ChatterboxTTS
+        print(f"Loading standard Chatterbox TTS model...")
+        with startup_phase("model.from_pretrained", variant=variant.name):
+            model = ChatterboxTTS.from_pretrained(device=device)
+        if variant.indonesian_weights:
+            _apply_indonesian_optimization(model)
+        with startup_phase("model.configure_sampling_steps", steps=Config.SAMPLING_STEPS):
+            _configure_sampling_steps(model)
+
+    # After the Indonesian overlay, so the fine-tuned weights are the ones cast
+    with startup_phase("model.apply_precision", precision=Config.PRECISION):
+        apply_precision(model, device)
+
+    return model
+
+
+async def initialize_model():
+    """Initialize the Chatterbox TTS model (the configured default variant)"""
+    global _device, _initialization_state, _initialization_error, _initialization_progress, _is_multilingual, _supported_languages
+
+    profiler = get_startup_profiler()
     try:
         print(f"🎬 Starting model initialization process...")
         _initialization_state = InitializationState.INITIALIZING.value
         _initialization_progress = "Validating configuration..."
-        
-        Config.validate()
+
+        with profiler.phase("init.config_validate"):
+            Config.validate()
         print(f"✅ Configuration validated")
-        _device = detect_device()
-        
+
+        # Heavy imports happen off the event loop so health checks keep answering
+        loop = asyncio.get_event_loop()
+        _initialization_progress = "Importing inference libraries..."
+        with profiler.phase("init.import_packages"):
+            await loop.run_in_executor(None, _import_model_packages)
+        with profiler.phase("init.detect_device"):
+            _device = detect_device()
+            precision = resolve_precision(_device)
+
         print(f"Initializing Chatterbox TTS model...")
         print(f"Device: {_device}")
+        print(f"Precision: {precision}")
         print(f"Voice sample: {Config.VOICE_SAMPLE_PATH}")
         print(f"Model cache: {Config.MODEL_CACHE_DIR}")
-        
+
         _initialization_progress = "Creating model cache directory..."
         # Ensure model cache directory exists
         os.makedirs(Config.MODEL_CACHE_DIR, exist_ok=True)
-        
+
         _initialization_progress = "Checking voice sample..."
         # Check voice sample exists
         if not os.path.exists(Config.VOICE_SAMPLE_PATH):
             raise FileNotFoundError(f"Voice sample not found: {Config.VOICE_SAMPLE_PATH}")
-        
+
         _initialization_progress = "Configuring device compatibility..."
-        # Patch torch.load for CPU compatibility if needed
         if _device == 'cpu':
-            import torch
-            original_load = torch.load
-            original_load_file = None
-            
-            # Try to patch safetensors if available
-            try:
-                import safetensors.torch
-                original_load_file = safetensors.torch.load_file
-            except ImportError:
-                pass
-            
-            def force_cpu_torch_load(f, map_location=None, **kwargs):
-                # Always force CPU mapping if we're on a CPU device
-                return original_load(f, map_location='cpu', **kwargs)
-            
-            def force_cpu_load_file(filename, device=None):
-                # Force CPU for safetensors loading too
-                return original_load_file(filename, device='cpu')
-            
-            torch.load = force_cpu_torch_load
-            if original_load_file:
-                safetensors.torch.load_file = force_cpu_load_file
-        
-        # Determine if we should use multilingual model
-        # NOTE: Indonesian optimized weights from grandhigh are based on the standard (704 tokens) 
-        # architecture and are INCOMPATIBLE with the multilingual (2352 tokens) architecture.
-        # We force standard model if Indonesian optimization is enabled.
-        use_multilingual = Config.USE_MULTILINGUAL_MODEL and not Config.USE_INDONESIAN_OPTIMIZED_MODEL
-        
-        if Config.USE_INDONESIAN_OPTIMIZED_MODEL and Config.USE_MULTILINGUAL_MODEL:
+            with profiler.phase("init.cpu_load_patches"):
+                _apply_cpu_load_patches()
+
+        variant = _registry.default_variant()
+        if Config.USE_INDONESIAN_OPTIMIZED_MODEL and Config.USE_MULTILINGUAL_MODEL and variant.name == "indonesian":
             print("ℹ️ Indonesian optimization enabled: Switching to standard model architecture for compatibility")
-        
-        print(f"📦 Model loading strategy: {'multilingual' if use_multilingual else 'standard'}")
+
+        print(f"📦 Model loading strategy: {variant.name} (enabled variants: {', '.join(Config.get_enabled_model_variants())})")
         _initialization_progress = "Loading TTS model (this may take a while)..."
+
         # Initialize model with run_in_executor for non-blocking
-        loop = asyncio.get_event_loop()
-        
-        if use_multilingual:
-            print(f"Loading Chatterbox Multilingual TTS model...")
-            _model = await loop.run_in_executor(
-                None, 
-                lambda: ChatterboxMultilingualTTS.from_pretrained(
-                    device=_device
-                )
-            )
-            _is_multilingual = True
-            _supported_languages = SUPPORTED_LANGUAGES.copy()
-            
-            # Apply Indonesian optimization if enabled
-            if Config.USE_INDONESIAN_OPTIMIZED_MODEL:
-                _initialization_progress = "Applying Indonesian optimization in background..."
-                # Run optimization in executor to avoid blocking the event loop
-                await loop.run_in_executor(
-                    None,
-                    lambda: apply_indonesian_optimization(_model)
-                )
-                
-            print(f"✓ Multilingual model initialized with {len(_supported_languages)} languages")
-        else:
-            print(f"Loading standard Chatterbox TTS model...")
-            _model = await loop.run_in_executor(
-                None, 
-                lambda: ChatterboxTTS.from_pretrained(
-                    device=_device
-                )
-            )
-            _is_multilingual = False
-            _supported_languages = {"en": "English", "id": "Indonesian"}  # Add Indonesian support for standard model too
-            
-            # Apply Indonesian optimization if enabled
-            if Config.USE_INDONESIAN_OPTIMIZED_MODEL:
-                _initialization_progress = "Applying Indonesian optimization in background..."
-                # Run optimization in executor to avoid blocking the event loop
-                await loop.run_in_executor(
-                    None,
-                    lambda: apply_indonesian_optimization(_model)
-                )
-                
-            # Deep set sampling steps for speed optimization
-            targets = [_model]
-            if hasattr(_model, 's3gen'): targets.append(_model.s3gen)
-            if hasattr(_model, 's3gen') and hasattr(_model.s3gen, 'cfm'): targets.append(_model.s3gen.cfm)
-            
-            for target in targets:
-                if hasattr(target, 'n_timesteps'):
-                    old_steps = getattr(target, 'n_timesteps')
-                    setattr(target, 'n_timesteps', Config.SAMPLING_STEPS)
-                    print(f"⚡ Set {type(target).__name__} sampling steps: {old_steps} -> {Config.SAMPLING_STEPS}")
-                
-            print(f"✓ Standard model initialized")
-        
+        started = time.time()
+        with profiler.phase("init.load_model", variant=variant.name, device=_device):
+            model = await loop.run_in_executor(None, lambda: _load_variant_sync(variant, _device))
+        _registry.adopt(variant, model, time.time() - started, reason="startup")
+
+        _is_multilingual = variant.multilingual
+        _supported_languages = variant.languages.copy()
+        print(f"✓ {variant.description} initialized with {len(_supported_languages)} languages")
+
         _initialization_state = InitializationState.READY.value
         _initialization_progress = "Model ready"
         _initialization_error = None
         print(f"✓ Model initialized successfully on {_device}")
-        return _model
-        
+        return model
+
     except Exception as e:
         _initialization_state = InitializationState.ERROR.value
         _initialization_error = str(e)
@@ -207,10 +540,26 @@ async def initialize_model():
         print(f"✗ Failed to initialize model: {e}")
         raise e
 
+    finally:
+        profiler.mark_complete()
+
+
+async def get_model_for_request(model_name: Optional[str] = None,
+                                language_id: Optional[str] = None) -> Tuple[Any, ModelVariant]:
+    """
+    Resolve and (lazily) load the model that should serve a request.
+
+    Raises:
+        UnknownModelError: if the request names a model that is not enabled
+    """
+    variant = _registry.resolve_variant(model_name, language_id)
+    model = await _registry.get_model(variant)
+    return model, variant
+
 
 def get_model():
-    """Get the current model instance"""
-    return _model
+    """Get the default model instance (None if it is not resident)"""
+    return _registry.get_resident(_registry.default_variant().name)
 
 
 def get_device():
@@ -234,27 +583,27 @@ def get_initialization_error():
 
 
 def is_ready():
-    """Check if the model is ready for use"""
-    return _initialization_state == InitializationState.READY.value and _model is not None
+    """Check if the model registry is ready to serve requests"""
+    return _initialization_state == InitializationState.READY.value
 
 
 def is_initializing():
     """Check if the model is currently initializing"""
-    return _initialization_state == InitializationState.INITIALIZING.value 
+    return _initialization_state == InitializationState.INITIALIZING.value
 
 
 def is_multilingual():
-    """Check if the loaded model supports multilingual generation"""
+    """Check if the default model variant supports multilingual generation"""
     return _is_multilingual
 
 
 def get_supported_languages():
-    """Get the dictionary of supported languages"""
+    """Get the dictionary of languages supported by the default variant"""
     return _supported_languages.copy()
 
 
 def supports_language(language_id: str):
-    """Check if the model supports a specific language"""
+    """Check if the default variant supports a specific language"""
     return language_id in _supported_languages
 
 
@@ -266,6 +615,10 @@ def get_model_info() -> Dict[str, Any]:
         "supported_languages": _supported_languages,
         "language_count": len(_supported_languages),
         "device": _device,
+        "precision": get_precision_info(),
         "is_ready": is_ready(),
-        "initialization_state": _initialization_state
-    }
\ No newline at end of file
+        "initialization_state": _initialization_state,
+        "default_variant": _registry.default_variant().name,
+        "resident_variants": _registry.resident_variants(),
+        "resident_memory_mb": _registry.get_memory_usage_mb()
+    }
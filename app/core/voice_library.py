@@ -22,6 +22,8 @@ class VoiceLibrary:
         self.metadata_file = self.library_dir / "voices.json"
         self.config_file = self.library_dir / "config.json"
         self._ensure_library_dir()
+        self._metadata_signature = None
+        self._config_signature = None
         self._metadata = self._load_metadata()
         self._config = self._load_config()
     
@@ -29,8 +31,35 @@ class VoiceLibrary:
         """Ensure the voice library directory exists"""
         self.library_dir.mkdir(parents=True, exist_ok=True)
     
+    @staticmethod
+    def _file_signature(path: Path) -> Optional[Tuple[int, int]]:
+        """Cheap change detector for files shared between worker processes"""
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+    
+    @staticmethod
+    def _write_json_atomic(path: Path, data: Dict):
+        """Write JSON via a temp file so other workers never read a partial file"""
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    
+    def refresh_if_changed(self):
+        """Reload metadata/config that another worker process has rewritten"""
+        if self._file_signature(self.metadata_file) != self._metadata_signature:
+            self._metadata = self._load_metadata()
+        if self._file_signature(self.config_file) != self._config_signature:
+            self._config = self._load_config()
+            # Keep the runtime default voice in step with the shared config
+            Config.VOICE_SAMPLE_PATH = self.get_default_voice_path() or os.getenv('VOICE_SAMPLE_PATH', './voice-sample.mp3')
+    
     def _load_metadata(self) -> Dict:
         """Load voice metadata from JSON file"""
+        self._metadata_signature = self._file_signature(self.metadata_file)
         if self.metadata_file.exists():
             try:
                 with open(self.metadata_file, 'r', encoding='utf-8') as f:
@@ -41,11 +70,12 @@ class VoiceLibrary:
     
     def _save_metadata(self):
         """Save voice metadata to JSON file"""
-        with open(self.metadata_file, 'w', encoding='utf-8') as f:
-            json.dump(self._metadata, f, indent=2, ensure_ascii=False)
+        self._write_json_atomic(self.metadata_file, self._metadata)
+        self._metadata_signature = self._file_signature(self.metadata_file)
     
     def _load_config(self) -> Dict:
         """Load configuration from JSON file"""
+        self._config_signature = self._file_signature(self.config_file)
         if self.config_file.exists():
             try:
                 with open(self.config_file, 'r', encoding='utf-8') as f:
@@ -62,8 +92,8 @@ class VoiceLibrary:
     def _save_config(self):
         """Save configuration to JSON file"""
         self._config["last_updated"] = datetime.now().isoformat()
-        with open(self.config_file, 'w', encoding='utf-8') as f:
-            json.dump(self._config, f, indent=2, ensure_ascii=False)
+        self._write_json_atomic(self.config_file, self._config)
+        self._config_signature = self._file_signature(self.config_file)
     
     def _get_file_hash(self, file_path: Path) -> str:
         """Generate a hash for the voice file for deduplication"""
@@ -588,4 +618,7 @@ def get_voice_library() -> VoiceLibrary:
         _voice_library = VoiceLibrary()
         # Initialize the default voice from persistent configuration
         _voice_library.initialize_default_voice()
+    else:
+        # Other worker processes may have changed the library on disk
+        _voice_library.refresh_if_changed()
     return _voice_library 
\ No newline at end of file
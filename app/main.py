@@ -7,12 +7,14 @@ from fastapi import FastAPI, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
-from app.core.tts_model import initialize_model
+from app.core.tts_model import initialize_model, is_ready
 from app.core.voice_library import get_voice_library
 from app.core.background_tasks import start_background_processor, stop_background_processor
+from app.core.processing_estimator import get_processing_estimator
 from app.api.router import api_router
 from app.config import Config
 from app.core.version import get_version
+from app.core.startup_profile import get_startup_profiler
 
 
 ascii_art = r"""
@@ -30,17 +32,24 @@ ascii_art = r"""
 async def lifespan(app: FastAPI):
     # Startup
     print(ascii_art)
+    profiler = get_startup_profiler()
     
     # Start model initialization in the background
     # This allows the server to respond to health checks immediately
     # while the model loads asynchronously
     import asyncio
-    model_init_task = asyncio.create_task(initialize_model())
+    if is_ready():
+        # Weights were preloaded by the parent process before this worker was forked
+        print("✓ Using model preloaded by the parent process")
+        model_init_task = None
+    else:
+        model_init_task = asyncio.create_task(initialize_model())
     
     # Initialize voice library to restore default voice settings
     print("Initializing voice library...")
-    voice_lib = get_voice_library()
-    default_voice = voice_lib.get_default_voice()
+    with profiler.phase("lifespan.voice_library"):
+        voice_lib = get_voice_library()
+        default_voice = voice_lib.get_default_voice()
     if default_voice:
         print(f"Restored default voice: {default_voice}")
     else:
@@ -48,7 +57,8 @@ async def lifespan(app: FastAPI):
 
     # Start background processor for long text TTS jobs
     print("Starting long text background processor...")
-    await start_background_processor()
+    with profiler.phase("lifespan.background_processor"):
+        await start_background_processor()
     print("Long text background processor started")
 
     # Note: We don't await the model initialization here
@@ -62,8 +72,11 @@ async def lifespan(app: FastAPI):
     await stop_background_processor()
     print("Long text background processor stopped")
 
+    # Persist learned processing times
+    get_processing_estimator().save(force=True)
+
     # Cancel model initialization if it's still running
-    if not model_init_task.done():
+    if model_init_task and not model_init_task.done():
         model_init_task.cancel()
         try:
             await model_init_task
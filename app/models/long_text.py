@@ -29,12 +29,16 @@ class LongTextJobActionType(str, Enum):
 class LongTextRequest(BaseModel):
     """Request model for long text TTS generation"""
     input: str = Field(..., min_length=1, description="Text to convert to speech (must be > MAX_TOTAL_LENGTH characters)")
+    model: Optional[str] = Field(None, description="Model variant to use (see /v1/models)")
     voice: Optional[str] = Field(None, description="Voice name from library or OpenAI voice name")
     response_format: Optional[str] = Field("mp3", description="Audio format (mp3 or wav)")
     exaggeration: Optional[float] = Field(None, ge=0.25, le=2.0, description="Emotion intensity")
     cfg_weight: Optional[float] = Field(None, ge=0.0, le=1.0, description="Pace control")
     temperature: Optional[float] = Field(None, ge=0.05, le=5.0, description="Sampling temperature")
     session_id: Optional[str] = Field(None, description="Frontend session ID for tracking")
+    deadline_seconds: Optional[float] = Field(None, gt=0, description="Reject the job unless it is predicted to complete within this many seconds")
+    parallelism: Optional[int] = Field(None, ge=1, description="Units generated at the same time (capped by LONG_TEXT_MAX_JOB_PARALLELISM)")
+    deduplicate: bool = Field(True, description="Reuse an identical job (same text, voice audio, settings, format and model): get its audio at once if it has completed, or when it completes if it is still running")
 
     @field_validator('input')
     @classmethod
@@ -50,8 +54,18 @@ class LongTextChunk(BaseModel):
     text: str = Field(..., min_length=1, description="Chunk text content")
     text_preview: str = Field(..., description="First 50 characters for display")
     character_count: int = Field(..., ge=1, description="Number of characters in chunk")
+    paragraph_index: int = Field(default=0, ge=0, description="Paragraph the chunk belongs to")
+    pause_after_ms: int = Field(default=0, ge=0, description="Silence inserted after this chunk in the final audio")
+    token_count: Optional[int] = Field(None, ge=0, description="Planned text tokens")
+    estimated_seconds: Optional[float] = Field(None, ge=0, description="Planned speech duration")
+    cache_key: Optional[str] = Field(None, description="Hash of the text and generation settings; equal keys give interchangeable audio")
     audio_file: Optional[str] = Field(None, description="Path to generated audio file")
+    audio_bytes: Optional[int] = Field(None, ge=0, description="Size of the audio file when it was written")
+    audio_sha256: Optional[str] = Field(None, description="SHA256 of the audio file when it was written")
+    audio_seconds: Optional[float] = Field(None, ge=0, description="Duration of the generated audio")
+    trimmed_seconds: Optional[float] = Field(None, ge=0, description="Edge silence trimmed from the generated audio")
     duration_ms: Optional[int] = Field(None, ge=0, description="Duration in milliseconds")
+    attempts: int = Field(default=0, ge=0, description="Generation attempts made")
     processing_started_at: Optional[datetime] = None
     processing_completed_at: Optional[datetime] = None
     error: Optional[str] = None
@@ -79,8 +93,11 @@ class LongTextJobMetadata(BaseModel):
     output_path: Optional[str] = Field(None, description="Path to final concatenated audio")
     output_size_bytes: Optional[int] = Field(None, ge=0, description="Final audio file size")
     output_duration_seconds: Optional[float] = Field(None, ge=0, description="Final audio duration")
+    trimmed_silence_seconds: Optional[float] = Field(None, ge=0, description="Edge silence trimmed from the chunks before stitching")
     error: Optional[str] = None
     user_session_id: Optional[str] = Field(None, description="Frontend session ID")
+    dedup_key: Optional[str] = Field(None, description="Hash of the text, voice audio, settings, format and model; jobs with equal keys give interchangeable audio")
+    deduplicated_from: Optional[str] = Field(None, description="Job whose audio this job shares instead of generating its own")
 
     # History-specific fields
     completion_timestamp: Optional[datetime] = Field(None, description="When job fully completed successfully")
@@ -102,6 +119,8 @@ class LongTextProgress(BaseModel):
     current_chunk: Optional[LongTextChunk] = None
     completed_chunks: List[LongTextChunk] = Field(default_factory=list)
     estimated_remaining_seconds: Optional[int] = Field(None, ge=0)
+    queue_position: Optional[int] = Field(None, ge=1, description="Place in the processing queue (1 = next to start); None unless waiting")
+    estimated_wait_seconds: Optional[int] = Field(None, ge=0, description="Predicted seconds of work ahead of the job while it waits in the queue")
     status: LongTextJobStatus = Field(..., description="Current job status")
     error: Optional[str] = None
 
@@ -115,6 +134,7 @@ class LongTextJobResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     download_url: Optional[str] = Field(None, description="URL to download completed audio")
+    stream_url: Optional[str] = Field(None, description="URL to stream the audio while the job is still running")
     can_pause: bool = Field(default=False, description="Whether job can be paused")
     can_resume: bool = Field(default=False, description="Whether job can be resumed")
     can_cancel: bool = Field(default=True, description="Whether job can be cancelled")
@@ -131,6 +151,7 @@ class LongTextJobListItem(BaseModel):
     completed_at: Optional[datetime] = None
     download_url: Optional[str] = None
     can_resume: bool = Field(default=False)
+    queue_position: Optional[int] = Field(None, ge=1, description="Place in the processing queue (1 = next to start)")
 
     # Enhanced fields for history
     voice: Optional[str] = None
@@ -159,6 +180,8 @@ class LongTextJobCreateResponse(BaseModel):
     status: LongTextJobStatus = Field(default=LongTextJobStatus.PENDING)
     message: str = Field(default="Job created successfully")
     estimated_processing_time_seconds: Optional[int] = Field(None, ge=0)
+    queue_position: Optional[int] = Field(None, ge=1, description="Place in the processing queue (1 = next to start)")
+    deduplicated_from: Optional[str] = Field(None, description="Identical job whose audio this job reuses (now, or once that job completes)")
     total_chunks: int = Field(..., ge=1)
     status_url: str = Field(..., description="URL to check job status")
     sse_url: str = Field(..., description="URL for real-time progress updates")
@@ -173,8 +196,9 @@ class LongTextJobAction(BaseModel):
 
 class LongTextSSEEvent(BaseModel):
     """Server-sent event model for real-time updates"""
+    id: Optional[int] = Field(None, description="Event sequence number (the SSE id, usable as Last-Event-ID)")
     job_id: str
-    event_type: str = Field(..., description="Event type: progress, status_change, error, completed")
+    event_type: str = Field(..., description="Event type: progress, chunk_started, chunk_completed, status_change, eta, deleted, error, completed")
     data: Dict[str, Any] = Field(default_factory=dict, description="Event data")
     timestamp: datetime = Field(default_factory=datetime.utcnow)
 
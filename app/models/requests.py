@@ -9,6 +9,7 @@ from pydantic import BaseModel, Field, validator
 class TTSRequest(BaseModel):
     """Text-to-speech request model"""
     
+    model: Optional[str] = Field(None, description="Model variant to use (see /v1/models); defaults to the configured variant")
     input: str = Field(..., description="The text to generate audio for", min_length=1, max_length=3000)
     voice: Optional[str] = Field("alloy", description="Voice to use (ignored - uses voice sample)")
     response_format: Optional[str] = Field("wav", description="Audio format (always returns WAV)")
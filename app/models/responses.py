@@ -26,6 +26,14 @@ class ModelInfo(BaseModel):
     object: str
     created: int
     owned_by: str
+    description: Optional[str] = None
+    alias_for: Optional[str] = None
+    is_default: Optional[bool] = None
+    loaded: Optional[bool] = None
+    languages: Optional[List[str]] = None
+    memory_mb: Optional[float] = None
+    last_used: Optional[int] = None
+    request_count: Optional[int] = None
 
 
 class ModelsResponse(BaseModel):
@@ -33,6 +41,10 @@ class ModelsResponse(BaseModel):
     
     object: str
     data: List[ModelInfo]
+    resident_memory_mb: Optional[float] = None
+    max_resident_models: Optional[int] = None
+    memory_budget_mb: Optional[int] = None
+    events: Optional[List[Dict[str, Any]]] = None
 
 
 class ConfigResponse(BaseModel):
@@ -108,6 +120,7 @@ class TTSStatusResponse(BaseModel):
     progress: Optional[TTSProgressResponse] = None
     error_message: Optional[str] = None
     memory_usage: Optional[Dict[str, float]] = None
+    chunk_plan: Optional[Dict[str, Any]] = None
     total_requests: int = 0
     message: Optional[str] = None
 
@@ -122,6 +135,10 @@ class TTSStatisticsResponse(BaseModel):
     average_duration_seconds: float
     average_text_length: float
     is_processing: bool
+    chunk_planner: Optional[Dict[str, Any]] = None
+    processing_estimator: Optional[Dict[str, Any]] = None
+    silence_trimming: Optional[Dict[str, Any]] = None
+    inference_scheduler: Optional[Dict[str, Any]] = None
 
 
 class APIInfoResponse(BaseModel):
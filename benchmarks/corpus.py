@@ -0,0 +1,61 @@
+"""
+Deterministic text corpora for the text-processing benchmarks
+
+The default corpus avoids abbreviations and initials so that the current and
+legacy splitters are expected to produce identical output on it.
+"""
+
+import random
+
+_SENTENCES = [
+    ("id", "Pemerintah daerah akan membangun jalan baru di wilayah timur kota tahun depan."),
+    ("id", "Anak-anak bermain di halaman sekolah sambil menunggu orang tua mereka datang menjemput."),
+    ("id", "Harga beras naik sekitar 3.5 persen dibandingkan bulan lalu, menurut data terbaru."),
+    ("id", "Apakah kamu sudah membaca laporan yang dikirimkan kemarin sore?"),
+    ("id", "Luar biasa!"),
+    ("en", "The committee reviewed every proposal carefully before making a final decision."),
+    ("en", "Rain is expected in the northern districts later this evening, so bring an umbrella."),
+    ("en", "Why would anyone leave the door open on a night like this?"),
+    ("id", "Kami berangkat pukul 07.30 dan tiba di Bandung sebelum makan siang; perjalanan cukup lancar."),
+    ("id", "Penjualan mencapai 1.250.000 unit - angka tertinggi dalam lima tahun terakhir."),
+    ("en", "She said the results were promising, but more testing would be needed."),
+    ("id", "Di pasar tradisional, pedagang menawarkan sayur, buah, ikan, dan rempah-rempah segar."),
+    ("en", "Nobody expected the small bakery on the corner to win the national award."),
+    ("en", "Turn left at the second light, then follow the river until you reach the old bridge."),
+    ("en", "Prices rose by 2.4 percent in March - the steepest increase in nearly three years."),
+    ("en", "Is it too late to change the schedule for tomorrow's meeting?"),
+]
+
+_ABBREVIATION_SENTENCES = [
+    "Dr. Siti Rahma dan Prof. Budi Santoso hadir di Jl. Merdeka No. 10 pagi ini.",
+    "Mr. Smith arrived at 5 p.m. with Mrs. Jones and their colleagues, e.g. the auditors.",
+    "Ia membeli buku, pensil, penghapus, dll. untuk persiapan ujian.",
+]
+
+
+# Characters mixed into the "unicode" corpus variants (smart punctuation, accents)
+UNICODE_SPRINKLE = "“”‘’–—…éèáíóúñçʼ"
+
+
+def make_corpus(length: int, seed: int = 42, paragraphs: bool = True, abbreviations: bool = False,
+                language: str = "mixed") -> str:
+    """Build roughly `length` characters of Indonesian ("id"), English ("en") or mixed prose"""
+    rng = random.Random(seed)
+    pool = [text for lang, text in _SENTENCES if language == "mixed" or lang == language]
+    pool += _ABBREVIATION_SENTENCES if abbreviations else []
+    parts = []
+    size = 0
+    while size < length:
+        sentence = rng.choice(pool)
+        separator = "\n\n" if paragraphs and rng.random() < 0.08 else " "
+        parts.append(sentence + separator)
+        size += len(sentence) + len(separator)
+    return "".join(parts)[:length].rstrip()
+
+
+def sprinkle_unicode(text: str, every: int = 37) -> str:
+    """Replace every `every`-th character with smart punctuation or an accented letter"""
+    chars = list(text)
+    for i in range(0, len(chars), every):
+        chars[i] = UNICODE_SPRINKLE[i % len(UNICODE_SPRINKLE)]
+    return "".join(chars)
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Long-text audio concatenation benchmark
+
+Compares concatenate_audio_files, which streams 16-bit PCM WAV chunks block
+by block into the output, against the previous implementation, which loaded
+every chunk into a pydub AudioSegment and grew the result with repeated
+`result + silence + segment`. Synthetic chunks are generated for each chunk
+count; both write WAV (pydub's built-in writer, so ffmpeg is not involved).
+Checks that the outputs have identical PCM and that streaming peak memory
+stays flat as the number of chunks grows.
+
+Usage:
+    python benchmarks/long_text_concat.py [--chunks 10,100,1000] [--chunk-seconds 1.0]
+        [--sample-rate 24000] [--no-legacy]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+import wave
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.audio_processing import AudioSegment, concatenate_audio_files
+
+# Streaming peak memory may grow by this factor (plus slack) from the smallest to the largest run
+MEMORY_GROWTH_LIMIT = 2.0
+MEMORY_SLACK_BYTES = 1024 * 1024
+
+
+def legacy_concatenate_audio_files(audio_files: List[Path], output_path: Path,
+                                   silence_durations_ms: List[int]) -> float:
+    """concatenate_audio_files as it was before streaming (WAV input, no normalization)"""
+    segments = [AudioSegment.from_wav(str(audio_file)) for audio_file in audio_files]
+    silences = {
+        duration: AudioSegment.silent(duration=duration, frame_rate=segments[0].frame_rate)
+        for duration in set(silence_durations_ms) if duration > 0
+    }
+    result = segments[0]
+    for segment, gap_ms in zip(segments[1:], silence_durations_ms):
+        if gap_ms > 0:
+            result = result + silences[gap_ms]
+        result = result + segment
+    result.export(str(output_path), format="wav")
+    return len(result) / 1000.0
+
+
+def make_chunks(directory: Path, count: int, seconds: float, sample_rate: int) -> List[Path]:
+    """Speech-like chunks: noise under a slow amplitude envelope, 16-bit mono WAV"""
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    frames = int(seconds * sample_rate)
+    envelope = 0.5 - 0.5 * np.cos(np.linspace(0, 2 * np.pi * max(1, int(seconds * 3)), frames))
+    paths = []
+    for i in range(count):
+        samples = (rng.standard_normal(frames) * envelope * 6000).astype('<i2')
+        path = directory / f"chunk_{i + 1:04d}.wav"
+        with wave.open(str(path), 'wb') as writer:
+            writer.setnchannels(1)
+            writer.setsampwidth(2)
+            writer.setframerate(sample_rate)
+            writer.writeframes(samples.tobytes())
+        paths.append(path)
+    return paths
+
+
+def measure(func):
+    """(seconds, peak traced bytes, result) of one call"""
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        started = time.perf_counter()
+        result = func()
+        seconds = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return seconds, max(0, peak - baseline), result
+
+
+def read_frames(path: Path) -> bytes:
+    with wave.open(str(path), 'rb') as reader:
+        return reader.readframes(reader.getnframes())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark long-text audio concatenation")
+    parser.add_argument("--chunks", default="10,100,1000", help="Comma-separated chunk counts")
+    parser.add_argument("--chunk-seconds", type=float, default=1.0, help="Duration of each synthetic chunk")
+    parser.add_argument("--sample-rate", type=int, default=24000)
+    parser.add_argument("--no-legacy", action="store_true", help="Only measure the streaming implementation")
+    args = parser.parse_args()
+
+    counts = [int(c) for c in args.chunks.split(",")]
+    success = True
+    streaming_peaks = []
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        chunks = make_chunks(tmp, max(counts), args.chunk_seconds, args.sample_rate)
+        for count in counts:
+            files = chunks[:count]
+            # Alternate clause, sentence and paragraph pauses
+            gaps = [(150, 350, 600)[i % 3] for i in range(count - 1)]
+
+            output = tmp / f"streamed_{count}.wav"
+            seconds, peak, metadata = measure(lambda: concatenate_audio_files(
+                files, output, output_format="wav", silence_durations_ms=gaps, normalize_volume=False
+            ))
+            streaming_peaks.append(peak)
+            line = (f"🔗 {count:>5} chunks ({metadata['duration_seconds']:8.1f}s audio): "
+                    f"streaming {seconds * 1000:9.1f} ms, peak {peak / 1024 ** 2:7.2f} MiB")
+
+            if not args.no_legacy:
+                legacy_output = tmp / f"legacy_{count}.wav"
+                legacy_seconds, legacy_peak, _ = measure(
+                    lambda: legacy_concatenate_audio_files(files, legacy_output, gaps)
+                )
+                identical = read_frames(output) == read_frames(legacy_output)
+                success &= identical
+                line += (f" | legacy {legacy_seconds * 1000:9.1f} ms, peak {legacy_peak / 1024 ** 2:8.2f} MiB"
+                         f" | identical: {'✅' if identical else '❌'}")
+                legacy_output.unlink()
+            output.unlink()
+            print(line)
+
+    if streaming_peaks[-1] > streaming_peaks[0] * MEMORY_GROWTH_LIMIT + MEMORY_SLACK_BYTES:
+        print(f"\n❌ Streaming peak memory grew from {streaming_peaks[0] / 1024 ** 2:.2f} MiB "
+              f"to {streaming_peaks[-1] / 1024 ** 2:.2f} MiB")
+        success = False
+    if not success:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Long-text splitter benchmark
+
+Compares split_text_for_long_generation against the previous implementation,
+which re-ran the paragraph/sentence/clause searches over (and sliced a copy
+of) the whole remaining text for every chunk. Checks that both produce
+identical LongTextChunk lists, on the benchmark corpus and on randomized
+inputs with overlaps, and reports the speedup.
+
+Usage:
+    python benchmarks/long_text_splitter.py [--sizes 100000,1000000] [--repeat 1]
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+from typing import List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.corpus import make_corpus
+from app.config import Config
+from app.core.text_processing import normalize_text, split_text_for_long_generation
+from app.models.long_text import LongTextChunk
+
+
+def legacy_split_text_for_long_generation(text: str,
+                                   max_chunk_size: Optional[int] = None,
+                                   overlap_chars: int = 0) -> List[LongTextChunk]:
+    """split_text_for_long_generation as it was before the boundary index"""
+    # Normalize text early
+    text = normalize_text(text)
+    
+    if max_chunk_size is None:
+        max_chunk_size = Config.LONG_TEXT_CHUNK_SIZE
+
+    # Ensure we don't exceed the regular TTS limit
+    effective_max = min(max_chunk_size, Config.MAX_TOTAL_LENGTH - 100)  # Leave some buffer
+
+    chunks = []
+    chunk_index = 0
+    remaining_text = text.strip()
+
+    while remaining_text:
+        if len(remaining_text) <= effective_max:
+            # Last chunk
+            chunk_text = remaining_text
+            remaining_text = ""
+        else:
+            # Find the best split point
+            chunk_text, remaining_text = legacy_find_best_split_point(
+                remaining_text, effective_max, overlap_chars
+            )
+
+        # Create chunk metadata
+        chunk = LongTextChunk(
+            index=chunk_index,
+            text=chunk_text,
+            text_preview=chunk_text[:50] + ("..." if len(chunk_text) > 50 else ""),
+            character_count=len(chunk_text)
+        )
+
+        chunks.append(chunk)
+        chunk_index += 1
+
+    return chunks
+
+
+def legacy_find_best_split_point(text: str, max_length: int, overlap_chars: int = 0) -> Tuple[str, str]:
+    """
+    Find the best point to split text while preserving semantic boundaries.
+
+    Returns:
+        Tuple of (chunk_text, remaining_text)
+    """
+    if len(text) <= max_length:
+        return text, ""
+
+    # Strategy 1: Split at paragraph boundaries
+    split_result = legacy_try_split_at_paragraphs(text, max_length, overlap_chars)
+    if split_result:
+        return split_result
+
+    # Strategy 2: Split at sentence boundaries
+    split_result = legacy_try_split_at_sentences(text, max_length, overlap_chars)
+    if split_result:
+        return split_result
+
+    # Strategy 3: Split at clause boundaries
+    split_result = legacy_try_split_at_clauses(text, max_length, overlap_chars)
+    if split_result:
+        return split_result
+
+    # Strategy 4: Split at word boundaries (last resort)
+    return legacy_split_at_words(text, max_length, overlap_chars)
+
+
+def legacy_try_split_at_paragraphs(text: str, max_length: int, overlap_chars: int) -> Optional[Tuple[str, str]]:
+    """Try to split at paragraph boundaries (double newlines)"""
+    # Find all paragraph breaks
+    paragraph_pattern = r'\n\s*\n'
+    matches = list(re.finditer(paragraph_pattern, text))
+
+    if not matches:
+        return None
+
+    # Find the best paragraph break within our limit
+    best_split = None
+    for match in matches:
+        split_pos = match.end()
+        if split_pos <= max_length:
+            best_split = split_pos
+        else:
+            break
+
+    if best_split and best_split > max_length * 0.5:  # Don't take chunks that are too small
+        chunk_text = text[:best_split].strip()
+        remaining_text = text[max(0, best_split - overlap_chars):].strip()
+        return chunk_text, remaining_text
+
+    return None
+
+
+def legacy_try_split_at_sentences(text: str, max_length: int, overlap_chars: int) -> Optional[Tuple[str, str]]:
+    """Try to split at sentence boundaries"""
+    # Enhanced sentence boundary detection
+    sentence_endings = ['. ', '! ', '? ', '.\n', '!\n', '?\n', '."', '!"', '?"', ".'", "!'", "?'"]
+
+    best_split = None
+    for ending in sentence_endings:
+        pos = 0
+        while pos < len(text):
+            found = text.find(ending, pos)
+            if found == -1:
+                break
+
+            split_pos = found + len(ending)
+            if split_pos <= max_length:
+                best_split = split_pos
+                pos = found + 1
+            else:
+                break
+
+    if best_split and best_split > max_length * 0.4:  # Don't take chunks that are too small
+        chunk_text = text[:best_split].strip()
+        remaining_text = text[max(0, best_split - overlap_chars):].strip()
+        return chunk_text, remaining_text
+
+    return None
+
+
+def legacy_try_split_at_clauses(text: str, max_length: int, overlap_chars: int) -> Optional[Tuple[str, str]]:
+    """Try to split at clause boundaries (commas, semicolons, etc.)"""
+    clause_delimiters = [', ', '; ', ': ', ' - ', ' — ', ' and ', ' or ', ' but ', ' while ', ' when ']
+
+    best_split = None
+    for delimiter in clause_delimiters:
+        pos = 0
+        while pos < len(text):
+            found = text.find(delimiter, pos)
+            if found == -1:
+                break
+
+            split_pos = found + len(delimiter)
+            if split_pos <= max_length:
+                best_split = split_pos
+                pos = found + 1
+            else:
+                break
+
+    if best_split and best_split > max_length * 0.3:  # Don't take chunks that are too small
+        chunk_text = text[:best_split].strip()
+        remaining_text = text[max(0, best_split - overlap_chars):].strip()
+        return chunk_text, remaining_text
+
+    return None
+
+
+def legacy_split_at_words(text: str, max_length: int, overlap_chars: int) -> Tuple[str, str]:
+    """Split at word boundaries as last resort"""
+    if len(text) <= max_length:
+        return text, ""
+
+    # Find the last space before our limit
+    split_pos = text.rfind(' ', 0, max_length)
+
+    if split_pos == -1:  # No space found, force split
+        split_pos = max_length
+
+    chunk_text = text[:split_pos].strip()
+    remaining_text = text[max(0, split_pos - overlap_chars):].strip()
+
+    return chunk_text, remaining_text
+
+
+# Fragments that exercise every boundary type, including overlapping delimiters
+_FRAGMENTS = [
+    "word", "kata", "and", "or", "but", "when", "while", ". ", "! ", "? ", ".\n", '."', "!'",
+    ", ", "; ", ": ", " - ", " — ", " and ", " and and ", " or ", "\n\n", "\n \n\n", "  ", " ",
+]
+
+
+def _random_text(rng: random.Random, length: int) -> str:
+    parts = []
+    size = 0
+    while size < length:
+        fragment = rng.choice(_FRAGMENTS)
+        if fragment.isalpha():
+            fragment = " " + fragment * rng.randint(1, 3)
+        parts.append(fragment)
+        size += len(fragment)
+    return "".join(parts)
+
+
+def check_random_inputs(cases: int = 300, seed: int = 7) -> bool:
+    """Compare both implementations on randomized texts, chunk sizes and overlaps"""
+    rng = random.Random(seed)
+    for case in range(cases):
+        text = _random_text(rng, rng.randint(50, 6000))
+        max_chunk_size = rng.choice([40, 100, 250, 1000])
+        # Overlaps must stay below the smallest accepted split or neither version terminates
+        overlap = rng.choice([0, 0, max_chunk_size // 20, max_chunk_size // 10])
+        expected = legacy_split_text_for_long_generation(text, max_chunk_size, overlap)
+        actual = split_text_for_long_generation(text, max_chunk_size, overlap)
+        if expected != actual:
+            print(f"❌ Mismatch on random case {case} (max_chunk_size={max_chunk_size}, overlap={overlap})")
+            return False
+    print(f"✅ {cases} randomized inputs produce identical chunks")
+    return True
+
+
+def _best_time(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the long-text splitter")
+    parser.add_argument("--sizes", default="100000,1000000", help="Comma-separated input sizes in characters")
+    parser.add_argument("--repeat", type=int, default=1, help="Timed repetitions (best is reported)")
+    args = parser.parse_args()
+
+    # Keep the report readable
+    Config.TEXT_NORMALIZATION_STATS_SAMPLE_RATE = 0.0
+
+    success = check_random_inputs()
+    for size in (int(s) for s in args.sizes.split(",")):
+        text = make_corpus(size)
+        expected = legacy_split_text_for_long_generation(text)
+        actual = split_text_for_long_generation(text)
+        identical = expected == actual
+        success &= identical
+
+        legacy = _best_time(lambda: legacy_split_text_for_long_generation(text), args.repeat)
+        current = _best_time(lambda: split_text_for_long_generation(text), args.repeat)
+        print(
+            f"📏 {size:>9,} chars, {len(actual)} chunks, identical: {'✅' if identical else '❌'}  "
+            f"{legacy * 1000:9.1f} ms -> {current * 1000:7.1f} ms ({legacy / current:.1f}x)"
+        )
+
+    if not success:
+        print("\n❌ Chunk output differs from the legacy implementation")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
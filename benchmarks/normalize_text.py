@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+normalize_text benchmark
+
+Compares the translation-table normalize_text with the previous implementation
+(per-character replace loop, per-character category filter and unconditional
+logging) on ASCII-only and accent/smart-punctuation heavy inputs.
+
+Usage:
+    python benchmarks/normalize_text.py [--sizes 3000,30000,100000] [--repeat 5]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.corpus import make_corpus, sprinkle_unicode
+from app.core.text_processing import normalize_text
+from test_normalization_golden import legacy_normalize_text
+
+
+def _unicode_corpus(size: int) -> str:
+    return sprinkle_unicode(make_corpus(size))
+
+
+def _legacy_with_logging(text: str) -> str:
+    """The previous implementation also built and printed statistics on every call"""
+    replacements_made = []
+    from app.core.text_processing import NORMALIZATION_REPLACEMENTS
+    for char, replacement in NORMALIZATION_REPLACEMENTS.items():
+        if char in text:
+            replacements_made.append(f"'{char}'→'{replacement}' ({text.count(char)}x)")
+    if replacements_made:
+        print(f"🔄 Text normalization: {', '.join(replacements_made)}")
+    result = legacy_normalize_text(text)
+    high_unicode_chars = [ch for ch in result if ord(ch) > 127 and ch not in "\n\r\t"]
+    if high_unicode_chars:
+        print(f"⚠️  Warning: {len(high_unicode_chars)} high-unicode characters remain")
+    return result
+
+
+def _best_time(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark normalize_text")
+    parser.add_argument("--sizes", default="3000,30000,100000", help="Comma-separated input sizes in characters")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed repetitions (best is reported)")
+    args = parser.parse_args()
+
+    failed = False
+    for size in (int(s) for s in args.sizes.split(",")):
+        for label, text in (("ascii", make_corpus(size)), ("unicode", _unicode_corpus(size))):
+            identical = normalize_text(text, log_stats=False) == legacy_normalize_text(text)
+            failed |= not identical
+            legacy = _best_time(lambda: _legacy_with_logging(text), args.repeat)
+            current = _best_time(lambda: normalize_text(text, log_stats=False), args.repeat)
+            print(
+                f"{size:>8,} chars {label:<8} identical: {'✅' if identical else '❌'}  "
+                f"{legacy * 1000:8.2f} ms -> {current * 1000:7.2f} ms ({legacy / current:.1f}x)"
+            )
+
+    if failed:
+        print("\n❌ Output differs from the legacy implementation")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
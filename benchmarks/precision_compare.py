@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+fp32 vs bfloat16 latency/quality comparison
+
+Loads the default model variant in fp32, generates a set of sentences, then
+converts the same model to bfloat16 (PRECISION=bf16) and generates them again
+with the same seeds. Reports latency, real-time factor and how far the bf16
+audio drifts from the fp32 reference (duration and log-mel distance).
+
+Usage:
+    python benchmarks/precision_compare.py [--runs 3] [--device cpu]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import torch
+import torchaudio
+
+from app.config import Config, detect_device
+from app.core import precision
+from app.core.tts_model import _load_variant_sync, get_model_registry
+
+SENTENCES = [
+    "Selamat pagi, hari ini cuaca sangat cerah di Jakarta.",
+    "The quick brown fox jumps over the lazy dog while the band plays on.",
+    "Mohon perhatian, kereta api tujuan Bandung akan segera diberangkatkan dari jalur dua.",
+]
+
+
+def _generate(model, text: str, seed: int):
+    torch.manual_seed(seed)
+    started = time.perf_counter()
+    with torch.no_grad():
+        audio = model.generate(
+            text=text,
+            audio_prompt_path=Config.VOICE_SAMPLE_PATH,
+            exaggeration=Config.EXAGGERATION,
+            cfg_weight=Config.CFG_WEIGHT,
+            temperature=Config.TEMPERATURE,
+        )
+    return audio.detach().float().cpu().reshape(-1), time.perf_counter() - started
+
+
+def _run_suite(model, runs: int, label: str):
+    results = []
+    for index, text in enumerate(SENTENCES):
+        latencies = []
+        audio = None
+        for _ in range(runs):
+            audio, elapsed = _generate(model, text, seed=1234 + index)
+            latencies.append(elapsed)
+        duration = audio.numel() / model.sr
+        latency = statistics.median(latencies)
+        print(f"   [{label}] sentence {index + 1}: {latency:.2f}s for {duration:.2f}s audio (RTF {latency / max(duration, 1e-6):.2f})")
+        results.append({"audio": audio, "latency": latency, "duration": duration})
+    return results
+
+
+def _log_mel_distance(reference, candidate, sample_rate: int) -> float:
+    """Mean absolute log-mel difference over the overlapping part of two clips"""
+    mel = torchaudio.transforms.MelSpectrogram(sample_rate=sample_rate, n_fft=1024, hop_length=256, n_mels=80)
+    length = min(reference.numel(), candidate.numel())
+    if length == 0:
+        return float("nan")
+    ref_mel = torch.log(mel(reference[:length]) + 1e-5)
+    cand_mel = torch.log(mel(candidate[:length]) + 1e-5)
+    return (ref_mel - cand_mel).abs().mean().item()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare fp32 and bfloat16 inference")
+    parser.add_argument("--runs", type=int, default=3, help="Timed generations per sentence")
+    parser.add_argument("--device", default=None, help="Device override (default: auto-detect)")
+    args = parser.parse_args()
+
+    device = args.device or detect_device()
+    supported, reason = precision.check_bf16_support(device)
+    print(f"🔍 bfloat16 support on {device}: {'yes' if supported else 'no'} ({reason})")
+
+    # Load in fp32 first
+    Config.PRECISION = "fp32"
+    variant = get_model_registry().default_variant()
+    print(f"📦 Loading {variant.name} variant in fp32...")
+    model = _load_variant_sync(variant, device)
+    fp32_bytes = sum(p.numel() * p.element_size() for p in model.t3.parameters())
+
+    print("\n⏱️  fp32")
+    fp32_results = _run_suite(model, args.runs, "fp32")
+
+    if not supported:
+        print("\n⚠️ Skipping bfloat16 run: not supported on this hardware")
+        return
+
+    Config.PRECISION = "bf16"
+    precision._resolved.clear()
+    converted = precision.apply_precision(model, device)
+    bf16_bytes = sum(p.numel() * p.element_size() for p in model.t3.parameters())
+
+    print("\n⏱️  bf16")
+    bf16_results = _run_suite(model, args.runs, "bf16")
+
+    print("\n📊 Comparison")
+    print(f"   Converted submodules: {', '.join(converted)}")
+    print(f"   T3 weights: {fp32_bytes / 1024 / 1024:.0f} MB -> {bf16_bytes / 1024 / 1024:.0f} MB")
+    for index, (ref, cand) in enumerate(zip(fp32_results, bf16_results)):
+        speedup = ref["latency"] / max(cand["latency"], 1e-6)
+        distance = _log_mel_distance(ref["audio"], cand["audio"], model.sr)
+        print(
+            f"   Sentence {index + 1}: speedup {speedup:.2f}x, "
+            f"duration {ref['duration']:.2f}s -> {cand['duration']:.2f}s, "
+            f"log-mel L1 {distance:.3f}"
+        )
+    total_fp32 = sum(r["latency"] for r in fp32_results)
+    total_bf16 = sum(r["latency"] for r in bf16_results)
+    print(f"   Overall speedup: {total_fp32 / max(total_bf16, 1e-6):.2f}x")
+
+
+if __name__ == "__main__":
+    main()
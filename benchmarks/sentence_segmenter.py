@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Sentence segmenter benchmark
+
+Compares split_text_into_chunks against the previous implementation, which
+searched the remaining text for every sentence ending and sliced it off in a
+loop. Checks that both produce identical chunks on an abbreviation-free corpus
+and reports the speedup at several input sizes.
+
+Usage:
+    python benchmarks/sentence_segmenter.py [--sizes 3000,30000,100000] [--repeat 3]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.corpus import make_corpus
+from app.core.text_processing import iter_sentence_spans, normalize_text, split_text_into_chunks
+
+MAX_LENGTH = 280
+
+
+def legacy_sentences(text: str) -> list:
+    """Sentence split as done before the single-pass segmenter"""
+    sentence_endings = ['. ', '! ', '? ', '.\n', '!\n', '?\n']
+    sentences = []
+    temp_text = text
+    while temp_text:
+        best_split = len(temp_text)
+        for ending in sentence_endings:
+            pos = temp_text.find(ending)
+            if pos != -1 and pos < best_split:
+                best_split = pos + len(ending)
+        if best_split == len(temp_text):
+            sentences.append(temp_text)
+            break
+        sentences.append(temp_text[:best_split])
+        temp_text = temp_text[best_split:]
+    return sentences
+
+
+def legacy_split_text_into_chunks(text: str, max_length: int) -> list:
+    """split_text_into_chunks as it was before the single-pass segmenter"""
+    text = normalize_text(text)
+    if len(text) <= max_length:
+        return [text]
+
+    chunks = []
+    current_chunk = ""
+    for sentence in legacy_sentences(text):
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+        if len(current_chunk) + len(sentence) <= max_length:
+            current_chunk += (" " if current_chunk else "") + sentence
+        else:
+            if current_chunk:
+                chunks.append(current_chunk.strip())
+            if len(sentence) > max_length:
+                sub_delimiters = [', ', '; ', ' - ', ' — ']
+                sub_chunks = [sentence]
+                for delimiter in sub_delimiters:
+                    new_sub_chunks = []
+                    for chunk in sub_chunks:
+                        if len(chunk) <= max_length:
+                            new_sub_chunks.append(chunk)
+                        else:
+                            parts = chunk.split(delimiter)
+                            current_part = ""
+                            for part in parts:
+                                if len(current_part) + len(delimiter) + len(part) <= max_length:
+                                    current_part += (delimiter if current_part else "") + part
+                                else:
+                                    if current_part:
+                                        new_sub_chunks.append(current_part)
+                                    current_part = part
+                            if current_part:
+                                new_sub_chunks.append(current_part)
+                    sub_chunks = new_sub_chunks
+                for sub_chunk in sub_chunks:
+                    if len(sub_chunk) <= max_length:
+                        chunks.append(sub_chunk.strip())
+                    else:
+                        words = sub_chunk.split()
+                        current_word_chunk = ""
+                        for word in words:
+                            if len(current_word_chunk) + len(word) + 1 <= max_length:
+                                current_word_chunk += (" " if current_word_chunk else "") + word
+                            else:
+                                if current_word_chunk:
+                                    chunks.append(current_word_chunk)
+                                current_word_chunk = word
+                        if current_word_chunk:
+                            chunks.append(current_word_chunk)
+                current_chunk = ""
+            else:
+                current_chunk = sentence
+    if current_chunk:
+        chunks.append(current_chunk.strip())
+    return [chunk for chunk in chunks if chunk.strip()]
+
+
+def _best_time(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the sentence segmenter")
+    parser.add_argument("--sizes", default="3000,30000,100000", help="Comma-separated input sizes in characters")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed repetitions (best is reported)")
+    args = parser.parse_args()
+
+    failed = False
+    for size in (int(s) for s in args.sizes.split(",")):
+        text = make_corpus(size)
+        normalized = normalize_text(text)
+
+        expected = legacy_split_text_into_chunks(text, MAX_LENGTH)
+        actual = split_text_into_chunks(text, MAX_LENGTH)
+        identical = expected == actual
+        failed |= not identical
+
+        legacy_seg = _best_time(lambda: legacy_sentences(normalized), args.repeat)
+        new_seg = _best_time(lambda: [normalized[s:e] for s, e in iter_sentence_spans(normalized)], args.repeat)
+        legacy_total = _best_time(lambda: legacy_split_text_into_chunks(text, MAX_LENGTH), args.repeat)
+        new_total = _best_time(lambda: split_text_into_chunks(text, MAX_LENGTH), args.repeat)
+
+        print(f"\n📏 {size:,} chars, {len(actual)} chunks, identical output: {'✅' if identical else '❌'}")
+        print(f"   Sentence segmentation: {legacy_seg * 1000:9.2f} ms -> {new_seg * 1000:8.2f} ms ({legacy_seg / new_seg:.1f}x)")
+        print(f"   split_text_into_chunks: {legacy_total * 1000:8.2f} ms -> {new_total * 1000:8.2f} ms ({legacy_total / new_total:.1f}x)")
+
+    if failed:
+        print("\n❌ Chunk output differs from the legacy implementation")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Startup time benchmark
+
+Starts the API server repeatedly and measures how long it takes until the
+listening socket accepts connections and until /ping answers. Model loading
+happens in the background, so neither number should include it.
+
+Usage:
+    python benchmarks/startup_time.py [--runs 5] [--port 0]
+"""
+
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _port_open(port: int) -> bool:
+    try:
+        with socket.create_connection(("127.0.0.1", port), timeout=0.2):
+            return True
+    except OSError:
+        return False
+
+
+def _ping_ok(port: int) -> bool:
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/ping", timeout=1) as response:
+            return response.status == 200
+    except Exception:
+        return False
+
+
+def measure_once(port: int, timeout: float) -> dict:
+    """Start one server and return the time to listening socket and first 200"""
+    env = dict(os.environ, HOST="127.0.0.1", PORT=str(port))
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "main.py"],
+        cwd=ROOT_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    result = {"listening": None, "first_response": None}
+    try:
+        while time.perf_counter() - started < timeout:
+            if process.poll() is not None:
+                raise RuntimeError(f"server exited with code {process.returncode}")
+            if result["listening"] is None and _port_open(port):
+                result["listening"] = time.perf_counter() - started
+            if result["listening"] is not None and _ping_ok(port):
+                result["first_response"] = time.perf_counter() - started
+                break
+            time.sleep(0.01)
+        else:
+            raise TimeoutError(f"server did not answer within {timeout}s")
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure API server startup time")
+    parser.add_argument("--runs", type=int, default=5, help="Number of server starts")
+    parser.add_argument("--port", type=int, default=0, help="Port to use (0 picks a free one)")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Seconds to wait per start")
+    args = parser.parse_args()
+
+    listening, first_response = [], []
+    for run in range(1, args.runs + 1):
+        port = args.port or _free_port()
+        result = measure_once(port, args.timeout)
+        listening.append(result["listening"])
+        first_response.append(result["first_response"])
+        print(f"Run {run}: listening {result['listening']:.3f}s, first /ping {result['first_response']:.3f}s")
+
+    print("\n📊 Startup time")
+    print(f"   Listening socket: median {statistics.median(listening):.3f}s, min {min(listening):.3f}s")
+    print(f"   First /ping 200:  median {statistics.median(first_response):.3f}s, min {min(first_response):.3f}s")
+
+
+if __name__ == "__main__":
+    main()
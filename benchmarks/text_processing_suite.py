@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Text-processing benchmark suite with regression checks
+
+Runs normalize_text, split_text_into_chunks, split_text_for_streaming (every
+strategy) and split_text_for_long_generation over Indonesian, English and
+mixed (smart punctuation / accented) corpora from 1 KB to 1 MB. Reports
+throughput and peak allocation per case and compares them with a stored
+baseline, exiting non-zero if any case is slower or allocates more than the
+tolerances allow.
+
+Timings depend on the machine: refresh the baseline with --update-baseline
+when the reference hardware changes, not to absorb a slowdown.
+
+Usage:
+    python benchmarks/text_processing_suite.py [--sizes 1000,10000,100000,1000000]
+        [--repeat 5] [--only split_text_for_streaming] [--baseline PATH]
+        [--update-baseline] [--time-tolerance 0.5] [--memory-tolerance 0.2]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import re
+import sys
+import time
+import tracemalloc
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from benchmarks.corpus import make_corpus, sprinkle_unicode
+from app.config import Config
+from app.core.text_processing import (
+    normalize_text,
+    split_text_for_long_generation,
+    split_text_for_streaming,
+    split_text_into_chunks,
+)
+
+DEFAULT_BASELINE = os.path.join(REPO_ROOT, "benchmarks", "baselines", "text_processing.json")
+
+# Settings the results depend on, pinned so .env does not change what is measured
+PINNED_CONFIG = {
+    "MAX_CHUNK_LENGTH": 280,
+    "MAX_TOTAL_LENGTH": 3000,
+    "LONG_TEXT_CHUNK_SIZE": 2500,
+    "TEXT_NORMALIZATION_STATS_SAMPLE_RATE": 0.0,
+}
+
+CORPORA = {
+    "id": lambda size: make_corpus(size, language="id"),
+    "en": lambda size: make_corpus(size, language="en"),
+    "mixed-unicode": lambda size: sprinkle_unicode(make_corpus(size, abbreviations=True)),
+}
+
+FUNCTIONS = {
+    "normalize_text": lambda text: normalize_text(text, log_stats=False),
+    "split_text_into_chunks": lambda text: split_text_into_chunks(text, Config.MAX_CHUNK_LENGTH),
+    **{
+        f"split_text_for_streaming[{strategy}]": (lambda text, s=strategy: split_text_for_streaming(text, strategy=s))
+        for strategy in ("sentence", "paragraph", "word", "fixed")
+    },
+    "split_text_for_long_generation": lambda text: split_text_for_long_generation(text),
+}
+
+# Absolute slack for tiny allocations, which vary with interpreter internals
+MEMORY_SLACK_BYTES = 64 * 1024
+
+# Absolute slack per call, on top of the relative tolerance: sub-millisecond
+# cases jitter by a few microseconds (allocator, cache and timer effects)
+TIME_SLACK_SECONDS = 5e-6
+
+# Each timing sample runs a case in a loop for at least this long, so short
+# cases are averaged over many calls instead of timed from a handful
+MIN_BATCH_SECONDS = 0.1
+
+# Times a flagged case is re-measured before it counts as a regression
+CONFIRMATION_ROUNDS = 4
+
+
+def _calibration_workload():
+    """Fixed mix of regex, string and interpreter work used to gauge machine speed"""
+    text = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 4000
+    total = 0
+    for word in text.split():
+        total += len(word.strip(".,").lower())
+    return total + len(re.findall(r"[.!?] ", text)) + len(text.replace("a", "b"))
+
+
+def calibrate(repeat: int) -> float:
+    """Best time of the calibration workload; results are compared relative to it"""
+    best = float("inf")
+    for _ in range(max(repeat, 20)):
+        started = time.perf_counter()
+        _calibration_workload()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def _quiet(func, text):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return func(text)
+
+
+def _run_batch(func, text: str, batch: int) -> float:
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(batch):
+            func(text)
+    return time.perf_counter() - started
+
+
+def _measure_time(func, text: str, repeat: int, min_batch_seconds: float = MIN_BATCH_SECONDS) -> float:
+    """Best per-call time over `repeat` samples, each a batch of calls lasting at least min_batch_seconds"""
+    _quiet(func, text)  # warm-up (regex compilation, caches)
+
+    # Size the batch from warm calls, growing it until it lasts long enough
+    batch = 1
+    elapsed = _run_batch(func, text, batch)
+    while elapsed < min_batch_seconds:
+        batch = max(batch * 2, int(batch * min_batch_seconds / max(elapsed, 1e-7) * 1.1))
+        elapsed = _run_batch(func, text, batch)
+
+    best = elapsed / batch
+    for _ in range(repeat - 1):
+        best = min(best, _run_batch(func, text, batch) / batch)
+    return best
+
+
+def _measure_peak_bytes(func, text: str) -> int:
+    """Peak memory allocated during one call (tracemalloc)"""
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        _quiet(func, text)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return max(0, peak - baseline)
+
+
+def build_cases(sizes, only=None):
+    """(case name, function, text) for every selected function, corpus and size"""
+    cases = []
+    for corpus_name, build in CORPORA.items():
+        for size in sizes:
+            text = build(size)
+            for function_name, func in FUNCTIONS.items():
+                if only and not any(pattern in function_name for pattern in only):
+                    continue
+                cases.append((f"{function_name}/{corpus_name}/{size}", func, text))
+    return cases
+
+
+def measure_case(func, text: str, repeat: int):
+    seconds = _measure_time(func, text, repeat)
+    text_bytes = len(text.encode("utf-8"))
+    return {
+        "seconds": seconds,
+        "mb_per_s": text_bytes / 1e6 / seconds,
+        "peak_bytes": _measure_peak_bytes(func, text),
+    }
+
+
+def run_suite(cases, repeat: int):
+    results = {}
+    for case, func, text in cases:
+        results[case] = result = measure_case(func, text, repeat)
+        print(
+            f"{case:<58} {result['seconds'] * 1000:9.3f} ms  {result['mb_per_s']:8.1f} MB/s  "
+            f"peak {result['peak_bytes'] / 1024:9.1f} KiB"
+        )
+    return results
+
+
+def compare(results, baseline, speed_ratio: float, time_tolerance: float, memory_tolerance: float):
+    """
+    Return a list of human-readable regressions against `baseline`. Baseline
+    times are scaled by `speed_ratio` (current / baseline calibration time) so
+    a uniformly slower or busier machine is not reported as a regression.
+    """
+    regressions = {}
+    for case, current in results.items():
+        reference = baseline.get(case)
+        if reference is None:
+            continue
+        expected = reference["seconds"] * speed_ratio
+        if current["seconds"] > expected * (1 + time_tolerance) + TIME_SLACK_SECONDS:
+            regressions[case] = (
+                f"{case}: {current['seconds'] * 1000:.3f} ms vs expected {expected * 1000:.3f} ms "
+                f"({current['seconds'] / expected:.2f}x)"
+            )
+        memory_limit = reference["peak_bytes"] * (1 + memory_tolerance) + MEMORY_SLACK_BYTES
+        if current["peak_bytes"] > memory_limit:
+            regressions[case] = (
+                f"{case}: peak {current['peak_bytes'] / 1024:.1f} KiB vs baseline "
+                f"{reference['peak_bytes'] / 1024:.1f} KiB"
+            )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark text processing and check for regressions")
+    parser.add_argument("--sizes", default="1000,10000,100000,1000000", help="Comma-separated corpus sizes in characters")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed repetitions per case (best is reported)")
+    parser.add_argument("--only", action="append", help="Only run functions whose name contains this (repeatable)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline JSON file")
+    parser.add_argument("--update-baseline", action="store_true", help="Write the results as the new baseline")
+    parser.add_argument("--time-tolerance", type=float, default=0.5, help="Allowed slowdown as a fraction (after scaling for machine speed)")
+    parser.add_argument("--memory-tolerance", type=float, default=0.2, help="Allowed peak-memory growth as a fraction")
+    args = parser.parse_args()
+
+    for name, value in PINNED_CONFIG.items():
+        setattr(Config, name, value)
+
+    sizes = [int(s) for s in args.sizes.split(",")]
+    calibration_before = calibrate(args.repeat)
+    cases = build_cases(sizes, args.only)
+    results = run_suite(cases, args.repeat)
+    calibration = min(calibration_before, calibrate(args.repeat))
+    print(f"\n⏱️  Calibration workload: {calibration * 1000:.2f} ms")
+
+    if args.update_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, "r", encoding="utf-8") as f:
+                baseline = json.load(f).get("results", {})
+        baseline.update(results)
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({
+                "machine": {
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "processor": platform.processor() or platform.machine(),
+                },
+                "config": PINNED_CONFIG,
+                "calibration_seconds": calibration,
+                "results": dict(sorted(baseline.items())),
+            }, f, indent=2)
+            f.write("\n")
+        print(f"\n💾 Baseline written to {args.baseline} ({len(results)} cases updated)")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"\n⚠️ No baseline at {args.baseline}; run with --update-baseline to create one")
+        return
+
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    missing = [case for case in results if case not in baseline.get("results", {})]
+    if missing:
+        print(f"\n⚠️ {len(missing)} cases have no baseline entry")
+
+    speed_ratio = calibration / baseline["calibration_seconds"] if baseline.get("calibration_seconds") else 1.0
+    print(f"   Machine speed relative to baseline: {1 / speed_ratio:.2f}x")
+    regressions = compare(results, baseline.get("results", {}), speed_ratio,
+                          args.time_tolerance, args.memory_tolerance)
+
+    # Re-measure flagged cases so one noisy sample does not fail the run
+    for _ in range(CONFIRMATION_ROUNDS):
+        if not regressions:
+            break
+        print(f"\n🔁 Re-measuring {len(regressions)} flagged cases...")
+        for case, func, text in cases:
+            if case in regressions:
+                retry = measure_case(func, text, args.repeat * 2)
+                results[case]["seconds"] = min(results[case]["seconds"], retry["seconds"])
+                results[case]["peak_bytes"] = min(results[case]["peak_bytes"], retry["peak_bytes"])
+        regressions = compare({case: results[case] for case in regressions}, baseline.get("results", {}),
+                              speed_ratio, args.time_tolerance, args.memory_tolerance)
+
+    if regressions:
+        print(f"\n❌ {len(regressions)} regressions against {args.baseline}:")
+        for regression in regressions.values():
+            print(f"   {regression}")
+        sys.exit(1)
+    print(f"\n✅ No regressions against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -20,11 +20,16 @@ def main():
     try:
         # Local imports to catch errors during specific module initialization
         print("🔍 Loading application modules...")
-        import uvicorn
-        from app.main import app
+        from app.core.startup_profile import get_startup_profiler
+        profiler = get_startup_profiler()
+        with profiler.phase("startup.import_uvicorn"):
+            import uvicorn
+        with profiler.phase("startup.import_app"):
+            from app.main import app
         from app.config import Config
         
-        Config.validate()
+        with profiler.phase("startup.config_validate"):
+            Config.validate()
         
         # User-friendly host message
         display_host = "localhost" if Config.HOST == "0.0.0.0" else Config.HOST
@@ -33,6 +38,12 @@ def main():
         print(f"📚 API documentation available at http://{display_host}:{Config.PORT}/docs")
         print(f"🔗 Health check available at http://{display_host}:{Config.PORT}/")
         
+        if Config.WORKERS > 1:
+            # Load weights once, then fork workers that share them copy-on-write
+            from app.core.prefork import serve_preforked
+            serve_preforked(app, Config.WORKERS)
+            return
+        
         # Simplified uvicorn call - use defaults for stability
         uvicorn.run(
             "app.main:app",
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Tests for the chunk-level inference scheduler
+
+One model-call slot is held while requests queue behind it, so the order in
+which they are granted the slot afterwards is fully determined by the
+scheduler. Time is driven by a fake clock for the aging tests.
+"""
+
+import asyncio
+import os
+import sys
+import types
+
+# Add app to path
+sys.path.append(os.getcwd())
+
+from app.core import inference_scheduler
+from app.core.inference_scheduler import BUFFERED, LONG_TEXT, STREAMING, InferenceScheduler
+
+
+class Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def monotonic(self):
+        return self.now
+
+
+def _scheduler(monkeypatch, aging_seconds=0.0):
+    clock = Clock()
+    monkeypatch.setattr(inference_scheduler, "time", types.SimpleNamespace(monotonic=clock.monotonic))
+    return InferenceScheduler(1, aging_seconds), clock
+
+
+async def _run_after_holder(scheduler, requests):
+    """
+    Queue `requests` (name, class, flow, cost) behind a held slot, release it,
+    and return the names in the order they were granted the slot.
+    """
+    order = []
+    await scheduler._acquire(BUFFERED, "holder", 1.0, 1.0)
+
+    async def request(name, priority_class, flow, cost):
+        async with scheduler.slot(priority_class, flow, cost):
+            order.append(name)
+
+    tasks = []
+    for name, priority_class, flow, cost in requests:
+        tasks.append(asyncio.ensure_future(request(name, priority_class, flow, cost)))
+        # Let it reach the queue, so queueing order is the listed order
+        await asyncio.sleep(0)
+    scheduler._release(BUFFERED)
+    await asyncio.gather(*tasks)
+    return order
+
+
+def test_streaming_chunk_goes_before_queued_long_text_units(monkeypatch):
+    scheduler, _ = _scheduler(monkeypatch)
+    order = asyncio.run(_run_after_holder(scheduler, [
+        ("unit-1", LONG_TEXT, "job", 100),
+        ("unit-2", LONG_TEXT, "job", 100),
+        ("speech", BUFFERED, "request-1", 100),
+        ("stream", STREAMING, "request-2", 100),
+    ]))
+    assert order == ["stream", "speech", "unit-1", "unit-2"]
+
+
+def test_long_text_flows_take_turns(monkeypatch):
+    scheduler, _ = _scheduler(monkeypatch)
+    requests = [(f"a{i}", LONG_TEXT, "job-a", 100) for i in range(1, 5)]
+    requests += [(f"b{i}", LONG_TEXT, "job-b", 100) for i in range(1, 3)]
+    order = asyncio.run(_run_after_holder(scheduler, requests))
+    # Job b arrived behind all of job a's units but does not wait for them
+    assert order == ["a1", "b1", "a2", "b2", "a3", "a4"]
+
+
+def test_fair_share_is_weighted_by_characters(monkeypatch):
+    scheduler, _ = _scheduler(monkeypatch)
+    requests = [(f"long{i}", LONG_TEXT, "job-long", 300) for i in range(1, 3)]
+    requests += [(f"short{i}", LONG_TEXT, "job-short", 100) for i in range(1, 5)]
+    order = asyncio.run(_run_after_holder(scheduler, requests))
+    # Three short units for every long one (ties go to the earlier arrival)
+    assert order == ["long1", "short1", "short2", "short3", "long2", "short4"]
+
+
+def test_long_text_unit_is_promoted_after_waiting(monkeypatch):
+    scheduler, clock = _scheduler(monkeypatch, aging_seconds=10.0)
+
+    async def scenario():
+        order = []
+        await scheduler._acquire(BUFFERED, "holder", 1.0, 1.0)
+
+        async def request(name, priority_class):
+            async with scheduler.slot(priority_class, name, 100):
+                order.append(name)
+
+        unit = asyncio.ensure_future(request("aged-unit", LONG_TEXT))
+        await asyncio.sleep(0)
+        # One class more urgent per 10s waited: ahead of streaming after 30s
+        clock.now += 31
+        stream = asyncio.ensure_future(request("stream", STREAMING))
+        await asyncio.sleep(0)
+        scheduler._release(BUFFERED)
+        await asyncio.gather(unit, stream)
+        return order
+
+    assert asyncio.run(scenario()) == ["aged-unit", "stream"]
+    assert scheduler.stats()["classes"][LONG_TEXT]["promoted_by_aging"] == 1
+
+
+def test_partly_aged_unit_does_not_overtake_its_new_class(monkeypatch):
+    scheduler, clock = _scheduler(monkeypatch, aging_seconds=10.0)
+
+    async def scenario():
+        order = []
+        await scheduler._acquire(BUFFERED, "holder", 1.0, 1.0)
+
+        async def request(name, priority_class):
+            async with scheduler.slot(priority_class, name, 100):
+                order.append(name)
+
+        unit = asyncio.ensure_future(request("unit", LONG_TEXT))
+        await asyncio.sleep(0)
+        clock.now += 15
+        speech = asyncio.ensure_future(request("speech", BUFFERED))
+        await asyncio.sleep(0)
+        scheduler._release(BUFFERED)
+        await asyncio.gather(unit, speech)
+        return order
+
+    # Aged up to the buffered class, where a native buffered request wins the tie
+    assert asyncio.run(scenario()) == ["speech", "unit"]
+
+
+def test_cancelled_waiter_does_not_hold_a_slot(monkeypatch):
+    scheduler, _ = _scheduler(monkeypatch)
+
+    async def scenario():
+        await scheduler._acquire(BUFFERED, "holder", 1.0, 1.0)
+        waiter = asyncio.ensure_future(scheduler._acquire(LONG_TEXT, "job", 100, 1.0))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        assert scheduler.stats()["classes"][LONG_TEXT]["queued"] == 0
+        scheduler._release(BUFFERED)
+
+        # The slot is free for the next request
+        async with scheduler.slot(STREAMING, "request", 100):
+            assert scheduler.stats()["running"] == 1
+        return scheduler.stats()
+
+    stats = asyncio.run(scenario())
+    assert stats["running"] == 0
+    assert all(c["running"] == 0 and c["queued"] == 0 for c in stats["classes"].values())
+
+
+def test_waiter_cancelled_as_it_is_granted_hands_the_slot_on(monkeypatch):
+    scheduler, _ = _scheduler(monkeypatch)
+
+    async def scenario():
+        await scheduler._acquire(BUFFERED, "holder", 1.0, 1.0)
+        cancelled = asyncio.ensure_future(scheduler._acquire(LONG_TEXT, "job-a", 100, 1.0))
+        await asyncio.sleep(0)
+        granted = asyncio.ensure_future(scheduler._acquire(LONG_TEXT, "job-b", 100, 1.0))
+        await asyncio.sleep(0)
+
+        # The slot goes to the first waiter, which is cancelled before it resumes
+        scheduler._release(BUFFERED)
+        assert scheduler.stats()["classes"][LONG_TEXT]["running"] == 1
+        cancelled.cancel()
+        await asyncio.gather(cancelled, return_exceptions=True)
+
+        await asyncio.wait_for(granted, 1.0)
+        stats = scheduler.stats()
+        scheduler._release(LONG_TEXT)
+        return stats, scheduler.stats()
+
+    while_running, after = asyncio.run(scenario())
+    assert while_running["running"] == 1 and while_running["classes"][LONG_TEXT]["queued"] == 0
+    assert after["running"] == 0
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Tests for pausing and cancelling a job that a worker is processing
+
+Two job managers share one data directory, as two worker processes do; the
+first holds the job live in memory, the second receives the pause/cancel.
+The last test drives the worker's processor through a pause and resume.
+"""
+
+import asyncio
+import os
+import sys
+
+# Add app to path
+sys.path.append(os.getcwd())
+
+from app.config import Config
+from app.core import background_tasks
+from app.core.long_text_jobs import LongTextJobManager
+from app.models.long_text import LongTextChunk, LongTextJobMetadata, LongTextJobStatus
+
+JOB_ID = "job-1"
+
+
+def _managers(monkeypatch, tmp_path):
+    monkeypatch.setattr(Config, "LONG_TEXT_DATA_DIR", str(tmp_path))
+    monkeypatch.setattr(Config, "LONG_TEXT_INDEX_PATH", "")
+    monkeypatch.setattr(Config, "LONG_TEXT_QUEUE_PATH", "")
+    worker = LongTextJobManager()
+    other = LongTextJobManager()
+
+    worker._create_job_directories(JOB_ID)
+    worker._save_job_metadata(LongTextJobMetadata(job_id=JOB_ID, text_length=20, text_hash="hash", total_chunks=2))
+    worker._save_chunks_data(JOB_ID, [
+        LongTextChunk(index=i, text=f"Kalimat {i}.", text_preview=f"Kalimat {i}.", character_count=10) for i in range(2)
+    ])
+    worker.enqueue_job(JOB_ID)
+
+    # The worker starts processing the job, holding its state in memory
+    live = worker.open_live_job(JOB_ID)
+    live.metadata.status = LongTextJobStatus.PROCESSING
+    worker._save_job_metadata(live.metadata)
+    return worker, other, live
+
+
+def _stored_status(manager):
+    return manager._read_metadata_file(JOB_ID).status
+
+
+def test_pause_from_another_worker_is_not_overwritten(monkeypatch, tmp_path):
+    worker, other, live = _managers(monkeypatch, tmp_path)
+    assert other.pause_job(JOB_ID)
+    assert JOB_ID not in other.queue.job_ids()
+
+    # The worker writes its progress after finishing a unit
+    live.chunks[0].audio_file = "chunk_000.wav"
+    live.metadata.completed_chunks = 1
+    worker.mark_job_dirty(JOB_ID, chunks=True)
+
+    assert _stored_status(other) == LongTextJobStatus.PAUSED
+    assert live.metadata.status == LongTextJobStatus.PAUSED
+    assert live.stop_requested.is_set()
+    # Progress is still written, so resuming continues after the finished unit
+    assert other._read_metadata_file(JOB_ID).completed_chunks == 1
+    assert other._load_chunks_data(JOB_ID)[0].audio_file == "chunk_000.wav"
+
+    worker.close_live_job(live)
+    assert _stored_status(other) == LongTextJobStatus.PAUSED
+    assert other.resume_job(JOB_ID)
+
+
+def test_cancel_from_another_worker_survives_closing_the_live_job(monkeypatch, tmp_path):
+    worker, other, live = _managers(monkeypatch, tmp_path)
+    assert other.cancel_job(JOB_ID)
+
+    live.metadata.current_chunk = 1
+    live.version += 1
+    worker.close_live_job(live)
+
+    assert _stored_status(other) == LongTextJobStatus.CANCELLED
+    assert live.stop_requested.is_set()
+
+
+def test_job_finished_elsewhere_keeps_its_metadata(monkeypatch, tmp_path):
+    worker, other, live = _managers(monkeypatch, tmp_path)
+    finished = other._read_metadata_file(JOB_ID)
+    finished.status = LongTextJobStatus.COMPLETED
+    finished.output_path = "output/final.mp3"
+    other._save_job_metadata(finished)
+
+    live.metadata.completed_chunks = 1
+    worker.mark_job_dirty(JOB_ID)
+
+    stored = other._read_metadata_file(JOB_ID)
+    assert stored.status == LongTextJobStatus.COMPLETED
+    assert stored.output_path == "output/final.mp3"
+
+
+def test_own_status_changes_are_written(monkeypatch, tmp_path):
+    worker, _, live = _managers(monkeypatch, tmp_path)
+    assert worker.pause_job(JOB_ID)
+    assert _stored_status(worker) == LongTextJobStatus.PAUSED
+
+    # Resumed in the same process before the paused run let go of the job
+    assert worker.resume_job(JOB_ID)
+    worker.close_live_job(live)
+    assert _stored_status(worker) == LongTextJobStatus.PENDING
+
+
+def test_job_taken_over_after_a_lost_lease_is_not_written(monkeypatch, tmp_path):
+    worker, other, live = _managers(monkeypatch, tmp_path)
+    # Our lease expired and the job was requeued after a pause and resume elsewhere
+    assert other.pause_job(JOB_ID)
+    assert other.resume_job(JOB_ID)
+
+    live.metadata.completed_chunks = 1
+    live.version += 1
+    worker.discard_live_job(live)
+
+    assert _stored_status(other) == LongTextJobStatus.PENDING
+    assert worker._load_job_metadata(JOB_ID).status == LongTextJobStatus.PENDING
+    assert worker._load_job_metadata(JOB_ID).completed_chunks == 0
+
+
+def test_job_resumed_while_its_paused_run_is_stopping_runs_again(monkeypatch, tmp_path):
+    worker, _, live = _managers(monkeypatch, tmp_path)
+    worker.close_live_job(live)
+    monkeypatch.setattr(background_tasks, "get_job_manager", lambda: worker)
+    monkeypatch.setattr(Config, "LONG_TEXT_QUEUE_POLL_SECONDS", 0.01)
+    processor = background_tasks.LongTextProcessor()
+    runs = []
+
+    async def scenario():
+        unit_finished = asyncio.Event()
+        second_run_done = asyncio.Event()
+
+        async def process_job(job_id):
+            run = worker.open_live_job(job_id)
+            runs.append(run.metadata.status)
+            if len(runs) == 1:
+                run.metadata.status = LongTextJobStatus.PROCESSING
+                worker._save_job_metadata(run.metadata)
+                # The pause only takes effect once the unit being generated finishes
+                await unit_finished.wait()
+                assert run.stop_requested.is_set()
+            else:
+                second_run_done.set()
+            worker.close_live_job(run)
+
+        processor._process_job = process_job
+        processor.is_running = True
+        worker.queue_changed = asyncio.Event()
+        worker_loop = asyncio.ensure_future(processor._worker_loop())
+        while not runs:
+            await asyncio.sleep(0.01)
+
+        assert worker.pause_job(JOB_ID)
+        assert worker.resume_job(JOB_ID)
+        # Leased again by this worker while the paused run is still going
+        while JOB_ID not in processor._reruns:
+            await asyncio.sleep(0.01)
+
+        unit_finished.set()
+        await asyncio.wait_for(second_run_done.wait(), 2.0)
+        while processor.active_tasks:
+            await asyncio.sleep(0.01)
+        processor.is_running = False
+        worker_loop.cancel()
+        await asyncio.gather(worker_loop, return_exceptions=True)
+
+    asyncio.run(scenario())
+    assert runs == [LongTextJobStatus.PROCESSING, LongTextJobStatus.PENDING]
+    assert worker.queue.job_ids() == []
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Tests for reusing the audio of identical long-text jobs
+
+Jobs are created in a temporary data directory with a stand-in voice
+library; no audio is generated, a finished job's files are written directly.
+"""
+
+import os
+import sys
+
+# Add app to path
+sys.path.append(os.getcwd())
+
+from app.config import Config
+from app.core import long_text_jobs
+from app.core.long_text_jobs import LongTextJobManager
+from app.models.long_text import LongTextJobStatus
+
+TEXT = "Selamat pagi semuanya. Hari ini kita belajar tentang sejarah sepak bola Indonesia."
+
+
+class FakeVoiceLibrary:
+    def __init__(self, voices):
+        self.voices = voices
+
+    def get_voice_path(self, voice_name):
+        return self.voices.get(voice_name)
+
+    def get_voice_language(self, voice_name):
+        return "id"
+
+    def get_default_voice(self):
+        return None
+
+
+def _manager(monkeypatch, tmp_path):
+    voices_dir = tmp_path / "voices"
+    voices_dir.mkdir()
+    for name in ("ani", "budi", "ani-copy"):
+        (voices_dir / f"{name}.wav").write_bytes(b"RIFF" + name.split("-")[0].encode() * 100)
+    library = FakeVoiceLibrary({name: str(voices_dir / f"{name}.wav") for name in ("ani", "budi", "ani-copy")})
+    monkeypatch.setattr(long_text_jobs, "get_voice_library", lambda: library)
+    monkeypatch.setattr(Config, "LONG_TEXT_DATA_DIR", str(tmp_path / "jobs"))
+    monkeypatch.setattr(Config, "LONG_TEXT_INDEX_PATH", "")
+    monkeypatch.setattr(Config, "LONG_TEXT_QUEUE_PATH", "")
+    return LongTextJobManager()
+
+
+def _finish(manager, job_id):
+    """Write audio for every unit and a final file, then complete the job as the processor would"""
+    paths = manager._get_job_file_paths(job_id)
+    units = manager._load_chunks_data(job_id)
+    for unit in units:
+        unit.audio_file = f"chunk_{unit.index + 1:03d}.wav"
+        (paths['chunks_dir'] / unit.audio_file).write_bytes(b"unit audio %d" % unit.index)
+    manager._save_chunks_data(job_id, units)
+    (paths['output_dir'] / "final.mp3").write_bytes(b"final audio")
+    metadata = manager._load_job_metadata(job_id)
+    metadata.completed_chunks = len(units)
+    manager._save_job_metadata(metadata)
+    manager.complete_job(job_id, "output/final.mp3", output_size_bytes=11, output_duration_seconds=4.2)
+
+
+def _create(manager, voice="ani", **kwargs):
+    return manager.create_job(text=TEXT, voice=voice, output_format="mp3", **kwargs)
+
+
+def test_dedup_key_covers_voice_audio_settings_and_format(monkeypatch, tmp_path):
+    manager = _manager(monkeypatch, tmp_path)
+    text_hash = manager._generate_text_hash(TEXT)
+
+    def key(voice="ani", output_format="mp3", **parameters):
+        return manager.job_dedup_key(text_hash, voice, output_format, parameters)
+
+    # Voices are compared by their audio, and unset settings by their defaults
+    assert key() == key(voice="ani-copy")
+    assert key() == key(temperature=Config.TEMPERATURE, exaggeration=None)
+    assert key() != key(voice="budi")
+    assert key() != key(output_format="wav")
+    assert key() != key(temperature=Config.TEMPERATURE + 0.1)
+    assert key() != manager.job_dedup_key(manager._generate_text_hash(TEXT + " Lagi."), "ani", "mp3", {})
+
+
+def test_find_duplicate_prefers_a_completed_job_with_its_audio(monkeypatch, tmp_path):
+    manager = _manager(monkeypatch, tmp_path)
+    first, _, _ = _create(manager, deduplicate=False)
+    second, _, _ = _create(manager, deduplicate=False)
+    dedup_key = manager._load_job_metadata(first).dedup_key
+
+    # Only unfinished jobs: the oldest one
+    assert manager.find_duplicate_job(dedup_key).job_id == first
+
+    _finish(manager, second)
+    assert manager.find_duplicate_job(dedup_key).job_id == second
+
+    # A completed job whose audio is gone cannot be reused
+    (manager._get_job_directory(second) / "output" / "final.mp3").unlink()
+    assert manager.find_duplicate_job(dedup_key).job_id == first
+    assert manager.find_duplicate_job("no-such-key") is None
+
+
+def test_identical_completed_job_is_reused_through_hardlinks(monkeypatch, tmp_path):
+    manager = _manager(monkeypatch, tmp_path)
+    source_id, chunks, _ = _create(manager)
+    _finish(manager, source_id)
+
+    job_id, reused_chunks, deduplicated_from = _create(manager, session_id="session-2")
+    assert job_id != source_id
+    assert (reused_chunks, deduplicated_from) == (chunks, source_id)
+
+    metadata = manager._load_job_metadata(job_id)
+    source = manager._load_job_metadata(source_id)
+    assert metadata.status == LongTextJobStatus.COMPLETED
+    assert metadata.deduplicated_from == source_id
+    assert metadata.user_session_id == "session-2"
+    assert (metadata.output_path, metadata.output_duration_seconds, metadata.total_chunks, metadata.completed_chunks) == \
+        (source.output_path, source.output_duration_seconds, source.total_chunks, source.completed_chunks)
+
+    source_dir, job_dir = manager._get_job_directory(source_id), manager._get_job_directory(job_id)
+    assert os.path.samefile(source_dir / "output" / "final.mp3", job_dir / "output" / "final.mp3")
+    units = manager._load_chunks_data(job_id)
+    assert units and all(os.path.samefile(source_dir / "chunks" / u.audio_file, job_dir / "chunks" / u.audio_file)
+                         for u in units)
+    assert manager._load_input_text(job_id) == TEXT
+
+
+def test_follower_of_a_job_in_progress_completes_with_its_audio(monkeypatch, tmp_path):
+    manager = _manager(monkeypatch, tmp_path)
+    source_id, _, _ = _create(manager)
+    follower_id, _, deduplicated_from = _create(manager)
+
+    assert follower_id != source_id and deduplicated_from == source_id
+    assert manager._load_job_metadata(follower_id).status == LongTextJobStatus.PENDING
+    # Only the source generates audio; the follower waits outside the queue
+    assert manager.queue.job_ids() == []
+    # A third submission follows the source too, not the follower
+    assert _create(manager)[2] == source_id
+
+    _finish(manager, source_id)
+    metadata = manager._load_job_metadata(follower_id)
+    assert metadata.status == LongTextJobStatus.COMPLETED
+    assert os.path.samefile(manager._get_job_directory(source_id) / "output" / "final.mp3",
+                            manager._get_job_directory(follower_id) / "output" / "final.mp3")
+
+
+def test_cancelling_a_follower_leaves_its_source_running(monkeypatch, tmp_path):
+    manager = _manager(monkeypatch, tmp_path)
+    source_id, _, _ = _create(manager)
+    follower_id, _, _ = _create(manager)
+
+    assert manager.cancel_job(follower_id)
+    assert manager._load_job_metadata(source_id).status == LongTextJobStatus.PENDING
+    _finish(manager, source_id)
+    assert manager._load_job_metadata(follower_id).status == LongTextJobStatus.CANCELLED
+
+
+def test_cancelled_source_hands_generation_to_its_oldest_follower(monkeypatch, tmp_path):
+    manager = _manager(monkeypatch, tmp_path)
+    source_id, _, _ = _create(manager)
+    first_id, _, _ = _create(manager)
+    second_id, _, _ = _create(manager)
+
+    assert manager.cancel_job(source_id)
+    first = manager._load_job_metadata(first_id)
+    second = manager._load_job_metadata(second_id)
+    assert first.deduplicated_from is None and manager._load_chunks_data(first_id)
+    assert manager.queue.job_ids() == [first_id]
+    assert second.deduplicated_from == first_id
+
+    _finish(manager, first_id)
+    assert manager._load_job_metadata(second_id).status == LongTextJobStatus.COMPLETED
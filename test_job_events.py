@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Tests for the job event bus shared by worker processes
+
+Two buses on one event log stand in for two worker processes: events
+published by either reach the subscribers of both, in the same order and
+with the same ids.
+"""
+
+import asyncio
+import os
+import sys
+
+# Add app to path
+sys.path.append(os.getcwd())
+
+from app.config import Config
+from app.core import job_events
+from app.core.job_events import CHUNK_COMPLETED, STATUS_CHANGE, JobEventBus
+
+
+def _buses(monkeypatch, tmp_path, history_size=1000):
+    monkeypatch.setattr(Config, "LONG_TEXT_EVENT_POLL_SECONDS", 0.05)
+    path = tmp_path / "events.db"
+    return JobEventBus(history_size, path), JobEventBus(history_size, path)
+
+
+async def _next_events(subscription, timeout=2.0):
+    return await asyncio.wait_for(subscription.get(), timeout)
+
+
+def test_events_published_by_another_worker_are_delivered(monkeypatch, tmp_path):
+    worker_a, worker_b = _buses(monkeypatch, tmp_path)
+
+    async def scenario():
+        subscription = worker_b.subscribe({"job-1"})
+        worker_a.publish("job-2", STATUS_CHANGE, {"status": "processing"})
+        published = worker_a.publish("job-1", CHUNK_COMPLETED, {"chunk": 0, "success": True})
+        events = await _next_events(subscription)
+        assert [(e.id, e.job_id, e.event_type, e.data) for e in events] == [
+            (published.id, "job-1", CHUNK_COMPLETED, {"chunk": 0, "success": True})
+        ]
+        worker_b.unsubscribe(subscription)
+
+    asyncio.run(scenario())
+
+
+def test_ids_follow_one_sequence_across_workers(monkeypatch, tmp_path):
+    worker_a, worker_b = _buses(monkeypatch, tmp_path)
+
+    async def scenario():
+        on_a = worker_a.subscribe()
+        on_b = worker_b.subscribe()
+        worker_a.publish("job-1", STATUS_CHANGE, {"status": "processing"})
+        worker_b.publish("job-2", STATUS_CHANGE, {"status": "processing"})
+        worker_a.publish("job-1", STATUS_CHANGE, {"status": "completed"})
+        received = {}
+        for name, subscription in (("a", on_a), ("b", on_b)):
+            events = []
+            while len(events) < 3:
+                events.extend(await _next_events(subscription))
+            received[name] = [(e.id, e.job_id, e.data["status"]) for e in events]
+        assert received["a"] == received["b"]
+        assert [event_id for event_id, _, _ in received["a"]] == [1, 2, 3]
+
+    asyncio.run(scenario())
+
+
+def test_last_event_id_from_one_worker_resumes_on_another(monkeypatch, tmp_path):
+    worker_a, worker_b = _buses(monkeypatch, tmp_path)
+
+    async def scenario():
+        on_a = worker_a.subscribe({"job-1"})
+        first = worker_a.publish("job-1", STATUS_CHANGE, {"status": "processing"})
+        await _next_events(on_a)
+        missed = [worker_a.publish("job-1", CHUNK_COMPLETED, {"chunk": i, "success": True}) for i in range(3)]
+
+        # The client reconnects to worker B with the id worker A sent it
+        on_b = worker_b.subscribe({"job-1"})
+        replayed = worker_b.replay(first.id, on_b.job_ids)
+        assert [e.id for e in replayed] == [e.id for e in missed]
+        # An id that was never issued cannot be resumed from
+        assert worker_b.replay(missed[-1].id + 10) is None
+
+    asyncio.run(scenario())
+
+
+def test_trimmed_history_cannot_be_replayed(monkeypatch, tmp_path):
+    monkeypatch.setattr(job_events, "TRIM_EVERY_EVENTS", 5)
+    worker_a, worker_b = _buses(monkeypatch, tmp_path, history_size=5)
+
+    async def scenario():
+        for i in range(10):
+            worker_a.publish("job-1", CHUNK_COMPLETED, {"chunk": i, "success": True})
+        worker_b.subscribe()
+        assert worker_b.replay(1) is None
+        assert [e.data["chunk"] for e in worker_b.replay(5)] == [5, 6, 7, 8, 9]
+
+    asyncio.run(scenario())
+
+
+def test_lagging_subscriber_catches_up_from_the_log(monkeypatch, tmp_path):
+    monkeypatch.setattr(job_events, "SUBSCRIBER_QUEUE_SIZE", 2)
+    worker_a, worker_b = _buses(monkeypatch, tmp_path)
+
+    async def scenario():
+        subscription = worker_b.subscribe({"job-1"})
+        for i in range(6):
+            worker_a.publish("job-1", CHUNK_COMPLETED, {"chunk": i, "success": True})
+        await asyncio.sleep(0.3)
+        events = await _next_events(subscription)
+        assert [e.data["chunk"] for e in events] == list(range(6))
+
+    asyncio.run(scenario())
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Tests for the SQLite index of long-text job metadata
+
+Search must keep the substring, case-insensitive matching of the old scan of
+the job directories, with or without SQLite's FTS5 trigram tokenizer.
+"""
+
+import os
+import sqlite3
+import sys
+from datetime import datetime
+
+# Add app to path
+sys.path.append(os.getcwd())
+
+from app.core.job_index import JobIndex
+from app.models.long_text import LongTextJobMetadata, LongTextJobStatus
+
+COMPLETED = LongTextJobStatus.COMPLETED
+FAILED = LongTextJobStatus.FAILED
+PENDING = LongTextJobStatus.PENDING
+
+
+class LikeOnlyIndex(JobIndex):
+    """An index on a SQLite built without the FTS5 trigram tokenizer"""
+
+    def _create_text_table(self):
+        self._conn.execute("CREATE TABLE IF NOT EXISTS jobs_text (rowid INTEGER PRIMARY KEY, input_text TEXT)")
+        return False
+
+
+def _metadata(job_id, status=COMPLETED, created=(2024, 1, 1), completed=None, **fields):
+    return LongTextJobMetadata(
+        job_id=job_id, status=status, text_length=100, text_hash="hash", total_chunks=1,
+        created_at=datetime(*created), completion_timestamp=datetime(*completed) if completed else None, **fields
+    )
+
+
+def _add(index, metadata, text, storage_bytes=0):
+    index.upsert(metadata, storage_bytes)
+    index.set_text(metadata.job_id, text)
+
+
+def _indexes(tmp_path):
+    """A populated trigram index and a LIKE-only one with the same jobs"""
+    indexes = []
+    for name, index_class in (("fts.db", JobIndex), ("like.db", LikeOnlyIndex)):
+        index = index_class(tmp_path / name)
+        _add(index, _metadata("job-1", voice="ani", display_name="Bab Satu"), "Sejarah Sepak Bola Indonesia dimulai")
+        _add(index, _metadata("job-2", voice="budi"), "Resep nasi goreng 100% pedas_manis")
+        _add(index, _metadata("job-3", status=FAILED, voice="ani"), "Cuaca hari ini cerah")
+        indexes.append(index)
+    assert indexes[0].trigram and not indexes[1].trigram
+    return indexes
+
+
+def _search(index, text, **filters):
+    return index.job_ids(search_text=text, **filters)
+
+
+def test_search_matches_substrings_ignoring_case(tmp_path):
+    for index in _indexes(tmp_path):
+        assert _search(index, "sepak bola") == ["job-1"]
+        assert _search(index, "EPA") == ["job-1"]
+        # Shorter than a trigram
+        assert _search(index, "go") == ["job-2"]
+        assert _search(index, "ri") == ["job-3"]
+        # The display name is searched as well as the text
+        assert _search(index, "bab sat") == ["job-1"]
+        assert _search(index, "tidak ada") == []
+
+
+def test_search_treats_wildcards_and_quotes_literally(tmp_path):
+    for index in _indexes(tmp_path):
+        assert _search(index, "100%") == ["job-2"]
+        assert _search(index, "%") == ["job-2"]
+        assert _search(index, "s_m") == ["job-2"]
+        assert _search(index, "_") == ["job-2"]
+        assert _search(index, 'a"b') == []
+        assert _search(index, "cerah OR Resep") == []
+
+
+def test_search_follows_updated_and_deleted_jobs(tmp_path):
+    for index in _indexes(tmp_path):
+        index.set_text("job-3", "Laporan cuaca besok hujan")
+        assert _search(index, "cerah") == []
+        assert _search(index, "hujan") == ["job-3"]
+        index.delete("job-1")
+        assert _search(index, "sepak") == []
+        assert index.job_ids() == ["job-2", "job-3"]
+
+
+def test_filters_combine_with_search(tmp_path):
+    index = JobIndex(tmp_path / "index.db")
+    _add(index, _metadata("old", created=(2024, 1, 1), completed=(2024, 1, 2)), "berita pagi")
+    _add(index, _metadata("new", created=(2024, 3, 1), completed=(2024, 3, 5)), "berita sore")
+    _add(index, _metadata("archived", created=(2024, 3, 2), completed=(2024, 3, 3), is_archived=True), "berita malam")
+    _add(index, _metadata("failed", status=FAILED, created=(2024, 3, 4)), "berita siang")
+    _add(index, _metadata("pending", status=PENDING, created=(2024, 3, 6)), "catatan")
+
+    assert index.job_ids(statuses=["completed"]) == ["old", "archived", "new"]
+    assert index.job_ids(statuses=["completed"], is_archived=False) == ["old", "new"]
+    assert index.job_ids(statuses=[]) == []
+    # Dates filter on completion time, or creation time until a job completes
+    assert index.job_ids(start_date=datetime(2024, 3, 3), end_date=datetime(2024, 3, 5)) == ["archived", "failed", "new"]
+    assert index.job_ids(sort_date_before=datetime(2024, 3, 4)) == ["old", "archived"]
+    assert index.job_ids(search_text="berita", statuses=["completed", "failed"], is_archived=False,
+                         start_date=datetime(2024, 2, 1)) == ["failed", "new"]
+    assert index.count_by_status(search_text="berita") == {"completed": 3, "failed": 1}
+
+
+def test_list_sorts_and_paginates(tmp_path):
+    index = JobIndex(tmp_path / "index.db")
+    _add(index, _metadata("a", created=(2024, 1, 3), total_duration_seconds=30.0), "alpha " * 30)
+    _add(index, _metadata("b", created=(2024, 1, 1), display_name="zulu"), "bravo")
+    _add(index, _metadata("c", created=(2024, 1, 2), total_duration_seconds=10.0), "charlie")
+
+    def listed(sort_by, **kwargs):
+        return [row["job_id"] for row in index.list(sort_by=sort_by, **kwargs)]
+
+    assert listed("created_desc") == ["a", "c", "b"]
+    assert listed("created_asc", limit=2, offset=1) == ["c", "a"]
+    # A job without a duration sorts as zero; a display name replaces the text
+    assert listed("duration_desc") == ["a", "c", "b"]
+    assert listed("name_asc") == ["a", "c", "b"]
+    # Unknown sort orders fall back to newest first
+    assert listed("no-such-order") == ["a", "c", "b"]
+
+    row = index.list(search_text="alpha")[0]
+    assert row["text_preview"] == ("alpha " * 30)[:100] + "..."
+    assert LongTextJobMetadata.parse_raw(row["metadata"]).created_at == datetime(2024, 1, 3)
+
+
+def test_rebuild_replaces_every_row(tmp_path):
+    index = JobIndex(tmp_path / "index.db")
+    _add(index, _metadata("stale"), "sudah dihapus", storage_bytes=10)
+    count = index.rebuild([
+        (_metadata("job-1"), "teks pertama", 100),
+        (_metadata("job-2", status=FAILED), None, 50),
+    ])
+    assert count == 2
+    assert index.job_ids() == ["job-1", "job-2"]
+    assert index.job_ids(search_text="pertama") == ["job-1"]
+    assert index.job_ids(search_text="dihapus") == []
+    assert index.storage_by_status() == {"completed": (1, 100), "failed": (1, 50)}
+
+
+def test_index_from_an_older_version_gains_dedup_keys(tmp_path):
+    path = tmp_path / "index.db"
+    conn = sqlite3.connect(str(path))
+    conn.execute(
+        "CREATE TABLE jobs (id INTEGER PRIMARY KEY, job_id TEXT NOT NULL UNIQUE, status TEXT NOT NULL, "
+        "created_at TEXT NOT NULL, completed_at TEXT, sort_date TEXT NOT NULL, voice TEXT, "
+        "is_archived INTEGER NOT NULL DEFAULT 0, display_name TEXT, text_preview TEXT NOT NULL DEFAULT '', "
+        "total_duration_seconds REAL, audio_file_size INTEGER, "
+        "total_processing_time_ms INTEGER NOT NULL DEFAULT 0, storage_bytes INTEGER NOT NULL DEFAULT 0, "
+        "metadata TEXT NOT NULL)"
+    )
+    conn.execute("INSERT INTO jobs (job_id, status, created_at, sort_date, metadata) VALUES ('old', 'completed', "
+                 "'2024-01-01T00:00:00.000000', '2024-01-01T00:00:00.000000', '{}')")
+    conn.execute("PRAGMA user_version = 1")
+    conn.commit()
+    conn.close()
+
+    index = JobIndex(path)
+    assert not index.created
+    index.upsert(_metadata("new", created=(2024, 2, 1), dedup_key="key"))
+    assert index.job_ids(dedup_key="key") == ["new"]
+    assert index.job_ids() == ["old", "new"]
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Tests for the durable job queue: leases, renewal, takeover and restarts
+
+Two lease owners share one SQLite file, as two worker processes do. Time is
+driven by a fake clock so lease expiry is deterministic.
+"""
+
+import os
+import socket
+import subprocess
+import sys
+import types
+
+# Add app to path
+sys.path.append(os.getcwd())
+
+from app.core import job_queue
+from app.core.job_queue import DurableJobQueue, new_lease_owner
+
+# Owners on another host, so the queue cannot tell whether they are alive
+WORKER_A = "host-a:100:aaaa"
+WORKER_B = "host-b:200:bbbb"
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+
+def _queues(monkeypatch, tmp_path):
+    clock = Clock()
+    monkeypatch.setattr(job_queue, "time", types.SimpleNamespace(time=clock.time))
+    path = tmp_path / "queue.db"
+    return DurableJobQueue(path), DurableJobQueue(path), clock
+
+
+def test_jobs_are_leased_in_order_by_one_owner_each(monkeypatch, tmp_path):
+    queue_a, queue_b, _ = _queues(monkeypatch, tmp_path)
+    queue_a.enqueue(["job-1", "job-2"])
+    queue_b.enqueue(["job-3", "job-1"])
+
+    assert queue_a.job_ids() == ["job-1", "job-2", "job-3"]
+    assert queue_a.lease(WORKER_A, 30) == ("job-1", 1)
+    assert queue_b.lease(WORKER_B, 30) == ("job-2", 1)
+    assert queue_a.lease(WORKER_A, 30) == ("job-3", 1)
+    assert queue_b.lease(WORKER_B, 30) is None
+    assert queue_b.leased_job_ids() == {"job-1", "job-2", "job-3"}
+
+
+def test_positions_count_only_jobs_waiting_for_a_lease(monkeypatch, tmp_path):
+    queue_a, queue_b, _ = _queues(monkeypatch, tmp_path)
+    queue_a.enqueue(["job-1", "job-2", "job-3", "job-4"])
+    queue_b.lease(WORKER_B, 30)
+
+    assert queue_a.positions() == {"job-2": 1, "job-3": 2, "job-4": 3}
+    assert queue_a.stats() == {"queued": 3, "leased": 1}
+
+    queue_a.remove("job-3")
+    assert queue_a.positions() == {"job-2": 1, "job-4": 2}
+
+
+def test_renewed_lease_is_kept_and_expired_one_is_taken_over(monkeypatch, tmp_path):
+    queue_a, queue_b, clock = _queues(monkeypatch, tmp_path)
+    queue_a.enqueue(["job-1", "job-2"])
+    assert queue_a.lease(WORKER_A, 30) == ("job-1", 1)
+    assert queue_a.lease(WORKER_A, 30) == ("job-2", 1)
+
+    # Worker A keeps renewing job-1, but stops processing job-2
+    clock.now += 20
+    assert queue_a.renew(WORKER_A, 30) == {"job-1", "job-2"}
+    queue_a.remove("job-2", WORKER_A)
+    queue_a.enqueue(["job-2"])
+    clock.now += 20
+    assert queue_a.renew(WORKER_A, 30) == {"job-1"}
+
+    # Worker A stops renewing: job-1 goes to worker B once the lease runs out
+    clock.now += 29
+    assert queue_b.lease(WORKER_B, 30) == ("job-2", 1)
+    assert queue_b.lease(WORKER_B, 30) is None
+    clock.now += 2
+    assert queue_b.lease(WORKER_B, 30) == ("job-1", 2)
+
+    # Worker A finds it no longer holds the job and cannot take it off the queue
+    assert queue_a.renew(WORKER_A, 30) == set()
+    queue_a.remove("job-1", WORKER_A)
+    assert "job-1" in queue_b.job_ids()
+    queue_b.remove("job-1", WORKER_B)
+    assert queue_b.job_ids() == ["job-2"]
+
+
+def test_released_lease_keeps_its_place_and_attempt_count(monkeypatch, tmp_path):
+    queue_a, queue_b, _ = _queues(monkeypatch, tmp_path)
+    queue_a.enqueue(["job-1", "job-2"])
+    assert queue_a.lease(WORKER_A, 30) == ("job-1", 1)
+
+    # A graceful shutdown gives the lease back; another owner's release does nothing
+    queue_b.release("job-1", WORKER_B)
+    assert queue_b.positions() == {"job-2": 1}
+    queue_a.release("job-1", WORKER_A)
+    assert queue_b.positions() == {"job-1": 1, "job-2": 2}
+    assert queue_b.lease(WORKER_B, 30) == ("job-1", 1)
+
+
+def test_queue_survives_a_restart_and_dead_owners_lose_their_leases(tmp_path):
+    path = tmp_path / "queue.db"
+    queue = DurableJobQueue(path)
+    queue.enqueue(["job-1", "job-2", "job-3"])
+
+    # A worker on this host that has exited
+    finished = subprocess.Popen([sys.executable, "-c", "pass"])
+    finished.wait()
+    dead_owner = f"{socket.gethostname()}:{finished.pid}:dead"
+    assert queue.lease(dead_owner, 3600) == ("job-1", 1)
+    assert queue.lease(WORKER_B, 3600) == ("job-2", 1)
+    queue.close()
+
+    restarted = DurableJobQueue(path)
+    assert restarted.job_ids() == ["job-1", "job-2", "job-3"]
+    # Worker B is on another host, so only its lease expiry can release it
+    assert restarted.release_dead_leases() == ["job-1"]
+    assert restarted.lease(WORKER_A, 30) == ("job-1", 2)
+    assert restarted.positions() == {"job-3": 1}
+    assert restarted.leased_job_ids() == {"job-1", "job-2"}
+
+
+def test_previous_instance_in_this_process_counts_as_dead(tmp_path):
+    queue = DurableJobQueue(tmp_path / "queue.db")
+    queue.enqueue(["job-1"])
+    # Same host and PID as us, e.g. before a container restart reused the PID
+    assert queue.lease(new_lease_owner(), 3600) == ("job-1", 1)
+    assert queue.release_dead_leases() == ["job-1"]
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Tests for the model registry: LRU order, eviction and memory budget
+
+Model loading is replaced by a stub that returns a fake model of a given
+size, so no weights are downloaded.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+
+# Add app to path
+sys.path.append(os.getcwd())
+
+from app.config import Config
+from app.core import tts_model
+from app.core.tts_model import MODEL_VARIANTS, ModelRegistry
+
+MB = 1024 * 1024
+
+STANDARD = MODEL_VARIANTS["standard"]
+MULTILINGUAL = MODEL_VARIANTS["multilingual"]
+INDONESIAN = MODEL_VARIANTS["indonesian"]
+
+
+class FakeModel:
+    def __init__(self, name: str, size_bytes: int):
+        self.name = name
+        self.size_bytes = size_bytes
+
+
+class StubLoader:
+    """Stands in for _load_variant_sync; tracks how many models exist at once"""
+
+    def __init__(self, registry: ModelRegistry, sizes_mb, load_seconds: float = 0.0):
+        self.registry = registry
+        self.sizes_mb = sizes_mb
+        self.load_seconds = load_seconds
+        self.loading = 0
+        self.peak_models = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, variant, device):
+        with self._lock:
+            self.loading += 1
+            self.peak_models = max(self.peak_models, len(self.registry.resident_variants()) + self.loading)
+        try:
+            time.sleep(self.load_seconds)
+            return FakeModel(variant.name, self.sizes_mb[variant.name] * MB)
+        finally:
+            with self._lock:
+                self.loading -= 1
+
+
+def _setup(monkeypatch, sizes_mb, max_resident=0, budget_mb=0, load_seconds=0.0):
+    registry = ModelRegistry()
+    loader = StubLoader(registry, sizes_mb, load_seconds)
+    monkeypatch.setattr(tts_model, "_load_variant_sync", loader)
+    monkeypatch.setattr(tts_model, "_estimate_model_bytes", lambda model: model.size_bytes)
+    monkeypatch.setattr(Config, "MAX_RESIDENT_MODELS", max_resident)
+    monkeypatch.setattr(Config, "MODEL_MEMORY_BUDGET_MB", budget_mb)
+    return registry, loader
+
+
+def test_least_recently_used_is_evicted(monkeypatch):
+    registry, _ = _setup(monkeypatch, {"standard": 100, "multilingual": 100, "indonesian": 100}, max_resident=2)
+
+    async def scenario():
+        await registry.get_model(STANDARD)
+        await registry.get_model(MULTILINGUAL)
+        # Using standard again makes multilingual the least recently used
+        await registry.get_model(STANDARD)
+        await registry.get_model(INDONESIAN)
+
+    asyncio.run(scenario())
+    assert registry.resident_variants() == ["standard", "indonesian"]
+    assert [e["variant"] for e in registry.get_events() if e["event"] == "evict"] == ["multilingual"]
+
+
+def test_memory_budget_is_respected(monkeypatch):
+    registry, _ = _setup(monkeypatch, {"standard": 400, "multilingual": 700, "indonesian": 400}, budget_mb=1000)
+
+    async def scenario():
+        await registry.get_model(STANDARD)
+        await registry.get_model(INDONESIAN)
+        assert registry.get_memory_usage_mb() == 800
+        # First load of multilingual is estimated at the average size (400MB),
+        # then corrected to its real size, which needs a second eviction
+        await registry.get_model(MULTILINGUAL)
+
+    asyncio.run(scenario())
+    assert registry.resident_variants() == ["multilingual"]
+    assert registry.get_memory_usage_mb() <= 1000
+
+
+def test_known_size_makes_room_before_loading(monkeypatch):
+    registry, loader = _setup(monkeypatch, {"standard": 600, "multilingual": 600, "indonesian": 600}, budget_mb=1000)
+
+    async def scenario():
+        await registry.get_model(STANDARD)
+        await registry.get_model(MULTILINGUAL)
+        await registry.get_model(STANDARD)
+
+    asyncio.run(scenario())
+    # Sizes are known after the first load, so the resident is evicted before the next one loads
+    assert loader.peak_models == 1
+    assert registry.resident_variants() == ["standard"]
+
+
+def test_concurrent_loads_of_different_variants_stay_within_limits(monkeypatch):
+    registry, loader = _setup(monkeypatch, {"standard": 100, "multilingual": 100, "indonesian": 100},
+                              max_resident=1, load_seconds=0.05)
+
+    async def scenario():
+        await registry.get_model(STANDARD)
+        models = await asyncio.gather(registry.get_model(MULTILINGUAL), registry.get_model(INDONESIAN))
+        assert [model.name for model in models] == ["multilingual", "indonesian"]
+
+    asyncio.run(scenario())
+    # One model being loaded at a time, with room made for it first
+    assert loader.peak_models == 1
+    assert len(registry.resident_variants()) == 1
+
+
+def test_concurrent_requests_for_one_variant_load_it_once(monkeypatch):
+    registry, _ = _setup(monkeypatch, {"standard": 100, "multilingual": 100, "indonesian": 100}, load_seconds=0.05)
+
+    async def scenario():
+        return await asyncio.gather(*(registry.get_model(STANDARD) for _ in range(5)))
+
+    models = asyncio.run(scenario())
+    assert len({id(model) for model in models}) == 1
+    assert [e["event"] for e in registry.get_events()] == ["load"]
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Golden tests for normalize_text
+
+Checks the translation-table implementation against the expected outputs from
+test_normalization*.py and against the previous per-character implementation
+on a deterministic set of random strings mixing ASCII, replaced characters,
+combining marks, control characters and other Unicode.
+"""
+
+import os
+import random
+import sys
+import unicodedata
+
+# Add app to path
+sys.path.append(os.getcwd())
+
+from app.core.text_processing import NORMALIZATION_REPLACEMENTS, normalize_text
+
+GOLDEN_CASES = [
+    ("Indonesian text with “smart quotes” and – dashes.", 'Indonesian text with "smart quotes" and - dashes.'),
+    ("Ellipsis… and weird glottal stopʼ marks", "Ellipsis... and weird glottal stop' marks"),
+    ("Accents: éèêë áàâä íìîï", "Accents: eeee aaaa iiii"),
+    ("Control characters \x00\x01\x02 test", "Control characters  test"),
+    ("Mix: Peléʼs “quote”—test…", "Mix: Pele's \"quote\"-test..."),
+    ("", ""),
+    ("   padded  \n", "padded"),
+    ("Tab\tnew\nline\rkept", "Tab\tnew\nline\rkept"),
+    ("Zero\u200bwidth and BOM\ufeff removed", "Zerowidth and BOM removed"),
+    ("Decomposed e\u0301 is composed first", "Decomposed e is composed first"),
+    ("Lone surrogate \ud800 dropped", "Lone surrogate  dropped"),
+    ("«Bonjour» ‹ok› „quote” ‚", "\"Bonjour\" <ok> \"quote\" ,"),
+    ("Non-Latin 日本語 stays", "Non-Latin 日本語 stays"),
+]
+
+
+def legacy_normalize_text(text: str) -> str:
+    """normalize_text as implemented before the translation table (without logging)"""
+    if not text:
+        return ""
+    text = text.encode('utf-8', errors='ignore').decode('utf-8')
+    text = unicodedata.normalize('NFC', text)
+    for char, replacement in NORMALIZATION_REPLACEMENTS.items():
+        if char in text:
+            text = text.replace(char, replacement)
+    text = "".join(ch for ch in text if unicodedata.category(ch)[0] != "C" or ch in "\n\r\t")
+    return text.strip()
+
+
+def _random_strings(count: int, seed: int = 1234):
+    rng = random.Random(seed)
+    alphabet = (
+        list("abcdefghijklmnopqrstuvwxyz ABCDEFGHIJKLMNOPQRSTUVWXYZ .,!?'\"-\n\t\r0123456789")
+        + list(NORMALIZATION_REPLACEMENTS)
+        + ["\u0301", "\u0308", "\u200b", "\u200e", "\ufeff", "\x00", "\x07", "\x1b", "\x7f", "\x85",
+           "\ue000", "\u00a0", "\u2028", "ß", "ł", "ğ", "日", "é", "😀", "\ud800"]
+    )
+    for _ in range(count):
+        yield "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 80)))
+
+
+def test_golden_cases():
+    """normalize_text matches the expected outputs"""
+    for original, expected in GOLDEN_CASES:
+        result = normalize_text(original, log_stats=False)
+        assert result == expected, f"{original!r}: expected {expected!r}, got {result!r}"
+
+
+def test_matches_legacy_implementation():
+    """normalize_text matches the previous implementation on random input"""
+    for text in _random_strings(2000):
+        assert normalize_text(text, log_stats=False) == legacy_normalize_text(text), repr(text)
+
+
+def test_logging_does_not_change_output():
+    """Sampled statistics are purely informational"""
+    for original, expected in GOLDEN_CASES:
+        assert normalize_text(original, log_stats=True) == expected
+
+
+if __name__ == "__main__":
+    print("🔍 Starting golden normalization tests...")
+    success = True
+    for test in (test_golden_cases, test_matches_legacy_implementation, test_logging_does_not_change_output):
+        try:
+            test()
+            print(f"✅ PASS: {test.__name__}")
+        except AssertionError as e:
+            print(f"❌ FAIL: {test.__name__}: {e}")
+            success = False
+
+    if success:
+        print("\n✨ All golden normalization tests passed!")
+    else:
+        print("\n⚠️ Some golden normalization tests failed.")
+        sys.exit(1)
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Tests for edge-silence trimming and punctuation-based pauses
+
+Audio is built at 1 kHz so one 10 ms analysis frame is 10 samples and the
+expected bounds can be worked out by hand.
+"""
+
+import os
+import sys
+
+import torch
+
+# Add app to path
+sys.path.append(os.getcwd())
+
+from app.config import Config
+from app.core.silence import find_speech_bounds, pause_after_text, pauses_for_chunks, trim_silence
+
+SAMPLE_RATE = 1000
+
+
+def _audio(*sections):
+    """Concatenate (samples, amplitude) sections of a square wave"""
+    parts = []
+    for samples, amplitude in sections:
+        signs = torch.where(torch.arange(samples) % 2 == 0, 1.0, -1.0)
+        parts.append(signs * amplitude)
+    return torch.cat(parts)
+
+
+def _settings(monkeypatch, threshold_db=-40.0, keep_ms=30):
+    monkeypatch.setattr(Config, "SILENCE_TRIM_ENABLED", True)
+    monkeypatch.setattr(Config, "SILENCE_TRIM_THRESHOLD_DB", threshold_db)
+    monkeypatch.setattr(Config, "SILENCE_TRIM_KEEP_MS", keep_ms)
+
+
+def test_bounds_keep_a_margin_around_speech(monkeypatch):
+    _settings(monkeypatch)
+    audio = _audio((200, 0.0), (300, 0.5), (150, 0.0))
+    assert find_speech_bounds(audio, SAMPLE_RATE) == (170, 530)
+
+    # Speech not on a frame boundary: whole frames are kept
+    audio = _audio((205, 0.0), (292, 0.5), (153, 0.0))
+    assert find_speech_bounds(audio, SAMPLE_RATE) == (170, 530)
+
+
+def test_bounds_are_relative_to_the_loudest_frame(monkeypatch):
+    _settings(monkeypatch)
+    # Noise 54 dB below the speech is cut; a soft onset 28 dB below is kept
+    audio = _audio((100, 0.001), (100, 0.02), (300, 0.5), (100, 0.001))
+    assert find_speech_bounds(audio, SAMPLE_RATE) == (70, 530)
+
+    _settings(monkeypatch, threshold_db=-20.0)
+    assert find_speech_bounds(audio, SAMPLE_RATE) == (170, 530)
+
+
+def test_bounds_are_clamped_to_the_audio(monkeypatch):
+    _settings(monkeypatch, keep_ms=50)
+    audio = _audio((20, 0.0), (300, 0.5), (5, 0.0))
+    assert find_speech_bounds(audio, SAMPLE_RATE) == (0, 325)
+
+
+def test_bounds_use_the_loudest_channel(monkeypatch):
+    _settings(monkeypatch)
+    left = _audio((100, 0.0), (100, 0.5), (300, 0.0))
+    right = _audio((300, 0.0), (100, 0.5), (100, 0.0))
+    assert find_speech_bounds(torch.stack([left, right]), SAMPLE_RATE) == (70, 430)
+    assert find_speech_bounds(torch.stack([left, right]).unsqueeze(0), SAMPLE_RATE) == (70, 430)
+
+
+def test_silent_and_very_short_audio_is_left_whole(monkeypatch):
+    _settings(monkeypatch)
+    # Loudest frame below MIN_PEAK_DB
+    assert find_speech_bounds(_audio((100, 0.0), (50, 0.0005), (100, 0.0)), SAMPLE_RATE) == (0, 250)
+    # Fewer than three frames
+    assert find_speech_bounds(_audio((5, 0.0), (10, 0.5), (5, 0.0)), SAMPLE_RATE) == (0, 20)
+
+
+def test_trim_silence_returns_a_view_and_the_seconds_removed(monkeypatch):
+    _settings(monkeypatch)
+    audio = _audio((200, 0.0), (300, 0.5), (150, 0.0)).unsqueeze(0)
+    trimmed, seconds = trim_silence(audio, SAMPLE_RATE)
+    assert trimmed.shape == (1, 360)
+    assert trimmed.data_ptr() == audio[..., 170:].data_ptr()
+    assert abs(seconds - 0.29) < 1e-9
+
+    monkeypatch.setattr(Config, "SILENCE_TRIM_ENABLED", False)
+    assert trim_silence(audio, SAMPLE_RATE) == (audio, 0.0)
+
+
+def test_pause_follows_the_final_punctuation(monkeypatch):
+    monkeypatch.setattr(Config, "PAUSE_SENTENCE_MS", 350)
+    monkeypatch.setattr(Config, "PAUSE_CLAUSE_MS", 150)
+    monkeypatch.setattr(Config, "LONG_TEXT_PARAGRAPH_PAUSE_MS", 600)
+
+    assert pause_after_text("Selamat pagi.") == 350
+    assert pause_after_text("Benarkah?!  ") == 350
+    assert pause_after_text("Lalu…") == 350
+    assert pause_after_text("Pertama,") == 150
+    assert pause_after_text("Catatan: ") == 150
+    assert pause_after_text("yaitu —") == 150
+    # Closing quotes and brackets are looked past
+    assert pause_after_text('Ia berkata, "Ayo pergi."') == 350
+    assert pause_after_text("(lihat lampiran),)") == 150
+    # Split inside a sentence
+    assert pause_after_text("dan kemudian mereka") == 0
+    assert pause_after_text("") == 0
+    assert pause_after_text('"') == 0
+    # A paragraph end outranks the punctuation
+    assert pause_after_text("Selesai,", paragraph_end=True) == 600
+    assert pause_after_text("Selesai.", paragraph_end=True) == 600
+
+    assert pauses_for_chunks(["Satu.", "dua,", "tiga", "empat."]) == [350, 150, 0]
+    assert pauses_for_chunks(["Satu."]) == []
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Tests for equal-power crossfade stitching
+
+Streaming (pushing chunks one at a time), buffered stitching and the
+streamed long-text file concatenation must give the same audio as stitching
+the whole timeline at once, including chunks shorter than the crossfade.
+"""
+
+import os
+import sys
+import wave
+
+import numpy as np
+import torch
+
+# Add app to path
+sys.path.append(os.getcwd())
+
+from app.core.audio_processing import concatenate_audio_files
+from app.core.stitching import StreamStitcher, equal_power_crossfade, stitch_chunks
+
+SAMPLE_RATE = 1000
+CROSSFADE_MS = 20  # 20 samples
+
+# Chunk lengths in samples: longer than, shorter than and equal to the crossfade
+LENGTHS = [300, 7, 150, 20, 1, 0, 90, 12, 200]
+PAUSES_MS = [0, 50, 0, 0, 30, 0, 0, 100]
+
+
+def _chunks(channels=None, seed=0):
+    rng = np.random.default_rng(seed)
+    shape = (lambda n: (n,)) if channels is None else (lambda n: (channels, n))
+    return [rng.uniform(-0.5, 0.5, size=shape(n)).astype(np.float32) for n in LENGTHS]
+
+
+def _whole_timeline(chunks, pauses_ms, crossfade_samples):
+    """Reference: join each chunk onto the finished output, overlapping its end"""
+    output = chunks[0]
+    for chunk, pause_ms in zip(chunks[1:], pauses_ms):
+        if pause_ms:
+            silence = np.zeros(chunk.shape[:-1] + (int(SAMPLE_RATE * pause_ms / 1000) + crossfade_samples,),
+                               dtype=chunk.dtype)
+            chunk = np.concatenate([silence, chunk], axis=-1)
+        overlap = min(crossfade_samples, output.shape[-1], chunk.shape[-1])
+        output = np.concatenate([
+            output[..., :output.shape[-1] - overlap],
+            equal_power_crossfade(output[..., output.shape[-1] - overlap:], chunk[..., :overlap]),
+            chunk[..., overlap:],
+        ], axis=-1)
+    return output
+
+
+def _streamed(chunks, pauses_ms, crossfade_ms):
+    stitcher = StreamStitcher(SAMPLE_RATE, crossfade_ms)
+    pieces = [stitcher.push(chunks[0])]
+    for chunk, pause_ms in zip(chunks[1:], pauses_ms):
+        piece = stitcher.push(chunk, pause_ms)
+        # Everything but the held-back crossfade is emitted as soon as it is final
+        assert stitcher._tail.shape[-1] <= stitcher.crossfade_samples
+        pieces.append(piece)
+    pieces.append(stitcher.flush())
+    return pieces
+
+
+def test_streamed_and_buffered_stitching_match_the_whole_timeline():
+    for channels in (None, 2):
+        chunks = _chunks(channels)
+        expected = _whole_timeline(chunks, PAUSES_MS, CROSSFADE_MS)
+        streamed = np.concatenate(_streamed(chunks, PAUSES_MS, CROSSFADE_MS), axis=-1)
+        buffered = stitch_chunks(chunks, SAMPLE_RATE, PAUSES_MS, CROSSFADE_MS)
+        np.testing.assert_array_equal(streamed, expected)
+        np.testing.assert_array_equal(buffered, expected)
+
+
+def test_torch_tensors_stitch_like_numpy_arrays():
+    chunks = _chunks(2)
+    expected = stitch_chunks(chunks, SAMPLE_RATE, PAUSES_MS, CROSSFADE_MS)
+    tensors = [torch.from_numpy(chunk) for chunk in chunks]
+    streamed = torch.cat(_streamed(tensors, PAUSES_MS, CROSSFADE_MS), dim=-1)
+    np.testing.assert_allclose(streamed.numpy(), expected, atol=1e-6)
+    np.testing.assert_allclose(stitch_chunks(tensors, SAMPLE_RATE, PAUSES_MS, CROSSFADE_MS).numpy(), expected,
+                               atol=1e-6)
+
+
+def test_without_crossfade_chunks_and_pauses_are_joined_end_to_end():
+    chunks = _chunks()
+    expected = [chunks[0]]
+    for chunk, pause_ms in zip(chunks[1:], PAUSES_MS):
+        expected += [np.zeros(SAMPLE_RATE * pause_ms // 1000, dtype=np.float32), chunk]
+    expected = np.concatenate(expected)
+    np.testing.assert_array_equal(np.concatenate(_streamed(chunks, PAUSES_MS, 0)), expected)
+    np.testing.assert_array_equal(stitch_chunks(chunks, SAMPLE_RATE, PAUSES_MS, 0), expected)
+
+
+def test_single_chunk_comes_back_unchanged():
+    chunk = _chunks()[0]
+    np.testing.assert_array_equal(stitch_chunks([chunk], SAMPLE_RATE, crossfade_ms=CROSSFADE_MS), chunk)
+    assert StreamStitcher(SAMPLE_RATE, CROSSFADE_MS).flush() is None
+
+
+def test_long_text_file_concatenation_matches_buffered_stitching(tmp_path):
+    for channels in (1, 2):
+        chunks = [np.round(chunk * 32767).astype(np.int16) for chunk in _chunks(channels, seed=channels)]
+        files = []
+        for i, chunk in enumerate(chunks):
+            path = tmp_path / f"chunk_{channels}_{i}.wav"
+            with wave.open(str(path), "wb") as writer:
+                writer.setnchannels(channels)
+                writer.setsampwidth(2)
+                writer.setframerate(SAMPLE_RATE)
+                writer.writeframes(chunk.T.tobytes())
+            files.append(path)
+
+        output = tmp_path / f"joined_{channels}.wav"
+        concatenate_audio_files(files, output, output_format="wav", silence_durations_ms=PAUSES_MS,
+                                crossfade_duration_ms=CROSSFADE_MS, normalize_volume=False)
+        with wave.open(str(output), "rb") as reader:
+            joined = np.frombuffer(reader.readframes(reader.getnframes()), dtype="<i2").reshape(-1, channels).T
+
+        expected = stitch_chunks([chunk.astype(np.float32) for chunk in chunks], SAMPLE_RATE, PAUSES_MS,
+                                 CROSSFADE_MS)
+        # Within rounding to 16 bits at each joint
+        assert joined.shape == expected.shape
+        assert np.abs(joined.astype(np.float32) - expected).max() <= 1.0
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Tests for splitting oversized sentences into chunks that fit, by character
+limit and by the token planner's budgets
+"""
+
+import os
+import sys
+
+# Add app to path
+sys.path.append(os.getcwd())
+
+from app.config import Config
+from app.core.chunk_planner import _plan_chunks
+from app.core.text_processing import split_long_sentence, split_text_into_chunks
+
+LONG_SENTENCE = (
+    "Pele memenangkan tiga Piala Dunia bersama Brasil, mencetak lebih dari seribu gol sepanjang kariernya, "
+    "bermain untuk Santos selama hampir dua dekade dan kemudian pindah ke New York Cosmos, "
+    "lalu menjadi duta olahraga yang dikenal di seluruh dunia karena kreativitas dan sportivitasnya"
+)
+
+
+def test_oversized_sentence_is_split_at_clause_boundaries():
+    chunks = split_text_into_chunks(LONG_SENTENCE, max_length=120)
+    assert all(len(chunk) <= 120 for chunk in chunks)
+    assert chunks[0].endswith("kariernya,")
+    # Delimiters are kept, so no words are lost
+    assert " ".join(chunks) == LONG_SENTENCE
+
+
+def test_dashes_and_conjunctions_are_kept_as_written():
+    sentence = ("Skor akhir tiga - satu untuk tuan rumah — sebuah kejutan besar, dan pelatih tamu "
+                "mengakui timnya kalah and pulang lebih awal but tetap bangga - kata dia kepada wartawan")
+    chunks = split_long_sentence(sentence, 60)
+    assert all(len(chunk) <= 60 for chunk in chunks)
+    assert " ".join(chunks) == sentence
+    # A split leaves the dash on the left; inside a chunk spaced dashes are untouched
+    assert chunks[0] == "Skor akhir tiga -"
+    assert "satu untuk tuan rumah — sebuah kejutan besar," in chunks
+    assert "and pulang lebih awal but tetap bangga -" in chunks
+
+    chunks = split_text_into_chunks("Delta - epsilon dan zeta. " + sentence, max_length=60)
+    assert chunks[0] == "Delta - epsilon dan zeta."
+    assert any("tiga - satu" in chunk for chunk in chunks)
+
+
+def test_oversized_sentence_without_delimiters_falls_back_to_words():
+    sentence = " ".join(["kata"] * 60)
+    chunks = split_text_into_chunks(sentence, max_length=50)
+    assert all(len(chunk) <= 50 for chunk in chunks)
+    assert " ".join(chunks) == sentence
+
+
+def test_oversized_word_is_hard_cut():
+    word = "a" * 130
+    chunks = split_text_into_chunks(f"Awal. {word}. Akhir.", max_length=50)
+    assert all(len(chunk) <= 50 for chunk in chunks)
+    assert "".join(chunks).replace(" ", "") == f"Awal.{word}.Akhir."
+
+
+class DigitHeavyTokenizer:
+    """One token per character and ten per digit, so digit runs are far denser than the rest"""
+
+    def encode(self, text):
+        return [0] * sum(10 if c.isdigit() else 1 for c in text)
+
+
+def test_token_plan_resplits_parts_denser_than_the_sentence(monkeypatch):
+    monkeypatch.setattr(Config, "CHUNK_PLANNER", "tokens")
+    monkeypatch.setattr(Config, "MAX_CHUNK_TOKENS", 60)
+    monkeypatch.setattr(Config, "MAX_CHUNK_SPEECH_SECONDS", 1000)
+    # The digits sit in one clause, so cutting at the sentence's average density leaves it over budget
+    sentence = ("nomor rekening yang harus dicatat dengan teliti oleh semua peserta rapat, "
+                "1234567890123456, lalu kirim bukti transfer kepada panitia sebelum akhir bulan ini")
+    tokenizer = DigitHeavyTokenizer()
+    plan = _plan_chunks(sentence, tokenizer, "id")
+    assert all(count <= 60 for count in plan.token_counts)
+    assert [len(tokenizer.encode(chunk)) for chunk in plan.chunks] == list(plan.token_counts)
+    assert "".join(plan.chunks).replace(" ", "") == sentence.replace(" ", "")
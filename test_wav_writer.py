@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Tests for the streaming WAV output of audio concatenation
+
+Files written block by block, with the header sizes patched on close, must be
+byte-for-byte what pydub writes for the same audio held in memory.
+"""
+
+import io
+import os
+import sys
+import wave
+
+import numpy as np
+from pydub import AudioSegment
+
+# Add app to path
+sys.path.append(os.getcwd())
+
+from app.core.audio_processing import _WavWriter, concatenate_audio_files
+
+SAMPLE_RATE = 24000
+
+
+def _pcm(frames, channels=1, seed=0):
+    samples = np.random.default_rng(seed).integers(-20000, 20000, size=frames * channels)
+    return samples.astype('<i2').tobytes()
+
+
+def _pydub_wav(pcm, channels=1):
+    segment = AudioSegment(data=pcm, sample_width=2, frame_rate=SAMPLE_RATE, channels=channels)
+    buffer = io.BytesIO()
+    segment.export(buffer, format="wav")
+    return buffer.getvalue()
+
+
+def _write_in_pieces(path, pcm, channels, piece_bytes):
+    writer = _WavWriter(path, SAMPLE_RATE, channels)
+    for start in range(0, len(pcm), piece_bytes):
+        writer.write(pcm[start:start + piece_bytes])
+    writer.close()
+    return path.read_bytes()
+
+
+def test_header_matches_pydub_for_audio_written_in_pieces(tmp_path):
+    for channels in (1, 2):
+        pcm = _pcm(10007, channels)
+        # Pieces that split frames, a single piece, and one piece per sample
+        for piece_bytes in (999, len(pcm), 2):
+            written = _write_in_pieces(tmp_path / f"out-{channels}-{piece_bytes}.wav", pcm, channels, piece_bytes)
+            assert written == _pydub_wav(pcm, channels)
+
+
+def test_header_matches_pydub_for_empty_audio(tmp_path):
+    path = tmp_path / "empty.wav"
+    _WavWriter(path, SAMPLE_RATE, 1).close()
+    assert path.read_bytes() == _pydub_wav(b"")
+
+
+def _write_wav(path, pcm, channels=1):
+    with wave.open(str(path), "wb") as writer:
+        writer.setnchannels(channels)
+        writer.setsampwidth(2)
+        writer.setframerate(SAMPLE_RATE)
+        writer.writeframes(pcm)
+    return path
+
+
+def test_streamed_concatenation_matches_pydub_join(tmp_path):
+    pieces = [_pcm(frames, seed=i) for i, frames in enumerate((4800, 31, 70000))]
+    files = [_write_wav(tmp_path / f"chunk_{i}.wav", pcm) for i, pcm in enumerate(pieces)]
+    gaps_ms = [250, 0]
+
+    output = tmp_path / "joined.wav"
+    result = concatenate_audio_files(files, output, output_format="wav", silence_durations_ms=gaps_ms,
+                                     normalize_volume=False)
+
+    joined = AudioSegment(data=pieces[0], sample_width=2, frame_rate=SAMPLE_RATE, channels=1)
+    for pcm, gap_ms in zip(pieces[1:], gaps_ms):
+        joined += AudioSegment.silent(duration=gap_ms, frame_rate=SAMPLE_RATE)
+        joined += AudioSegment(data=pcm, sample_width=2, frame_rate=SAMPLE_RATE, channels=1)
+    assert output.read_bytes() == _pydub_wav(joined.raw_data)
+    assert result["duration_seconds"] == len(joined.raw_data) / 2 / SAMPLE_RATE
+    assert result["file_size_bytes"] == output.stat().st_size